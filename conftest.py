@@ -10,6 +10,9 @@ Note: this file is loaded very early, so it avoids importing `fiberq` at module
 top level; fixtures resolve paths from __file__ instead.
 """
 import os
+import shutil
+import socket
+import subprocess
 
 import pytest
 
@@ -33,3 +36,45 @@ def sample_project_path():
     if not os.path.exists(path):
         pytest.skip("tests/fixtures/sample_project.gpkg not present yet")
     return path
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def pg_dsn(tmp_path_factory):
+    """libpq DSN of a PostGIS database for the publish tests.
+
+    Uses FIBERQ_TEST_PG_DSN when set; otherwise starts a throwaway cluster with
+    initdb/pg_ctl if they are on PATH. Skips when neither works.
+    """
+    psycopg2 = pytest.importorskip("psycopg2")
+    dsn = os.environ.get("FIBERQ_TEST_PG_DSN")
+    data_dir = None
+    if not dsn:
+        if not (shutil.which("initdb") and shutil.which("pg_ctl")):
+            pytest.skip("no PostgreSQL: set FIBERQ_TEST_PG_DSN or put initdb on PATH")
+        data_dir = str(tmp_path_factory.mktemp("pgdata"))
+        port = _free_port()
+        subprocess.run(["initdb", "-D", data_dir, "-U", "fiberq", "-A", "trust"],
+                       check=True, capture_output=True)
+        subprocess.run(["pg_ctl", "-D", data_dir, "-w", "-l", os.path.join(data_dir, "log"),
+                        "-o", f"-p {port} -k {data_dir} -c listen_addresses=''", "start"],
+                       check=True, capture_output=True)
+        dsn = f"host={data_dir} port={port} dbname=postgres user=fiberq"
+    try:
+        conn = psycopg2.connect(dsn)
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+        conn.close()
+    except Exception as e:
+        if data_dir:
+            subprocess.run(["pg_ctl", "-D", data_dir, "-m", "fast", "stop"], capture_output=True)
+        pytest.skip(f"PostGIS not available: {e}")
+    yield dsn
+    if data_dir:
+        subprocess.run(["pg_ctl", "-D", data_dir, "-m", "fast", "stop"], capture_output=True)
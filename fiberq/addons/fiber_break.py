@@ -18,6 +18,7 @@ from qgis.core import (
 )
 from qgis.gui import QgsMapTool, QgsVertexMarker
 
+from ..core.layer_registry import get_layer_registry
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -140,16 +141,9 @@ class FiberBreakTool(QgsMapTool):
         """
         proj = QgsProject.instance()
 
-        for lyr in proj.mapLayers().values():
+        for lyr in get_layer_registry().layers(
+                "Fiber break", geometry=QgsWkbTypes.GeometryType.PointGeometry):
             try:
-                is_break_layer = (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry  # noqa: W503
-                    and lyr.name() in ("Prekid vlakna", "Fiber break")  # noqa: W503
-                )
-                if not is_break_layer:
-                    continue
-
                 if lyr.name() == "Prekid vlakna":
                     try:
                         lyr.setName("Fiber break")
@@ -1,9 +1,11 @@
 from qgis.PyQt import QtCore, QtWidgets
 from qgis.PyQt.QtGui import QIcon, QColor
 from qgis.core import (
+    NULL,
     QgsVectorLayer,
     QgsProject,
     QgsDataSourceUri,
+    QgsExpression,
     QgsFeatureRequest,
     QgsRasterLayer,
     QgsCoordinateReferenceSystem,
@@ -12,7 +14,10 @@ from qgis.core import (
     QgsRectangle,
     QgsWkbTypes,
     QgsPalLayerSettings,
+    QgsRuleBasedLabeling,
+    QgsSettings,
     QgsVectorLayerSimpleLabeling, QgsTextFormat,
+    QgsVectorSimplifyMethod,
     QgsTextBufferSettings,
     QgsUnitTypes,
     Qgis
@@ -27,6 +32,9 @@ from qgis.PyQt.QtCore import QUrl
 from qgis.PyQt.QtNetwork import QNetworkRequest
 from qgis.core import QgsBlockingNetworkRequest
 
+from ..core.pg_publish import pg_dsn
+from ..core.pg_search import SEARCH_FIELDS, PgSearch, recommended_index_ddl
+
 # Phase 5.3: Logging
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
@@ -125,6 +133,159 @@ def _get_project_crs():
     return QgsCoordinateReferenceSystem("EPSG:3857")
 
 
+#: Scale denominator past which (zoomed further out) the preview draws no labels.
+PREVIEW_LABEL_MAX_SCALE = 25000
+
+#: Most values offered by the ID / name completer.
+COMPLETER_LIMIT = 5000
+
+#: Preview layers the user unticked, opened only once ticked again.
+SETTING_HIDDEN_LAYERS = "FiberQ/preview_hidden_layers"
+
+PREVIEW_LAYERS = [
+    ("Route", "Trasa"),
+    ("Poles", "Stubovi"),
+    ("Manholes", "OKNA"),
+    ("ODF", "OR"),
+    ("TB", "ZOK"),
+    ("PE pipes", "PE cevi"),
+    ("Transition pipes", "Prelazne cevi"),
+    ("Underground cables", "Kablovi_podzemni"),
+    ("Aerial cables", "Kablovi_vazdusni"),
+    ("Joint Closures", "Nastavci"),
+    ("Fiber break", "Prekid vlakna"),
+    ("Service Area", "Rejon"),
+    ("Optical slacks", "Opticke_rezerve"),
+    ("Patch panel", "Patch panel"),
+    ("OTB", "OD ormar"),
+    ("Pole OTB", "OD ormar na stubu"),
+    ("Outdoor OTB", "Spoljašnji OD ormar"),
+    ("Indoor OTB", "Unutrašnji OD ormar"),
+    ("TO", "TO Izvod"),
+    ("Pole TO", "TO Izvod na stubu"),
+    ("Joint Closure TO", "TO Izvod u nastavku"),
+    ("Outdoor TO", "Spoljašnji TO Izvod"),
+    ("Indoor TO", "Unutrašnji TO Izvod"),
+]
+
+_STYLE_FILES = {
+    "Route": "Route.qml",
+    "Poles": "Poles.qml",
+    "Manholes": "Manholes.qml",
+    "ODF": "ODF.qml",
+    "TB": "TB.qml",
+    "PE pipes": "PE pipes.qml",
+    "Transition pipes": "Transition pipes.qml",
+    "Underground cables": "Underground cables.qml",
+    "Aerial cables": "Aerial cables.qml",
+    "Joint Closures": "Joint Closures.qml",
+    "Fiber break": "Fiber break.qml",
+    "Service Area": "Service area.qml",
+    "Optical slacks": "Optical slacks.qml",
+    "Patch panel": "Patch Panel.qml",
+    "OTB": "OTB.qml",
+    "Pole OTB": "Pole OTB.qml",
+    "Outdoor OTB": "Outdoor OTB.qml",
+    "Indoor OTB": "Indoor OTB.qml",
+    "TO": "TO.qml",
+    "Pole TO": "Pole TO.qml",
+    "Joint Closure TO": "Joint Closure TO.qml",
+    "Outdoor TO": "Outdoor TO.qml",
+    "Indoor TO": "Indoor TO.qml",
+}
+
+_LAYER_ICONS = {
+    "Route": "ic_create_route.svg",
+    "Poles": "ic_add_pole.svg",
+    "Manholes": "ic_place_manholes.svg",
+    "ODF": "ic_place_odf.svg",
+    "TB": "ic_place_tb.svg",
+    "PE pipes": "ic_place_pe_pipe.svg",
+    "Transition pipes": "ic_place_transition_pipe.svg",
+    "Underground cables": "ic_cable_underground.svg",
+    "Aerial cables": "ic_cable_aerial.svg",
+    "Joint Closures": "ic_place_jc.svg",
+    "Fiber break": "ic_fiber_break.svg",
+    "Service Area": "ic_service_area.svg",
+    "Optical slacks": "ic_slack_midspan.svg",
+    "Patch panel": "ic_place_patch_panel.svg",
+    "OTB": "ic_place_otb.svg",
+    "Pole OTB": "ic_place_pole_otb.svg",
+    "Outdoor OTB": "ic_place_outdoor_otb.svg",
+    "Indoor OTB": "ic_place_indoor_otb.svg",
+    "TO": "ic_place_to.svg",
+    "Pole TO": "ic_place_pole_to.svg",
+    "Joint Closure TO": "ic_place_joint_closure_to.svg",
+    "Outdoor TO": "ic_place_outdoor_to.svg",
+    "Indoor TO": "ic_place_indoor_to.svg",
+}
+
+
+def _hidden_preview_layers():
+    """Labels of the preview layers unticked last time."""
+    try:
+        value = QgsSettings().value(SETTING_HIDDEN_LAYERS, "")
+        if isinstance(value, (list, tuple)):
+            return set(value)
+        return {v for v in str(value or "").split("|") if v}
+    except Exception as e:
+        logger.debug(f"Error in _hidden_preview_layers: {e}")
+        return set()
+
+
+def _limit_labels_to_scale(layer, max_scale):
+    """
+    Label ``layer`` only at scales down to 1:``max_scale``.
+
+    Labelling every feature of a national network is what makes a zoomed-out
+    preview slow. Labels that already carry their own scale range keep it.
+    """
+    try:
+        labeling = layer.labeling()
+        if isinstance(labeling, QgsVectorLayerSimpleLabeling):
+            settings = QgsPalLayerSettings(labeling.settings())
+            if not settings.scaleVisibility:
+                settings.scaleVisibility = True
+                settings.minimumScale = max_scale
+                settings.maximumScale = 0
+                layer.setLabeling(QgsVectorLayerSimpleLabeling(settings))
+        elif isinstance(labeling, QgsRuleBasedLabeling):
+            for rule in labeling.rootRule().children():
+                if not rule.dependsOnScale():
+                    rule.setMinimumScale(max_scale)
+    except Exception as e:
+        logger.debug(f"Error in _limit_labels_to_scale: {e}")
+
+
+def _id_field(layer):
+    """The column the ID / name locator searches in ``layer``, or None."""
+    names = set(layer.fields().names())
+    for name in SEARCH_FIELDS:
+        if name in names:
+            return name
+    return None
+
+
+def _completer_values(layer, field_name, limit=COMPLETER_LIMIT):
+    """
+    Sorted distinct non-empty values of ``field_name``, at most ``limit``.
+
+    Goes through uniqueValues(), which the postgres provider answers with a
+    server-side SELECT DISTINCT ... LIMIT instead of fetching every feature.
+    """
+    idx = layer.fields().indexFromName(field_name)
+    if idx < 0:
+        return []
+    values = set()
+    for v in layer.uniqueValues(idx, limit):
+        if v is None or v == NULL:
+            continue
+        text = str(v).strip()
+        if text:
+            values.add(text)
+    return sorted(values)
+
+
 class RectSelectTool(QgsMapTool):
     """
     Rectangle selection tool that works in older QGIS versions
@@ -308,6 +469,9 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         # Canvas
         self.canvas = QgsMapCanvas()
         self.canvas.setCanvasColor(QtCore.Qt.GlobalColor.white)
+        # Panning back or toggling a layer redraws from cache, not the database
+        self.canvas.setCachingEnabled(True)
+        self.canvas.setParallelRenderingEnabled(True)
 
         # AUTO-DETECT CRS FROM PROJECT
         # This ensures Preview Map uses the same CRS as your QGIS project
@@ -344,6 +508,10 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         self.searchEdit = QtWidgets.QLineEdit()
         self.searchEdit.setPlaceholderText("Search ID / name...")
         self.searchButton = QtWidgets.QPushButton("Find")
+        self.searchAllCheck = QtWidgets.QCheckBox("All layers")
+        self.searchAllCheck.setToolTip("Search every preview layer, not only the current one")
+        self.searchIndexButton = QtWidgets.QPushButton("Index SQL")
+        self.searchIndexButton.setToolTip("Indexes that make the ID / name search fast")
 
         # Address locator
         self.addressButton = QtWidgets.QPushButton("Address Locator")
@@ -369,6 +537,8 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         topBar = QtWidgets.QHBoxLayout()
         topBar.addWidget(self.searchEdit)
         topBar.addWidget(self.searchButton)
+        topBar.addWidget(self.searchAllCheck)
+        topBar.addWidget(self.searchIndexButton)
         topBar.addWidget(self.addressButton)
         topBar.addStretch(1)
         topBar.addWidget(self.crsLabel)
@@ -407,9 +577,11 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         self.previewLayers = {}
         self.baseLayers = []
         self.postgis_params = None
+        self._search = None
 
         # Signals
         self.searchButton.clicked.connect(self._on_search_clicked)
+        self.searchIndexButton.clicked.connect(self._show_search_index_ddl)
         self.addressButton.clicked.connect(self._on_address_locator)
         self.btnSendToProject.clicked.connect(self._send_selected_to_project)
         self.btnPan.clicked.connect(self._set_pan_mode)
@@ -511,9 +683,19 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
 
     def _init_postgis_and_layers(self):
         self.postgis_params = _load_postgis_config()
+        self._search = PgSearch(pg_dsn(self.postgis_params), self.postgis_params["schema"])
         self._load_preview_layers()
         self._init_id_completer()
 
+    def done(self, result):
+        if self._search is not None:
+            try:
+                self._search.close()
+            except Exception as e:
+                logger.debug(f"Error in FiberQPreviewDialog.done: {e}")
+            self._search = None
+        super().done(result)
+
     def _build_uri(self, table_name, geom_column="geom"):
         """
         Build PostGIS URI with SRID from project CRS.
@@ -628,84 +810,6 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
                 logger.debug(f"Error in FiberQPreviewDialog._on_basemap_changed: {e}")
 
     def _load_preview_layers(self):
-        layer_defs = [
-            ("Route", "Trasa"),
-            ("Poles", "Stubovi"),
-            ("Manholes", "OKNA"),
-            ("ODF", "OR"),
-            ("TB", "ZOK"),
-            ("PE pipes", "PE cevi"),
-            ("Transition pipes", "Prelazne cevi"),
-            ("Underground cables", "Kablovi_podzemni"),
-            ("Aerial cables", "Kablovi_vazdusni"),
-            ("Joint Closures", "Nastavci"),
-            ("Fiber break", "Prekid vlakna"),
-            ("Service Area", "Rejon"),
-            ("Optical slacks", "Opticke_rezerve"),
-            ("Patch panel", "Patch panel"),
-            ("OTB", "OD ormar"),
-            ("Pole OTB", "OD ormar na stubu"),
-            ("Outdoor OTB", "Spoljašnji OD ormar"),
-            ("Indoor OTB", "Unutrašnji OD ormar"),
-            ("TO", "TO Izvod"),
-            ("Pole TO", "TO Izvod na stubu"),
-            ("Joint Closure TO", "TO Izvod u nastavku"),
-            ("Outdoor TO", "Spoljašnji TO Izvod"),
-            ("Indoor TO", "Unutrašnji TO Izvod"),
-        ]
-
-        STYLE_FILES = {
-            "Route": "Route.qml",
-            "Poles": "Poles.qml",
-            "Manholes": "Manholes.qml",
-            "ODF": "ODF.qml",
-            "TB": "TB.qml",
-            "PE pipes": "PE pipes.qml",
-            "Transition pipes": "Transition pipes.qml",
-            "Underground cables": "Underground cables.qml",
-            "Aerial cables": "Aerial cables.qml",
-            "Joint Closures": "Joint Closures.qml",
-            "Fiber break": "Fiber break.qml",
-            "Service Area": "Service area.qml",
-            "Optical slacks": "Optical slacks.qml",
-            "Patch panel": "Patch Panel.qml",
-            "OTB": "OTB.qml",
-            "Pole OTB": "Pole OTB.qml",
-            "Outdoor OTB": "Outdoor OTB.qml",
-            "Indoor OTB": "Indoor OTB.qml",
-            "TO": "TO.qml",
-            "Pole TO": "Pole TO.qml",
-            "Joint Closure TO": "Joint Closure TO.qml",
-            "Outdoor TO": "Outdoor TO.qml",
-            "Indoor TO": "Indoor TO.qml",
-        }
-
-        LAYER_ICONS = {
-            "Route": "ic_create_route.svg",
-            "Poles": "ic_add_pole.svg",
-            "Manholes": "ic_place_manholes.svg",
-            "ODF": "ic_place_odf.svg",
-            "TB": "ic_place_tb.svg",
-            "PE pipes": "ic_place_pe_pipe.svg",
-            "Transition pipes": "ic_place_transition_pipe.svg",
-            "Underground cables": "ic_cable_underground.svg",
-            "Aerial cables": "ic_cable_aerial.svg",
-            "Joint Closures": "ic_place_jc.svg",
-            "Fiber break": "ic_fiber_break.svg",
-            "Service Area": "ic_service_area.svg",
-            "Optical slacks": "ic_slack_midspan.svg",
-            "Patch panel": "ic_place_patch_panel.svg",
-            "OTB": "ic_place_otb.svg",
-            "Pole OTB": "ic_place_pole_otb.svg",
-            "Outdoor OTB": "ic_place_outdoor_otb.svg",
-            "Indoor OTB": "ic_place_indoor_otb.svg",
-            "TO": "ic_place_to.svg",
-            "Pole TO": "ic_place_pole_to.svg",
-            "Joint Closure TO": "ic_place_joint_closure_to.svg",
-            "Outdoor TO": "ic_place_outdoor_to.svg",
-            "Indoor TO": "ic_place_indoor_to.svg",
-        }
-
         layers_for_canvas = []
 
         # Only add basemap if not "none"
@@ -720,52 +824,14 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
                     self.baseLayers.append(osm)
                     layers_for_canvas.append(osm)
 
-        proj = QgsProject.instance()  # noqa: F841
-
-        # Load ALL layers directly from PostGIS with project CRS
-        for label, table in layer_defs:
-            try:
-                uri = self._build_uri(table)
-                vlayer = QgsVectorLayer(uri.uri(False), label, "postgres")
-                if not vlayer.isValid():
-                    continue
-
-                # Force layer CRS to match project CRS
-                # This is crucial for proper coordinate alignment
-                try:
-                    vlayer.setCrs(self._project_crs)
-                except Exception as e:
-                    logger.debug(f"Could not set layer CRS: {e}")
-
-                applied_style = False
-                try:
-                    style_file = STYLE_FILES.get(label)
-                    if style_file:
-                        plugin_dir = _plugin_root_dir()
-                        qml_path = os.path.join(plugin_dir, "styles", style_file)
-                        if os.path.exists(qml_path):
-                            vlayer.loadNamedStyle(qml_path)
-                            # FORCE label fixes for Preview
-                            lname = (label or "").lower()
-                            if "aerial" in lname or "underground" in lname:
-                                self._apply_preview_cable_labels(vlayer)
-                            if "manhole" in lname:
-                                self._apply_preview_manhole_labels(vlayer)
-                            vlayer.triggerRepaint()
-                            applied_style = True
-                except Exception:
-                    applied_style = False
-
-                if not applied_style:
-                    try:
-                        vlayer.loadDefaultStyle()
-                    except Exception as e:
-                        logger.debug(f"Error in FiberQPreviewDialog._load_preview_layers: {e}")
-                self.previewLayers[label] = vlayer
-                layers_for_canvas.append(vlayer)
-
+        # List every layer, but open only those shown: a hidden layer costs
+        # nothing until it is ticked (see _ensure_preview_layer)
+        hidden = _hidden_preview_layers()
+        self.layersList.blockSignals(True)
+        try:
+            for label, _table in PREVIEW_LAYERS:
                 item = QtWidgets.QListWidgetItem(label)
-                icon_name = LAYER_ICONS.get(label)
+                icon_name = _LAYER_ICONS.get(label)
                 if icon_name:
                     icon_path = os.path.join(_plugin_root_dir(), "icons", icon_name)
                     if os.path.exists(icon_path):
@@ -773,17 +839,20 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
                             item.setIcon(QIcon(icon_path))
                         except Exception as e:
                             logger.debug(f"Error in FiberQPreviewDialog._load_preview_layers: {e}")
-                try:
-                    fc = vlayer.featureCount()
-                    item.setToolTip(f"{label} - {fc} objects")
-                except Exception as e:
-                    logger.debug(f"Error in FiberQPreviewDialog._load_preview_layers: {e}")
-                item.setCheckState(QtCore.Qt.CheckState.Checked)
+                shown = label not in hidden
+                item.setCheckState(QtCore.Qt.CheckState.Checked if shown else QtCore.Qt.CheckState.Unchecked)
                 self.layersList.addItem(item)
-
-            except Exception as e:
-                logger.debug(f"Skipping preview layer that failed to load: {e}")
-                continue
+                if not shown:
+                    item.setToolTip(f"{label} - not loaded until shown")
+                    continue
+                vlayer = self._ensure_preview_layer(label)
+                if vlayer is None:
+                    # No such table in this database
+                    self.layersList.takeItem(self.layersList.row(item))
+                    continue
+                layers_for_canvas.append(vlayer)
+        finally:
+            self.layersList.blockSignals(False)
 
         if layers_for_canvas:
             vector_layers = [lyr for lyr in layers_for_canvas if lyr not in self.baseLayers]
@@ -801,6 +870,91 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
             if "Route" in self.previewLayers:
                 self.canvas.setCurrentLayer(self.previewLayers["Route"])
 
+    def _ensure_preview_layer(self, label):
+        """
+        The preview layer for ``label``, opened (and styled) on first use.
+
+        Opening must not scan the table: metadata (extent, geometry type,
+        feature count) is estimated and the primary key is not checked for
+        unicity. Drawing then fetches only the canvas extent, as always, with
+        coarse geometries simplified by the server, and labels only once zoomed
+        in past PREVIEW_LABEL_MAX_SCALE. Returns None if the table is missing.
+        """
+        vlayer = self.previewLayers.get(label)
+        if vlayer is not None:
+            return vlayer
+        table = dict(PREVIEW_LAYERS).get(label)
+        if not table or not self.postgis_params:
+            return None
+        try:
+            uri = self._build_uri(table)
+            uri.setUseEstimatedMetadata(True)
+            uri.setParam("checkPrimaryKeyUnicity", "0")
+            vlayer = QgsVectorLayer(uri.uri(False), label, "postgres")
+            if not vlayer.isValid():
+                return None
+        except Exception as e:
+            logger.debug(f"Skipping preview layer that failed to load: {e}")
+            return None
+
+        # Force layer CRS to match project CRS
+        # This is crucial for proper coordinate alignment
+        try:
+            vlayer.setCrs(self._project_crs)
+        except Exception as e:
+            logger.debug(f"Could not set layer CRS: {e}")
+
+        applied_style = False
+        try:
+            style_file = _STYLE_FILES.get(label)
+            if style_file:
+                plugin_dir = _plugin_root_dir()
+                qml_path = os.path.join(plugin_dir, "styles", style_file)
+                if os.path.exists(qml_path):
+                    vlayer.loadNamedStyle(qml_path)
+                    # FORCE label fixes for Preview
+                    lname = (label or "").lower()
+                    if "aerial" in lname or "underground" in lname:
+                        self._apply_preview_cable_labels(vlayer)
+                    if "manhole" in lname:
+                        self._apply_preview_manhole_labels(vlayer)
+                    applied_style = True
+        except Exception:
+            applied_style = False
+
+        if not applied_style:
+            try:
+                vlayer.loadDefaultStyle()
+            except Exception as e:
+                logger.debug(f"Error in FiberQPreviewDialog._ensure_preview_layer: {e}")
+        _limit_labels_to_scale(vlayer, PREVIEW_LABEL_MAX_SCALE)
+        try:
+            simplify = QgsVectorSimplifyMethod(vlayer.simplifyMethod())
+            simplify.setSimplifyHints(QgsVectorSimplifyMethod.SimplifyHint.GeometrySimplification)
+            simplify.setForceLocalOptimization(False)
+            vlayer.setSimplifyMethod(simplify)
+        except Exception as e:
+            logger.debug(f"Error in FiberQPreviewDialog._ensure_preview_layer: {e}")
+        self.previewLayers[label] = vlayer
+
+        item = self._list_item(label)
+        if item is not None:
+            self.layersList.blockSignals(True)
+            try:
+                item.setToolTip(f"{label} - ~{vlayer.featureCount()} objects")
+            except Exception as e:
+                logger.debug(f"Error in FiberQPreviewDialog._ensure_preview_layer: {e}")
+            finally:
+                self.layersList.blockSignals(False)
+        return vlayer
+
+    def _list_item(self, label):
+        for i in range(self.layersList.count()):
+            item = self.layersList.item(i)
+            if item.text() == label:
+                return item
+        return None
+
     def _apply_preview_cable_labels(self, layer):
         try:
             s = QgsPalLayerSettings()
@@ -959,7 +1113,7 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         for item in items:
             if item.isHidden():
                 continue
-            layer = self.previewLayers.get(item.text())
+            layer = self._ensure_preview_layer(item.text())
             if not isinstance(layer, QgsVectorLayer):
                 continue
             try:
@@ -990,34 +1144,20 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         item = self.layersList.currentItem()
         if not item:
             return None
-        return self.previewLayers.get(item.text())
+        return self._ensure_preview_layer(item.text())
 
     def _update_id_completer_for_layer(self, layer):
         if layer is None or not isinstance(layer, QgsVectorLayer):
             self.searchEdit.setCompleter(None)
             return
 
-        fields = {f.name(): f for f in layer.fields()}
-        candidate_names = ["id_trase", "ID_trase", "id", "ID", "naziv", "name"]
-        field_name = None
-        for name in candidate_names:
-            if name in fields:
-                field_name = name
-                break
-
+        field_name = _id_field(layer)
         if not field_name:
             self.searchEdit.setCompleter(None)
             return
 
-        values = set()
         try:
-            for feat in layer.getFeatures():
-                v = feat[field_name]
-                if v is None:
-                    continue
-                s = str(v).strip()
-                if s:
-                    values.add(s)
+            values = _completer_values(layer, field_name)
         except Exception:
             self.searchEdit.setCompleter(None)
             return
@@ -1026,7 +1166,7 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
             self.searchEdit.setCompleter(None)
             return
 
-        completer = QtWidgets.QCompleter(sorted(values), self)
+        completer = QtWidgets.QCompleter(values, self)
         completer.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
         try:
             completer.setFilterMode(QtCore.Qt.MatchFlag.MatchContains)
@@ -1062,13 +1202,29 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
 
     def _on_layer_toggled(self, item):
         vector_layers = []
+        hidden = []
         for i in range(self.layersList.count()):
             it = self.layersList.item(i)
-            lyr = self.previewLayers.get(it.text())
+            if it.checkState() != QtCore.Qt.CheckState.Checked:
+                hidden.append(it.text())
+                continue
+            lyr = self._ensure_preview_layer(it.text())
             if not lyr:
+                # First shown just now, but the table is missing
+                self.layersList.blockSignals(True)
+                try:
+                    it.setCheckState(QtCore.Qt.CheckState.Unchecked)
+                    it.setFlags(it.flags() & ~QtCore.Qt.ItemFlag.ItemIsEnabled)
+                    it.setToolTip(f"{it.text()} - not in the database")
+                finally:
+                    self.layersList.blockSignals(False)
                 continue
-            if it.checkState() == QtCore.Qt.CheckState.Checked:
-                vector_layers.append(lyr)
+            vector_layers.append(lyr)
+
+        try:
+            QgsSettings().setValue(SETTING_HIDDEN_LAYERS, "|".join(hidden))
+        except Exception as e:
+            logger.debug(f"Error in FiberQPreviewDialog._on_layer_toggled: {e}")
 
         visible_layers = vector_layers + list(self.baseLayers)
         self.canvas.setLayers(visible_layers)
@@ -1078,7 +1234,7 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         if not current:
             self._update_id_completer_for_layer(None)
             return
-        layer = self.previewLayers.get(current.text())
+        layer = self._ensure_preview_layer(current.text())
         if layer:
             self.canvas.setCurrentLayer(layer)
         self._update_id_completer_for_layer(layer)
@@ -1096,62 +1252,137 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         if not text_value:
             return
 
-        layer = self._current_vector_layer()
-        if not layer:
-            layer = self.previewLayers.get("Trasa")
+        if self.searchAllCheck.isChecked():
+            labels = [label for label, _table in PREVIEW_LAYERS if self._list_item(label) is not None]
+            layer = None
+        else:
+            layer = self._current_vector_layer()
+            if not layer:
+                layer = self._ensure_preview_layer("Route")
+
+            if not layer:
+                QtWidgets.QMessageBox.information(
+                    self, "Locator", "No vector layer is active in the preview map."
+                )
+                return
+            labels = [layer.name()]
+
+        if self._search is not None and self._search.available:
+            try:
+                self._search_server_side(text_value, labels)
+                return
+            except Exception as e:
+                logger.debug(f"Server-side search failed, searching the layers: {e}")
+
+        for lyr in ([layer] if layer else [self._ensure_preview_layer(lbl) for lbl in labels]):
+            if lyr is not None and self._search_layer(lyr, text_value, quiet=layer is None):
+                return
+        if layer is None:
+            QtWidgets.QMessageBox.information(
+                self, "Locator", "No features found for the given ID/name."
+            )
 
-        if not layer:
+    def _search_server_side(self, text_value, labels):
+        """Search ``labels`` in the database; select the best matches and zoom to them."""
+        tables = dict(PREVIEW_LAYERS)
+        by_table = {tables[label]: label for label in labels if label in tables}
+        hits = self._search.search(text_value, list(by_table))
+        if not hits:
             QtWidgets.QMessageBox.information(
-                self, "Locator", "No vector layer is active in the preview map."
+                self, "Locator", "No features found for the given ID/name."
             )
             return
 
-        label = layer.name()
+        bbox = None
+        for table, hit in hits.items():
+            label = by_table[table]
+            layer = self._ensure_preview_layer(label)
+            if layer is None:
+                continue
+            item = self._list_item(label)
+            if item is not None and item.checkState() != QtCore.Qt.CheckState.Checked:
+                item.setCheckState(QtCore.Qt.CheckState.Checked)
+            try:
+                layer.selectByIds(self._feature_ids(layer, hit.pk, hit.ids))
+            except Exception as e:
+                logger.debug(f"Error in FiberQPreviewDialog._search_server_side: {e}")
+            if hit.extent is not None:
+                rect = QgsRectangle(*hit.extent)
+                if bbox is None:
+                    bbox = rect
+                else:
+                    bbox.combineExtentWith(rect)
+        self._zoom_to_hits(bbox)
+
+    @staticmethod
+    def _feature_ids(layer, pk, values):
+        """Feature ids of the rows whose ``pk`` is one of ``values`` (no geometry fetched)."""
+        expr = "{} IN ({})".format(
+            QgsExpression.quotedColumnRef(pk),
+            ", ".join(QgsExpression.quotedValue(v) for v in values),
+        )
+        req = QgsFeatureRequest().setFilterExpression(expr)
+        req.setFlags(QgsFeatureRequest.Flag.NoGeometry)
+        req.setNoAttributes()
+        return [f.id() for f in layer.getFeatures(req)]
+
+    def _zoom_to_hits(self, bbox):
+        if bbox is None:
+            return
+        try:
+            if bbox.isEmpty():
+                # A single point
+                self.canvas.setCenter(bbox.center())
+                self.canvas.zoomScale(1500)
+            else:
+                self.canvas.setExtent(bbox)
+            self.canvas.refresh()
+        except Exception as e:
+            logger.debug(f"Error in FiberQPreviewDialog._zoom_to_hits: {e}")
 
-        fields = {f.name(): f for f in layer.fields()}
-        candidate_names = ["id_trase", "ID_trase", "id", "ID", "naziv", "name"]
-        field_name = None
-        for n in candidate_names:
-            if n in fields:
-                field_name = n
-                break
+    def _search_layer(self, layer, text_value, quiet=False):
+        """Exact ID / name match in ``layer`` without the database search; True if found."""
+        label = layer.name()
 
+        field_name = _id_field(layer)
         if not field_name:
-            QtWidgets.QMessageBox.information(
-                self,
-                "Locator",
-                f"Cannot find ID/name column in layer '{label}' (id_trase, id, naziv, name...).",
-            )
-            return
+            if not quiet:
+                QtWidgets.QMessageBox.information(
+                    self,
+                    "Locator",
+                    f"Cannot find ID/name column in layer '{label}' (id_trase, id, naziv, name...).",
+                )
+            return False
 
-        safe_value = text_value.replace("'", "''")
-        expr = '"{}" = \'{}\''.format(field_name, safe_value)
+        expr = QgsExpression.createFieldEqualityExpression(field_name, text_value)
 
         try:
             req = QgsFeatureRequest().setFilterExpression(expr)
         except Exception:
-            QtWidgets.QMessageBox.warning(
-                self, "Locator", "Invalid search expression."
-            )
-            return
+            if not quiet:
+                QtWidgets.QMessageBox.warning(
+                    self, "Locator", "Invalid search expression."
+                )
+            return False
 
         feats = [f for f in layer.getFeatures(req)]
         if not feats:
-            QtWidgets.QMessageBox.information(
-                self,
-                "Locator",
-                f"No features found in layer '{label}' for the given ID/name.",
-            )
-            return
+            if not quiet:
+                QtWidgets.QMessageBox.information(
+                    self,
+                    "Locator",
+                    f"No features found in layer '{label}' for the given ID/name.",
+                )
+            return False
 
         try:
             layer.removeSelection()
         except Exception as e:
-            logger.debug(f"Error in FiberQPreviewDialog._on_search_clicked: {e}")
+            logger.debug(f"Error in FiberQPreviewDialog._search_layer: {e}")
         try:
             layer.selectByIds([f.id() for f in feats])
         except Exception as e:
-            logger.debug(f"Error in FiberQPreviewDialog._on_search_clicked: {e}")
+            logger.debug(f"Error in FiberQPreviewDialog._search_layer: {e}")
         bbox = None
         for f in feats:
             g = f.geometry()
@@ -1166,6 +1397,29 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
         if bbox is not None:
             self.canvas.setExtent(bbox)
             self.canvas.refresh()
+        return True
+
+    def _show_search_index_ddl(self):
+        """Show the SQL creating the search indexes of the loaded layers."""
+        schema = (self.postgis_params or {}).get("schema", "public")
+        tables = dict(PREVIEW_LAYERS)
+        statements = []
+        for label, layer in self.previewLayers.items():
+            field_name = _id_field(layer)
+            if field_name and label in tables:
+                statements.extend(recommended_index_ddl(schema, tables[label], field_name))
+        statements = list(dict.fromkeys(statements))
+        if not statements:
+            QtWidgets.QMessageBox.information(
+                self, "Locator", "No loaded layer has an ID/name column."
+            )
+            return
+        box = QtWidgets.QMessageBox(self)
+        box.setWindowTitle("Locator")
+        box.setText("Run these statements (as the table owner) to make the ID/name search "
+                    "use indexes. The trigram index needs the pg_trgm extension.")
+        box.setDetailedText(";\n".join(statements) + ";")
+        box.exec()
 
     def _on_address_locator(self):
         """Open advanced address locator (PreviewLocatorDialog)."""
@@ -1229,7 +1483,7 @@ class FiberQPreviewDialog(QtWidgets.QDialog):
 
         for item in items:
             label = item.text()
-            layer = self.previewLayers.get(label)
+            layer = self._ensure_preview_layer(label)
             if not layer:
                 continue
 
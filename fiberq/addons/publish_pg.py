@@ -4,6 +4,7 @@ from qgis.PyQt.QtWidgets import (
     QLineEdit, QCheckBox, QPushButton, QMessageBox
 )
 from qgis.core import (
+    QgsApplication,
     QgsProject,
     QgsVectorLayer,
     QgsVectorLayerExporter,
@@ -13,10 +14,16 @@ import os
 import re
 import configparser
 
+from ..core.layer_registry import get_layer_registry
+from ..core.pg_publish import PgPublishTask, pg_dsn
+
 # Phase 5.3: Logging
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
+# Project publishes in flight (task, progress dialog), kept alive until they report back
+_RUNNING_PUBLISHES = set()
+
 
 def _plugin_root_dir():
     """
@@ -234,6 +241,11 @@ class PublishDialog(QDialog):
 
         # Dugmad
         hbtn = QHBoxLayout()
+        btn_project = QPushButton("Publish project")
+        btn_project.setToolTip("Publish every FiberQ layer in one transaction; "
+                               "tables with fiberq_uuid are updated in place")
+        btn_project.clicked.connect(self._do_publish_project)
+        hbtn.addWidget(btn_project)
         hbtn.addStretch(1)
         btn_ok = QPushButton("Publish")
         btn_cancel = QPushButton("Cancel")
@@ -353,6 +365,104 @@ class PublishDialog(QDialog):
         )
         self.accept()
 
+    def _do_publish_project(self):
+        """Publish all FiberQ layers in the background (see core.pg_publish)."""
+        if not self.pg:
+            QMessageBox.warning(
+                self.iface.mainWindow(),
+                "PostGIS",
+                "No valid PostGIS configuration (config.ini).",
+            )
+            return
+
+        layers = [lyr for lyr in get_layer_registry().layers() if isinstance(lyr, QgsVectorLayer)]
+        if not layers:
+            QMessageBox.warning(
+                self.iface.mainWindow(),
+                "PostGIS",
+                "No FiberQ layers in the project.",
+            )
+            return
+
+        schema = (self.le_schema.text() or "").strip() or self.pg["schema"]
+        try:
+            publish_project(self.iface, pg_dsn(self.pg), schema, layers)
+        except Exception as e:
+            QMessageBox.critical(
+                self.iface.mainWindow(),
+                "PostGIS",
+                f"Error starting the publish:\n\n{e}",
+            )
+            return
+        self.accept()
+
+
+def publish_project(iface, dsn, schema, layers):
+    """Start a PgPublishTask for ``layers`` with a progress dialog; returns the task.
+
+    One publish at a time: while one runs, its dialog is brought back and the
+    running task returned instead.
+    """
+    from ..dialogs.export_progress_dialog import GpkgExportProgressDialog
+
+    if _RUNNING_PUBLISHES:
+        running, running_dlg = next(iter(_RUNNING_PUBLISHES))
+        iface.messageBar().pushInfo("PostGIS", "A publish is already running; wait for it to finish.")
+        running_dlg.show()
+        running_dlg.raise_()
+        return running
+
+    task = PgPublishTask(dsn, schema, layers)
+    dlg = GpkgExportProgressDialog(task, iface.mainWindow(), title="Publish to PostGIS",
+                                   target=f"schema {task.schema}")
+    entry = (task, dlg)
+
+    def _done(result):
+        _RUNNING_PUBLISHES.discard(entry)
+        _report_publish(iface, result)
+
+    task.resultReady.connect(_done)
+    _RUNNING_PUBLISHES.add(entry)
+    dlg.show()
+    QgsApplication.taskManager().addTask(task)
+    return task
+
+
+def _report_publish(iface, result):
+    try:
+        if result.cancelled:
+            iface.messageBar().pushInfo("PostGIS", "Publish cancelled; nothing was changed in the database.")
+            return
+        if not result.ok:
+            iface.messageBar().pushWarning(
+                "PostGIS",
+                "Nothing was published:\n" + "\n".join(result.errors)
+            )
+            return
+        written = sum(w for w, _d in result.counts.values())
+        deleted = sum(d for _w, d in result.counts.values())
+        iface.messageBar().pushSuccess(
+            "PostGIS",
+            f"{len(result.tables)} layer(s) published to schema {result.schema} "
+            f"({written} row(s) written, {deleted} deleted)."
+        )
+    except Exception as e:
+        logger.debug(f"Error in _report_publish: {e}")
+
+
+def cancel_project_publishes():
+    """Cancel every project publish still running (plugin unload).
+
+    The tasks roll back on their own; core.pg_publish.close_pg_connections()
+    waits for them to let go of their connection before closing it.
+    """
+    for task, _dlg in list(_RUNNING_PUBLISHES):
+        try:
+            task.cancel()
+        except Exception as e:
+            logger.debug(f"Error in cancel_project_publishes: {e}")
+    _RUNNING_PUBLISHES.clear()
+
 
 def open_publish_dialog(iface):
     dlg = PublishDialog(iface)
@@ -1,14 +1,15 @@
-from qgis.PyQt.QtCore import QObject, QVariant
+from qgis.PyQt.QtCore import QObject
 from qgis.core import (
-    QgsProject, QgsVectorLayer, QgsField, QgsWkbTypes, QgsGeometry,
+    QgsProject, QgsVectorLayer, QgsWkbTypes,
     QgsRendererCategory, QgsCategorizedSymbolRenderer, QgsMarkerSymbol,
     QgsSvgMarkerSymbolLayer, QgsUnitTypes, QgsPalLayerSettings, QgsVectorLayerSimpleLabeling
 )
 import os
 
+from ..core.slack_totals import get_slack_totals, write_cable_totals
+
 # Phase 5.3: Logging
 from ..utils.logger import get_logger
-from ..utils.measure import ground_length
 logger = get_logger(__name__)
 
 
@@ -21,6 +22,7 @@ class ReserveHook(QObject):
         self.iface = iface
         self._connected = False
         self._layer = None
+        self._totals = None
         QgsProject.instance().layersAdded.connect(self._layers_added)
 
     # --- Wiring ---
@@ -46,33 +48,23 @@ class ReserveHook(QObject):
     def _connect_layer(self, lyr: QgsVectorLayer):
         if self._layer is lyr:
             return
+        if self._totals is not None:
+            self._totals.remove_listener(self._update_cables)
         self._layer = lyr
-        # hook signals
-        try:
-            lyr.committedFeaturesAdded.connect(self._on_rez_added)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._connect_layer: {e}")
-        try:
-            lyr.committedFeaturesRemoved.connect(self._on_rez_removed)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._connect_layer: {e}")
-        try:
-            lyr.committedAttributeValuesChanges.connect(self._on_attr_changed)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._connect_layer: {e}")
+        # Running slack totals follow the layer's commits and report the
+        # cables each commit touched
         try:
-            lyr.committedGeometriesChanges.connect(self._on_geom_changed)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._connect_layer: {e}")
-        try:
-            lyr.editingStopped.connect(self._on_editing_stopped)
+            self._totals = get_slack_totals(lyr)
+            self._totals.add_listener(self._update_cables)
         except Exception as e:
+            self._totals = None
             logger.debug(f"Error in ReserveHook._connect_layer: {e}")
         # style
         try:
             self._apply_style(lyr)
         except Exception as e:
             logger.debug(f"Error in ReserveHook._connect_layer: {e}")
+
     # --- Style for reserves layer ---
 
     def _icons_dir(self):
@@ -108,173 +100,20 @@ class ReserveHook(QObject):
         rez.setRenderer(r)
         rez.triggerRepaint()
 
-    # --- Signal handlers ---
-    def _on_rez_added(self, layer_id, addedFeatures):
-        try:
-            rez = self._layer
-            if not isinstance(rez, QgsVectorLayer):
-                return
-            idx_kid = rez.fields().indexFromName('cable_layer_id')
-            idx_fid = rez.fields().indexFromName('cable_fid')
-            if idx_kid == -1 or idx_fid == -1:
-                return
-            touched = set()
-            for f in addedFeatures:
-                kid = f.attribute(idx_kid)
-                fid = f.attribute(idx_fid)
-                if kid is None or fid is None:
-                    continue
-                touched.add((kid, int(fid)))
-            for kid, fid in touched:
-                self._update_cable(kid, fid)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._on_rez_added: {e}")
-
-    def _on_rez_removed(self, layer_id, fids):
-        try:
-            rez = self._layer
-            if not isinstance(rez, QgsVectorLayer):
-                return
-            # Find impacted cables by scanning remaining features (cheap unless many)
-            idx_kid = rez.fields().indexFromName('cable_layer_id')
-            idx_fid = rez.fields().indexFromName('cable_fid')
-            impacted = set()
-            for f in rez.getFeatures():
-                try:
-                    impacted.add((f.attribute(idx_kid), int(f.attribute(idx_fid))))
-                except Exception as e:
-                    logger.debug(f"Error in ReserveHook._on_rez_removed: {e}")
-            # Unique set ensures we recompute all current ones; removed ones will be ignored safely
-            for kid, fid in impacted:
-                self._update_cable(kid, fid)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._on_rez_removed: {e}")
-
-    def _on_attr_changed(self, layer_id, changedAttrsMap):
-        # changedAttrsMap: dict(fid -> {idx: value})
-        try:
-            rez = self._layer
-            if not isinstance(rez, QgsVectorLayer):
-                return
-            idx_kid = rez.fields().indexFromName('cable_layer_id')
-            idx_fid = rez.fields().indexFromName('cable_fid')
-            touched = set()
-            for fid in changedAttrsMap.keys():
-                f = next(rez.getFeatures(f'id={int(fid)}'), None)
-                if f:
-                    kid = f.attribute(idx_kid)
-                    kfid = f.attribute(idx_fid)
-                    if kid is not None and kfid is not None:
-                        touched.add((kid, int(kfid)))
-            for kid, fid in touched:
-                self._update_cable(kid, fid)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._on_attr_changed: {e}")
-
-    def _on_geom_changed(self, layer_id, geomMap):
-        # Just recompute for all referenced features
-        try:
-            rez = self._layer
-            if not isinstance(rez, QgsVectorLayer):
-                return
-            idx_kid = rez.fields().indexFromName('cable_layer_id')
-            idx_fid = rez.fields().indexFromName('cable_fid')
-            touched = set()
-            for fid in geomMap.keys():
-                f = next(rez.getFeatures(f'id={int(fid)}'), None)
-                if f:
-                    kid = f.attribute(idx_kid)
-                    kfid = f.attribute(idx_fid)
-                    if kid is not None and kfid is not None:
-                        touched.add((kid, int(kfid)))
-            for kid, fid in touched:
-                self._update_cable(kid, fid)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._on_geom_changed: {e}")
-
-    def _on_editing_stopped(self):
-        # Safety net: recompute all
-        try:
-            rez = self._layer
-            if not isinstance(rez, QgsVectorLayer):
-                return
-            idx_kid = rez.fields().indexFromName('cable_layer_id')
-            idx_fid = rez.fields().indexFromName('cable_fid')
-            touched = set()
-            for f in rez.getFeatures():
-                try:
-                    kid = f.attribute(idx_kid)
-                    kfid = f.attribute(idx_fid)
-                    if kid is not None and kfid is not None:
-                        touched.add((kid, int(kfid)))
-                except Exception as e:
-                    logger.debug(f"Error in ReserveHook._on_editing_stopped: {e}")
-            for kid, fid in touched:
-                self._update_cable(kid, fid)
-        except Exception as e:
-            logger.debug(f"Error in ReserveHook._on_editing_stopped: {e}")
     # --- Core recompute ---
 
-    def _update_cable(self, cable_layer_id, cable_fid):
-        proj = QgsProject.instance()
-        lyr = proj.mapLayer(cable_layer_id)
-        if not isinstance(lyr, QgsVectorLayer):
+    def _update_cables(self, keys):
+        """Write slack_m/total_len_m of the (cable layer id, fid) ``keys``: one
+        edit session and one relabel per cable layer."""
+        if self._totals is None:
             return
+        write_cable_totals(keys, self._totals, add_missing_fields=True, places=2,
+                           restyle=self._label_totals)
 
-        # Sum slack from all reserves for this cable
-        rez = None
-        for l in proj.mapLayers().values():  # noqa: E741
-            if isinstance(l, QgsVectorLayer) and l.name().lower().startswith('opticke_rezerve'):
-                rez = l
-                break
-        if rez is None:
-            return
-
-        idx_kid = rez.fields().indexFromName('cable_layer_id')
-        idx_fid = rez.fields().indexFromName('cable_fid')
-        idx_len = rez.fields().indexFromName('duzina_m')
-        total_slack = 0.0
-        for f in rez.getFeatures():
-            try:
-                if f.attribute(idx_kid) == cable_layer_id and int(f.attribute(idx_fid)) == int(cable_fid):
-                    val = f.attribute(idx_len) if idx_len != -1 else f.attribute('slack_m')
-                    total_slack += float(val or 0.0)
-            except Exception as e:
-                logger.debug(f"Error in ReserveHook._update_cable: {e}")
-        # Geometry length (meters)
-        g_m = 0.0
-        try:
-            kf = next(lyr.getFeatures(f'id={int(cable_fid)}'))
-            geom = kf.geometry()
-            g_m = ground_length(geom, lyr) if isinstance(geom, QgsGeometry) else 0.0
-        except StopIteration:
-            pass
-
-        # Ensure fields exist
-        slack_idx = lyr.fields().indexFromName('slack_m')
-        tot_idx = lyr.fields().indexFromName('total_len_m')
-        attrs_to_add = []
-        if slack_idx == -1:
-            attrs_to_add.append(QgsField('slack_m', QVariant.Double))
-        if tot_idx == -1:
-            attrs_to_add.append(QgsField('total_len_m', QVariant.Double))
-        if attrs_to_add:
-            lyr.startEditing()
-            lyr.dataProvider().addAttributes(attrs_to_add)
-            lyr.updateFields()
-            lyr.commitChanges()
-            slack_idx = lyr.fields().indexFromName('slack_m')
-            tot_idx = lyr.fields().indexFromName('total_len_m')
-
-        # Write values
-        lyr.startEditing()
-        try:
-            lyr.changeAttributeValue(int(cable_fid), slack_idx, round(total_slack, 2))
-            lyr.changeAttributeValue(int(cable_fid), tot_idx, round((g_m or 0) + total_slack, 2))
-        finally:
-            lyr.commitChanges()
-            lyr.triggerRepaint()
+    def _update_cable(self, cable_layer_id, cable_fid):
+        self._update_cables({(cable_layer_id, cable_fid)})
 
+    def _label_totals(self, lyr: QgsVectorLayer):
         # Ensure labeling on total_len_m so the user sees the update
         try:
             s = QgsPalLayerSettings()
@@ -283,4 +122,4 @@ class ReserveHook(QObject):
             lyr.setLabeling(lbl)
             lyr.setLabelsEnabled(True)
         except Exception as e:
-            logger.debug(f"Error in ReserveHook._update_cable: {e}")
+            logger.debug(f"Error in ReserveHook._label_totals: {e}")
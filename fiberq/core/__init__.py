@@ -9,6 +9,10 @@ Modules:
 - config_manager.py: Configuration handling (Phase 1)
 - license_manager.py: Pro license management (Phase 1.2)
 - layer_manager.py: Layer creation and management (Phase 6)
+- layer_registry.py: FiberQ layers indexed by canonical name, geometry and role
+- cable_catalog.py: Cached cable features, attributes and lengths
+- element_index.py: Spatially indexed search for elements along cables
+- slack_totals.py: Running slack totals per cable
 - style_manager.py: Layer styling (Phase 7)
 - data_manager.py: Data persistence and management (Phase 8)
 - export_manager.py: Export functionality (Phase 8)
@@ -97,6 +101,36 @@ from .route_manager import (
     TRASA_LABEL_TO_CODE,
 )
 
+# Layer registry
+from .layer_registry import (
+    LayerRegistry,
+    get_layer_registry,
+    release_layer_registry,
+)
+
+# Cable catalogue
+from .cable_catalog import (
+    CableCatalog,
+    get_cable_catalog,
+    release_cable_catalog,
+)
+
+# Candidate elements along cables
+from .element_index import (
+    ElementIndex,
+    candidate_elements,
+    candidate_elements_for_cables,
+    clear_element_indexes,
+)
+
+# Running slack totals per cable
+from .slack_totals import (
+    SlackTotals,
+    get_slack_totals,
+    clear_slack_totals,
+    write_cable_totals,
+)
+
 # Phase 3.3: Cable Manager
 from .cable_manager import CableManager
 
@@ -188,6 +222,25 @@ __all__ = [
     'TRASA_TYPE_LABELS',
     'TRASA_LABEL_TO_CODE',
 
+    # Layer registry
+    'LayerRegistry',
+    'get_layer_registry',
+    'release_layer_registry',
+    # Cable catalogue
+    'CableCatalog',
+    'get_cable_catalog',
+    'release_cable_catalog',
+    # Candidate elements along cables
+    'ElementIndex',
+    'candidate_elements',
+    'candidate_elements_for_cables',
+    'clear_element_indexes',
+    # Running slack totals per cable
+    'SlackTotals',
+    'get_slack_totals',
+    'clear_slack_totals',
+    'write_cable_totals',
+
     # Cable Manager (Phase 3.3)
     'CableManager',
 
@@ -0,0 +1,418 @@
+"""Bill of materials, computed off the GUI thread.
+
+The BOM dialog used to walk every vector layer of the project -- DXF drawings
+and other foreign layers included -- fetching every feature with its geometry
+on the GUI thread, only to sum a length and a slack per layer.
+
+Here only FiberQ layers (those of the layer registry) are read, and each one
+is streamed once:
+
+* the length is the stored one (``duzina_m``, ``duzina``...) when the layer has
+  it: those features are fetched with ``NoGeometry`` and only the attributes
+  the BOM needs. Only features whose stored length is missing are fetched
+  again with their geometry, to be measured on the ellipsoid (through the
+  project's ground-length cache, so an unchanged cable is measured once);
+* every feature lands in one pass in a rollup keyed by category, layer and the
+  category's grouping fields (:data:`GROUP_FIELDS`: cable type, capacity and
+  segment type; pipe material and diameter; route type; element type), next
+  to the per-layer totals the "By Layers" table shows.
+
+:class:`BomTask` snapshots the layers on the main thread and runs
+:func:`build_bom` in the background. :func:`write_bom_csv` and
+:func:`write_bom_xlsx` write the result row by row (xlsxwriter in
+``constant_memory`` mode).
+"""
+import csv
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from qgis.core import (
+    QgsFeatureRequest,
+    QgsFields,
+    QgsTask,
+    QgsVectorLayerFeatureSource,
+    QgsWkbTypes,
+)
+from qgis.PyQt.QtCore import QCoreApplication, pyqtSignal
+
+from ..utils.logger import get_logger
+from ..utils.measure import distance_area, length_cache, measure_key
+from .layer_registry import (
+    ROLE_CABLE,
+    ROLE_ELEMENT,
+    ROLE_MANHOLE,
+    ROLE_PIPE,
+    ROLE_POLE,
+    ROLE_ROUTE,
+    get_layer_registry,
+)
+
+logger = get_logger(__name__)
+
+#: Stored length fields, in order of preference (lower case).
+LENGTH_FIELDS = ("duzina_m", "dužina_m", "duzina", "dužina", "length_m", "len_m")
+#: Stored slack fields, in order of preference (lower case).
+SLACK_FIELDS = ("slack_m", "slack", "slacks_m")
+
+#: Role -> the fields its features are grouped by (missing fields group as "").
+GROUP_FIELDS: Dict[str, Tuple[str, ...]] = {
+    ROLE_CABLE: ("tip", "kapacitet", "podtip"),
+    ROLE_PIPE: ("materijal", "fi", "kapacitet"),
+    ROLE_ROUTE: ("tip_trase",),
+    ROLE_ELEMENT: (),
+    ROLE_POLE: ("tip",),
+    ROLE_MANHOLE: ("tip",),
+}
+
+#: Features read between two progress reports / cancel checks.
+PROGRESS_EVERY = 1000
+
+LINE = "Line"
+POINT = "Point"
+
+
+@dataclass
+class BomRow:
+    """Count, length and slack of one rollup bucket."""
+
+    category: str
+    layer: str
+    #: Values of the category's GROUP_FIELDS (empty for a per-layer row)
+    key: Tuple[str, ...] = ()
+    kind: str = LINE
+    count: int = 0
+    length_m: float = 0.0
+    slack_m: float = 0.0
+
+    @property
+    def total_m(self) -> float:
+        return self.length_m + self.slack_m
+
+    def add(self, length: float, slack: float) -> None:
+        self.count += 1
+        self.length_m += length
+        self.slack_m += slack
+
+
+@dataclass
+class BomResult:
+    """Outcome of :func:`build_bom`."""
+
+    #: layer id -> its totals, in layer order
+    by_layer: Dict[str, BomRow] = field(default_factory=dict)
+    #: (category, layer, key) -> totals, in the order first seen
+    groups: Dict[tuple, BomRow] = field(default_factory=dict)
+    #: "<layer name>: <message>" for each layer that could not be read
+    errors: List[str] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.cancelled
+
+    @property
+    def totals(self) -> Dict[str, float]:
+        lines = [r for r in self.by_layer.values() if r.kind == LINE]
+        return {
+            "line_len": sum(r.length_m for r in lines),
+            "line_slack": sum(r.slack_m for r in lines),
+            "line_total": sum(r.total_m for r in lines),
+            "points": sum(r.count for r in self.by_layer.values() if r.kind == POINT),
+        }
+
+
+def _field_named(fields: QgsFields, candidates) -> Optional[str]:
+    names = {f.name().lower(): f.name() for f in fields}
+    return next((names[c] for c in candidates if c in names), None)
+
+
+def _text(value) -> str:
+    if value is None or (hasattr(value, "isNull") and value.isNull()):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _number(value) -> Optional[float]:
+    """A stored length as float; None if missing, negative or not a number."""
+    if value is None or (hasattr(value, "isNull") and value.isNull()):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number >= 0 else None
+
+
+class BomLayer:
+    """One layer as it was when the BOM started: what the worker reads."""
+
+    def __init__(self, layer, role: str, canonical: str, project=None):
+        self.layer_id = layer.id()
+        self.layer_name = layer.name()
+        self.role = role
+        self.canonical = canonical or layer.name()
+        gtype = layer.geometryType()
+        if gtype == QgsWkbTypes.GeometryType.LineGeometry:
+            self.kind = LINE
+        elif gtype == QgsWkbTypes.GeometryType.PointGeometry:
+            self.kind = POINT
+        else:
+            self.kind = None  # polygons are not counted
+        self.fields = QgsFields(layer.fields())
+        self.length_field = _field_named(self.fields, LENGTH_FIELDS) if self.kind == LINE else None
+        self.slack_field = _field_named(self.fields, SLACK_FIELDS) if self.kind == LINE else None
+        names = self.fields.names()
+        self.group_fields = tuple(GROUP_FIELDS.get(role, ()))
+        self.group_indexes = tuple(self.fields.indexFromName(n) if n in names else -1 for n in self.group_fields)
+        self.count = max(int(layer.featureCount()), 0)
+        # Configured here, on the main thread; the worker only measures with it
+        self.measurer = distance_area(layer.crs(), project) if self.kind == LINE else None
+        self.measure_key = measure_key(layer.crs(), project)
+        self.lengths = length_cache(project)
+        if self.kind == LINE:
+            self.lengths.watch(layer)
+        self.source = QgsVectorLayerFeatureSource(layer)
+
+
+def bom_layers(project=None, registry=None) -> List[BomLayer]:
+    """A :class:`BomLayer` for every FiberQ line or point layer (main thread)."""
+    registry = registry or get_layer_registry()
+    jobs = []
+    for layer in registry.layers():
+        try:
+            job = BomLayer(layer, registry.role(layer) or "", registry.canonical_name(layer), project)
+        except Exception as e:
+            logger.debug(f"Error in bom_layers: {e}")
+            continue
+        if job.kind is not None:
+            jobs.append(job)
+    return jobs
+
+
+def _key(attrs, job: BomLayer) -> Tuple[str, ...]:
+    return tuple(_text(attrs[i]) if i != -1 else "" for i in job.group_indexes)
+
+
+def _read_layer(job: BomLayer, result: BomResult, progress, is_cancelled) -> bool:
+    """Add ``job``'s features to ``result``; False if cancelled."""
+    layer_row = result.by_layer.setdefault(
+        job.layer_id, BomRow(job.role, job.layer_name, (), job.kind))
+    idx_len = job.fields.indexFromName(job.length_field) if job.length_field else -1
+    idx_slack = job.fields.indexFromName(job.slack_field) if job.slack_field else -1
+    wanted = sorted({i for i in (idx_len, idx_slack) + job.group_indexes if i != -1})
+
+    request = QgsFeatureRequest().setSubsetOfAttributes(wanted)
+    if job.kind == POINT or idx_len != -1:
+        request.setFlags(QgsFeatureRequest.Flag.NoGeometry)
+
+    def add(key, length, slack):
+        layer_row.add(length, slack)
+        bucket = result.groups.get((job.role, job.canonical, key))
+        if bucket is None:
+            bucket = result.groups[(job.role, job.canonical, key)] = BomRow(job.role, job.canonical, key, job.kind)
+        bucket.add(length, slack)
+
+    def measured(feat) -> float:
+        geom = feat.geometry()
+
+        def measure():
+            try:
+                return float(job.measurer.measureLength(geom))
+            except Exception:
+                return 0.0
+        if geom is None or geom.isEmpty():
+            return 0.0
+        # Unchanged cables measured by an earlier report come from the cache
+        return job.lengths.length(job.layer_id, feat.id(), geom, measure, job.measure_key)
+
+    unmeasured: Dict[int, Tuple[Tuple[str, ...], float]] = {}
+    done = 0
+    for feat in job.source.getFeatures(request):
+        attrs = feat.attributes()
+        key = _key(attrs, job)
+        if job.kind == POINT:
+            add(key, 0.0, 0.0)
+        else:
+            slack = (_number(attrs[idx_slack]) or 0.0) if idx_slack != -1 else 0.0
+            if idx_len == -1:
+                add(key, measured(feat), slack)
+            else:
+                length = _number(attrs[idx_len])
+                if length is None:
+                    unmeasured[int(feat.id())] = (key, slack)
+                else:
+                    add(key, length, slack)
+        done += 1
+        if done % PROGRESS_EVERY == 0:
+            if is_cancelled is not None and is_cancelled():
+                return False
+            if progress is not None:
+                progress(job.layer_id, 100.0 * done / max(job.count, done, 1))
+
+    if unmeasured:
+        # Only the features without a stored length need their geometry
+        request = QgsFeatureRequest().setFilterFids(sorted(unmeasured)).setNoAttributes()
+        for feat in job.source.getFeatures(request):
+            key, slack = unmeasured.pop(int(feat.id()))
+            add(key, measured(feat), slack)
+            if is_cancelled is not None and is_cancelled():
+                return False
+    if progress is not None:
+        progress(job.layer_id, 100.0)
+    return True
+
+
+def build_bom(jobs: List[BomLayer],
+              progress: Optional[Callable[[str, float], None]] = None,
+              is_cancelled: Optional[Callable[[], bool]] = None) -> BomResult:
+    """
+    Roll ``jobs`` up into a :class:`BomResult`, one pass per layer.
+
+    Args:
+        jobs: Layer snapshots (:func:`bom_layers`)
+        progress: Called with (layer id, percent read)
+        is_cancelled: Polled between batches of features
+
+    Returns:
+        The rollup; ``cancelled`` set (and the rollup partial) if stopped.
+    """
+    result = BomResult()
+    for job in jobs:
+        if is_cancelled is not None and is_cancelled():
+            result.cancelled = True
+            return result
+        try:
+            if not _read_layer(job, result, progress, is_cancelled):
+                result.cancelled = True
+                return result
+        except Exception as e:
+            logger.warning(f"BOM: could not read {job.layer_name}: {e}")
+            result.errors.append(f"{job.layer_name}: {e}")
+    return result
+
+
+# -- writers -------------------------------------------------------------------
+
+LAYER_HEADERS = ["Layer", "Type", "Number", "Length_m", "Slack_m", "Total_m"]
+GROUP_HEADERS = ["Category", "Layer", "Type", "Number", "Length_m", "Slack_m", "Total_m"]
+
+
+def layer_rows(result: BomResult) -> Iterator[list]:
+    """The "By Layers" rows: name, kind, count, then length/slack/total
+    (empty for point layers)."""
+    for row in result.by_layer.values():
+        if row.kind == LINE:
+            yield [row.layer, row.kind, row.count, row.length_m, row.slack_m, row.total_m]
+        else:
+            yield [row.layer, row.kind, row.count, "", "", ""]
+
+
+def group_rows(result: BomResult) -> Iterator[list]:
+    """The rollup rows: category, layer, type ("/"-joined group values),
+    count, then length/slack/total (empty for points), sorted."""
+    for (category, layer, key), row in sorted(result.groups.items(), key=lambda kv: kv[0]):
+        label = " / ".join(v or "-" for v in key)
+        if row.kind == LINE:
+            yield [category, layer, label, row.count, row.length_m, row.slack_m, row.total_m]
+        else:
+            yield [category, layer, label, row.count, "", "", ""]
+
+
+def write_bom_csv(path: str, result: BomResult) -> None:
+    """Write the per-layer table, the totals and the rollup to ``path``."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, delimiter=";")
+        w.writerow(LAYER_HEADERS)
+        w.writerows(layer_rows(result))
+        # add a blank and totals
+        w.writerow([])
+        t = result.totals
+        w.writerow(["TOTAL", "", t["points"], t["line_len"], t["line_slack"], t["line_total"]])
+        w.writerow([])
+        w.writerow(GROUP_HEADERS)
+        w.writerows(group_rows(result))
+
+
+def write_bom_xlsx(path: str, result: BomResult) -> None:
+    """Write "By layers", "By type" and "Total" sheets to ``path``.
+
+    Needs ``xlsxwriter``; rows are flushed as they are written.
+    """
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+    try:
+        for name, headers, rows in (("By layers", LAYER_HEADERS, layer_rows(result)),
+                                    ("By type", GROUP_HEADERS, group_rows(result))):
+            ws = wb.add_worksheet(name)
+            ws.write_row(0, 0, headers)
+            for r, row in enumerate(rows, start=1):
+                ws.write_row(r, 0, row)
+        # totals sheet
+        ws = wb.add_worksheet("Total")
+        t = result.totals
+        for r, (label, value) in enumerate([
+            ("Total length of lines [m]", t["line_len"]),
+            ("Total slack [m]", t["line_slack"]),
+            ("Line + slack [m]", t["line_total"]),
+            ("Total number of point elements", t["points"]),
+        ]):
+            ws.write_row(r, 0, [label, value])
+    finally:
+        wb.close()
+
+
+class BomTask(QgsTask):
+    """Build the project's BOM off the GUI thread."""
+
+    #: The run is over: the BomResult.
+    resultReady = pyqtSignal(object)
+
+    def __init__(self, project=None, registry=None):
+        super().__init__(QCoreApplication.translate('BomTask', 'FiberQ BOM'))
+        # Snapshot here, on the main thread: run() must not touch a live layer
+        self.jobs = bom_layers(project, registry)
+        self._total = sum(max(job.count, 1) for job in self.jobs) or 1
+        self._done_before: Dict[str, int] = {}
+        acc = 0
+        for job in self.jobs:
+            self._done_before[job.layer_id] = acc
+            acc += max(job.count, 1)
+        self._result = None
+
+    def _progress(self, layer_id: str, percent: float) -> None:
+        job = next((j for j in self.jobs if j.layer_id == layer_id), None)
+        if job is not None:
+            done = self._done_before[layer_id] + max(job.count, 1) * percent / 100.0
+            self.setProgress(100.0 * done / self._total)
+
+    def run(self):
+        try:
+            self._result = build_bom(self.jobs, self._progress, self.isCanceled)
+        except Exception as e:
+            logger.warning(f"BOM task failed: {e}")
+            self._result = BomResult(errors=[str(e)])
+            return False
+        return not self._result.cancelled
+
+    def finished(self, ok):
+        result = self._result or BomResult(errors=["BOM did not run"])
+        result.cancelled = result.cancelled or self.isCanceled()
+        self.resultReady.emit(result)
+
+
+__all__ = [
+    'BomLayer',
+    'BomResult',
+    'BomRow',
+    'BomTask',
+    'GROUP_FIELDS',
+    'bom_layers',
+    'build_bom',
+    'group_rows',
+    'layer_rows',
+    'write_bom_csv',
+    'write_bom_xlsx',
+]
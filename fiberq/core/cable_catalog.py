@@ -0,0 +1,362 @@
+"""FiberQ cable catalogue.
+
+The schematic, relations and latent-elements dialogs and ``list_all_cables``
+each rebuilt every cable's attribute dict from a full layer scan when they
+opened, and the schematic then found each cable's feature again by iterating
+the layer until the fid matched. The catalogue reads a line layer once and
+keeps, per feature:
+
+* the feature and its attributes, reachable by ``(layer_id, fid)`` and by
+  ``fiberq_uuid``;
+* its ground length and its vertices in the project CRS, worked out on first
+  use.
+
+Edits invalidate only what they touch: an attribute, geometry or added feature
+marks that fid stale, and the stale fids are re-read together with one
+:meth:`QgsFeatureRequest.setFilterFids` request on the next lookup. A commit or
+rollback renumbers features, so it drops the whole layer; a CRS change drops
+the cached vertices.
+
+Cable layers come from the layer registry (:data:`~.layer_registry.ROLE_CABLE`);
+any other line layer -- the schematic's pipes -- is read on first lookup.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .layer_registry import ROLE_CABLE, get_layer_registry
+from ..utils.logger import get_logger
+from ..utils.measure import ground_length
+
+logger = get_logger(__name__)
+
+UUID_FIELD = "fiberq_uuid"
+
+
+@dataclass
+class CableRecord:
+    """One cached line feature."""
+
+    layer_id: str
+    layer_name: str
+    fid: int
+    feature: object
+    attributes: Dict[str, object]
+    uuid: str = ""
+    _length: Optional[float] = field(default=None, repr=False)
+    _coords: Optional[List[Tuple[float, float]]] = field(default=None, repr=False)
+
+    def get(self, key, default=None):
+        """The attribute ``key``, or ``default`` if the layer has no such field."""
+        return self.attributes.get(key, default)
+
+
+class _LayerEntry:
+    """The records of one layer, and what is stale about them."""
+
+    def __init__(self, layer):
+        self.layer = layer
+        self.records: Dict[int, CableRecord] = {}
+        self.by_uuid: Dict[str, int] = {}
+        self.dirty: Set[int] = set()
+        self.connections: list = []
+
+
+def _plain(value):
+    """NULL QVariants as None, everything else as is."""
+    try:
+        if value is None or (hasattr(value, "isNull") and value.isNull()):
+            return None
+    except Exception:
+        return value
+    return value
+
+
+class CableCatalog:
+    """Cached line features of one project, invalidated by layer signals.
+
+    Build one with :func:`get_cable_catalog` for the current project; a
+    catalogue over another project is built directly and must be
+    :meth:`detach`\\ ed when done.
+    """
+
+    def __init__(self, project, registry=None):
+        self.project = project
+        self.registry = registry
+        self._entries: Dict[str, _LayerEntry] = {}
+        self._transforms: Dict[str, object] = {}
+        self._connections = [
+            (project.layersWillBeRemoved, self._on_layers_removed),
+            (project.cleared, self.invalidate),
+            (project.crsChanged, self._on_crs_changed),
+        ]
+        for signal, slot in self._connections:
+            try:
+                signal.connect(slot)
+            except Exception as e:
+                logger.debug(f"Error in CableCatalog.__init__: {e}")
+
+    # -- lookups -----------------------------------------------------------
+
+    def records(self, *roles: str, geometry=None) -> List[CableRecord]:
+        """Every record of the registry's layers with ``roles`` (cables by
+        default) and, if given, ``geometry`` type, in layer order and then fid
+        order."""
+        registry = self.registry or get_layer_registry()
+        out = []
+        for layer in registry.by_role(*(roles or (ROLE_CABLE,)), geometry=geometry):
+            entry = self._entry(layer)
+            if entry is not None:
+                out.extend(entry.records[fid] for fid in sorted(entry.records))
+        return out
+
+    def record(self, layer_id: str, fid) -> Optional[CableRecord]:
+        """The record of feature ``fid`` of layer ``layer_id``, or None."""
+        layer = self.project.mapLayer(layer_id)
+        if layer is None:
+            return None
+        entry = self._entry(layer)
+        if entry is None:
+            return None
+        try:
+            return entry.records.get(int(fid))
+        except (TypeError, ValueError):
+            return None
+
+    def layer_records(self, layer) -> List[CableRecord]:
+        """Every record of ``layer`` (any line layer), in fid order."""
+        entry = self._entry(layer)
+        if entry is None:
+            return []
+        return [entry.records[fid] for fid in sorted(entry.records)]
+
+    def by_uuid(self, uuid: str) -> Optional[CableRecord]:
+        """The cable record whose ``fiberq_uuid`` is ``uuid``, or None."""
+        if not uuid:
+            return None
+        self.records()  # make sure every cable layer is loaded and fresh
+        for entry in self._entries.values():
+            fid = entry.by_uuid.get(uuid)
+            if fid is not None:
+                return entry.records.get(fid)
+        return None
+
+    def length(self, record: CableRecord) -> float:
+        """Ground length of ``record`` in metres."""
+        if record._length is None:
+            try:
+                layer = self.project.mapLayer(record.layer_id)
+                record._length = ground_length(record.feature.geometry(), layer, project=self.project,
+                                               fid=record.fid)
+            except Exception as e:
+                logger.debug(f"Error in CableCatalog.length: {e}")
+                record._length = 0.0
+        return record._length
+
+    def coords(self, record: CableRecord) -> List[Tuple[float, float]]:
+        """Vertices of ``record`` in the project CRS (all parts, in order)."""
+        if record._coords is None:
+            record._coords = self._project_coords(record)
+        return record._coords
+
+    def fetch(self, layer, fids: Iterable[int]) -> Dict[int, object]:
+        """Features ``fids`` of ``layer`` with one request, keyed by fid."""
+        from qgis.core import QgsFeatureRequest
+
+        wanted = sorted({int(fid) for fid in fids})
+        if not wanted:
+            return {}
+        request = QgsFeatureRequest().setFilterFids(wanted)
+        return {int(feat.id()): feat for feat in layer.getFeatures(request)}
+
+    # -- upkeep ------------------------------------------------------------
+
+    def invalidate(self, layer_id: Optional[str] = None) -> None:
+        """Forget ``layer_id`` (every layer when None); it is re-read on use."""
+        ids = list(self._entries) if layer_id is None else [layer_id]
+        for lid in ids:
+            entry = self._entries.pop(lid, None)
+            if entry is not None:
+                self._disconnect(entry)
+            self._transforms.pop(lid, None)
+
+    def mark_stale(self, layer_id: str, fids: Iterable[int]) -> None:
+        """Re-read ``fids`` of ``layer_id`` on next use (they were written
+        through the provider, which emits no layer signal)."""
+        entry = self._entries.get(layer_id)
+        if entry is not None:
+            entry.dirty.update(int(fid) for fid in fids)
+
+    def detach(self) -> None:
+        """Stop following the project (the plugin unloads)."""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in CableCatalog.detach: {e}")
+        self._connections = []
+        self.invalidate()
+
+    def _entry(self, layer) -> Optional[_LayerEntry]:
+        from qgis.core import QgsVectorLayer
+
+        if not isinstance(layer, QgsVectorLayer):
+            return None
+        entry = self._entries.get(layer.id())
+        if entry is None:
+            entry = self._load(layer)
+        elif entry.dirty:
+            self._refresh(entry)
+        return entry
+
+    def _load(self, layer) -> _LayerEntry:
+        entry = _LayerEntry(layer)
+        try:
+            for feat in layer.getFeatures():
+                self._put(entry, feat)
+        except Exception as e:
+            logger.debug(f"Error in CableCatalog._load: {e}")
+        self._entries[layer.id()] = entry
+        self._watch(entry)
+        return entry
+
+    def _refresh(self, entry: _LayerEntry) -> None:
+        stale, entry.dirty = entry.dirty, set()
+        try:
+            fresh = self.fetch(entry.layer, stale)
+        except Exception as e:
+            logger.debug(f"Error in CableCatalog._refresh: {e}")
+            self.invalidate(entry.layer.id())
+            return
+        for fid in stale:
+            self._drop(entry, fid)
+        for feat in fresh.values():
+            self._put(entry, feat)
+
+    def _put(self, entry: _LayerEntry, feat) -> None:
+        layer = entry.layer
+        names = layer.fields().names()
+        attrs = {name: _plain(value) for name, value in zip(names, feat.attributes())}
+        uuid = str(attrs.get(UUID_FIELD) or "")
+        fid = int(feat.id())
+        entry.records[fid] = CableRecord(layer.id(), layer.name(), fid, feat, attrs, uuid)
+        if uuid:
+            entry.by_uuid[uuid] = fid
+
+    @staticmethod
+    def _drop(entry: _LayerEntry, fid: int) -> None:
+        old = entry.records.pop(fid, None)
+        if old is not None and old.uuid and entry.by_uuid.get(old.uuid) == fid:
+            del entry.by_uuid[old.uuid]
+
+    def _project_coords(self, record: CableRecord) -> List[Tuple[float, float]]:
+        geom = record.feature.geometry()
+        if geom is None or geom.isEmpty():
+            return []
+        xform = self._transform(record.layer_id)
+        try:
+            if xform is not None:
+                # One call for every vertex, not one per point
+                geom.transform(xform)
+            parts = geom.asMultiPolyline() if geom.isMultipart() else [geom.asPolyline()]
+            return [(pt.x(), pt.y()) for part in parts for pt in part]
+        except Exception as e:
+            logger.debug(f"Error in CableCatalog.coords: {e}")
+            return []
+
+    def _transform(self, layer_id: str):
+        if layer_id not in self._transforms:
+            from qgis.core import QgsCoordinateTransform
+
+            xform = None
+            try:
+                layer = self.project.mapLayer(layer_id)
+                if layer is not None and layer.crs() != self.project.crs():
+                    xform = QgsCoordinateTransform(layer.crs(), self.project.crs(), self.project)
+            except Exception as e:
+                logger.debug(f"Error in CableCatalog._transform: {e}")
+            self._transforms[layer_id] = xform
+        return self._transforms[layer_id]
+
+    def _watch(self, entry: _LayerEntry) -> None:
+        layer = entry.layer
+        lid = layer.id()
+
+        def stale(fid, *args):
+            entry.dirty.add(int(fid))
+
+        def deleted(fids):
+            for fid in fids:
+                self._drop(entry, int(fid))
+                entry.dirty.discard(int(fid))
+
+        def renumbered(*args):
+            self.invalidate(lid)
+
+        wiring = [
+            (layer.attributeValueChanged, stale),
+            (layer.geometryChanged, stale),
+            (layer.featureAdded, stale),
+            (layer.featuresDeleted, deleted),
+            (layer.afterCommitChanges, renumbered),
+            (layer.afterRollBack, renumbered),
+            (layer.dataSourceChanged, renumbered),
+            (layer.nameChanged, renumbered),
+            (layer.crsChanged, renumbered),
+        ]
+        for signal, slot in wiring:
+            try:
+                signal.connect(slot)
+                entry.connections.append((signal, slot))
+            except Exception as e:
+                logger.debug(f"Error in CableCatalog._watch: {e}")
+
+    @staticmethod
+    def _disconnect(entry: _LayerEntry) -> None:
+        for signal, slot in entry.connections:
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in CableCatalog._disconnect: {e}")
+        entry.connections = []
+
+    def _on_layers_removed(self, layer_ids) -> None:
+        for lid in layer_ids:
+            if not isinstance(lid, str):  # the QList<QgsMapLayer*> overload
+                lid = lid.id()
+            self.invalidate(lid)
+
+    def _on_crs_changed(self) -> None:
+        self._transforms = {}
+        for entry in self._entries.values():
+            for record in entry.records.values():
+                record._coords = None
+                record._length = None
+
+
+# Catalogue of QgsProject.instance(), built on first use
+_catalog: Optional[CableCatalog] = None
+
+
+def get_cable_catalog() -> CableCatalog:
+    """The :class:`CableCatalog` of the current project."""
+    global _catalog
+    if _catalog is None:
+        from qgis.core import QgsProject
+        _catalog = CableCatalog(QgsProject.instance())
+    return _catalog
+
+
+def release_cable_catalog() -> None:
+    """Detach and drop the current project's catalogue (the plugin unloads)."""
+    global _catalog
+    if _catalog is not None:
+        _catalog.detach()
+        _catalog = None
+
+
+__all__ = [
+    'CableCatalog',
+    'CableRecord',
+    'get_cable_catalog',
+    'release_cable_catalog',
+]
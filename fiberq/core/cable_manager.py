@@ -10,7 +10,7 @@ This module provides cable management functionality:
 Phase 5.2: Added logging infrastructure
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from qgis.PyQt.QtCore import QVariant, Qt
 from qgis.PyQt.QtWidgets import QMessageBox, QDialog
@@ -21,8 +21,11 @@ from qgis.core import (
     QgsVectorLayer,
     QgsField,
     QgsFeature,
+    QgsFeatureRequest,
     QgsGeometry,
     QgsPointXY,
+    QgsRectangle,
+    QgsVectorDataProvider,
     QgsWkbTypes,
     QgsSymbol,
     QgsSimpleLineSymbolLayer,
@@ -37,8 +40,12 @@ from qgis.core import (
     QgsSymbolLayer,
 )
 
+from .cable_catalog import get_cable_catalog
+from .layer_registry import ROLE_CABLE, ROLE_ELEMENT, ROLE_MANHOLE, ROLE_POLE, get_layer_registry
+
 # Phase 5.2: Logging
 from ..utils.logger import get_logger
+from ..utils.geometry import VertexIndex
 from ..utils.measure import ground_length
 logger = get_logger(__name__)
 
@@ -46,6 +53,46 @@ logger = get_logger(__name__)
 from ..utils.uuid_utils import FIBERQ_UUID_FIELD, generate_uuid  # noqa: E402
 
 
+def _cable_ends(geom) -> Optional[Tuple[QgsPointXY, QgsPointXY]]:
+    """First and last vertex of a cable (first part of a multi-line)."""
+    if geom is None or geom.isEmpty():
+        return None
+    try:
+        if geom.isMultipart():
+            line = geom.asMultiPolyline()[0]
+        else:
+            line = geom.asPolyline()
+    except Exception as e:
+        logger.debug(f"Skipping feature; could not read cable geometry: {e}")
+        return None
+    if len(line) < 2:
+        return None
+    return QgsPointXY(line[0]), QgsPointXY(line[-1])
+
+
+def _branch_key(nodes: VertexIndex, p1: QgsPointXY, p2: QgsPointXY):
+    """Direction-independent key of a cable's endpoint pair."""
+    k1 = nodes.snap(p1)
+    k2 = nodes.snap(p2)
+    return (k1, k2) if k1 <= k2 else (k2, k1)
+
+
+def _branch_index_values(groups) -> Dict[int, int]:
+    """branch_index per fid: 0 for a lone cable, else symmetric around zero."""
+    values = {}
+    for ids in groups.values():
+        ids_sorted = sorted(ids)
+        n = len(ids_sorted)
+        for i, fid in enumerate(ids_sorted):
+            values[fid] = int(i * 2 - (n - 1))
+    return values
+
+
+#: Endpoint grouping tolerance of 'Branch cables (offset)', also used when
+#: newly laid cables are slotted into their groups.
+BRANCH_TOL_M = 1.3
+
+
 class CableManager:
     """Manager for cable operations."""
 
@@ -217,14 +264,7 @@ class CableManager:
         base_width = 0.8
         base_unit = QgsUnitTypes.RenderUnit.RenderMetersInMapUnits
         try:
-            route_layer = next(
-                (
-                    lyr for lyr in QgsProject.instance().mapLayers().values()
-                    if lyr.name().lower().strip() in ("trasa", "route")
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                ),
-                None
-            )
+            route_layer = get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
             if route_layer and route_layer.renderer() and route_layer.renderer().symbol():
                 sl = route_layer.renderer().symbol().symbolLayer(0)
                 if hasattr(sl, "width"):
@@ -332,6 +372,9 @@ class CableManager:
         """
         Assign branch_index for cables with same endpoints (direction-independent).
 
+        Only values that differ from the stored ones are written, in one bulk
+        provider call; an unchanged layer is not touched at all.
+
         Args:
             layer: Cable layer
             tol_m: Tolerance for grouping in meters
@@ -342,75 +385,111 @@ class CableManager:
         if layer is None or layer.geometryType() != QgsWkbTypes.GeometryType.LineGeometry:
             return 0, 0
 
-        tol_units = float(tol_m)
-
-        def round_key(pt):
-            return (int(round(pt.x() / tol_units)),
-                    int(round(pt.y() / tol_units)))
-
-        groups = {}  # key = ((x1,y1),(x2,y2)), value = [fid,...]
-
-        for f in layer.getFeatures():
-            g = f.geometry()
-            if g is None or g.isEmpty():
-                continue
-
-            try:
-                if g.isMultipart():
-                    line = g.asMultiPolyline()[0]
-                else:
-                    line = g.asPolyline()
-            except Exception as e:
-                logger.debug(f"Skipping feature; could not read cable geometry: {e}")
-                continue
-
-            if len(line) < 2:
-                continue
-
-            p1 = line[0]
-            p2 = line[-1]
-            k1 = round_key(p1)
-            k2 = round_key(p2)
-            # Direction-independent key
-            key = (k1, k2) if k1 <= k2 else (k2, k1)
-            groups.setdefault(key, []).append(f.id())
-
-        if not groups:
-            return 0, 0
-
-        # Write branch_index values
         self.ensure_branch_index_field(layer)
         idx = layer.fields().indexFromName("branch_index")
         if idx == -1:
             return 0, 0
 
-        layer.startEditing()
-        updated = 0
+        # Endpoints within tol_m of each other are the same node
+        nodes = VertexIndex(float(tol_m))
+        request = QgsFeatureRequest().setSubsetOfAttributes([idx])
+        groups, current = self._branch_groups(layer.getFeatures(request), idx, nodes)
+        if not groups:
+            return 0, 0
 
-        for key, ids in groups.items():
-            ids_sorted = sorted(ids)
-            n = len(ids_sorted)
+        updated = self._write_branch_indices(layer, idx, _branch_index_values(groups), current)
+        return len(groups), updated
 
-            if n == 1:
-                # Single cable between these nodes - no offset
-                try:
-                    layer.changeAttributeValue(ids_sorted[0], idx, 0)
-                    updated += 1
-                except Exception as e:
-                    logger.debug(f"Error in CableManager.round_key: {e}")
-                continue
+    def update_branch_indices_near(self, layer: QgsVectorLayer, geoms: List[QgsGeometry],
+                                   tol_m: float = BRANCH_TOL_M) -> int:
+        """
+        Re-assign branch_index only in the endpoint groups of ``geoms``.
 
-            # n >= 2 - assign symmetric values around zero
-            for i, fid in enumerate(ids_sorted):
-                pos = i * 2 - (n - 1)
-                try:
-                    layer.changeAttributeValue(fid, idx, int(pos))
-                    updated += 1
-                except Exception as e:
-                    logger.debug(f"Error in CableManager.round_key: {e}")
+        Called after cables are laid: only the cables sharing both endpoints
+        with a new one can change, and they all have an endpoint near the new
+        cable's start. Layers that were never branched are left alone.
 
-        layer.commitChanges()
-        return len(groups), updated
+        Returns:
+            Number of cables whose branch_index changed
+        """
+        if layer is None:
+            return 0
+        idx = layer.fields().indexFromName("branch_index")
+        if idx == -1:
+            return 0
+
+        nodes = VertexIndex(float(tol_m))
+        wanted = set()
+        starts = {}
+        for geom in geoms:
+            ends = _cable_ends(geom)
+            if ends is None:
+                continue
+            wanted.add(_branch_key(nodes, *ends))
+            starts.setdefault(nodes.snap(ends[0]), ends[0])
+        if not wanted:
+            return 0
+
+        near = {}
+        for pt in starts.values():
+            rect = QgsRectangle(pt, pt)
+            rect.grow(float(tol_m))
+            request = QgsFeatureRequest().setFilterRect(rect).setSubsetOfAttributes([idx])
+            for feat in layer.getFeatures(request):
+                near[int(feat.id())] = feat
+        groups, current = self._branch_groups(near.values(), idx, nodes, wanted)
+        return self._write_branch_indices(layer, idx, _branch_index_values(groups), current)
+
+    @staticmethod
+    def _branch_groups(feats, idx: int, nodes: VertexIndex, wanted=None):
+        """Group cables by their endpoint pair (restricted to ``wanted`` keys),
+        with the branch_index each one holds now."""
+        groups = {}  # key = ((x1,y1),(x2,y2)), value = [fid,...]
+        current = {}
+        for f in feats:
+            ends = _cable_ends(f.geometry())
+            if ends is None:
+                continue
+            key = _branch_key(nodes, *ends)
+            if wanted is not None and key not in wanted:
+                continue
+            groups.setdefault(key, []).append(f.id())
+            value = f.attribute(idx)
+            try:
+                current[f.id()] = int(value)
+            except (TypeError, ValueError):
+                current[f.id()] = None
+        return groups, current
+
+    @staticmethod
+    def _write_branch_indices(layer: QgsVectorLayer, idx: int, values: Dict[int, int],
+                              current: Dict[int, Any]) -> int:
+        """Write the ``values`` that differ from ``current``; returns how many."""
+        changes = {fid: {idx: value} for fid, value in values.items() if current.get(fid) != value}
+        if not changes:
+            return 0
+
+        provider = layer.dataProvider()
+        if layer.isEditable() or not (provider.capabilities() & QgsVectorDataProvider.Capability.ChangeAttributeValues):
+            # Into the user's (or a short) edit session
+            was_editing = layer.isEditable()
+            if not was_editing:
+                layer.startEditing()
+            for fid, attrs in changes.items():
+                layer.changeAttributeValues(fid, attrs)
+            if not was_editing:
+                layer.commitChanges()
+        else:
+            if not provider.changeAttributeValues(changes):
+                logger.debug("Error in CableManager._write_branch_indices: provider refused the update")
+                return 0
+            # A provider write emits no layer signal: announce each change the
+            # way an edit would, so every cache following the layer (cable
+            # catalog, schematic, incremental validation) re-reads it
+            for fid, attrs in changes.items():
+                layer.attributeValueChanged.emit(fid, idx, attrs[idx])
+        layer.triggerRepaint()
+        return len(changes)
 
     def apply_branch_offset_style(self, layer: QgsVectorLayer, offset_mm: float = 2.0) -> None:
         """Apply data-defined offset based on branch_index."""
@@ -500,7 +579,7 @@ class CableManager:
                 logger.debug(f"Error in CableManager.branch_cables_offset: {e}")
             return
 
-        groups, updated = self.compute_branch_indices_for_layer(layer, tol_m=1.3)
+        groups, updated = self.compute_branch_indices_for_layer(layer, tol_m=BRANCH_TOL_M)
         self.apply_branch_offset_style(layer, offset_mm=2.0)
 
         try:
@@ -532,68 +611,48 @@ class CableManager:
                 logger.debug(f"Error in CableManager.list_all_cables: {e}")
 
         # Fallback: inline implementation
-        items = []
-        candidate_names = {
-            "Kablovi_podzemni",
-            "Kablovi_vazdusni",
-            "Underground cables",
-            "Aerial cables",
+        podtip_labels = {
+            "glavni": "Backbone",
+            "distributivni": "Distribution",
+            "razvodni": "Drop",
+            "Backbone": "Backbone",
+            "Distribution": "Distribution",
+            "Drop": "Drop",
         }
-
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (
-                    not isinstance(lyr, QgsVectorLayer)
-                    or lyr.geometryType() != QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                    or lyr.name() not in candidate_names  # noqa: W503
-                ):
-                    continue
-            except Exception as e:
-                logger.debug(f"Skipping layer; could not check cable layer type: {e}")
-                continue
-
-            fields = lyr.fields()
-            for feat in lyr.getFeatures():
-                attrs = {fld.name(): feat[fld.name()] for fld in fields}
-                tip = attrs.get("tip") or ""
-                podtip_code = attrs.get("podtip") or ""
-                kap = attrs.get("kapacitet") or ""
-                cc = attrs.get("color_code") or ""
-                od = attrs.get("od") or ""
-                do = attrs.get("do") or ""
-
-                podtip_labels = {
-                    "glavni": "Backbone",
-                    "distributivni": "Distribution",
-                    "razvodni": "Drop",
-                    "Backbone": "Backbone",
-                    "Distribution": "Distribution",
-                    "Drop": "Drop",
-                }
-                podtip_label = podtip_labels.get(str(podtip_code), str(podtip_code))
-
-                opis_parts = []
-                if tip:
-                    opis_parts.append(str(tip))
-                if podtip_label:
-                    opis_parts.append(str(podtip_label))
-                if kap:
-                    opis_parts.append(str(kap))
-
-                opis = " ".join(opis_parts) if opis_parts else f"FID {int(feat.id())}"
-
-                items.append({
-                    "layer_id": lyr.id(),
-                    "layer_name": lyr.name(),
-                    "fid": int(feat.id()),
-                    "opis": opis,
-                    "tip": tip,
-                    "podtip": podtip_code,
-                    "kapacitet": kap,
-                    "color_code": cc,
-                    "od": od,
-                    "do": do,
-                })
+        items = []
+        for rec in get_cable_catalog().records(ROLE_CABLE, geometry=QgsWkbTypes.GeometryType.LineGeometry):
+            attrs = rec.attributes
+            tip = attrs.get("tip") or ""
+            podtip_code = attrs.get("podtip") or ""
+            kap = attrs.get("kapacitet") or ""
+            cc = attrs.get("color_code") or ""
+            od = attrs.get("od") or ""
+            do = attrs.get("do") or ""
+
+            podtip_label = podtip_labels.get(str(podtip_code), str(podtip_code))
+
+            opis_parts = []
+            if tip:
+                opis_parts.append(str(tip))
+            if podtip_label:
+                opis_parts.append(str(podtip_label))
+            if kap:
+                opis_parts.append(str(kap))
+
+            opis = " ".join(opis_parts) if opis_parts else f"FID {rec.fid}"
+
+            items.append({
+                "layer_id": rec.layer_id,
+                "layer_name": rec.layer_name,
+                "fid": rec.fid,
+                "opis": opis,
+                "tip": tip,
+                "podtip": podtip_code,
+                "kapacitet": kap,
+                "color_code": cc,
+                "od": od,
+                "do": do,
+            })
 
         return items
 
@@ -601,48 +660,99 @@ class CableManager:
     # Cable laying
     # -------------------------------------------------------------------------
 
+    #: Attribute schema of a cable layer created by lay_cable.
+    CABLE_FIELDS = {
+        "tip": QVariant.String,
+        "podtip": QVariant.String,
+        "color_code": QVariant.String,
+        "broj_cevcica": QVariant.Int,
+        "broj_vlakana": QVariant.Int,
+        "tip_kabla": QVariant.String,
+        "vrsta_vlakana": QVariant.String,
+        "vrsta_omotaca": QVariant.String,
+        "vrsta_armature": QVariant.String,
+        "talasno_podrucje": QVariant.String,
+        "naziv": QVariant.String,
+        "slabljenje_dbkm": QVariant.Double,
+        "hrom_disp_ps_nmxkm": QVariant.Double,
+        "stanje_kabla": QVariant.String,
+        "cable_laying": QVariant.String,
+        "vrsta_mreze": QVariant.String,
+        "godina_ugradnje": QVariant.Int,
+        "konstr_vlakna_u_cevcicama": QVariant.Int,
+        "konstr_sa_uzlepljenim_elementom": QVariant.Int,
+        "konstr_punjeni_kabl": QVariant.Int,
+        "konstr_sa_arm_vlaknima": QVariant.Int,
+        "konstr_bez_metalnih": QVariant.Int,
+        "od": QVariant.String,
+        "do": QVariant.String,
+        "duzina_m": QVariant.Double,
+        "slack_m": QVariant.Double,
+        "total_len_m": QVariant.Double,
+        FIBERQ_UUID_FIELD: QVariant.String,
+        # Phase 0.3: Fiber schema for FiberQ Designer
+        "fibers_per_tube": QVariant.Int,
+        "total_fibers": QVariant.Int,
+        "color_standard": QVariant.String,
+    }
+
+    #: Dialog values copied 1:1 onto a new cable feature.
+    CABLE_DIALOG_ATTRIBUTES = (
+        "tip", "podtip", "color_code", "broj_cevcica", "broj_vlakana", "tip_kabla",
+        "vrsta_vlakana", "vrsta_omotaca", "vrsta_armature", "talasno_podrucje", "naziv",
+        "slabljenje_dbkm", "hrom_disp_ps_nmxkm", "stanje_kabla", "cable_laying",
+        "vrsta_mreze", "godina_ugradnje", "konstr_vlakna_u_cevcicama",
+        "konstr_sa_uzlepljenim_elementom", "konstr_punjeni_kabl",
+        "konstr_sa_arm_vlaknima", "konstr_bez_metalnih",
+    )
+
     def lay_cable_type(self, tip: str, podtip: str) -> None:
         """Set cable type and subtype, then lay cable."""
         self.selected_cable_type = tip
         self.selected_cable_subtype = podtip
         self.lay_cable()
 
-    def lay_cable(self, color_codes_callback=None, path_callback=None) -> None:
-        """
-        Lay a cable along a route between two selected elements.
-
-        Args:
-            color_codes_callback: Optional callable returning list of color codes
-            path_callback: Optional callable (route_layer, pt1, pt2, tol) returning path points
-        """
-        from ..dialogs.cable_dialog import CablePickerDialog
-        from ..models.element_defs import NASTAVAK_DEF, ELEMENT_DEFS
+    def _element_layers(self) -> List[QgsVectorLayer]:
+        """All element layers (+ Poles + Manholes) in the project: the point
+        layers a cable may start or end on."""
+        return get_layer_registry().by_role(
+            ROLE_ELEMENT, ROLE_POLE, ROLE_MANHOLE, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
-        # Collect selections from all element layers (+ Poles + Manholes)
-        relevant_names = [NASTAVAK_DEF['name']] + [d['name'] for d in ELEMENT_DEFS] + ['Poles', 'Stubovi', 'OKNA', 'Manholes']
+    def _selected_elements(self) -> List[Tuple[QgsVectorLayer, QgsFeature]]:
+        """Collect selections from all element layers (+ Poles + Manholes)."""
         selected = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            if isinstance(lyr, QgsVectorLayer) and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and lyr.name() in relevant_names:
-                feats = lyr.selectedFeatures()
-                for f in feats:
-                    selected.append((lyr, f))
+        for lyr in self._element_layers():
+            for f in lyr.selectedFeatures():
+                selected.append((lyr, f))
+        return selected
 
-        if len(selected) != 2:
-            QMessageBox.warning(self.iface.mainWindow(), "Cable", "Select exactly 2 elements (of any type)!")
-            return
+    def _find_route_layer(self):
+        """The Route layer, or None."""
+        return get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
-        # Find route layer
-        route_layer = None
-        for lyr in QgsProject.instance().mapLayers().values():
-            if lyr.name() in ('Route', 'Trasa') and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry:
-                route_layer = lyr
-                break
-        if route_layer is None or route_layer.featureCount() == 0:
-            QMessageBox.warning(self.iface.mainWindow(), "Cable", "Layer 'Route' not found or has no line!")
-            return
+    def _element_display_name(self, layer: QgsVectorLayer, feat: QgsFeature) -> str:
+        """Name written into a cable's od/do fields for an element."""
+        try:
+            if layer.name() in ('OKNA', 'Manholes'):
+                if 'broj_okna' in layer.fields().names():
+                    broj = feat['broj_okna']
+                    if broj is not None and str(broj).strip():
+                        return f"MH {str(broj).strip()}"  # Issue #9: KO -> MH
+            idx = layer.fields().indexFromName('naziv')
+            if idx != -1:
+                val = feat['naziv']
+                if val is not None and str(val).strip():
+                    return str(val).strip()
+            if layer.name() == 'Poles':
+                tip = str(feat['tip']) if 'tip' in layer.fields().names() and feat['tip'] is not None else ''
+                return ("Pole " + tip).strip() or f"Pole {int(feat.id())}"  # Stub -> Pole
+        except Exception as e:
+            logger.debug(f"Error in CableManager._element_display_name: {e}")
+        return f"{layer.name()}:{int(feat.id())}"
 
-        point1 = selected[0][1].geometry().asPoint()
-        point2 = selected[1][1].geometry().asPoint()
+    def _pick_cable_values(self, color_codes_callback=None):
+        """Show the cable dialog; returns its values, or None if cancelled."""
+        from ..dialogs.cable_dialog import CablePickerDialog
 
         # Determine type/subtype
         tip = self.selected_cable_type
@@ -664,148 +774,38 @@ class CableManager:
             try:
                 color_codes = color_codes_callback()
             except Exception as e:
-                logger.debug(f"Error in CableManager._infer_vrsta: {e}")
+                logger.debug(f"Error in CableManager._pick_cable_values: {e}")
         elif self.data_manager:
             try:
                 color_codes = self.data_manager.list_color_codes()
             except Exception as e:
-                logger.debug(f"Error in CableManager._infer_vrsta: {e}")
+                logger.debug(f"Error in CableManager._pick_cable_values: {e}")
 
         dlg = CablePickerDialog(self.iface.mainWindow(), default_vrsta=default_vrsta, default_podtip=podtip, color_codes=color_codes)
         if dlg.exec() != QDialog.DialogCode.Accepted:
-            return
+            return None
+        return dlg.values()
 
-        vals = dlg.values()
-        vrsta = vals["vrsta"]
-        tip = vals["tip"]
-        podtip = vals["podtip"]
-        color_code = vals["color_code"]
-        broj_cevcica = vals["broj_cevcica"]
-        broj_vlakana = vals["broj_vlakana"]
-        tip_kabla = vals["tip_kabla"]
-        vrsta_vlakana = vals["vrsta_vlakana"]
-        vrsta_omotaca = vals["vrsta_omotaca"]
-        vrsta_armature = vals["vrsta_armature"]
-        talasno_podrucje = vals["talasno_podrucje"]
-        naziv = vals["naziv"]
-        slabljenje_dbkm = vals["slabljenje_dbkm"]
-        hrom_disp_ps_nmxkm = vals["hrom_disp_ps_nmxkm"]
-        stanje_kabla = vals["stanje_kabla"]
-        cable_laying = vals["cable_laying"]
-        vrsta_mreze = vals["vrsta_mreze"]
-        godina_ugradnje = vals["godina_ugradnje"]
-        konstr_vlakna_u_cevcicama = vals["konstr_vlakna_u_cevcicama"]
-        konstr_sa_uzlepljenim_elementom = vals["konstr_sa_uzlepljenim_elementom"]
-        konstr_punjeni_kabl = vals["konstr_punjeni_kabl"]
-        konstr_sa_arm_vlaknima = vals["konstr_sa_arm_vlaknima"]
-        konstr_bez_metalnih = vals["konstr_bez_metalnih"]
-        # Phase 0.3: Fiber schema for FiberQ Designer
-        fibers_per_tube = vals.get("fibers_per_tube", 0)
-        total_fibers = vals.get("total_fibers", 0)
-        color_standard = vals.get("color_standard", "")
-
-        # Select cable layer
-        layer_suffix = "vazdusni" if str(vrsta).lower().startswith("vazdu") else "podzemni"
-        if layer_suffix == "vazdusni":
-            candidate_names = ("Kablovi_vazdusni", "Aerial cables")
+    def _ensure_cables_layer(self, vrsta) -> QgsVectorLayer:
+        """Find or create the aerial/underground cable layer for ``vrsta``, with all fields."""
+        if str(vrsta).lower().startswith("vazdu"):
             default_name = "Aerial cables"
         else:
-            candidate_names = ("Kablovi_podzemni", "Underground cables")
             default_name = "Underground cables"
 
-        cables_layer = None
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                    and lyr.name() in candidate_names  # noqa: W503
-                ):
-                    cables_layer = lyr
-                    break
-            except Exception as e:
-                logger.debug(f"Error in CableManager._infer_vrsta: {e}")
+        cables_layer = get_layer_registry().layer(default_name, geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
         if cables_layer is None:
             crs = self.iface.mapCanvas().mapSettings().destinationCrs().authid()
             cables_layer = QgsVectorLayer(f"LineString?crs={crs}", default_name, "memory")
             pr = cables_layer.dataProvider()
-
-            pr.addAttributes([
-                QgsField("tip", QVariant.String),
-                QgsField("podtip", QVariant.String),
-                QgsField("color_code", QVariant.String),
-                QgsField("broj_cevcica", QVariant.Int),
-                QgsField("broj_vlakana", QVariant.Int),
-                QgsField("tip_kabla", QVariant.String),
-                QgsField("vrsta_vlakana", QVariant.String),
-                QgsField("vrsta_omotaca", QVariant.String),
-                QgsField("vrsta_armature", QVariant.String),
-                QgsField("talasno_podrucje", QVariant.String),
-                QgsField("naziv", QVariant.String),
-                QgsField("slabljenje_dbkm", QVariant.Double),
-                QgsField("hrom_disp_ps_nmxkm", QVariant.Double),
-                QgsField("stanje_kabla", QVariant.String),
-                QgsField("cable_laying", QVariant.String),
-                QgsField("vrsta_mreze", QVariant.String),
-                QgsField("godina_ugradnje", QVariant.Int),
-                QgsField("konstr_vlakna_u_cevcicama", QVariant.Int),
-                QgsField("konstr_sa_uzlepljenim_elementom", QVariant.Int),
-                QgsField("konstr_punjeni_kabl", QVariant.Int),
-                QgsField("konstr_sa_arm_vlaknima", QVariant.Int),
-                QgsField("konstr_bez_metalnih", QVariant.Int),
-                QgsField("od", QVariant.String),
-                QgsField("do", QVariant.String),
-                QgsField("duzina_m", QVariant.Double),
-                QgsField("slack_m", QVariant.Double),
-                QgsField("total_len_m", QVariant.Double),
-                QgsField(FIBERQ_UUID_FIELD, QVariant.String),
-                # Phase 0.3: Fiber schema for FiberQ Designer
-                QgsField("fibers_per_tube", QVariant.Int),
-                QgsField("total_fibers", QVariant.Int),
-                QgsField("color_standard", QVariant.String),
-            ])
-
+            pr.addAttributes([QgsField(fname, ftype) for fname, ftype in self.CABLE_FIELDS.items()])
             cables_layer.updateFields()
             QgsProject.instance().addMapLayer(cables_layer)
 
         # Ensure layer has all needed fields
-        needed_fields = {
-            "tip": QVariant.String,
-            "podtip": QVariant.String,
-            "color_code": QVariant.String,
-            "broj_cevcica": QVariant.Int,
-            "broj_vlakana": QVariant.Int,
-            "tip_kabla": QVariant.String,
-            "vrsta_vlakana": QVariant.String,
-            "vrsta_omotaca": QVariant.String,
-            "vrsta_armature": QVariant.String,
-            "talasno_podrucje": QVariant.String,
-            "naziv": QVariant.String,
-            "slabljenje_dbkm": QVariant.Double,
-            "hrom_disp_ps_nmxkm": QVariant.Double,
-            "stanje_kabla": QVariant.String,
-            "cable_laying": QVariant.String,
-            "vrsta_mreze": QVariant.String,
-            "godina_ugradnje": QVariant.Int,
-            "konstr_vlakna_u_cevcicama": QVariant.Int,
-            "konstr_sa_uzlepljenim_elementom": QVariant.Int,
-            "konstr_punjeni_kabl": QVariant.Int,
-            "konstr_sa_arm_vlaknima": QVariant.Int,
-            "konstr_bez_metalnih": QVariant.Int,
-            "od": QVariant.String,
-            "do": QVariant.String,
-            "duzina_m": QVariant.Double,
-            "slack_m": QVariant.Double,
-            "total_len_m": QVariant.Double,
-            FIBERQ_UUID_FIELD: QVariant.String,
-            # Phase 0.3: Fiber schema for FiberQ Designer
-            "fibers_per_tube": QVariant.Int,
-            "total_fibers": QVariant.Int,
-            "color_standard": QVariant.String,
-        }
         to_add = []
-        for fname, ftype in needed_fields.items():
+        for fname, ftype in self.CABLE_FIELDS.items():
             if cables_layer.fields().indexFromName(fname) == -1:
                 to_add.append(QgsField(fname, ftype))
         if to_add:
@@ -820,70 +820,128 @@ class CableManager:
                 )
 
         self.stylize_cable_layer(cables_layer)
+        return cables_layer
 
-        def _disp_name(layer, feat):
-            try:
-                if layer.name() in ('OKNA', 'Manholes'):
-                    if 'broj_okna' in layer.fields().names():
-                        broj = feat['broj_okna']
-                        if broj is not None and str(broj).strip():
-                            return f"MH {str(broj).strip()}"  # Issue #9: KO -> MH
-                idx = layer.fields().indexFromName('naziv')
-                if idx != -1:
-                    val = feat['naziv']
-                    if val is not None and str(val).strip():
-                        return str(val).strip()
-                if layer.name() == 'Poles':
-                    tip = str(feat['tip']) if 'tip' in layer.fields().names() and feat['tip'] is not None else ''
-                    return ("Pole " + tip).strip() or f"Pole {int(feat.id())}"  # Stub -> Pole
-            except Exception as e:
-                logger.debug(f"Error in CableManager._disp_name: {e}")
-            return f"{layer.name()}:{int(feat.id())}"
+    def _new_cable_feature(self, cables_layer: QgsVectorLayer, cable_geom: QgsGeometry,
+                           vals: Dict[str, Any], od_naziv: str, do_naziv: str) -> QgsFeature:
+        """A cable feature with the dialog values, endpoints, UUID and lengths set."""
+        feat = QgsFeature(cables_layer.fields())
+        feat.setGeometry(cable_geom)
+        for name in self.CABLE_DIALOG_ATTRIBUTES:
+            feat.setAttribute(name, vals[name])
+        feat.setAttribute("od", od_naziv)
+        feat.setAttribute("do", do_naziv)
+        # Phase 0.3: Set fiber schema fields for FiberQ Designer
+        try:
+            if "fibers_per_tube" in cables_layer.fields().names():
+                feat.setAttribute("fibers_per_tube", vals.get("fibers_per_tube", 0))
+            if "total_fibers" in cables_layer.fields().names():
+                feat.setAttribute("total_fibers", vals.get("total_fibers", 0))
+            if "color_standard" in cables_layer.fields().names():
+                feat.setAttribute("color_standard", vals.get("color_standard", ""))
+        except Exception as e:
+            logger.debug(f"Error setting fiber schema on cable: {e}")
+        # Phase 0.1: Set UUID for FiberQ Designer
+        try:
+            if FIBERQ_UUID_FIELD in cables_layer.fields().names():
+                feat.setAttribute(FIBERQ_UUID_FIELD, generate_uuid())
+        except Exception as e:
+            logger.debug(f"Error setting UUID on cable: {e}")
+        try:
+            cable_length = ground_length(cable_geom, cables_layer)
+            feat.setAttribute("duzina_m", cable_length)
+            feat.setAttribute("slack_m", 0.0)  # Issue #1: Initialize slack to 0
+            feat.setAttribute("total_len_m", cable_length)  # Issue #1: Set total_len_m = duzina_m initially
+        except Exception as e:
+            logger.debug(f"Error in CableManager._new_cable_feature setting length: {e}")
+        return feat
+
+    def _record_undo(self, cables_layer: QgsVectorLayer, feats: List[QgsFeature]) -> None:
+        # Record for undo (v1.2 — Feature 2)
+        try:
+            undo_mgr = getattr(self, 'undo_manager', None)
+            if undo_mgr:
+                for feat in feats:
+                    undo_mgr.record_add(cables_layer, feat)
+        except Exception as e:
+            logger.debug(f"Error recording undo for cable: {e}")
+
+    def _slot_into_branches(self, cables_layer: QgsVectorLayer, geoms: List[QgsGeometry]) -> None:
+        """Keep branch offsets right after laying cables on a branched layer."""
+        try:
+            self.update_branch_indices_near(cables_layer, geoms)
+        except Exception as e:
+            logger.debug(f"Error in CableManager._slot_into_branches: {e}")
+
+    def _routing_tolerance(self) -> float:
+        """Snapping tolerance for routing: six pixels at the current scale."""
+        return self.iface.mapCanvas().mapUnitsPerPixel() * 6
+
+    def lay_cable(self, color_codes_callback=None, path_callback=None) -> None:
+        """
+        Lay a cable along a route between two selected elements.
+
+        Args:
+            color_codes_callback: Optional callable returning list of color codes
+            path_callback: Optional callable (route_layer, pt1, pt2, tol) returning path points
+        """
+        selected = self._selected_elements()
+        if len(selected) != 2:
+            QMessageBox.warning(self.iface.mainWindow(), "Cable", "Select exactly 2 elements (of any type)!")
+            return
+
+        # Find route layer
+        route_layer = self._find_route_layer()
+        if route_layer is None or route_layer.featureCount() == 0:
+            QMessageBox.warning(self.iface.mainWindow(), "Cable", "Layer 'Route' not found or has no line!")
+            return
+
+        point1 = selected[0][1].geometry().asPoint()
+        point2 = selected[1][1].geometry().asPoint()
 
-        od_naziv = _disp_name(selected[0][0], selected[0][1])
-        do_naziv = _disp_name(selected[1][0], selected[1][1])
+        vals = self._pick_cable_values(color_codes_callback)
+        if vals is None:
+            return
+
+        cables_layer = self._ensure_cables_layer(vals["vrsta"])
+
+        od_naziv = self._element_display_name(selected[0][0], selected[0][1])
+        do_naziv = self._element_display_name(selected[1][0], selected[1][1])
 
         # Find cable geometry along route
+        tol_units = self._routing_tolerance()
+        graph = None
+        try:
+            from ..utils.route_graph import get_route_graph
+            graph = get_route_graph(route_layer, tol_units)
+        except Exception as e:
+            logger.debug(f"Error in CableManager.lay_cable getting route graph: {e}")
+
         cable_geom = None
-        for feat in route_layer.getFeatures():
-            geom = feat.geometry()
-            if geom.type() != QgsWkbTypes.GeometryType.LineGeometry:
-                continue
-            line = geom.asPolyline()
-            if not line:
-                multi = geom.asMultiPolyline()
-                if multi and len(multi) > 0:
-                    line = multi[0]
-            dists1 = [QgsPointXY(point1).distance(QgsPointXY(p)) for p in line]
-            dists2 = [QgsPointXY(point2).distance(QgsPointXY(p)) for p in line]
-            min_dist1 = min(dists1)
-            min_dist2 = min(dists2)
-            idx1 = dists1.index(min_dist1)
-            idx2 = dists2.index(min_dist2)
-            if min_dist1 < 1 and min_dist2 < 1 and idx1 != idx2:
-                if idx1 < idx2:
-                    cable_geom = QgsGeometry.fromPolylineXY(line[idx1:idx2 + 1])
-                else:
-                    cable_geom = QgsGeometry.fromPolylineXY(list(reversed(line[idx2:idx1 + 1])))
-                break
+        if graph is not None:
+            line_pts = graph.path_within_feature(QgsPointXY(point1), QgsPointXY(point2), max_dist=1.0)
+            if line_pts:
+                cable_geom = QgsGeometry.fromPolylineXY(line_pts)
 
         if cable_geom is None:
             # Try through joined route segments (virtual merge)
-            tol_units = self.iface.mapCanvas().mapUnitsPerPixel() * 6
             path_pts = None
 
             if path_callback:
                 try:
                     path_pts = path_callback(route_layer, point1, point2, tol_units)
                 except Exception as e:
-                    logger.debug(f"Error in CableManager._disp_name: {e}")
+                    logger.debug(f"Error in CableManager.lay_cable: {e}")
             elif self.route_manager:
                 try:
                     path_pts = self.route_manager.build_path_across_network(route_layer, QgsPointXY(point1), QgsPointXY(point2), tol_units)
                     if not path_pts:
                         path_pts = self.route_manager.build_path_across_joined_routes(route_layer, QgsPointXY(point1), QgsPointXY(point2), tol_units)
                 except Exception as e:
-                    logger.debug(f"Error in CableManager._disp_name: {e}")
+                    logger.debug(f"Error in CableManager.lay_cable: {e}")
+            elif graph is not None:
+                from ..utils.routing import ROUTING_ASTAR
+                path_pts = graph.find_route(QgsPointXY(point1), QgsPointXY(point2), ROUTING_ASTAR, tolerance=tol_units)
 
             if path_pts:
                 cable_geom = QgsGeometry.fromPolylineXY(path_pts)
@@ -893,55 +951,7 @@ class CableManager:
             return
 
         # Create cable feature
-        feat = QgsFeature(cables_layer.fields())
-        feat.setGeometry(cable_geom)
-        feat.setAttribute("tip", tip)
-        feat.setAttribute("podtip", podtip)
-        feat.setAttribute("color_code", color_code)
-        feat.setAttribute("broj_cevcica", broj_cevcica)
-        feat.setAttribute("broj_vlakana", broj_vlakana)
-        feat.setAttribute("tip_kabla", tip_kabla)
-        feat.setAttribute("vrsta_vlakana", vrsta_vlakana)
-        feat.setAttribute("vrsta_omotaca", vrsta_omotaca)
-        feat.setAttribute("vrsta_armature", vrsta_armature)
-        feat.setAttribute("talasno_podrucje", talasno_podrucje)
-        feat.setAttribute("naziv", naziv)
-        feat.setAttribute("slabljenje_dbkm", slabljenje_dbkm)
-        feat.setAttribute("hrom_disp_ps_nmxkm", hrom_disp_ps_nmxkm)
-        feat.setAttribute("stanje_kabla", stanje_kabla)
-        feat.setAttribute("cable_laying", cable_laying)
-        feat.setAttribute("vrsta_mreze", vrsta_mreze)
-        feat.setAttribute("godina_ugradnje", godina_ugradnje)
-        feat.setAttribute("konstr_vlakna_u_cevcicama", konstr_vlakna_u_cevcicama)
-        feat.setAttribute("konstr_sa_uzlepljenim_elementom", konstr_sa_uzlepljenim_elementom)
-        feat.setAttribute("konstr_punjeni_kabl", konstr_punjeni_kabl)
-        feat.setAttribute("konstr_sa_arm_vlaknima", konstr_sa_arm_vlaknima)
-        feat.setAttribute("konstr_bez_metalnih", konstr_bez_metalnih)
-        feat.setAttribute("od", od_naziv)
-        feat.setAttribute("do", do_naziv)
-        # Phase 0.3: Set fiber schema fields for FiberQ Designer
-        try:
-            if "fibers_per_tube" in cables_layer.fields().names():
-                feat.setAttribute("fibers_per_tube", fibers_per_tube)
-            if "total_fibers" in cables_layer.fields().names():
-                feat.setAttribute("total_fibers", total_fibers)
-            if "color_standard" in cables_layer.fields().names():
-                feat.setAttribute("color_standard", color_standard)
-        except Exception as e:
-            logger.debug(f"Error setting fiber schema on cable: {e}")
-        # Phase 0.1: Set UUID for FiberQ Designer
-        try:
-            if FIBERQ_UUID_FIELD in cables_layer.fields().names():
-                feat.setAttribute(FIBERQ_UUID_FIELD, generate_uuid())
-        except Exception as e:
-            logger.debug(f"Error setting UUID on cable: {e}")
-        try:
-            cable_length = ground_length(cable_geom, cables_layer)
-            feat.setAttribute("duzina_m", cable_length)
-            feat.setAttribute("slack_m", 0.0)  # Issue #1: Initialize slack to 0
-            feat.setAttribute("total_len_m", cable_length)  # Issue #1: Set total_len_m = duzina_m initially
-        except Exception as e:
-            logger.debug(f"Error in CableManager.lay_cable setting length: {e}")
+        feat = self._new_cable_feature(cables_layer, cable_geom, vals, od_naziv, do_naziv)
 
         cables_layer.startEditing()
         cables_layer.addFeature(feat)
@@ -949,15 +959,209 @@ class CableManager:
         cables_layer.updateExtents()
         cables_layer.triggerRepaint()
 
-        # Record for undo (v1.2 — Feature 2)
+        self._record_undo(cables_layer, [feat])
+        self._slot_into_branches(cables_layer, [cable_geom])
+
+        QMessageBox.information(self.iface.mainWindow(), "FiberQ", "Cable has been laid along the route!")
+
+    # -------------------------------------------------------------------------
+    # Batch cable laying
+    # -------------------------------------------------------------------------
+
+    def route_cable_pairs(self, route_layer: QgsVectorLayer, pairs: List[Tuple[QgsPointXY, QgsPointXY]],
+                          tol_units: float, cost_profile=None) -> List[Any]:
+        """
+        Route many cables at once: one shortest-path tree per distinct source.
+
+        Pairs are grouped by source point, and each group is answered by a
+        single search of the shared route graph (see RouteGraph.paths_from),
+        so 300 drops out of one OTB cost one search, not 300.
+
+        Args:
+            route_layer: Route layer to lay along
+            pairs: (source point, target point) per cable
+            tol_units: Tolerance for vertex matching (map units)
+            cost_profile: Optional tip_trase -> cost multiplier mapping; defaults
+                to the RouteManager's route_cost_profile
+
+        Returns:
+            One QgsGeometry (or None if unreachable) per pair, in input order
+        """
+        from ..utils.route_graph import get_route_graph
+
+        if cost_profile is None and self.route_manager is not None:
+            cost_profile = getattr(self.route_manager, "route_cost_profile", None)
+
+        graph = get_route_graph(route_layer, tol_units)
+        by_source: Dict[Tuple[float, float], List[int]] = {}
+        for i, (src, _dst) in enumerate(pairs):
+            by_source.setdefault((src.x(), src.y()), []).append(i)
+
+        geoms: List[Any] = [None] * len(pairs)
+        for (sx, sy), indices in by_source.items():
+            paths = graph.paths_from(QgsPointXY(sx, sy), [QgsPointXY(pairs[i][1]) for i in indices],
+                                     cost_profile, tol_units)
+            for i, path_pts in zip(indices, paths):
+                if path_pts and len(path_pts) >= 2:
+                    geoms[i] = QgsGeometry.fromPolylineXY(path_pts)
+        return geoms
+
+    def _lay_cable_batch(self, pairs, color_codes_callback=None) -> None:
+        """
+        Lay one cable per (source, target) element pair in a single edit session.
+
+        Args:
+            pairs: List of ((layer, feature), (layer, feature)) element pairs
+            color_codes_callback: Optional callable returning list of color codes
+        """
+        route_layer = self._find_route_layer()
+        if route_layer is None or route_layer.featureCount() == 0:
+            QMessageBox.warning(self.iface.mainWindow(), "Cable", "Layer 'Route' not found or has no line!")
+            return
+
+        vals = self._pick_cable_values(color_codes_callback)
+        if vals is None:
+            return
+        cables_layer = self._ensure_cables_layer(vals["vrsta"])
+
+        points = [
+            (QgsPointXY(src[1].geometry().asPoint()), QgsPointXY(dst[1].geometry().asPoint()))
+            for src, dst in pairs
+        ]
+        geoms = self.route_cable_pairs(route_layer, points, self._routing_tolerance())
+
+        feats = []
+        laid = []
+        unreachable = []
+        for (src, dst), geom in zip(pairs, geoms):
+            od_naziv = self._element_display_name(*src)
+            do_naziv = self._element_display_name(*dst)
+            if geom is None:
+                unreachable.append(f"{od_naziv} -> {do_naziv}")
+                continue
+            feat = self._new_cable_feature(cables_layer, geom, vals, od_naziv, do_naziv)
+            feats.append(feat)
+            laid.append(f"{od_naziv} -> {do_naziv}: {float(feat['duzina_m'] or 0.0):.2f} m")
+
+        if feats:
+            cables_layer.startEditing()
+            cables_layer.addFeatures(feats)
+            cables_layer.commitChanges()
+            cables_layer.updateExtents()
+            cables_layer.triggerRepaint()
+            self._record_undo(cables_layer, feats)
+            self._slot_into_branches(cables_layer, [f.geometry() for f in feats])
+
+        box = QMessageBox(self.iface.mainWindow())
+        box.setWindowTitle("FiberQ")
+        box.setIcon(QMessageBox.Icon.Information if not unreachable else QMessageBox.Icon.Warning)
+        box.setText(f"Cables laid: {len(feats)}\nUnreachable targets: {len(unreachable)}")
+        details = laid[:]
+        if unreachable:
+            details += ["", "Unreachable:"] + unreachable
+        box.setDetailedText("\n".join(details))
+        box.exec()
+
+    def lay_cable_batch(self, color_codes_callback=None) -> None:
+        """
+        Lay cables from one selected element to every other selected element.
+
+        The user picks which of the selected elements is the source (ODF/OTB);
+        all cables share the attributes entered once in the cable dialog.
+        """
+        from qgis.PyQt.QtWidgets import QInputDialog
+
+        selected = self._selected_elements()
+        if len(selected) < 2:
+            QMessageBox.warning(self.iface.mainWindow(), "Cable", "Select the source element and at least one target element!")
+            return
+
+        labels = [f"{self._element_display_name(lyr, f)} ({lyr.name()})" for lyr, f in selected]
+        label, ok = QInputDialog.getItem(
+            self.iface.mainWindow(), "Batch cable laying", "Source element:", labels, 0, False
+        )
+        if not ok or not label:
+            return
+        source = selected[labels.index(label)]
+        pairs = [(source, target) for target in selected if target is not source]
+        self._lay_cable_batch(pairs, color_codes_callback)
+
+    def read_cable_pairs_csv(self, path: str) -> List[Tuple[str, str]]:
+        """
+        Read (from, to) element references from a CSV file.
+
+        The header may name the columns ``from``/``to`` or ``od``/``do``;
+        otherwise the first two columns are used. Delimiter is sniffed.
+        """
+        import csv
+
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            sample = fh.read(4096)
+            fh.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+            except csv.Error:
+                dialect = csv.excel
+            rows = [row for row in csv.reader(fh, dialect) if any(c.strip() for c in row)]
+
+        if not rows:
+            return []
+        header = [c.strip().lower() for c in rows[0]]
+        for a, b in (("from", "to"), ("od", "do")):
+            if a in header and b in header:
+                ia, ib = header.index(a), header.index(b)
+                return [(r[ia].strip(), r[ib].strip()) for r in rows[1:] if len(r) > max(ia, ib)]
+        return [(r[0].strip(), r[1].strip()) for r in rows if len(r) >= 2]
+
+    def _element_lookup(self) -> Dict[str, Tuple[QgsVectorLayer, QgsFeature]]:
+        """Element references (display name, naziv, fiberq_uuid) -> (layer, feature)."""
+        lookup = {}
+        for lyr in self._element_layers():
+            names = lyr.fields().names()
+            for f in lyr.getFeatures():
+                keys = [self._element_display_name(lyr, f)]
+                for field in ("naziv", FIBERQ_UUID_FIELD):
+                    if field in names and f[field] is not None and str(f[field]).strip():
+                        keys.append(str(f[field]).strip())
+                for key in keys:
+                    lookup.setdefault(key, (lyr, f))
+        return lookup
+
+    def lay_cable_batch_from_csv(self, path: str = None, color_codes_callback=None) -> None:
+        """Lay one cable per from/to row of a CSV file of element names or UUIDs."""
+        from qgis.PyQt.QtWidgets import QFileDialog
+
+        if not path:
+            path, _ = QFileDialog.getOpenFileName(
+                self.iface.mainWindow(), "Cable pairs (CSV)", "", "CSV files (*.csv *.txt);;All files (*)"
+            )
+            if not path:
+                return
+
         try:
-            undo_mgr = getattr(self, 'undo_manager', None)
-            if undo_mgr:
-                undo_mgr.record_add(cables_layer, feat)
+            rows = self.read_cable_pairs_csv(path)
         except Exception as e:
-            logger.debug(f"Error recording undo for cable: {e}")
+            QMessageBox.warning(self.iface.mainWindow(), "Cable", f"Could not read the CSV file:\n{e}")
+            return
 
-        QMessageBox.information(self.iface.mainWindow(), "FiberQ", "Cable has been laid along the route!")
+        lookup = self._element_lookup()
+        pairs = []
+        missing = []
+        for ref_from, ref_to in rows:
+            src, dst = lookup.get(ref_from), lookup.get(ref_to)
+            if src is None or dst is None:
+                missing.append(f"{ref_from} -> {ref_to}")
+                continue
+            pairs.append((src, dst))
+
+        if missing:
+            QMessageBox.warning(
+                self.iface.mainWindow(), "Cable",
+                f"{len(missing)} row(s) name elements that were not found and are skipped:\n" + "\n".join(missing[:20])
+            )
+        if not pairs:
+            return
+        self._lay_cable_batch(pairs, color_codes_callback)
 
 
 __all__ = ['CableManager']
@@ -13,10 +13,13 @@ Phase 8 of the modular refactoring.
 
 import json
 import os
-from qgis.core import QgsProject, QgsVectorLayer, QgsWkbTypes
+from qgis.core import QgsProject, QgsWkbTypes
 
 # WP1a: schema version marker
 from .schema_version import write_project_schema_version
+from .cable_catalog import get_cable_catalog
+from .element_index import candidate_elements, candidate_elements_for_cables
+from .layer_registry import ROLE_CABLE, get_layer_registry
 
 # Phase 5.2: Logging
 from ..utils.logger import get_logger
@@ -398,71 +401,53 @@ class DataManager:
         """
         items = []
 
-        # Accept both Serbian and English layer names
-        candidate_names = {
-            "Kablovi_podzemni",
-            "Kablovi_vazdusni",
-            "Underground cables",
-            "Aerial cables",
+        # Display label mapping
+        podtip_labels = {
+            "glavni": "Backbone",
+            "distributivni": "Distribution",
+            "razvodni": "Drop",
+            "Backbone": "Backbone",
+            "Distribution": "Distribution",
+            "Drop": "Drop",
         }
 
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (
-                    not isinstance(lyr, QgsVectorLayer)
-                    or lyr.geometryType() != QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                    or lyr.name() not in candidate_names  # noqa: W503
-                ):
-                    continue
-            except Exception as e:
-                logger.debug(f"Skipping layer while listing cables: {e}")
-                continue
-
-            fields = lyr.fields()
-            for feat in lyr.getFeatures():
-                attrs = {fld.name(): feat[fld.name()] for fld in fields}
-
-                tip = attrs.get("tip") or ""
-                podtip_code = attrs.get("podtip") or ""
-                kap = attrs.get("kapacitet") or ""
-                cc = attrs.get("color_code") or ""
-                od = attrs.get("od") or ""
-                do = attrs.get("do") or ""
-
-                # Display label mapping
-                podtip_labels = {
-                    "glavni": "Backbone",
-                    "distributivni": "Distribution",
-                    "razvodni": "Drop",
-                    "Backbone": "Backbone",
-                    "Distribution": "Distribution",
-                    "Drop": "Drop",
-                }
-                podtip_label = podtip_labels.get(str(podtip_code), str(podtip_code))
-
-                # Build description
-                opis_parts = []
-                if tip:
-                    opis_parts.append(str(tip))
-                if podtip_label:
-                    opis_parts.append(str(podtip_label))
-                if kap:
-                    opis_parts.append(str(kap))
-
-                opis = " ".join(opis_parts) if opis_parts else f"FID {int(feat.id())}"
-
-                items.append({
-                    "layer_id": lyr.id(),
-                    "layer_name": lyr.name(),
-                    "fid": int(feat.id()),
-                    "opis": opis,
-                    "tip": tip,
-                    "podtip": podtip_code,
-                    "kapacitet": kap,
-                    "color_code": cc,
-                    "od": od,
-                    "do": do,
-                })
+        # The catalogue reads each cable layer once and follows its edits
+        for rec in get_cable_catalog().records(
+                ROLE_CABLE, geometry=QgsWkbTypes.GeometryType.LineGeometry):
+            attrs = rec.attributes
+
+            tip = attrs.get("tip") or ""
+            podtip_code = attrs.get("podtip") or ""
+            kap = attrs.get("kapacitet") or ""
+            cc = attrs.get("color_code") or ""
+            od = attrs.get("od") or ""
+            do = attrs.get("do") or ""
+
+            podtip_label = podtip_labels.get(str(podtip_code), str(podtip_code))
+
+            # Build description
+            opis_parts = []
+            if tip:
+                opis_parts.append(str(tip))
+            if podtip_label:
+                opis_parts.append(str(podtip_label))
+            if kap:
+                opis_parts.append(str(kap))
+
+            opis = " ".join(opis_parts) if opis_parts else f"FID {rec.fid}"
+
+            items.append({
+                "layer_id": rec.layer_id,
+                "layer_name": rec.layer_name,
+                "fid": rec.fid,
+                "opis": opis,
+                "tip": tip,
+                "podtip": podtip_code,
+                "kapacitet": kap,
+                "color_code": cc,
+                "od": od,
+                "do": do,
+            })
 
         return items
 
@@ -474,19 +459,12 @@ class DataManager:
             list: Pipe records with layer_id, fid, opis, etc.
         """
         items = []
-        layers = []
 
         pipe_names = ('PE cevi', 'Prelazne cevi', 'PE pipes', 'Transition pipes',
                       'PE ducts', 'Transition ducts')
 
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                        and lyr.name() in pipe_names):  # noqa: W503
-                    layers.append(lyr)
-            except Exception as e:
-                logger.debug(f"Error in DataManager.list_all_pipes: {e}")
+        layers = get_layer_registry().layers(
+            *pipe_names, geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
         for lyr in layers:
             fields = lyr.fields()
@@ -521,6 +499,20 @@ class DataManager:
 
         return items
 
+    #: Issue #5: "Placing elements" layer names (passive optical elements)
+    PLACING_ELEMENT_LAYERS = (
+        # English names
+        'Joint Closures', 'ODF', 'TB', 'Patch panel', 'Patch Panel',
+        'OTB', 'Indoor OTB', 'Outdoor OTB', 'Pole OTB',
+        'TO', 'Indoor TO', 'Outdoor TO', 'Pole TO', 'Joint Closure TO',
+        # Serbian names (backward compatibility)
+        'Nastavci', 'Optički razdelnik', 'Završna optička kutija',
+    )
+
+    def _placing_element_layers(self):
+        return get_layer_registry().layers(
+            *self.PLACING_ELEMENT_LAYERS, geometry=QgsWkbTypes.GeometryType.PointGeometry)
+
     def find_candidate_elements_for_cable(self, cable_layer, cable_feature, tol=5.0):
         """
         Find point elements near a cable route.
@@ -536,92 +528,20 @@ class DataManager:
         Returns:
             list: Candidate elements sorted by distance along cable
         """
-        from qgis.core import QgsGeometry, QgsPointXY
-
-        # Issue #5: Only include "Placing elements" layer names (passive optical elements)
-        PLACING_ELEMENT_LAYERS = {
-            # English names
-            'Joint Closures', 'ODF', 'TB', 'Patch panel', 'Patch Panel',
-            'OTB', 'Indoor OTB', 'Outdoor OTB', 'Pole OTB',
-            'TO', 'Indoor TO', 'Outdoor TO', 'Pole TO', 'Joint Closure TO',
-            # Serbian names (backward compatibility)
-            'Nastavci', 'Optički razdelnik', 'Završna optička kutija',
-        }
-
-        geom = cable_feature.geometry()
-        if geom is None or geom.isEmpty():
-            return []
+        return candidate_elements(cable_layer, cable_feature, self._placing_element_layers(), tol)
 
-        # Get from/to names to exclude endpoints
-        try:
-            od = str(cable_feature['od']) if 'od' in cable_layer.fields().names() and cable_feature['od'] is not None else ''
-            do = str(cable_feature['do']) if 'do' in cable_layer.fields().names() and cable_feature['do'] is not None else ''
-        except Exception:
-            od = ''
-            do = ''
+    def find_candidate_elements_for_cables(self, cables, tol=5.0):
+        """
+        :meth:`find_candidate_elements_for_cable` for many cables in one sweep.
 
-        cands = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if lyr.geometryType() != QgsWkbTypes.GeometryType.PointGeometry:
-                    continue
-
-                # Issue #5: Only include layers from "Placing elements"
-                if lyr.name() not in PLACING_ELEMENT_LAYERS:
-                    continue
-
-                fields = lyr.fields()
-                has_naziv = fields.indexFromName('naziv') != -1
-
-                for f in lyr.getFeatures():
-                    pgeom = f.geometry()
-                    if pgeom is None or pgeom.isEmpty():
-                        continue
-
-                    d = geom.distance(pgeom)
-                    if d > tol:
-                        continue
-
-                    try:
-                        m = geom.lineLocatePoint(pgeom)
-                        m = float(m)
-                    except Exception:
-                        nearest = geom.closestSegmentWithContext(pgeom.asPoint())[1] if hasattr(geom, 'closestSegmentWithContext') else None
-                        m = float(geom.length()) if nearest is None else float(geom.lineLocatePoint(QgsGeometry.fromPointXY(QgsPointXY(nearest))))
-
-                    name = ''
-                    if has_naziv:
-                        val = f['naziv']
-                        if val is not None:
-                            name = str(val).strip()
-
-                    # Skip endpoints by name
-                    if name and (name == od or name == do):
-                        continue
-
-                    cands.append({
-                        "layer_id": lyr.id(),
-                        "layer_name": lyr.name(),
-                        "fid": int(f.id()),
-                        "naziv": name if name else f"{lyr.name()}:{int(f.id())}",
-                        "m": m,
-                        "distance": float(d),
-                    })
-            except Exception as e:
-                logger.debug(f"Skipping layer while finding candidate elements: {e}")
-                continue
-
-        # Sort and deduplicate
-        out = []
-        seen = set()
-        for it in sorted(cands, key=lambda x: x.get('m', 0.0)):
-            key = (it['layer_id'], it['fid'])
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(it)
+        Args:
+            cables: Iterable of (cable_layer, cable_feature) pairs
+            tol: Tolerance distance
 
-        return out
+        Returns:
+            dict: (cable layer id, fid) -> candidate elements
+        """
+        return candidate_elements_for_cables(cables, self._placing_element_layers(), tol)
 
 
 # Module-level convenience function
@@ -0,0 +1,326 @@
+"""
+FiberQ v2 - Candidate Elements Along Cables
+
+Finding the elements a cable passes used to walk every feature of every point
+layer and measure its distance to the cable -- once per cable, and the latent
+elements dialog asked for every cable row. On a backbone with a few thousand
+closures and poles around it that made the dialog take minutes to open.
+
+An :class:`ElementIndex` holds a ``QgsSpatialIndex`` of one point layer with the
+point geometries and names the search needs. It is built on first use, shared
+through :func:`get_element_index`, and rebuilt lazily after the layer's edit
+signals mark it stale. The search asks the index with the cable's segments grown
+by the tolerance, so only points that can be within it are measured; a long
+diagonal cable does not pull in everything in its bounding box.
+
+:func:`candidate_elements` answers for one cable, with the same results (and
+ordering) as the old scan; :func:`candidate_elements_for_cables` answers for
+many in one sweep, reading each layer's index once.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from qgis.core import (
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsPointXY,
+    QgsRectangle,
+    QgsSpatialIndex,
+    QgsVectorLayer,
+)
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+#: Segment envelopes are merged into one query until they span this many
+#: segments, so a densely digitised cable does not pay one query per vertex.
+SEGMENTS_PER_QUERY = 8
+
+_INDEXES: Dict[str, "ElementIndex"] = {}
+
+
+class ElementIndex:
+    """Spatial index, geometries and names of one point layer."""
+
+    def __init__(self, layer: QgsVectorLayer):
+        self.layer = layer
+        self.layer_id = layer.id()
+        self._connected = False
+        self._dirty = True
+        self._index = QgsSpatialIndex()
+        self._geoms: Dict[int, QgsGeometry] = {}
+        self._names: Dict[int, str] = {}
+        self._count = 0
+        self.has_naziv = False
+
+    def invalidate(self, *args) -> None:
+        """Force a rebuild on the next query."""
+        self._dirty = True
+
+    def rebuild(self) -> None:
+        """Re-read every feature of the layer."""
+        self._index = QgsSpatialIndex()
+        self._geoms = {}
+        self._names = {}
+        self._count = 0
+        naziv_idx = self.layer.fields().indexFromName('naziv')
+        self.has_naziv = naziv_idx != -1
+        request = QgsFeatureRequest()
+        request.setSubsetOfAttributes([naziv_idx] if self.has_naziv else [])
+        for feat in self.layer.getFeatures(request):
+            self._count += 1
+            geom = feat.geometry()
+            if geom is None or geom.isEmpty():
+                continue
+            fid = int(feat.id())
+            self._geoms[fid] = QgsGeometry(geom)
+            if self.has_naziv:
+                val = feat.attribute(naziv_idx)
+                self._names[fid] = '' if val is None else str(val).strip()
+            self._index.addFeature(fid, geom.boundingBox())
+        self._dirty = False
+
+    def ensure_current(self) -> None:
+        """Rebuild if invalidated, or if the layer changed behind our back
+        (provider writes emit no per-feature signal)."""
+        self.connect()
+        if not self._dirty:
+            try:
+                if self.layer.featureCount() != self._count:
+                    self._dirty = True
+            except Exception as e:
+                logger.debug(f"Error in ElementIndex.ensure_current: {e}")
+                self._dirty = True
+        if self._dirty:
+            self.rebuild()
+
+    def near(self, rect: QgsRectangle) -> List[int]:
+        """Fids whose point falls in ``rect``."""
+        return self._index.intersects(rect)
+
+    def geometry(self, fid: int) -> Optional[QgsGeometry]:
+        return self._geoms.get(fid)
+
+    def name(self, fid: int) -> str:
+        return self._names.get(fid, '')
+
+    def _signals(self):
+        lyr = self.layer
+        return (
+            (lyr.featureAdded, self.invalidate),
+            (lyr.featureDeleted, self.invalidate),
+            (lyr.geometryChanged, self.invalidate),
+            (lyr.attributeValueChanged, self.invalidate),
+            (lyr.committedFeaturesAdded, self.invalidate),
+            (lyr.afterRollBack, self.invalidate),
+            (lyr.dataSourceChanged, self.invalidate),
+        )
+
+    def connect(self) -> None:
+        """Start following the layer's edit signals."""
+        if self._connected:
+            return
+        for signal, slot in self._signals():
+            try:
+                signal.connect(slot)
+            except Exception as e:
+                logger.debug(f"Error in ElementIndex.connect: {e}")
+        self._connected = True
+
+    def disconnect(self) -> None:
+        """Stop following the layer (it is going away, or the plugin unloads)."""
+        if not self._connected:
+            return
+        for signal, slot in self._signals():
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in ElementIndex.disconnect: {e}")
+        self._connected = False
+
+
+def get_element_index(layer: QgsVectorLayer) -> ElementIndex:
+    """The shared, current :class:`ElementIndex` for a point layer."""
+    layer_id = layer.id()
+    index = _INDEXES.get(layer_id)
+    if index is None or index.layer is not layer:
+        if index is not None:
+            index.disconnect()
+        else:
+            try:
+                layer.willBeDeleted.connect(lambda lid=layer_id: drop_element_index(lid))
+            except Exception as e:
+                logger.debug(f"Error in get_element_index: {e}")
+        index = ElementIndex(layer)
+        _INDEXES[layer_id] = index
+    index.ensure_current()
+    return index
+
+
+def drop_element_index(layer_id: str) -> None:
+    """Forget the index of one layer."""
+    index = _INDEXES.pop(layer_id, None)
+    if index is not None:
+        index.disconnect()
+
+
+def clear_element_indexes() -> None:
+    """Forget every cached index (plugin unload)."""
+    for layer_id in list(_INDEXES):
+        drop_element_index(layer_id)
+
+
+def _line_parts(geom: QgsGeometry) -> List[List[QgsPointXY]]:
+    if geom.isMultipart():
+        return [list(part) for part in geom.asMultiPolyline()]
+    return [list(geom.asPolyline())]
+
+
+def _search_rects(geom: QgsGeometry, tol: float) -> List[QgsRectangle]:
+    """Envelopes of runs of the cable's segments, grown by ``tol``."""
+    rects = []
+    try:
+        parts = _line_parts(geom)
+    except Exception:
+        parts = []
+    for part in parts:
+        if len(part) == 1:
+            part = part * 2
+        for start in range(0, len(part) - 1, SEGMENTS_PER_QUERY):
+            run = part[start:start + SEGMENTS_PER_QUERY + 1]
+            rect = QgsRectangle(run[0], run[1])
+            for pt in run[2:]:
+                rect.combineExtentWith(pt.x(), pt.y())
+            rect.grow(tol)
+            rects.append(rect)
+    if not rects:
+        rect = geom.boundingBox()
+        rect.grow(tol)
+        rects.append(rect)
+    return rects
+
+
+def _locate(geom: QgsGeometry, pgeom: QgsGeometry) -> float:
+    """Distance along ``geom`` to the point of it nearest ``pgeom``."""
+    try:
+        return float(geom.lineLocatePoint(pgeom))
+    except Exception:
+        nearest = geom.closestSegmentWithContext(pgeom.asPoint())[1] if hasattr(geom, 'closestSegmentWithContext') else None
+        return float(geom.length()) if nearest is None else float(geom.lineLocatePoint(QgsGeometry.fromPointXY(QgsPointXY(nearest))))
+
+
+def _endpoint_names(cable_layer, cable_feature) -> Tuple[str, str]:
+    try:
+        names = cable_layer.fields().names()
+        od = str(cable_feature['od']) if 'od' in names and cable_feature['od'] is not None else ''
+        do = str(cable_feature['do']) if 'do' in names and cable_feature['do'] is not None else ''
+    except Exception:
+        od = ''
+        do = ''
+    return od, do
+
+
+def candidate_elements(cable_layer, cable_feature, layers: Iterable[QgsVectorLayer],
+                       tol: float = 5.0) -> List[Dict[str, Any]]:
+    """
+    Points of ``layers`` within ``tol`` (map units) of a cable.
+
+    Elements named like the cable's ``od``/``do`` endpoints are left out.
+
+    Returns:
+        Candidate dicts (layer_id, layer_name, fid, naziv, m, distance), ordered
+        by distance along the cable and without duplicates
+    """
+    indexes = []
+    for lyr in layers:
+        try:
+            indexes.append(get_element_index(lyr))
+        except Exception as e:
+            logger.debug(f"Skipping layer while finding candidate elements: {e}")
+    return _candidates(cable_layer, cable_feature, indexes, tol)
+
+
+def candidate_elements_for_cables(cables: Iterable[Tuple[Any, Any]],
+                                  layers: Iterable[QgsVectorLayer],
+                                  tol: float = 5.0) -> Dict[Tuple[str, int], List[Dict[str, Any]]]:
+    """
+    :func:`candidate_elements` for many ``(cable_layer, cable_feature)`` pairs,
+    keyed by ``(cable layer id, fid)``. Each layer's index is brought up to date
+    once for the whole sweep.
+    """
+    indexes = []
+    for lyr in layers:
+        try:
+            indexes.append(get_element_index(lyr))
+        except Exception as e:
+            logger.debug(f"Skipping layer while finding candidate elements: {e}")
+    out = {}
+    for cable_layer, cable_feature in cables:
+        if cable_layer is None or cable_feature is None:
+            continue
+        out[(cable_layer.id(), int(cable_feature.id()))] = _candidates(
+            cable_layer, cable_feature, indexes, tol)
+    return out
+
+
+def _candidates(cable_layer, cable_feature, indexes: List[ElementIndex], tol: float) -> List[Dict[str, Any]]:
+    geom = cable_feature.geometry()
+    if geom is None or geom.isEmpty():
+        return []
+    od, do = _endpoint_names(cable_layer, cable_feature)
+    rects = _search_rects(geom, tol)
+
+    cands = []
+    for index in indexes:
+        lyr = index.layer
+        try:
+            near: Set[int] = set()
+            for rect in rects:
+                near.update(index.near(rect))
+            for fid in sorted(near):  # layer order, as a full scan visits them
+                pgeom = index.geometry(fid)
+                if pgeom is None:
+                    continue
+
+                d = geom.distance(pgeom)
+                if d > tol:
+                    continue
+
+                name = index.name(fid)
+                # Skip endpoints by name
+                if name and (name == od or name == do):
+                    continue
+
+                cands.append({
+                    "layer_id": lyr.id(),
+                    "layer_name": lyr.name(),
+                    "fid": int(fid),
+                    "naziv": name if name else f"{lyr.name()}:{int(fid)}",
+                    "m": _locate(geom, pgeom),
+                    "distance": float(d),
+                })
+        except Exception as e:
+            logger.debug(f"Skipping layer while finding candidate elements: {e}")
+            continue
+
+    # Sort and deduplicate
+    out = []
+    seen_keys = set()
+    for it in sorted(cands, key=lambda x: x.get('m', 0.0)):
+        key = (it['layer_id'], it['fid'])
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        out.append(it)
+    return out
+
+
+__all__ = [
+    'ElementIndex',
+    'get_element_index',
+    'drop_element_index',
+    'clear_element_indexes',
+    'candidate_elements',
+    'candidate_elements_for_cables',
+]
@@ -29,6 +29,10 @@ from .schema_version import mark_project_current
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
+# Managers with a GeoPackage export in flight, kept alive until it reports back
+# (the standalone save_all_layers_to_gpkg() holds no reference of its own)
+_RUNNING_EXPORTS = set()
+
 
 class ExportManager:
     """
@@ -62,6 +66,10 @@ class ExportManager:
         """
         self.iface = iface
         self.plugin = plugin
+        self._gpkg_task = None
+        self._gpkg_dialog = None
+        self._gpkg_edited = set()  # ids of layers changed since the export's snapshot
+        self._gpkg_watch = []  # (signal, slot) connections feeding _gpkg_edited
 
     # =========================================================================
     # SINGLE LAYER EXPORT
@@ -247,8 +255,21 @@ class ExportManager:
     def save_all_layers_to_gpkg(self):
         """
         Export all vector layers to a single GeoPackage and redirect sources.
+
+        The write runs as a background task (core.gpkg_export_task) with a
+        per-layer progress dialog; layers are redirected in
+        _on_gpkg_export_finished, once every layer has been written. The
+        dialog is not modal, so a layer edited while the task runs is left on
+        its source: the GeoPackage holds it as it was before the edit.
         """
         try:
+            if self._gpkg_task is not None:
+                # One export at a time
+                if self._gpkg_dialog is not None:
+                    self._gpkg_dialog.show()
+                    self._gpkg_dialog.raise_()
+                return
+
             prj = QgsProject.instance()
 
             # Get save path
@@ -284,52 +305,103 @@ class ExportManager:
                 except Exception as e:
                     logger.debug(f"Error in ExportManager.save_all_layers_to_gpkg: {e}")
 
-            used = set()
-            errors = []
-
-            for idx, lyr in enumerate(layers):
-                # Generate unique layer name
-                base = re.sub(r"[^A-Za-z0-9_]+", "_", lyr.name()).strip("_") or f"layer_{idx + 1}"
-                name = base
-                c = 1
-                while name in used:
-                    c += 1
-                    name = f"{base}_{c}"
-                used.add(name)
-
-                # Export layer
-                opts = QgsVectorFileWriter.SaveVectorOptions()
-                opts.driverName = "GPKG"
-                opts.layerName = name
-                opts.actionOnExistingFile = (
-                    QgsVectorFileWriter.ActionOnExistingFile.CreateOrOverwriteLayer
-                    if os.path.exists(gpkg_path)
-                    else QgsVectorFileWriter.ActionOnExistingFile.CreateOrOverwriteFile
-                )
+            from qgis.core import QgsApplication
+            from .gpkg_export_task import GpkgExportTask
+            from ..dialogs.export_progress_dialog import GpkgExportProgressDialog
+
+            # Saving into an existing file syncs the tables already in it
+            # (only changed features are written) instead of rewriting them
+            task = GpkgExportTask(gpkg_path, layers, delta=os.path.exists(gpkg_path))
+            self._watch_edits(layers)
+            task.resultReady.connect(self._on_gpkg_export_finished)
+            dlg = GpkgExportProgressDialog(task, self.iface.mainWindow())
+            self._gpkg_task = task
+            self._gpkg_dialog = dlg
+            _RUNNING_EXPORTS.add(self)
+            dlg.show()
+            QgsApplication.taskManager().addTask(task)
+        except Exception as e:
+            self._gpkg_task = None
+            self._unwatch_edits()
+            _RUNNING_EXPORTS.discard(self)
+            try:
+                self.iface.messageBar().pushCritical("GPKG export", f"Unexpected error: {e}")
+            except Exception as e:
+                logger.debug(f"Error in ExportManager.save_all_layers_to_gpkg: {e}")
 
-                result = QgsVectorFileWriter.writeAsVectorFormatV3(
-                    lyr, gpkg_path, QgsCoordinateTransformContext(), opts
+    def _watch_edits(self, layers):
+        """Record in _gpkg_edited every layer edited from now until the export reports back."""
+        self._unwatch_edits()
+        for lyr in layers:
+            slot = (lambda *_args, layer_id=lyr.id(): self._gpkg_edited.add(layer_id))
+            for signal in (lyr.editingStarted, lyr.layerModified, lyr.dataChanged):
+                signal.connect(slot)
+                self._gpkg_watch.append((signal, slot))
+
+    def _unwatch_edits(self):
+        """Stop recording edits; returns the ids of the layers edited meanwhile."""
+        for signal, slot in self._gpkg_watch:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass  # the layer is gone already
+        edited, self._gpkg_edited, self._gpkg_watch = self._gpkg_edited, set(), []
+        return edited
+
+    def cancel_gpkg_export(self):
+        """Stop the GeoPackage export in flight, if any (nothing is redirected)."""
+        task = self._gpkg_task
+        if task is not None:
+            try:
+                task.cancel()
+            except Exception as e:
+                logger.debug(f"Error in ExportManager.cancel_gpkg_export: {e}")
+
+    def _on_gpkg_export_finished(self, result):
+        """Redirect the written layers and report the outcome (main thread)."""
+        self._gpkg_task = None
+        self._gpkg_dialog = None
+        edited = self._unwatch_edits()
+        _RUNNING_EXPORTS.discard(self)
+        try:
+            if result.cancelled:
+                self.iface.messageBar().pushInfo(
+                    "GPKG export", "Export cancelled; no layer was changed.")
+                return
+            if not result.ok:
+                self.iface.messageBar().pushWarning(
+                    "GPKG export",
+                    "Nothing was saved:\n" + "\n".join(result.errors)
                 )
+                return
 
-                if isinstance(result, tuple):
-                    err_code = result[0]
-                    err_msg = result[1] if len(result) > 1 else ""
-                else:
-                    err_code = result
-                    err_msg = ""
-
-                if err_code != QgsVectorFileWriter.WriterError.NoError:
-                    errors.append(f"{lyr.name()}: {err_msg}")
+            prj = QgsProject.instance()
+            gpkg_path = result.path
+            errors = []
+            for layer_id, name in result.written.items():
+                lyr = prj.mapLayer(layer_id)
+                if lyr is None:
+                    continue  # removed while the export ran
+                if layer_id in result.moved:
+                    # Its features were renumbered in the GeoPackage: fid
+                    # references (a slack's cable_fid) would point elsewhere
+                    errors.append(f"{lyr.name()}: saved, but kept on its source (feature ids changed)")
+                    continue
+                if layer_id in edited or lyr.isModified():
+                    # The GeoPackage has it as it was before these edits;
+                    # redirecting would drop them
+                    errors.append(f"{lyr.name()}: edited during the save, kept on its source (save again)")
                     continue
 
-                # Redirect layer source to GPKG
+                # Redirect layer source to GPKG (unless it already reads it)
                 uri = f"{gpkg_path}|layername={name}"
                 try:
-                    lyr.setDataSource(uri, lyr.name(), "ogr")
+                    if lyr.providerType() != "ogr" or lyr.source() != uri:
+                        lyr.setDataSource(uri, lyr.name(), "ogr")
                     try:
                         lyr.saveStyleToDatabase("default", "auto-saved by FiberQ", True, "")
                     except Exception as e:
-                        logger.debug(f"Error in ExportManager.save_all_layers_to_gpkg: {e}")
+                        logger.debug(f"Error in ExportManager._on_gpkg_export_finished: {e}")
                 except Exception:
                     # Fallback: add new layer
                     new_lyr = QgsVectorLayer(uri, lyr.name(), "ogr")
@@ -341,7 +413,7 @@ class ExportManager:
                         try:
                             new_lyr.saveStyleToDatabase("default", "auto-saved by FiberQ", True, "")
                         except Exception as e:
-                            logger.debug(f"Error in ExportManager.save_all_layers_to_gpkg: {e}")
+                            logger.debug(f"Error in ExportManager._on_gpkg_export_finished: {e}")
                     else:
                         errors.append(f"{lyr.name()}: Failed to reload from GPKG")
 
@@ -364,15 +436,17 @@ class ExportManager:
                     "Completed with errors:\n" + "\n".join(errors)
                 )
             else:
-                self.iface.messageBar().pushSuccess(
-                    "GPKG export",
-                    f"All layers saved to:\n{gpkg_path}"
-                )
+                msg = f"All layers saved to:\n{gpkg_path}"
+                if result.synced:
+                    ins, upd, dele = (sum(c[i] for c in result.synced.values()) for i in range(3))
+                    msg += (f"\n{len(result.synced)} layers synced: {ins} added, "
+                            f"{upd} changed, {dele} deleted features")
+                self.iface.messageBar().pushSuccess("GPKG export", msg)
         except Exception as e:
             try:
                 self.iface.messageBar().pushCritical("GPKG export", f"Unexpected error: {e}")
             except Exception as e:
-                logger.debug(f"Error in ExportManager.save_all_layers_to_gpkg: {e}")
+                logger.debug(f"Error in ExportManager._on_gpkg_export_finished: {e}")
 
     def export_one_layer_to_gpkg(self, layer, gpkg_path):
         """
@@ -0,0 +1,542 @@
+"""GeoPackage export as a background task.
+
+Saving the whole project to one GeoPackage used to write layer after layer
+with ``writeAsVectorFormatV3`` on the GUI thread, each write its own
+transaction with its own spatial index; forty layers of 100k features froze
+QGIS for minutes.
+
+The constructor of :class:`GpkgExportTask` runs on the main thread and
+snapshots each layer (a ``QgsVectorLayerFeatureSource`` plus its name, fields,
+geometry type and CRS). :meth:`GpkgExportTask.run` writes every snapshot with
+:func:`write_gpkg`: one OGR transaction for all layers, WAL journalling while
+writing, spatial indexes built once the data is in. If any layer fails, or the
+user cancels, the transaction is rolled back and the file keeps what it had.
+:meth:`~GpkgExportTask.finished` is back on the main thread, where the caller
+repoints the layers -- only ever after every write succeeded.
+
+Feature ids are kept, so attributes that refer to a feature by fid (a slack's
+``cable_fid``) still point at the same feature after the layers are repointed.
+
+Saving again into the same file need not rewrite it: in delta mode a table that
+already holds the layer is synced by ``fiberq_uuid``. Every write records a
+content hash per feature in the ``_fiberq_sync`` side table; the next save
+upserts only the features whose hash changed and deletes those that are gone,
+so re-saving a large project after a few edits touches a few rows. A table
+whose rows are not stored under their feature's fid is rewritten instead.
+"""
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from qgis.core import (
+    QgsFeatureRequest,
+    QgsFields,
+    QgsTask,
+    QgsVectorLayerFeatureSource,
+    QgsWkbTypes,
+)
+from qgis.PyQt.QtCore import QCoreApplication, QVariant, pyqtSignal
+
+from ..utils.logger import get_logger
+from ..utils.uuid_utils import FIBERQ_UUID_FIELD
+
+logger = get_logger(__name__)
+
+#: Features written between two progress reports / cancel checks.
+PROGRESS_EVERY = 500
+
+#: Side table (next to ``_fiberq_metadata``) with the content hash of every
+#: feature last written, per table and ``fiberq_uuid``.
+SYNC_TABLE = "_fiberq_sync"
+
+#: Rows per statement when the side table is updated.
+SQL_BATCH = 500
+
+
+def gpkg_layer_names(layers) -> Dict[str, str]:
+    """A unique GeoPackage table name per layer, keyed by layer id."""
+    used = set()
+    names = {}
+    for idx, lyr in enumerate(layers):
+        base = re.sub(r"[^A-Za-z0-9_]+", "_", lyr.name()).strip("_") or f"layer_{idx + 1}"
+        name = base
+        c = 1
+        while name in used:
+            c += 1
+            name = f"{base}_{c}"
+        used.add(name)
+        names[lyr.id()] = name
+    return names
+
+
+class LayerExport:
+    """One layer as it was when the export started: what the worker writes."""
+
+    def __init__(self, layer, table: str):
+        self.layer_id = layer.id()
+        self.layer_name = layer.name()
+        self.table = table
+        self.fields = QgsFields(layer.fields())
+        self.wkb_type = layer.wkbType()
+        self.crs_wkt = layer.crs().toWkt() if layer.crs().isValid() else ""
+        self.srid = layer.crs().postgisSrid() if layer.crs().isValid() else 0
+        self.count = max(int(layer.featureCount()), 0)
+        self.source = QgsVectorLayerFeatureSource(layer)
+
+
+@dataclass
+class GpkgExportResult:
+    """Outcome of :func:`write_gpkg`."""
+
+    path: str
+    #: layer id -> table name, for every layer written (empty unless committed)
+    written: Dict[str, str] = field(default_factory=dict)
+    #: layer id -> (inserted, updated, deleted), for the layers synced in place
+    synced: Dict[str, Tuple[int, int, int]] = field(default_factory=dict)
+    #: ids of the written layers whose features could not keep their fid
+    #: (e.g. fid 0 of a shapefile): repointing them would renumber the features
+    moved: List[str] = field(default_factory=list)
+    #: "<layer name>: <message>" for each failure
+    errors: List[str] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.cancelled
+
+
+def write_gpkg(path: str, jobs: List[LayerExport],
+               progress: Optional[Callable[[str, float], None]] = None,
+               is_cancelled: Optional[Callable[[], bool]] = None,
+               delta: bool = False) -> GpkgExportResult:
+    """
+    Write ``jobs`` into the GeoPackage ``path`` in one transaction.
+
+    Existing tables of the same name are replaced; other tables are left alone.
+    With ``delta``, a table that already holds the layer (same fields and
+    geometry type, every feature keyed by a unique ``fiberq_uuid`` and stored
+    under its own fid) is synced instead: only features whose content hash
+    differs from the one stored in :data:`SYNC_TABLE` are upserted, and
+    features gone from the layer are deleted.
+
+    Args:
+        path: GeoPackage file (created if missing)
+        jobs: Layer snapshots to write
+        progress: Called with (layer id, percent) as each layer is written
+        is_cancelled: Polled between batches of features
+        delta: Sync existing tables row by row rather than rewrite them
+
+    Returns:
+        GpkgExportResult; ``written`` is empty unless everything was committed
+    """
+    from osgeo import ogr
+
+    result = GpkgExportResult(path)
+    ogr.UseExceptions()
+    try:
+        ds = ogr.Open(path, 1)
+    except Exception:
+        ds = None
+    if ds is None:
+        try:
+            ds = ogr.GetDriverByName("GPKG").CreateDataSource(path)
+        except Exception as e:
+            result.errors.append(f"{path}: {e}")
+            return result
+
+    try:
+        _sql(ds, "PRAGMA journal_mode=WAL")
+        ds.StartTransaction()
+        _sql(ds, f"CREATE TABLE IF NOT EXISTS {SYNC_TABLE} ("
+                 "table_name TEXT NOT NULL, uuid TEXT NOT NULL, hash TEXT NOT NULL, "
+                 "PRIMARY KEY (table_name, uuid))")
+        written = {}
+        synced = {}
+        moved = []
+        for job in jobs:
+            if is_cancelled is not None and is_cancelled():
+                result.cancelled = True
+                break
+            try:
+                rows = _sync_fids(ds, job) if delta else None
+                if rows is not None:
+                    counts = _sync_layer(ds, job, *rows, progress, is_cancelled)
+                    if counts is not None:
+                        synced[job.layer_id] = counts
+                else:
+                    renumbered = _write_layer(ds, job, progress, is_cancelled)
+                    counts = None if renumbered is None else ()
+                    if renumbered:
+                        moved.append(job.layer_id)
+                if counts is None:
+                    result.cancelled = True
+                    break
+                written[job.layer_id] = job.table
+            except Exception as e:
+                result.errors.append(f"{job.layer_name}: {e}")
+                break
+
+        if not result.ok:
+            ds.RollbackTransaction()
+            return result
+        ds.CommitTransaction()
+        result.written = written
+        result.synced = synced
+        result.moved = moved
+
+        # Indexes last: one bulk build per rewritten table instead of one
+        # insert per row (synced tables keep theirs, maintained by triggers)
+        for job in jobs:
+            if job.layer_id in synced:
+                continue
+            try:
+                lyr = ds.GetLayerByName(job.table)
+                geom_col = lyr.GetGeometryColumn() if lyr is not None else ""
+                if geom_col:
+                    _sql(ds, f"SELECT CreateSpatialIndex('{job.table}', '{geom_col}')")
+            except Exception as e:
+                logger.debug(f"Error in write_gpkg creating spatial index: {e}")
+    except Exception as e:
+        result.errors.append(f"{path}: {e}")
+        result.written = {}
+        result.synced = {}
+        result.moved = []
+        try:
+            ds.RollbackTransaction()
+        except Exception as e:
+            logger.debug(f"Error in write_gpkg rolling back: {e}")
+    finally:
+        # Back to the default journal whatever happened, so the user's file
+        # is not left in WAL mode with -wal/-shm files next to it
+        try:
+            _sql(ds, "PRAGMA journal_mode=DELETE")
+        except Exception as e:
+            logger.debug(f"Error in write_gpkg resetting the journal mode: {e}")
+        ds = None
+    return result
+
+
+def _sql(ds, statement: str):
+    """Run ``statement``; rows of a SELECT are returned as a list of lists."""
+    rs = ds.ExecuteSQL(statement)
+    if rs is None:
+        return []
+    try:
+        return [[feat.GetField(i) for i in range(feat.GetFieldCount())] + [feat.GetFID()]
+                for feat in rs]
+    finally:
+        ds.ReleaseResultSet(rs)
+
+
+def _quote(value) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _columns(fields: QgsFields):
+    """(QgsFields index, field) of the fields written to the GeoPackage."""
+    # 'fid' is the GeoPackage's own fid column
+    return [(idx, fld) for idx, fld in enumerate(fields) if fld.name().lower() != "fid"]
+
+
+def _ogr_feature(defn, feat, columns):
+    from osgeo import ogr
+
+    ofeat = ogr.Feature(defn)
+    geom = feat.geometry()
+    if geom is not None and not geom.isEmpty():
+        ofeat.SetGeometry(ogr.CreateGeometryFromWkb(bytes(geom.asWkb())))
+    attrs = feat.attributes()
+    for dst, (src, _fld) in enumerate(columns):
+        value = _ogr_value(attrs[src])
+        if value is None:
+            ofeat.SetFieldNull(dst)
+        else:
+            ofeat.SetField(dst, value)
+    return ofeat
+
+
+def _feature_hash(feat, columns) -> str:
+    """Digest of a feature's geometry and written attributes (not its fid)."""
+    digest = hashlib.blake2b(digest_size=16)
+    geom = feat.geometry()
+    if geom is not None and not geom.isEmpty():
+        digest.update(bytes(geom.asWkb()))
+    attrs = feat.attributes()
+    for src, _fld in columns:
+        digest.update(b"\x1f" + repr(_ogr_value(attrs[src])).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _uuid_of(feat, idx: int) -> str:
+    value = _ogr_value(feat.attribute(idx)) if idx != -1 else None
+    return "" if value is None else str(value)
+
+
+def _store_hashes(ds, table: str, hashes: Dict[str, str], gone=(), replace: bool = False) -> None:
+    """Record ``hashes`` (uuid -> digest) for ``table`` and forget ``gone``."""
+    # OGR's ExecuteSQL binds no parameters: every value goes through _quote
+    if replace:
+        _sql(ds, f"DELETE FROM {SYNC_TABLE} WHERE table_name = {_quote(table)}")  # nosec B608 # _quote-escaped literal
+    gone = list(gone)
+    for start in range(0, len(gone), SQL_BATCH):
+        keys = ", ".join(_quote(uuid) for uuid in gone[start:start + SQL_BATCH])
+        _sql(ds, f"DELETE FROM {SYNC_TABLE} WHERE table_name = {_quote(table)} AND uuid IN ({keys})")  # nosec B608 # _quote-escaped literals
+    rows = list(hashes.items())
+    for start in range(0, len(rows), SQL_BATCH):
+        values = ", ".join(f"({_quote(table)}, {_quote(uuid)}, {_quote(digest)})"
+                           for uuid, digest in rows[start:start + SQL_BATCH])
+        _sql(ds, f"INSERT OR REPLACE INTO {SYNC_TABLE} (table_name, uuid, hash) VALUES {values}")
+
+
+def _write_layer(ds, job: LayerExport, progress, is_cancelled) -> Optional[int]:
+    """Create ``job.table`` and copy the snapshot into it; returns how many
+    features got a fid other than their own, or None if cancelled."""
+    from osgeo import ogr, osr
+
+    for i in range(ds.GetLayerCount()):
+        if ds.GetLayerByIndex(i).GetName() == job.table:
+            ds.DeleteLayer(i)
+            break
+
+    srs = None
+    if job.crs_wkt:
+        srs = osr.SpatialReference()
+        srs.ImportFromWkt(job.crs_wkt)
+        srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    out = ds.CreateLayer(job.table, srs, _ogr_geometry_type(job.wkb_type),
+                         options=["SPATIAL_INDEX=NO"])
+
+    columns = _columns(job.fields)
+    for _idx, fld in columns:
+        defn = ogr.FieldDefn(fld.name(), _ogr_field_type(fld.type()))
+        if fld.type() == QVariant.Bool:
+            defn.SetSubType(ogr.OFSTBoolean)
+        out.CreateField(defn)
+
+    # Keep the hashes of a keyed layer, so the next save can sync it
+    idx_uuid = job.fields.indexFromName(FIBERQ_UUID_FIELD)
+    hashes = {}
+    defn = out.GetLayerDefn()
+    done = moved = 0
+    for feat in job.source.getFeatures(QgsFeatureRequest()):
+        ofeat = _ogr_feature(defn, feat, columns)
+        if feat.id() > 0:
+            ofeat.SetFID(int(feat.id()))
+        out.CreateFeature(ofeat)
+        if ofeat.GetFID() != feat.id():
+            moved += 1
+        uuid = _uuid_of(feat, idx_uuid)
+        if uuid:
+            hashes[uuid] = _feature_hash(feat, columns)
+        done += 1
+        if done % PROGRESS_EVERY == 0:
+            if is_cancelled is not None and is_cancelled():
+                return None
+            if progress is not None:
+                progress(job.layer_id, 100.0 * done / max(job.count, done, 1))
+    _store_hashes(ds, job.table, hashes, replace=True)
+    if progress is not None:
+        progress(job.layer_id, 100.0)
+    return moved
+
+
+def _sync_fids(ds, job: LayerExport) -> Optional[Tuple[Dict[str, int], Dict[str, int]]]:
+    """
+    ``fiberq_uuid`` -> fid of the rows of ``job.table`` whose feature is still
+    in the layer, and of those whose feature is gone; None when the table
+    cannot be synced and must be rewritten.
+
+    Syncing needs this layer's schema, a unique uuid on every feature and on
+    every row, and each feature stored under its own fid -- the fids of the
+    GeoPackage are those of the layer once it is repointed, and a slack's
+    ``cable_fid`` must not change meaning.
+    """
+    out = ds.GetLayerByName(job.table)
+    if out is None:
+        return None
+    idx_uuid = job.fields.indexFromName(FIBERQ_UUID_FIELD)
+    if idx_uuid == -1:
+        return None
+    defn = out.GetLayerDefn()
+    have = [(defn.GetFieldDefn(i).GetName(), defn.GetFieldDefn(i).GetType()) for i in range(defn.GetFieldCount())]
+    want = [(fld.name(), _ogr_field_type(fld.type())) for _idx, fld in _columns(job.fields)]
+    if have != want or out.GetGeomType() != _ogr_geometry_type(job.wkb_type):
+        return None
+
+    fid_col = out.GetFIDColumn() or "fid"
+    # Identifiers only: the table name is sanitised (gpkg_layer_names)
+    rows = _sql(ds, f'SELECT "{FIBERQ_UUID_FIELD}", "{fid_col}" FROM "{job.table}"')  # nosec B608 # identifiers only
+    existing = {}
+    for row in rows:
+        uuid, fid = row[0], row[1]
+        if uuid is None or str(uuid) in existing:
+            return None
+        existing[str(uuid)] = int(fid)
+
+    request = QgsFeatureRequest()
+    request.setFlags(QgsFeatureRequest.Flag.NoGeometry)
+    request.setSubsetOfAttributes([idx_uuid])
+    seen = set()
+    for feat in job.source.getFeatures(request):
+        uuid = _uuid_of(feat, idx_uuid)
+        if not uuid or uuid in seen or feat.id() <= 0:
+            return None
+        if existing.get(uuid, feat.id()) != feat.id():
+            return None  # the row sits under another fid
+        seen.add(uuid)
+    gone = {uuid: fid for uuid, fid in existing.items() if uuid not in seen}
+    kept = {uuid: fid for uuid, fid in existing.items() if uuid in seen}
+    return kept, gone
+
+
+def _sync_layer(ds, job: LayerExport, existing: Dict[str, int], gone: Dict[str, int],
+                progress, is_cancelled) -> Optional[Tuple[int, int, int]]:
+    """Upsert the changed features of ``job`` into its table and delete the
+    ones gone, each feature under its own fid (``existing`` and ``gone``: see
+    :func:`_sync_fids`); returns (inserted, updated, deleted), or None if
+    cancelled."""
+    out = ds.GetLayerByName(job.table)
+    table = job.table
+    stored = {row[0]: row[1] for row in _sql(
+        ds, f"SELECT uuid, hash FROM {SYNC_TABLE} WHERE table_name = {_quote(table)}")}  # nosec B608 # _quote-escaped literal
+
+    # Deletes first: a new feature may take the fid of one gone
+    for fid in gone.values():
+        out.DeleteFeature(fid)
+
+    idx_uuid = job.fields.indexFromName(FIBERQ_UUID_FIELD)
+    columns = _columns(job.fields)
+    defn = out.GetLayerDefn()
+    hashes = {}
+    inserted = updated = 0
+    done = 0
+    for feat in job.source.getFeatures(QgsFeatureRequest()):
+        uuid = _uuid_of(feat, idx_uuid)
+        digest = _feature_hash(feat, columns)
+        if uuid not in existing or stored.get(uuid) != digest:
+            ofeat = _ogr_feature(defn, feat, columns)
+            ofeat.SetFID(int(feat.id()))
+            if uuid in existing:
+                out.SetFeature(ofeat)
+                updated += 1
+            else:
+                out.CreateFeature(ofeat)
+                inserted += 1
+            hashes[uuid] = digest
+        done += 1
+        if done % PROGRESS_EVERY == 0:
+            if is_cancelled is not None and is_cancelled():
+                return None
+            if progress is not None:
+                progress(job.layer_id, 100.0 * done / max(job.count, done, 1))
+
+    _store_hashes(ds, table, hashes, gone)
+    if progress is not None:
+        progress(job.layer_id, 100.0)
+    return inserted, updated, len(gone)
+
+
+def _enum_value(value) -> int:
+    return int(getattr(value, "value", value))
+
+
+def _ogr_geometry_type(wkb_type) -> int:
+    from osgeo import ogr
+
+    flat = _enum_value(QgsWkbTypes.flatType(wkb_type))
+    if flat == _enum_value(QgsWkbTypes.Type.NoGeometry):
+        return ogr.wkbNone
+    if flat > 7:  # curves and the like: let the GeoPackage say GEOMETRY
+        return ogr.wkbUnknown
+    gtype = flat
+    if QgsWkbTypes.hasZ(wkb_type):
+        gtype = ogr.GT_SetZ(gtype)
+    if QgsWkbTypes.hasM(wkb_type):
+        gtype = ogr.GT_SetM(gtype)
+    return gtype
+
+
+def _ogr_field_type(qtype) -> int:
+    from osgeo import ogr
+
+    return {
+        QVariant.Int: ogr.OFTInteger,
+        QVariant.Bool: ogr.OFTInteger,
+        QVariant.LongLong: ogr.OFTInteger64,
+        QVariant.Double: ogr.OFTReal,
+        QVariant.Date: ogr.OFTDate,
+        QVariant.DateTime: ogr.OFTDateTime,
+        QVariant.Time: ogr.OFTTime,
+    }.get(qtype, ogr.OFTString)
+
+
+def _ogr_value(value):
+    """A QGIS attribute value as something ``ogr.Feature.SetField`` takes."""
+    if value is None:
+        return None
+    if isinstance(value, QVariant):
+        if value.isNull():
+            return None
+        value = value.value()
+    if isinstance(value, (bool, int, float, str)):
+        return int(value) if isinstance(value, bool) else value
+    if hasattr(value, "toString"):  # QDate / QDateTime / QTime
+        from qgis.PyQt.QtCore import Qt
+        return value.toString(Qt.DateFormat.ISODate)
+    return str(value)
+
+
+class GpkgExportTask(QgsTask):
+    """Write the project's vector layers to one GeoPackage off the GUI thread."""
+
+    #: A layer advanced: its id and percent written.
+    layerProgress = pyqtSignal(str, float)
+    #: The run is over: the GpkgExportResult.
+    resultReady = pyqtSignal(object)
+
+    def __init__(self, path: str, layers, delta: bool = False):
+        super().__init__(QCoreApplication.translate('GpkgExportTask', 'FiberQ GeoPackage export'))
+        self.path = path
+        self.delta = delta
+        names = gpkg_layer_names(layers)
+        # Snapshot here, on the main thread: run() must not touch a live layer
+        self.jobs = [LayerExport(lyr, names[lyr.id()]) for lyr in layers]
+        self._total = sum(max(job.count, 1) for job in self.jobs) or 1
+        self._done_before: Dict[str, int] = {}
+        acc = 0
+        for job in self.jobs:
+            self._done_before[job.layer_id] = acc
+            acc += max(job.count, 1)
+        self._result = None
+
+    def _progress(self, layer_id: str, percent: float) -> None:
+        job = next((j for j in self.jobs if j.layer_id == layer_id), None)
+        if job is not None:
+            done = self._done_before[layer_id] + max(job.count, 1) * percent / 100.0
+            self.setProgress(100.0 * done / self._total)
+        self.layerProgress.emit(layer_id, float(percent))
+
+    def run(self):
+        try:
+            self._result = write_gpkg(self.path, self.jobs, self._progress, self.isCanceled, self.delta)
+        except Exception as e:  # write_gpkg reports its own failures
+            logger.warning(f"GeoPackage export task failed: {e}")
+            self._result = GpkgExportResult(self.path, errors=[str(e)])
+            return False
+        return self._result.ok
+
+    def finished(self, ok):
+        result = self._result or GpkgExportResult(self.path, errors=["export did not run"])
+        result.cancelled = result.cancelled or self.isCanceled()
+        self.resultReady.emit(result)
+
+
+__all__ = [
+    'GpkgExportTask',
+    'GpkgExportResult',
+    'LayerExport',
+    'gpkg_layer_names',
+    'write_gpkg',
+    'SYNC_TABLE',
+]
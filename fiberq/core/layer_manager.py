@@ -29,6 +29,7 @@ from qgis.PyQt.QtGui import QColor
 from qgis.PyQt.QtWidgets import QMessageBox, QFileDialog
 
 # Phase 5.2: Logging
+from .layer_registry import get_layer_registry
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
@@ -168,14 +169,7 @@ def _ensure_element_layer_with_style(plugin, layer_name: str):
         QgsVectorLayer: The element layer
     """
     # Find existing layer
-    elem_layer = None
-    for lyr in QgsProject.instance().mapLayers().values():
-        try:
-            if isinstance(lyr, QgsVectorLayer) and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and lyr.name() == layer_name:
-                elem_layer = lyr
-                break
-        except Exception as e:
-            logger.debug(f"Error in element layer creation: {e}")
+    elem_layer = get_layer_registry().layer(layer_name, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
     if elem_layer is None:
         # Create new layer
@@ -349,24 +343,16 @@ def _ensure_region_layer(core):
         proj = QgsProject.instance()
 
         # Find existing layer ('Rejon' or 'Service Area')
-        for lyr in proj.mapLayers().values():
-            try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.PolygonGeometry  # noqa: W503
-                    and lyr.name() in ('Rejon', 'Service Area')  # noqa: W503
-                ):
-                    # Rename old 'Rejon' to 'Service Area'
-                    if lyr.name() == 'Rejon':
-                        try:
-                            lyr.setName('Service Area')
-                        except Exception as e:
-                            logger.debug(f"Error in _ensure_region_layer: {e}")
-                    ensure_uuid_field(lyr)
-                    return lyr
-            except Exception as e:
-                logger.debug(f"Skipping layer while locating region layer: {e}")
-                continue
+        lyr = get_layer_registry().layer('Service Area', geometry=QgsWkbTypes.GeometryType.PolygonGeometry)
+        if lyr is not None:
+            # Rename old 'Rejon' to 'Service Area'
+            if lyr.name() == 'Rejon':
+                try:
+                    lyr.setName('Service Area')
+                except Exception as e:
+                    logger.debug(f"Error in _ensure_region_layer: {e}")
+            ensure_uuid_field(lyr)
+            return lyr
 
         # Create new layer
         crs = proj.crs().authid() if proj and proj.crs().isValid() else 'EPSG:3857'
@@ -621,17 +607,13 @@ def _ensure_objects_layer(core):
         prj = QgsProject.instance()
 
         # Find existing layer ('Objekti' or 'Objects')
-        for lyr in prj.mapLayers().values():
+        for lyr in get_layer_registry().layers("Objects"):
             try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.wkbType() in (  # noqa: W503
-                        QgsWkbTypes.Type.Polygon,
-                        QgsWkbTypes.Type.MultiPolygon,
-                        QgsWkbTypes.Type.PolygonZM,
-                        QgsWkbTypes.Type.MultiPolygonZM,
-                    )
-                    and lyr.name() in ("Objekti", "Objects")  # noqa: W503
+                if lyr.wkbType() in (
+                    QgsWkbTypes.Type.Polygon,
+                    QgsWkbTypes.Type.MultiPolygon,
+                    QgsWkbTypes.Type.PolygonZM,
+                    QgsWkbTypes.Type.MultiPolygonZM,
                 ):
                     _apply_objects_field_aliases(lyr)
                     _set_objects_layer_alias(lyr)
@@ -977,15 +959,11 @@ class LayerManager:
         project = QgsProject.instance()
 
         # Check if layer exists
-        for lyr in project.mapLayers().values():
-            if (
-                isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                lyr.name() in ("Poles", "Stubovi")
-            ):
-                self._apply_poles_aliases(lyr)
-                ensure_uuid_field(lyr)
-                return lyr
+        lyr = get_layer_registry().layer("Poles", geometry=QgsWkbTypes.GeometryType.PointGeometry)
+        if lyr is not None:
+            self._apply_poles_aliases(lyr)
+            ensure_uuid_field(lyr)
+            return lyr
 
         # Create new layer
         crs = self.get_crs()
@@ -1038,17 +1016,13 @@ class LayerManager:
         project = QgsProject.instance()
 
         # Check if layer exists
-        # Issue #2: Check for all possible slack layer names
-        for lyr in project.mapLayers().values():
+        # Issue #2: the registry resolves all possible slack layer names
+        lyr = get_layer_registry().layer("Optical slack", geometry=QgsWkbTypes.GeometryType.PointGeometry)
+        if lyr is not None:
             try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry  # noqa: W503
-                    and lyr.name() in ("Opticke_rezerve", "Optical slacks", "Optical slack")  # noqa: W503
-                ):
-                    self._apply_slack_aliases(lyr)
-                    ensure_uuid_field(lyr)
-                    return lyr
+                self._apply_slack_aliases(lyr)
+                ensure_uuid_field(lyr)
+                return lyr
             except Exception as e:
                 logger.debug(f"Error in ensure_slack_layer: {e}")
 
@@ -1118,17 +1092,15 @@ class LayerManager:
         project = QgsProject.instance()
 
         # Check if layer exists
-        for lyr in project.mapLayers().values():
+        lyr = get_layer_registry().layer("Manholes", geometry=QgsWkbTypes.GeometryType.PointGeometry)
+        if lyr is not None:
             try:
-                name = lyr.name().strip()
-                if name in ("OKNA", "Manholes") and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry:
-                    self._apply_manholes_aliases(lyr)
-                    ensure_uuid_field(lyr)
-                    self.move_layer_to_top(lyr)
-                    return lyr
+                self._apply_manholes_aliases(lyr)
+                ensure_uuid_field(lyr)
+                self.move_layer_to_top(lyr)
+                return lyr
             except Exception as e:
-                logger.debug(f"Skipping layer while locating manholes layer: {e}")
-                continue
+                logger.debug(f"Error in ensure_manholes_layer: {e}")
 
         # Create new layer
         crs = self.get_crs()
@@ -1227,21 +1199,17 @@ class LayerManager:
             "PE cevi": "PE pipes",
             "Prelazne cevi": "Transition pipes",
         }
-        target_names = {name}
+        target_names = [name]
         if name in alias_map:
-            target_names.add(alias_map[name])
+            target_names.append(alias_map[name])
 
         # Find existing layer
-        for lyr in prj.mapLayers().values():
+        lyr = get_layer_registry().layer(*target_names, geometry=QgsWkbTypes.GeometryType.LineGeometry)
+        if lyr is not None:
             try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                    and lyr.name() in target_names  # noqa: W503
-                ):
-                    self._apply_pipe_aliases(lyr)
-                    ensure_uuid_field(lyr)
-                    return lyr
+                self._apply_pipe_aliases(lyr)
+                ensure_uuid_field(lyr)
+                return lyr
             except Exception as e:
                 logger.debug(f"Error in _telecom_export_one_layer_to_gpkg: {e}")
 
@@ -1351,23 +1319,15 @@ class LayerManager:
             proj = QgsProject.instance()
 
             # Find existing layer
-            for lyr in proj.mapLayers().values():
-                try:
-                    if (
-                        isinstance(lyr, QgsVectorLayer)
-                        and lyr.geometryType() == QgsWkbTypes.GeometryType.PolygonGeometry  # noqa: W503
-                        and lyr.name() in ('Rejon', 'Service Area')  # noqa: W503
-                    ):
-                        if lyr.name() == 'Rejon':
-                            try:
-                                lyr.setName('Service Area')
-                            except Exception as e:
-                                logger.debug(f"Error in _telecom_export_one_layer_to_gpkg: {e}")
-                        ensure_uuid_field(lyr)
-                        return lyr
-                except Exception as e:
-                    logger.debug(f"Skipping layer while locating region layer: {e}")
-                    continue
+            lyr = get_layer_registry().layer('Service Area', geometry=QgsWkbTypes.GeometryType.PolygonGeometry)
+            if lyr is not None:
+                if lyr.name() == 'Rejon':
+                    try:
+                        lyr.setName('Service Area')
+                    except Exception as e:
+                        logger.debug(f"Error in _telecom_export_one_layer_to_gpkg: {e}")
+                ensure_uuid_field(lyr)
+                return lyr
 
             # Create new layer
             crs = proj.crs().authid() if proj and proj.crs().isValid() else 'EPSG:3857'
@@ -1411,17 +1371,13 @@ class LayerManager:
             prj = QgsProject.instance()
 
             # Find existing layer
-            for lyr in prj.mapLayers().values():
+            for lyr in get_layer_registry().layers("Objects"):
                 try:
-                    if (
-                        isinstance(lyr, QgsVectorLayer)
-                        and lyr.wkbType() in (  # noqa: W503
-                            QgsWkbTypes.Type.Polygon,
-                            QgsWkbTypes.Type.MultiPolygon,
-                            QgsWkbTypes.Type.PolygonZM,
-                            QgsWkbTypes.Type.MultiPolygonZM,
-                        )
-                        and lyr.name() in ("Objekti", "Objects")  # noqa: W503
+                    if lyr.wkbType() in (
+                        QgsWkbTypes.Type.Polygon,
+                        QgsWkbTypes.Type.MultiPolygon,
+                        QgsWkbTypes.Type.PolygonZM,
+                        QgsWkbTypes.Type.MultiPolygonZM,
                     ):
                         self._apply_objects_aliases(lyr)
                         ensure_uuid_field(lyr)
@@ -1478,16 +1434,12 @@ class LayerManager:
         prj = QgsProject.instance()
 
         # Find existing layer
-        for lyr in prj.mapLayers().values():
+        lyr = get_layer_registry().layer(layer_name, geometry=QgsWkbTypes.GeometryType.PointGeometry)
+        if lyr is not None:
             try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry  # noqa: W503
-                    and lyr.name() == layer_name  # noqa: W503
-                ):
-                    self._apply_element_aliases(lyr)
-                    ensure_uuid_field(lyr)
-                    return lyr
+                self._apply_element_aliases(lyr)
+                ensure_uuid_field(lyr)
+                return lyr
             except Exception as e:
                 logger.debug(f"Error in _telecom_export_one_layer_to_gpkg: {e}")
 
@@ -1605,14 +1557,10 @@ class LayerManager:
         prj = QgsProject.instance()
 
         # Find existing layer
-        for lyr in prj.mapLayers().values():
-            if (
-                isinstance(lyr, QgsVectorLayer)
-                and lyr.name() in ('Route', 'Trasa')  # noqa: W503
-                and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-            ):
-                ensure_uuid_field(lyr)
-                return lyr
+        lyr = get_layer_registry().layer('Route', geometry=QgsWkbTypes.GeometryType.LineGeometry)
+        if lyr is not None:
+            ensure_uuid_field(lyr)
+            return lyr
 
         # Create new layer
         crs = self.get_crs()
@@ -1764,16 +1712,7 @@ class LayerManager:
         Returns:
             QgsVectorLayer or None
         """
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if isinstance(lyr, QgsVectorLayer) and lyr.name() == name:
-                    if geometry_type is None:
-                        return lyr
-                    if lyr.geometryType() == geometry_type:
-                        return lyr
-            except Exception as e:
-                logger.debug(f"Error in _telecom_export_one_layer_to_gpkg: {e}")
-        return None
+        return get_layer_registry().layer(name, geometry=geometry_type)
 
     def find_layers_by_names(self, names, geometry_type=None):
         """
@@ -1786,15 +1725,7 @@ class LayerManager:
         Returns:
             List of matching QgsVectorLayer instances
         """
-        result = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if isinstance(lyr, QgsVectorLayer) and lyr.name() in names:
-                    if geometry_type is None or lyr.geometryType() == geometry_type:
-                        result.append(lyr)
-            except Exception as e:
-                logger.debug(f"Error in _telecom_export_one_layer_to_gpkg: {e}")
-        return result
+        return get_layer_registry().layers(*names, geometry=geometry_type)
 
 
 # Module-level convenience functions for backward compatibility
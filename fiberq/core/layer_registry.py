@@ -0,0 +1,308 @@
+"""FiberQ layer registry.
+
+Tools and managers used to find their layers by walking
+``QgsProject.instance().mapLayers()`` and comparing every name against a
+hand-kept set of English and legacy Serbian spellings -- on tool activation, and
+in several places on every click. The registry does that walk once and then
+follows the project:
+
+* every FiberQ vector layer is indexed by its canonical name
+  (:func:`~fiberq.models.schema.canonical_layer_name`, so legacy names resolve
+  to the same entry), by geometry type and by role (:data:`ROLES`);
+* ``layersAdded``, ``layersWillBeRemoved`` and each layer's ``nameChanged`` keep
+  the index current, and ``cleared`` empties it.
+
+Lookups return layers in ``mapLayers()`` order (by layer id), so code that
+took "the first matching layer" of a scan gets the same layer from
+:meth:`LayerRegistry.layer`.
+
+Names are matched as :func:`canonical_layer_name` matches them and, failing
+that, ignoring case and surrounding whitespace -- the old scans disagreed on
+this, and "OKNA"/"Okna" or a trailing space are the same layer to a user.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from ..models import schema
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROLE_ROUTE = "route"
+ROLE_CABLE = "cable"
+ROLE_PIPE = "pipe"
+ROLE_ELEMENT = "element"
+ROLE_POLE = "pole"
+ROLE_MANHOLE = "manhole"
+ROLE_SLACK = "slack"
+ROLE_BREAK = "break"
+ROLE_AREA = "area"
+
+#: Canonical layer name -> role. Elements are the shared-roster point layers
+#: plus joint closures, the set the placement and cabling tools work with.
+ROLES: Dict[str, str] = {
+    "Route": ROLE_ROUTE,
+    "Aerial cables": ROLE_CABLE,
+    "Underground cables": ROLE_CABLE,
+    "PE pipes": ROLE_PIPE,
+    "Transition pipes": ROLE_PIPE,
+    "Joint Closures": ROLE_ELEMENT,
+    "Poles": ROLE_POLE,
+    "Manholes": ROLE_MANHOLE,
+    "Optical slack": ROLE_SLACK,
+    "Fiber break": ROLE_BREAK,
+    "Service Area": ROLE_AREA,
+    "Objects": ROLE_AREA,
+}
+ROLES.update({name: ROLE_ELEMENT for name in schema.ELEMENT_LAYER_NAMES})
+
+
+def _folded_names() -> Dict[str, str]:
+    folded = {}
+    for canonical in schema.LAYER_SCHEMAS:
+        folded[canonical.strip().casefold()] = canonical
+    for canonical, legacy in schema.LAYER_NAME_ALIASES.items():
+        for name in legacy:
+            folded.setdefault(name.strip().casefold(), canonical)
+    return folded
+
+
+_FOLDED = _folded_names()
+
+
+def resolve_layer_name(name: str) -> Optional[str]:
+    """The canonical name a layer called ``name`` is indexed under, or None if
+    it is not a FiberQ layer."""
+    if not name:
+        return None
+    return schema.canonical_layer_name(name) or _FOLDED.get(name.strip().casefold())
+
+
+def _drop(index: Dict[object, list], key, lid: str) -> None:
+    """Remove layer ``lid`` from ``index[key]``, and the key once it is empty."""
+    remaining = [lyr for lyr in index.get(key, ()) if lyr.id() != lid]
+    if remaining:
+        index[key] = remaining
+    else:
+        index.pop(key, None)
+
+
+class LayerRegistry:
+    """The FiberQ layers of one project, indexed and kept current.
+
+    Build one with :func:`get_layer_registry` for the current project; a registry
+    over another project (a test's ``QgsProject()``) is built directly and must be
+    :meth:`detach`\\ ed when done.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._layers: Dict[str, object] = {}        # layer id -> layer
+        self._canonical: Dict[str, str] = {}        # layer id -> canonical name
+        self._by_name: Dict[str, List[object]] = {}
+        self._by_geometry: Dict[object, List[object]] = {}
+        self._watched: Dict[str, list] = {}         # layer id -> [(signal, slot)]
+        self._connections = [
+            (project.layersAdded, self._on_layers_added),
+            (project.layersWillBeRemoved, self._on_layers_removed),
+            (project.cleared, self._on_cleared),
+        ]
+        for signal, slot in self._connections:
+            try:
+                signal.connect(slot)
+            except Exception as e:
+                logger.debug(f"Error in LayerRegistry.__init__: {e}")
+        self._on_layers_added(project.mapLayers().values())
+
+    # -- lookups -----------------------------------------------------------
+
+    def layers(self, *names: str, geometry=None) -> list:
+        """Layers whose canonical name is one of ``names`` (canonical or legacy
+        spellings), optionally only those of ``geometry`` type
+        (``QgsWkbTypes.GeometryType``). Every FiberQ layer when no name is given.
+        A name that is not a FiberQ layer name is looked up in the project."""
+        if names:
+            found = []
+            for name in dict.fromkeys(names):
+                canonical = resolve_layer_name(name)
+                if canonical is not None:
+                    found.extend(self._by_name.get(canonical, ()))
+                else:  # not a FiberQ name, so not indexed: ask the project
+                    found.extend(self._named(name))
+            found = list({lyr.id(): lyr for lyr in found}.values())
+        else:
+            found = list(self._layers.values())
+        return self._ordered(found, geometry)
+
+    def layer(self, *names: str, geometry=None):
+        """The first of :meth:`layers`, or None."""
+        found = self.layers(*names, geometry=geometry)
+        return found[0] if found else None
+
+    def by_role(self, *roles: str, geometry=None) -> list:
+        """Layers whose canonical name has one of ``roles`` (see :data:`ROLES`)."""
+        names = [name for name, role in ROLES.items() if role in roles]
+        found = []
+        for name in names:
+            found.extend(self._by_name.get(name, ()))
+        return self._ordered(found, geometry)
+
+    def by_geometry(self, geometry) -> list:
+        """Every FiberQ layer of ``geometry`` type."""
+        return self._ordered(self._by_geometry.get(geometry, ()), None)
+
+    def canonical_name(self, layer) -> Optional[str]:
+        """The canonical name ``layer`` is indexed under, or None."""
+        try:
+            return self._canonical.get(layer.id())
+        except Exception as e:
+            logger.debug(f"Error in LayerRegistry.canonical_name: {e}")
+            return None
+
+    def role(self, layer) -> Optional[str]:
+        """The role of ``layer``, or None if it is not a FiberQ layer."""
+        return ROLES.get(self.canonical_name(layer))
+
+    def _named(self, name: str) -> list:
+        from qgis.core import QgsVectorLayer
+
+        try:
+            return [lyr for lyr in self.project.mapLayersByName(name)
+                    if isinstance(lyr, QgsVectorLayer)]
+        except Exception as e:
+            logger.debug(f"Error in LayerRegistry._named: {e}")
+            return []
+
+    @staticmethod
+    def _ordered(layers: Iterable, geometry) -> list:
+        ordered = []
+        for lyr in sorted(layers, key=lambda lyr: lyr.id()):
+            try:
+                if geometry is None or lyr.geometryType() == geometry:
+                    ordered.append(lyr)
+            except Exception as e:
+                logger.debug(f"Error in LayerRegistry._ordered: {e}")
+        return ordered
+
+    # -- upkeep ------------------------------------------------------------
+
+    def _index(self, layer) -> None:
+        lid = layer.id()
+        self._unindex(lid)
+        canonical = resolve_layer_name(layer.name())
+        if canonical is None:
+            return
+        self._layers[lid] = layer
+        self._canonical[lid] = canonical
+        self._by_name.setdefault(canonical, []).append(layer)
+        try:
+            self._by_geometry.setdefault(layer.geometryType(), []).append(layer)
+        except Exception as e:
+            logger.debug(f"Error in LayerRegistry._index: {e}")
+
+    def _unindex(self, lid: str) -> None:
+        self._layers.pop(lid, None)
+        canonical = self._canonical.pop(lid, None)
+        if canonical is None:
+            return
+        _drop(self._by_name, canonical, lid)
+        for geometry in list(self._by_geometry):
+            _drop(self._by_geometry, geometry, lid)
+
+    def _on_layers_added(self, layers) -> None:
+        from qgis.core import QgsVectorLayer
+
+        for layer in layers:
+            try:
+                if not isinstance(layer, QgsVectorLayer):
+                    continue
+                self._watch(layer)
+                self._index(layer)
+            except Exception as e:
+                logger.debug(f"Error in LayerRegistry._on_layers_added: {e}")
+
+    def _on_layers_removed(self, layer_ids) -> None:
+        for lid in layer_ids:
+            if not isinstance(lid, str):  # the QList<QgsMapLayer*> overload
+                lid = lid.id()
+            self._unindex(lid)
+            self._unwatch(lid)
+
+    def _on_cleared(self) -> None:
+        for lid in list(self._watched):
+            self._unwatch(lid)
+        self._layers = {}
+        self._canonical = {}
+        self._by_name = {}
+        self._by_geometry = {}
+
+    def _watch(self, layer) -> None:
+        """Follow renames: a layer renamed to (or away from) a FiberQ name joins
+        (or leaves) the index."""
+        lid = layer.id()
+        if lid in self._watched:
+            return
+
+        def renamed():
+            self._index(layer)
+
+        try:
+            layer.nameChanged.connect(renamed)
+            self._watched[lid] = [(layer.nameChanged, renamed)]
+        except Exception as e:
+            logger.debug(f"Error in LayerRegistry._watch: {e}")
+
+    def _unwatch(self, lid: str) -> None:
+        for signal, slot in self._watched.pop(lid, ()):
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in LayerRegistry._unwatch: {e}")
+
+    def detach(self) -> None:
+        """Stop following the project (the plugin unloads)."""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in LayerRegistry.detach: {e}")
+        self._connections = []
+        self._on_cleared()
+
+
+# Registry of QgsProject.instance(), built on first use
+_registry: Optional[LayerRegistry] = None
+
+
+def get_layer_registry() -> LayerRegistry:
+    """The :class:`LayerRegistry` of the current project."""
+    global _registry
+    if _registry is None:
+        from qgis.core import QgsProject
+        _registry = LayerRegistry(QgsProject.instance())
+    return _registry
+
+
+def release_layer_registry() -> None:
+    """Detach and drop the current project's registry (the plugin unloads)."""
+    global _registry
+    if _registry is not None:
+        _registry.detach()
+        _registry = None
+
+
+__all__ = [
+    'LayerRegistry',
+    'get_layer_registry',
+    'release_layer_registry',
+    'resolve_layer_name',
+    'ROLES',
+    'ROLE_ROUTE',
+    'ROLE_CABLE',
+    'ROLE_PIPE',
+    'ROLE_ELEMENT',
+    'ROLE_POLE',
+    'ROLE_MANHOLE',
+    'ROLE_SLACK',
+    'ROLE_BREAK',
+    'ROLE_AREA',
+]
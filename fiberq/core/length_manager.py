@@ -182,7 +182,7 @@ def _plan_layer(plan, layer, length_field, config, project):
         if geom is None or geom.isNull() or geom.isEmpty():
             continue  # nothing to measure; E2 reports the geometry itself
 
-        computed = ground_length(geom, layer, project=project)
+        computed = ground_length(geom, layer, project=project, fid=feat.id())
 
         # A zero-length geometry is E2's finding, but its stored length is still
         # wrong and D3 still reports it. Setting it to 0 is the honest answer and
@@ -0,0 +1,490 @@
+"""Publishing the project to PostGIS in one transaction.
+
+``PublishDialog`` exports one layer at a time through
+``QgsVectorLayerExporter``: a fresh connection per layer, one INSERT per
+feature, and a full table rewrite on every publish. This module publishes many
+layers together:
+
+* one pooled ``psycopg2`` connection per server (:func:`get_pg_connection`),
+  one transaction for every layer -- a failure or cancel publishes nothing.
+  A publish holds its connection for its whole run (:func:`pg_connection`),
+  so a second publish to the same server waits instead of interleaving;
+* rows are streamed with ``COPY ... FROM STDIN (FORMAT csv)`` into a staging
+  table, straight from the layer snapshots, without building them in memory;
+* tables with a ``fiberq_uuid`` column are upserted on it: new rows are
+  inserted, changed rows updated, rows gone from the layer deleted, and
+  unchanged rows left untouched, so republishing costs what changed. A layer
+  whose features repeat a uuid fails rather than lose the repeats;
+* a new table gets its GiST index after it is loaded, not while.
+
+The layers are read from :class:`~.gpkg_export_task.LayerExport` snapshots, so
+:class:`PgPublishTask` can run the whole publish off the GUI thread. No source
+layer is modified: the tables carry their own ``fid`` primary key.
+
+``psycopg2`` is imported on first use; without it publishing reports why.
+"""
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from qgis.core import QgsFeatureRequest, QgsTask, QgsWkbTypes
+from qgis.PyQt.QtCore import QCoreApplication, QVariant, pyqtSignal
+
+from ..utils.logger import get_logger
+from ..utils.uuid_utils import FIBERQ_UUID_FIELD
+from .gpkg_export_task import LayerExport
+
+logger = get_logger(__name__)
+
+#: Rows streamed between two progress reports / cancel checks.
+PROGRESS_EVERY = 1000
+
+GEOM_COLUMN = "geom"
+PK_COLUMN = "fid"
+
+_POOL: Dict[str, object] = {}
+_IN_USE: Dict[str, threading.Lock] = {}  # dsn -> held while a publish uses its connection
+_POOL_LOCK = threading.Lock()
+
+
+def _sanitize_identifier(name: str, fallback: str = "layer_export") -> str:
+    """Lower-case identifier of letters, digits and ``_``, not starting with a digit."""
+    base = re.sub(r"[^A-Za-z0-9_]+", "_", (name or "").strip())
+    base = base.strip("_") or fallback
+    if base[0].isdigit():
+        base = "_" + base
+    return base.lower()
+
+
+def pg_table_names(layers) -> Dict[str, str]:
+    """A unique table name per layer, keyed by layer id."""
+    used = set()
+    names = {}
+    for lyr in layers:
+        base = _sanitize_identifier(lyr.name())
+        name = base
+        c = 1
+        while name in used:
+            c += 1
+            name = f"{base}_{c}"
+        used.add(name)
+        names[lyr.id()] = name
+    return names
+
+
+def pg_dsn(pg: Dict[str, str]) -> str:
+    """libpq connection string from the ``[postgis]`` settings of config.ini."""
+    parts = []
+    for key in ("host", "port", "dbname", "user", "password", "sslmode"):
+        value = str(pg.get(key) or "")
+        if value:
+            parts.append(f"{key}='" + value.replace("\\", "\\\\").replace("'", "\\'") + "'")
+    return " ".join(parts)
+
+
+def get_pg_connection(dsn: str):
+    """The pooled connection for ``dsn``, (re)opened as needed."""
+    try:
+        import psycopg2
+    except ImportError as e:
+        raise RuntimeError("Publishing the project needs the psycopg2 Python package.") from e
+    with _POOL_LOCK:
+        conn = _POOL.get(dsn)
+        if conn is None or conn.closed:
+            conn = psycopg2.connect(dsn)
+            _POOL[dsn] = conn
+        return conn
+
+
+def _in_use(dsn: str) -> threading.Lock:
+    with _POOL_LOCK:
+        return _IN_USE.setdefault(dsn, threading.Lock())
+
+
+@contextmanager
+def pg_connection(dsn: str):
+    """The pooled connection for ``dsn``, held for the length of the ``with``.
+
+    A connection runs one transaction at a time: a second publish to the same
+    server waits here until the first has committed or rolled back.
+    """
+    with _in_use(dsn):
+        yield get_pg_connection(dsn)
+
+
+def close_pg_connections(timeout: float = 30.0) -> None:
+    """Close every pooled connection (plugin unload).
+
+    A connection still held by a publish is closed once the publish lets go
+    of it -- cancel the publishes first -- or left open after ``timeout``
+    seconds rather than closed under its feet.
+    """
+    with _POOL_LOCK:
+        pooled = list(_POOL.items())
+        _POOL.clear()
+    for dsn, conn in pooled:
+        lock = _in_use(dsn)
+        if not lock.acquire(timeout=timeout):
+            logger.warning("A PostGIS publish is still running; its connection is left open")
+            continue
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error in close_pg_connections: {e}")
+        finally:
+            lock.release()
+
+
+@dataclass
+class PublishResult:
+    """Outcome of :func:`publish_layers`."""
+
+    schema: str
+    #: layer id -> table name, for every layer published (empty unless committed)
+    tables: Dict[str, str] = field(default_factory=dict)
+    #: layer id -> (inserted or updated, deleted)
+    counts: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    #: "<layer name>: <message>" for each failure
+    errors: List[str] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.cancelled
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def _ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _pg_type(qtype) -> str:
+    return {
+        QVariant.Int: "integer",
+        QVariant.LongLong: "bigint",
+        QVariant.Double: "double precision",
+        QVariant.Bool: "boolean",
+        QVariant.Date: "date",
+        QVariant.DateTime: "timestamp",
+        QVariant.Time: "time",
+    }.get(qtype, "text")
+
+
+def _geometry_type(job: LayerExport) -> Optional[str]:
+    """``geometry(<type>, <srid>)`` of the layer, None for a table without geometry."""
+    wkb = job.wkb_type
+    flat = QgsWkbTypes.flatType(wkb)
+    if flat == QgsWkbTypes.Type.NoGeometry:
+        return None
+    if flat in (QgsWkbTypes.Type.Point, QgsWkbTypes.Type.LineString, QgsWkbTypes.Type.Polygon,
+                QgsWkbTypes.Type.MultiPoint, QgsWkbTypes.Type.MultiLineString,
+                QgsWkbTypes.Type.MultiPolygon):
+        name = QgsWkbTypes.displayString(flat)
+        if QgsWkbTypes.hasZ(wkb):
+            name += "Z"
+        if QgsWkbTypes.hasM(wkb):
+            name += "M"
+    else:
+        name = "Geometry"
+    return f"geometry({name}, {int(job.srid or 0)})"
+
+
+def _columns(job: LayerExport) -> List[Tuple[int, str, str]]:
+    """(QgsFields index, column name, PostgreSQL type) of the published fields."""
+    used = {PK_COLUMN, GEOM_COLUMN}
+    columns = []
+    for idx, fld in enumerate(job.fields):
+        name = _sanitize_identifier(fld.name(), f"field_{idx + 1}")
+        if name in used:
+            continue
+        used.add(name)
+        columns.append((idx, name, _pg_type(fld.type())))
+    return columns
+
+
+def _csv_text(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _csv_cell(value) -> str:
+    """
+    An attribute as a COPY CSV cell.
+
+    NULL is the unquoted empty cell -- COPY reads a quoted ``""`` as an empty
+    string, which a numeric, date or bytea column rejects -- so text is always
+    quoted, keeping ``''`` apart from NULL.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, QVariant):
+        if value.isNull():
+            return ""
+        value = value.value()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if hasattr(value, "isNull") and value.isNull():
+        return ""
+    if hasattr(value, "toString") and not isinstance(value, str):  # QDate / QDateTime / QTime
+        from qgis.PyQt.QtCore import Qt
+        return _csv_text(value.toString(Qt.DateFormat.ISODate))
+    return _csv_text(str(value))
+
+
+class _CopyStream:
+    """File-like CSV of a layer snapshot for ``copy_expert``, produced as read."""
+
+    def __init__(self, job: LayerExport, columns, with_geometry: bool, progress, is_cancelled):
+        self._job = job
+        self._progress = progress
+        self._is_cancelled = is_cancelled
+        self._buffer = ""
+        self._rows = self._generate(columns, with_geometry)
+        self.count = 0
+
+    def _generate(self, columns, with_geometry: bool) -> Iterator[str]:
+        for feat in self._job.source.getFeatures(QgsFeatureRequest()):
+            attrs = feat.attributes()
+            row = [_csv_cell(attrs[idx]) for idx, _name, _type in columns]
+            if with_geometry:
+                geom = feat.geometry()
+                has_geom = geom is not None and not geom.isEmpty()
+                row.append("\\x" + bytes(geom.asWkb()).hex() if has_geom else "")
+            self.count += 1
+            if self.count % PROGRESS_EVERY == 0:
+                if self._is_cancelled is not None and self._is_cancelled():
+                    raise _Cancelled()
+                if self._progress is not None:
+                    self._progress(self._job.layer_id, 100.0 * self.count / max(self._job.count, self.count, 1))
+            yield ",".join(row) + "\n"
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._rows)
+            except StopIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
+
+
+def publish_layers(conn, schema: str, jobs: List[LayerExport],
+                   progress: Optional[Callable[[str, float], None]] = None,
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> PublishResult:
+    """
+    Publish ``jobs`` to ``schema`` in one transaction of ``conn``.
+
+    Args:
+        conn: psycopg2 connection (see :func:`get_pg_connection`)
+        schema: Target schema (created if missing)
+        jobs: Layer snapshots to publish
+        progress: Called with (layer id, percent) as each layer is streamed
+        is_cancelled: Polled while streaming
+
+    Returns:
+        PublishResult; ``tables`` is empty unless everything was committed
+    """
+    schema = _sanitize_identifier(schema, "public")
+    result = PublishResult(schema)
+    tables = {}
+    counts = {}
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA IF NOT EXISTS {_ident(schema)}")
+            for job in jobs:
+                if is_cancelled is not None and is_cancelled():
+                    raise _Cancelled()
+                try:
+                    counts[job.layer_id] = _publish_layer(cur, schema, job, progress, is_cancelled)
+                    tables[job.layer_id] = job.table
+                except _Cancelled:
+                    raise
+                except Exception as e:
+                    result.errors.append(f"{job.layer_name}: {e}")
+                    break
+                if progress is not None:
+                    progress(job.layer_id, 100.0)
+        if result.errors:
+            conn.rollback()
+            return result
+        conn.commit()
+        result.tables = tables
+        result.counts = counts
+    except _Cancelled:
+        conn.rollback()
+        result.cancelled = True
+    except Exception as e:
+        result.errors.append(str(e))
+        try:
+            conn.rollback()
+        except Exception as e:
+            logger.debug(f"Error in publish_layers rolling back: {e}")
+    return result
+
+
+#: information_schema udt_name of each column type this module creates.
+_UDT = {
+    "integer": "int4",
+    "bigint": "int8",
+    "bigserial": "int8",
+    "double precision": "float8",
+    "boolean": "bool",
+    "date": "date",
+    "timestamp": "timestamp",
+    "time": "time",
+    "text": "text",
+}
+
+
+def _existing_columns(cur, schema: str, table: str) -> Optional[Dict[str, str]]:
+    cur.execute(
+        "SELECT column_name, udt_name FROM information_schema.columns "
+        "WHERE table_schema = %s AND table_name = %s",
+        (schema, table))
+    rows = cur.fetchall()
+    return {name: udt for name, udt in rows} if rows else None
+
+
+def _publish_layer(cur, schema: str, job: LayerExport, progress, is_cancelled) -> Tuple[int, int]:
+    """Stream one layer into its table; returns (rows written, rows deleted)."""
+    columns = _columns(job)
+    geom_type = _geometry_type(job)
+    names = [name for _idx, name, _type in columns]
+    keyed = FIBERQ_UUID_FIELD in names
+    target = f"{_ident(schema)}.{_ident(job.table)}"
+
+    # Reuse a keyed table only if it has exactly our columns
+    wanted = {name: _UDT[pg_type] for _idx, name, pg_type in columns}
+    wanted[PK_COLUMN] = _UDT["bigserial"]
+    if geom_type:
+        wanted[GEOM_COLUMN] = "geometry"
+    fresh = not keyed or _existing_columns(cur, schema, job.table) != wanted
+    if fresh:
+        cur.execute(f"DROP TABLE IF EXISTS {target} CASCADE")
+        defs = [f"{_ident(PK_COLUMN)} bigserial PRIMARY KEY"]
+        defs += [f"{_ident(name)} {pg_type}" for _idx, name, pg_type in columns]
+        if geom_type:
+            defs.append(f"{_ident(GEOM_COLUMN)} {geom_type}")
+        cur.execute(f"CREATE TABLE {target} ({', '.join(defs)})")
+    if keyed:
+        cur.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {_ident(job.table + '_uuid_key')} "
+                    f"ON {target} ({_ident(FIBERQ_UUID_FIELD)})")
+
+    # Stage the snapshot with COPY
+    stage_defs = [f"{_ident(name)} {pg_type}" for _idx, name, pg_type in columns]
+    if geom_type:
+        stage_defs.append(f"{_ident('_wkb')} bytea")
+    cur.execute("DROP TABLE IF EXISTS _fiberq_stage")
+    cur.execute(f"CREATE TEMP TABLE _fiberq_stage ({', '.join(stage_defs)}) ON COMMIT DROP")
+    stage_cols = [_ident(name) for name in names] + ([_ident("_wkb")] if geom_type else [])
+    stream = _CopyStream(job, columns, geom_type is not None, progress, is_cancelled)
+    cur.copy_expert(f"COPY _fiberq_stage ({', '.join(stage_cols)}) FROM STDIN WITH (FORMAT csv)", stream)
+
+    cols = [_ident(name) for name in names]
+    select = list(cols)
+    if geom_type:
+        cols.append(_ident(GEOM_COLUMN))
+        select.append(f"ST_SetSRID(ST_GeomFromWKB({_ident('_wkb')}), {int(job.srid or 0)})")
+    col_list = ", ".join(cols)
+    select_list = ", ".join(select)
+
+    # The statements below interpolate identifiers only (sanitised, then quoted
+    # by _ident) and the SRID as an int; no attribute value reaches the SQL text
+    deleted = 0
+    if not keyed:
+        cur.execute(f"INSERT INTO {target} ({col_list}) SELECT {select_list} FROM _fiberq_stage")  # nosec B608 # identifiers only
+        return cur.rowcount, deleted
+
+    uuid = _ident(FIBERQ_UUID_FIELD)
+    # One row per uuid can be kept; publishing the rest would silently drop them
+    cur.execute(f"SELECT count({uuid}) - count(DISTINCT {uuid}) FROM _fiberq_stage")  # nosec B608 # identifiers only
+    duplicates = cur.fetchone()[0]
+    if duplicates:
+        raise ValueError(f"{duplicates} feature(s) repeat another feature's {FIBERQ_UUID_FIELD}; "
+                         "give them their own (see validation rule B4) and publish again")
+    if not fresh:
+        # Rows gone from the layer, and rows without a uuid (re-inserted below)
+        cur.execute(
+            f"DELETE FROM {target} t WHERE t.{uuid} IS NULL OR NOT EXISTS "  # nosec B608 # identifiers only
+            f"(SELECT 1 FROM _fiberq_stage s WHERE s.{uuid} = t.{uuid})")
+        deleted = cur.rowcount
+    others = [c for c in cols if c != uuid]
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in others) or f"{uuid} = EXCLUDED.{uuid}"
+    changed = " OR ".join(f"t.{c} IS DISTINCT FROM EXCLUDED.{c}" for c in others) or "FALSE"
+    # Unchanged rows match no WHERE and are not rewritten
+    cur.execute(
+        f"INSERT INTO {target} AS t ({col_list}) "  # nosec B608 # identifiers only
+        f"SELECT {select_list} FROM _fiberq_stage WHERE {uuid} IS NOT NULL "
+        f"ON CONFLICT ({uuid}) DO UPDATE SET {updates} WHERE {changed}")
+    written = cur.rowcount
+    cur.execute(f"INSERT INTO {target} ({col_list}) SELECT {select_list} FROM _fiberq_stage WHERE {uuid} IS NULL")  # nosec B608 # identifiers only
+    written += cur.rowcount
+
+    if fresh and geom_type:
+        # Built once the rows are in, not row by row
+        cur.execute(f"CREATE INDEX {_ident(job.table + '_geom_idx')} ON {target} USING GIST ({_ident(GEOM_COLUMN)})")
+    cur.execute("DROP TABLE _fiberq_stage")
+    return written, deleted
+
+
+class PgPublishTask(QgsTask):
+    """Publish FiberQ layers to PostGIS off the GUI thread."""
+
+    #: A layer advanced: its id and percent streamed.
+    layerProgress = pyqtSignal(str, float)
+    #: The run is over: the PublishResult.
+    resultReady = pyqtSignal(object)
+
+    def __init__(self, dsn: str, schema: str, layers):
+        super().__init__(QCoreApplication.translate('PgPublishTask', 'FiberQ PostGIS publish'))
+        self.dsn = dsn
+        self.schema = schema
+        names = pg_table_names(layers)
+        # Snapshot here, on the main thread: run() must not touch a live layer
+        self.jobs = [LayerExport(lyr, names[lyr.id()]) for lyr in layers]
+        self._result = None
+
+    def _progress(self, layer_id: str, percent: float) -> None:
+        ids = [job.layer_id for job in self.jobs]
+        if layer_id in ids:
+            self.setProgress(100.0 * (ids.index(layer_id) + percent / 100.0) / max(len(ids), 1))
+        self.layerProgress.emit(layer_id, float(percent))
+
+    def run(self):
+        try:
+            with pg_connection(self.dsn) as conn:
+                self._result = publish_layers(conn, self.schema, self.jobs, self._progress, self.isCanceled)
+        except Exception as e:
+            logger.warning(f"PostGIS publish task failed: {e}")
+            self._result = PublishResult(self.schema, errors=[str(e)])
+            return False
+        return self._result.ok
+
+    def finished(self, ok):
+        result = self._result or PublishResult(self.schema, errors=["publish did not run"])
+        result.cancelled = result.cancelled or self.isCanceled()
+        self.resultReady.emit(result)
+
+
+__all__ = [
+    'PgPublishTask',
+    'PublishResult',
+    'publish_layers',
+    'pg_table_names',
+    'pg_dsn',
+    'get_pg_connection',
+    'pg_connection',
+    'close_pg_connections',
+]
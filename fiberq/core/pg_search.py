@@ -0,0 +1,260 @@
+"""Server-side ID / name search over the PostGIS preview tables.
+
+The preview locator used to build a ``"field" = 'value'`` expression and fetch
+every matching feature, geometry included, just to zoom to them. Here the
+matching and the bounding box are left to PostgreSQL:
+
+* an exact (case-insensitive) match wins, then a prefix match (``ILIKE``),
+  then -- when the ``pg_trgm`` extension is installed -- a substring or
+  trigram-similar match;
+* only the primary keys of the best matches and their ``ST_Extent`` come back;
+* the tables are searched concurrently by a small pool of worker threads,
+  each with its own connection;
+* recent answers are cached for :data:`CACHE_TTL_S` seconds.
+
+:func:`recommended_index_ddl` gives the indexes that keep these queries off
+sequential scans. ``psycopg2`` is needed; without it :attr:`PgSearch.available`
+is False and the caller searches the layers itself.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..utils.logger import get_logger
+from .pg_publish import _ident
+
+logger = get_logger(__name__)
+
+#: Columns searched, in order of preference (the first one a table has).
+SEARCH_FIELDS = ("id_trase", "ID_trase", "id", "ID", "naziv", "name")
+
+#: Most matches returned per table.
+MAX_HITS = 500
+#: Recent queries remembered, and for how long.
+CACHE_SIZE = 64
+CACHE_TTL_S = 60.0
+#: Worker threads (each with its own connection).
+MAX_WORKERS = 4
+
+
+@dataclass
+class SearchHit:
+    """Best matches of a query in one table."""
+
+    table: str
+    column: str
+    pk: str
+    #: Primary-key values of the matching rows
+    ids: List[object] = field(default_factory=list)
+    #: (xmin, ymin, xmax, ymax) of their geometries, None if they have none
+    extent: Optional[Tuple[float, float, float, float]] = None
+    #: 0 exact, 1 prefix, 2 substring / similar
+    rank: int = 0
+
+
+@dataclass
+class _Table:
+    column: str
+    pk: str
+    geom: Optional[str]
+
+
+def recommended_index_ddl(schema: str, table: str, column: str) -> List[str]:
+    """Statements creating the indexes :class:`PgSearch` queries can use."""
+    target = f"{_ident(schema)}.{_ident(table)}"
+    col = _ident(column)
+    return [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        # exact match: lower(col) = lower(q)
+        f"CREATE INDEX IF NOT EXISTS {_ident(f'{table}_{column}_lower')} "
+        f"ON {target} (lower({col}::text))",
+        # prefix, substring and similarity: ILIKE 'q%', ILIKE '%q%', col % q
+        f"CREATE INDEX IF NOT EXISTS {_ident(f'{table}_{column}_trgm')} "
+        f"ON {target} USING gin (({col}::text) gin_trgm_ops)",
+    ]
+
+
+def _like_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class PgSearch:
+    """
+    Search the preview tables of one schema.
+
+    Args:
+        dsn: libpq connection string (see :func:`.pg_publish.pg_dsn`)
+        schema: Schema of the preview tables
+    """
+
+    def __init__(self, dsn: str, schema: str):
+        self.dsn = dsn
+        self.schema = schema
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._tables: Dict[str, Optional[_Table]] = {}
+        self._trgm: Optional[bool] = None
+        self._cache: "OrderedDict[tuple, Tuple[float, Dict[str, SearchHit]]]" = OrderedDict()
+        self._executor = None
+        try:
+            import psycopg2  # noqa: F401
+            self.available = True
+        except ImportError:
+            self.available = False
+
+    # --- connections ---
+
+    def _conn(self):
+        """This thread's connection (autocommit, read-only)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn.closed:
+            import psycopg2
+            conn = psycopg2.connect(self.dsn)
+            conn.set_session(readonly=True, autocommit=True)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Stop the workers and close their connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.debug(f"Error in PgSearch.close: {e}")
+            self._connections = []
+        self._cache.clear()
+
+    # --- schema ---
+
+    def _has_trgm(self, cur) -> bool:
+        if self._trgm is None:
+            cur.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            self._trgm = cur.fetchone() is not None
+        return self._trgm
+
+    def _table(self, cur, table: str) -> Optional[_Table]:
+        """Search column, primary key and geometry column of ``table``, cached."""
+        with self._lock:
+            if table in self._tables:
+                return self._tables[table]
+        cur.execute(
+            "SELECT column_name, udt_name FROM information_schema.columns "
+            "WHERE table_schema = %s AND table_name = %s",
+            (self.schema, table))
+        columns = {name: udt for name, udt in cur.fetchall()}
+        column = next((c for c in SEARCH_FIELDS if c in columns), None)
+        info = None
+        if column:
+            cur.execute(
+                "SELECT a.attname FROM pg_index i "
+                "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) "
+                "WHERE i.indrelid = %s::regclass AND i.indisprimary",
+                (f"{_ident(self.schema)}.{_ident(table)}",))
+            pks = [r[0] for r in cur.fetchall()]
+            geom = next((c for c, udt in columns.items() if udt == "geometry"), None)
+            if len(pks) == 1:
+                info = _Table(column, pks[0], geom)
+        with self._lock:
+            self._tables[table] = info
+        return info
+
+    # --- search ---
+
+    def _search_table(self, table: str, text: str, limit: int) -> Optional[SearchHit]:
+        conn = self._conn()
+        with conn.cursor() as cur:
+            info = self._table(cur, table)
+            if info is None:
+                return None
+            trgm = self._has_trgm(cur)
+            col = f"{_ident(info.column)}::text"
+            target = f"{_ident(self.schema)}.{_ident(table)}"
+            geom = f"{_ident(info.geom)}" if info.geom else "NULL::geometry"
+            prefix = _like_escape(text) + "%"
+            where = f"{col} ILIKE %(prefix)s"
+            if trgm:
+                where += f" OR {col} ILIKE %(contains)s OR {col} %% %(q)s"
+            # Only _ident-quoted identifiers are interpolated; the text is bound
+            cur.execute(
+                f"WITH m AS ("  # nosec B608 # identifiers only
+                f" SELECT {_ident(info.pk)} AS id, {geom} AS g,"
+                f"  CASE WHEN lower({col}) = lower(%(q)s) THEN 0"
+                f"   WHEN {col} ILIKE %(prefix)s THEN 1 ELSE 2 END AS rank"
+                f" FROM {target} WHERE {where}"
+                f"), best AS ("
+                f" SELECT id, g, rank FROM m WHERE rank = (SELECT min(rank) FROM m)"
+                f" ORDER BY id LIMIT %(limit)s"
+                f") "
+                f"SELECT ids, rank, ST_XMin(e), ST_YMin(e), ST_XMax(e), ST_YMax(e) FROM ("
+                f" SELECT array_agg(id) AS ids, min(rank) AS rank, ST_Extent(g) AS e FROM best"
+                f") s",
+                {"q": text, "prefix": prefix, "contains": "%" + _like_escape(text) + "%", "limit": int(limit)})
+            row = cur.fetchone()
+        if row is None or not row[0]:
+            return None
+        ids, rank, xmin, ymin, xmax, ymax = row
+        extent = (xmin, ymin, xmax, ymax) if xmin is not None else None
+        return SearchHit(table, info.column, info.pk, list(ids), extent, int(rank))
+
+    def search(self, text: str, tables: Sequence[str], limit: int = MAX_HITS) -> Dict[str, SearchHit]:
+        """
+        Best matches of ``text`` in each of ``tables``, searched concurrently.
+
+        Returns:
+            table -> SearchHit, for the tables with a match. A table that
+            cannot be searched (missing, no search column, no single-column
+            primary key) or whose query fails is left out.
+
+        Raises:
+            The first error, if no table could be queried at all.
+        """
+        text = (text or "").strip()
+        if not text or not tables or not self.available:
+            return {}
+        key = (text.lower(), tuple(tables), int(limit))
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_S:
+            self._cache.move_to_end(key)
+            return dict(cached[1])
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="fiberq-search")
+        futures = {t: self._executor.submit(self._search_table, t, text, limit) for t in tables}
+        hits = {}
+        errors = []
+        for table, future in futures.items():
+            try:
+                hit = future.result()
+            except Exception as e:
+                logger.debug(f"Error in PgSearch.search ({table}): {e}")
+                errors.append(e)
+                continue
+            if hit is not None:
+                hits[table] = hit
+        if errors and len(errors) == len(futures):
+            # Nothing could be asked (server down?): let the caller fall back
+            raise errors[0]
+
+        self._cache[key] = (time.monotonic(), hits)
+        self._cache.move_to_end(key)
+        while len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return dict(hits)
+
+
+__all__ = [
+    'PgSearch',
+    'SearchHit',
+    'recommended_index_ddl',
+    'SEARCH_FIELDS',
+]
@@ -28,6 +28,7 @@ from qgis.core import (
 )
 
 # Phase 5.2: Logging
+from .layer_registry import get_layer_registry
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
@@ -219,27 +220,19 @@ class PipeManager:
                 logger.debug(f"Error in PipeManager.ensure_pipe_layer: {e}")
 
         # Fallback: inline implementation
-        prj = QgsProject.instance()
-
-        target_names = {name}
+        target_names = [name]
         if name in self.LAYER_ALIAS_MAP:
-            target_names.add(self.LAYER_ALIAS_MAP[name])
+            target_names.append(self.LAYER_ALIAS_MAP[name])
 
-        for lyr in prj.mapLayers().values():
+        lyr = get_layer_registry().layer(
+            *target_names, geometry=QgsWkbTypes.GeometryType.LineGeometry)
+        if lyr is not None:
             try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                    and lyr.name() in target_names  # noqa: W503
-                ):
-                    try:
-                        self.apply_pipe_field_aliases(lyr)
-                        self.set_pipe_layer_alias(lyr)
-                    except Exception as e:
-                        logger.debug(f"Error in PipeManager.ensure_pipe_layer: {e}")
-                    return lyr
+                self.apply_pipe_field_aliases(lyr)
+                self.set_pipe_layer_alias(lyr)
             except Exception as e:
                 logger.debug(f"Error in PipeManager.ensure_pipe_layer: {e}")
+            return lyr
 
         crs = self.iface.mapCanvas().mapSettings().destinationCrs().authid()
         layer = QgsVectorLayer(f"LineString?crs={crs}", name, "memory")
@@ -268,6 +261,7 @@ class PipeManager:
         except Exception as e:
             logger.debug(f"Error in PipeManager.ensure_pipe_layer: {e}")
 
+        prj = QgsProject.instance()
         prj.addMapLayer(layer, False)
         try:
             group = self.ensure_pipes_group()
@@ -356,15 +350,8 @@ class PipeManager:
 
         # Fallback: inline implementation
         items = []
-        layers = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                        and lyr.name() in self.PIPE_LAYER_NAMES):  # noqa: W503
-                    layers.append(lyr)
-            except Exception as e:
-                logger.debug(f"Error in PipeManager.list_all_pipes: {e}")
+        layers = get_layer_registry().layers(
+            *self.PIPE_LAYER_NAMES, geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
         for lyr in layers:
             fields = lyr.fields()
@@ -16,11 +16,11 @@ from qgis.core import (
     QgsProject,
     QgsVectorLayer,
     QgsFeature,
-    QgsGeometry,
-    QgsPointXY,
     QgsWkbTypes,
 )
 
+from .element_index import candidate_elements, candidate_elements_for_cables
+
 # Phase 5.2: Logging
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
@@ -356,81 +356,40 @@ class RelationsManager:
                 logger.debug(f"Error in RelationsManager.find_candidate_elements_for_cable: {e}")
 
         # Fallback: inline implementation
-        geom = cable_feature.geometry()
-        if geom is None or geom.isEmpty():
-            return []
+        return candidate_elements(cable_layer, cable_feature, self._candidate_element_layers(), tol)
 
-        # Get cable endpoints names
-        try:
-            od = str(cable_feature['od']) if 'od' in cable_layer.fields().names() and cable_feature['od'] is not None else ''
-            do = str(cable_feature['do']) if 'do' in cable_layer.fields().names() and cable_feature['do'] is not None else ''
-        except Exception:
-            od = ''
-            do = ''
+    def find_candidate_elements_for_cables(self, cables, tol: float = 5.0) -> Dict[Tuple[str, int], List[Dict[str, Any]]]:
+        """
+        :meth:`find_candidate_elements_for_cable` for many cables in one sweep.
 
-        cands = []
-        for lyr in QgsProject.instance().mapLayers().values():
+        Args:
+            cables: Iterable of (cable_layer, cable_feature) pairs
+            tol: Tolerance in map units (default 5.0)
+
+        Returns:
+            Dict of (cable layer id, fid) -> candidate dicts
+        """
+        if self.data_manager:
             try:
-                if lyr.geometryType() != QgsWkbTypes.GeometryType.PointGeometry:
-                    continue
+                return self.data_manager.find_candidate_elements_for_cables(cables, tol)
+            except Exception as e:
+                logger.debug(f"Error in RelationsManager.find_candidate_elements_for_cables: {e}")
 
-                fields = lyr.fields()
-                has_naziv = fields.indexFromName('naziv') != -1
+        return candidate_elements_for_cables(cables, self._candidate_element_layers(), tol)
 
-                # Take layers that have 'naziv' or are named 'Poles'
-                if not has_naziv and lyr.name() != 'Poles':
+    @staticmethod
+    def _candidate_element_layers() -> List[QgsVectorLayer]:
+        """Point layers that have 'naziv' or are named 'Poles'."""
+        layers = []
+        for lyr in QgsProject.instance().mapLayers().values():
+            try:
+                if not isinstance(lyr, QgsVectorLayer) or lyr.geometryType() != QgsWkbTypes.GeometryType.PointGeometry:
                     continue
-
-                for f in lyr.getFeatures():
-                    pgeom = f.geometry()
-                    if pgeom is None or pgeom.isEmpty():
-                        continue
-
-                    d = geom.distance(pgeom)
-                    if d > tol:
-                        continue
-
-                    try:
-                        m = geom.lineLocatePoint(pgeom)
-                        m = float(m)
-                    except Exception:
-                        # Fallback: project nearest point and measure distance from start
-                        nearest = geom.closestSegmentWithContext(pgeom.asPoint())[1] if hasattr(geom, 'closestSegmentWithContext') else None
-                        m = float(geom.length()) if nearest is None else float(geom.lineLocatePoint(QgsGeometry.fromPointXY(QgsPointXY(nearest))))
-
-                    name = ''
-                    if has_naziv:
-                        val = f['naziv']
-                        if val is not None:
-                            name = str(val).strip()
-
-                    # Skip endpoints by name
-                    if name and (name == od or name == do):
-                        continue
-
-                    cands.append({
-                        "layer_id": lyr.id(),
-                        "layer_name": lyr.name(),
-                        "fid": int(f.id()),
-                        "naziv": name if name else f"{lyr.name()}:{int(f.id())}",
-                        "m": m,
-                        "distance": float(d),
-                    })
+                if lyr.fields().indexFromName('naziv') != -1 or lyr.name() == 'Poles':
+                    layers.append(lyr)
             except Exception as e:
                 logger.debug(f"skipping layer while collecting relation candidates: {e}")
-                continue
-
-        # Sort and remove duplicates
-        out = []
-        seen = set()
-        for it in sorted(cands, key=lambda x: x.get('m', 0.0)):
-            key = (it['layer_id'], it['fid'])
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(it)
-
-        return out
+        return layers
 
 
 __all__ = ['RelationsManager']
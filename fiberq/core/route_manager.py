@@ -11,7 +11,7 @@ This module provides route management functionality:
 Phase 5.2: Added logging infrastructure
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 
 from qgis.PyQt.QtCore import QVariant, Qt
 from qgis.PyQt.QtWidgets import QMessageBox, QInputDialog, QFileDialog
@@ -30,8 +30,10 @@ from qgis.core import (
 )
 
 # Phase 5.2: Logging
+from .layer_registry import ROLE_MANHOLE, ROLE_POLE, get_layer_registry
 from ..utils.logger import get_logger
 from ..utils.measure import ground_length
+from ..utils.routing import ROUTING_ASTAR
 logger = get_logger(__name__)
 
 
@@ -50,6 +52,13 @@ ROUTE_LABEL_TO_CODE = {v: k for k, v in ROUTE_TYPE_LABELS.items()}
 class RouteManager:
     """Manager for route/trasa operations."""
 
+    #: Path search used for cables and pipes laid along routes. A* minimises
+    #: metres; ROUTING_BFS restores the old fewest-vertices behaviour.
+    routing_algorithm = ROUTING_ASTAR
+    #: Optional ``tip_trase`` -> cost multiplier mapping for weighted searches,
+    #: e.g. ``{"podzemna": 0.5}`` to prefer existing underground routes.
+    route_cost_profile = None
+
     def __init__(self, iface, style_manager=None):
         """
         Initialize RouteManager.
@@ -130,20 +139,33 @@ class RouteManager:
 
     def build_path_across_network(self, route_layer: QgsVectorLayer,
                                   start_pt: QgsPointXY, end_pt: QgsPointXY,
-                                  tol_units: float) -> Optional[List[QgsPointXY]]:
+                                  tol_units: float, algorithm: Optional[str] = None,
+                                  cost_profile: Optional[Dict[str, float]] = None) -> Optional[List[QgsPointXY]]:
         """Route through ALL vertices (including breakpoints) without physically merging features.
 
+        Queries the layer's cached RouteGraph, so the network is read once and
+        not again for every cable. ``algorithm`` and ``cost_profile`` default to
+        :attr:`routing_algorithm` and :attr:`route_cost_profile`.
+
         Returns list of QgsPointXY or None if no path exists in the network.
         """
-        from ..utils.routing import build_path_across_network
-        return build_path_across_network(route_layer, start_pt, end_pt, tol_units)
+        return self.route_graph(route_layer, tol_units).path_across_network(
+            start_pt, end_pt,
+            algorithm or self.routing_algorithm,
+            self.route_cost_profile if cost_profile is None else cost_profile,
+            tolerance=tol_units,
+        )
 
     def build_path_across_joined_routes(self, route_layer: QgsVectorLayer,
                                         start_pt: QgsPointXY, end_pt: QgsPointXY,
                                         tol_units: float) -> Optional[List[QgsPointXY]]:
         """Find path across joined routes at feature level."""
-        from ..utils.routing import build_path_across_joined_routes
-        return build_path_across_joined_routes(route_layer, start_pt, end_pt, tol_units)
+        return self.route_graph(route_layer, tol_units).path_across_joined_routes(start_pt, end_pt, tol_units)
+
+    def route_graph(self, route_layer: QgsVectorLayer, tol_units: float):
+        """The shared, signal-maintained RouteGraph of a route layer."""
+        from ..utils.route_graph import get_route_graph
+        return get_route_graph(route_layer, tol_units)
 
     # -------------------------------------------------------------------------
     # Layer management helpers
@@ -151,10 +173,7 @@ class RouteManager:
 
     def _find_route_layer(self) -> Optional[QgsVectorLayer]:
         """Find existing Route layer."""
-        for lyr in QgsProject.instance().mapLayers().values():
-            if lyr.name() in ('Route', 'Trasa') and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry:
-                return lyr
-        return None
+        return get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
     def _ensure_route_layer(self) -> QgsVectorLayer:
         """Find or create Route layer with required fields."""
@@ -224,12 +243,11 @@ class RouteManager:
         """Create a route from selected poles/manholes."""
         # Collect selected features from Poles and Manholes layers
         selected_features = []
-        for lyr in QgsProject.instance().mapLayers().values():
+        for lyr in get_layer_registry().by_role(
+                ROLE_POLE, ROLE_MANHOLE, geometry=QgsWkbTypes.GeometryType.PointGeometry):
             try:
-                if (lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                        lyr.name() in ('Poles', 'Stubovi', 'OKNA', 'Manholes')):
-                    if lyr.selectedFeatureCount() > 0:
-                        selected_features.extend(lyr.selectedFeatures())
+                if lyr.selectedFeatureCount() > 0:
+                    selected_features.extend(lyr.selectedFeatures())
             except Exception as e:
                 logger.debug(f"Error in RouteManager.create_route: {e}")
 
@@ -0,0 +1,457 @@
+"""Node/edge model behind the optical schematic.
+
+The schematic dialog rebuilt everything -- a scan of every point layer for
+node names, every cable and pipe for edges -- on any edit to any layer. The
+model collects once and then applies per-layer change sets: the fids that
+were added or changed are re-read together, removed ones dropped, and layers
+the schematic does not draw are ignored.
+
+Nodes are named as before: ``MH <broj_okna>`` for manholes, ``naziv`` on any
+point layer, ``Pole <tip>`` for unnamed poles; the first feature (in layer
+and fid order) to claim a name owns it. Edges are the cables and pipes of the
+layer registry, read through the cable catalogue (which caches their
+vertices and lengths).
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .cable_catalog import get_cable_catalog
+from .layer_registry import ROLE_CABLE, ROLE_PIPE, get_layer_registry
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MANHOLE_LAYER_NAMES = ('OKNA', 'Manholes')
+POLE_LAYER_NAME = 'Poles'
+
+Key = Tuple[str, int]
+
+
+def _text(value) -> str:
+    if value is None:
+        return ''
+    try:
+        if hasattr(value, 'isNull') and value.isNull():
+            return ''
+    except Exception:
+        return ''
+    return str(value).strip()
+
+
+def node_name(layer_name: str, attrs: Dict[str, object], fid: int) -> Optional[str]:
+    """The schematic name of a point feature with attributes ``attrs``, or None."""
+    # 1) Manholes (OKNA): MH + broj_okna
+    if layer_name in MANHOLE_LAYER_NAMES and 'broj_okna' in attrs:
+        val = _text(attrs.get('broj_okna'))
+        if val:
+            return f"MH {val}"  # Issue #9: KO -> MH
+    # 2) other layers with 'naziv' field
+    if 'naziv' in attrs:
+        val = _text(attrs.get('naziv'))
+        if val:
+            return val
+    # 3) Poles fallback
+    if layer_name == POLE_LAYER_NAME:
+        tip = _text(attrs.get('tip'))
+        return ("Pole " + tip).strip() or f"Pole {int(fid)}"  # Stub -> Pole
+    return None
+
+
+def pipe_capacity_text(attrs: Dict[str, object]) -> str:
+    """``Ø <fi> mm | <kapacitet>`` of a pipe, as list_all_pipes shows it."""
+    cap_text = ''
+    fi = attrs.get('fi')
+    try:
+        if fi not in (None, ''):
+            cap_text = f"Ø {int(fi)} mm"
+    except Exception as e:
+        logger.debug(f"Error in pipe_capacity_text: {e}")
+    kap = _text(attrs.get('kapacitet'))
+    if kap:
+        cap_text = (cap_text + (' | ' if cap_text else '')) + kap
+    return cap_text
+
+
+def edge_from_record(rec, catalog, pipe_layer: bool = False) -> dict:
+    """The schematic edge of a cable or pipe catalogue record."""
+    attrs = rec.attributes
+    raw_lname = rec.layer_name or ''
+    low_lname = raw_lname.lower()
+    vrsta = 'vazdusni' if ('vazdu' in low_lname or 'aerial' in low_lname) else 'podzemni'
+
+    def gv(key):
+        value = attrs.get(key)
+        return '' if value is None else value
+
+    if pipe_layer:
+        tip, podtip, kapacitet = 'pipe', 'pipe', pipe_capacity_text(attrs)
+    else:
+        tip, podtip, kapacitet = gv('tip'), gv('podtip'), gv('kapacitet')
+
+    # Detect pipe (vs cable) by source layer name so the schematic can render
+    # them and skip cable-only filters. Layer names cover both English ("PE
+    # pipes", "Transition pipes", "PE ducts", "Transition ducts") and legacy
+    # Serbian ("PE cevi", "Prelazne cevi").
+    is_pipe = (
+        'cevi' in low_lname
+        or 'pipe' in low_lname  # noqa: W503
+        or 'duct' in low_lname  # noqa: W503
+        or str(tip or '').lower() == 'pipe'  # noqa: W503
+    )
+    return {
+        "key": (rec.layer_id, rec.fid),
+        "from": str(gv('od')).strip(),
+        "to": str(gv('do')).strip(),
+        "podtip": str(podtip).lower(),
+        "kapacitet": kapacitet,
+        "geom_coords": catalog.coords(rec),
+        "length": catalog.length(rec),
+        "vrsta": vrsta,
+        "relacija": str(gv('relacija')).lower(),
+        "is_pipe": is_pipe,
+        "layer_name": raw_lname,
+    }
+
+
+def bundle_edges(lines) -> Dict[Tuple[str, str], List[tuple]]:
+    """
+    Group laid-out edges that join the same two nodes.
+
+    Args:
+        lines: (edge, path) pairs, as the schematic layout returns them
+
+    Returns:
+        (node, node) -> its (edge, path) pairs, in input order, for every node
+        pair joined by more than one edge. The pair is ordered by name, so a
+        cable drawn a -> b and one drawn b -> a share a bundle.
+    """
+    groups: Dict[Tuple[str, str], List[tuple]] = {}
+    for edge, path in lines:
+        a, b = edge.get('from'), edge.get('to')
+        if not a or not b or not path:
+            continue
+        groups.setdefault((min(a, b), max(a, b)), []).append((edge, path))
+    return {pair: members for pair, members in groups.items() if len(members) > 1}
+
+
+def _representative_point(geom):
+    """A point standing for ``geom``: itself, a line's midpoint, a centroid."""
+    from qgis.core import QgsWkbTypes
+
+    if geom is None or geom.isEmpty():
+        return None
+    if geom.type() == QgsWkbTypes.GeometryType.PointGeometry:
+        return geom.asPoint()
+    if geom.type() == QgsWkbTypes.GeometryType.LineGeometry:
+        try:
+            return geom.interpolate(geom.length() / 2.0).asPoint()
+        except Exception:
+            ps = geom.asPolyline()
+            return ps[len(ps) // 2] if ps else None
+    try:
+        return geom.centroid().asPoint()
+    except Exception:
+        return None
+
+
+def node_map_points(nodes: Dict[str, dict], project=None) -> Dict[str, Tuple[float, float]]:
+    """
+    Project-CRS position of each node (as :meth:`SchematicModel.nodes` gives them).
+
+    The owning features are fetched with one request per layer, and one
+    transform is built per source CRS. Nodes without a usable geometry are
+    left out.
+    """
+    from qgis.core import QgsCoordinateTransform, QgsFeatureRequest, QgsPointXY
+
+    if project is None:
+        from qgis.core import QgsProject
+        project = QgsProject.instance()
+    dst = project.crs()
+    by_layer: Dict[str, Dict[int, str]] = {}
+    for name, info in nodes.items():
+        try:
+            by_layer.setdefault(info['layer_id'], {})[int(info['fid'])] = name
+        except Exception as e:
+            logger.debug(f"Skipping node without a feature: {e}")
+
+    transforms = {}
+    out = {}
+    for lid, names in by_layer.items():
+        layer = project.mapLayer(lid)
+        if layer is None:
+            continue
+        src = layer.crs()
+        key = src.authid() or src.toWkt()
+        if key not in transforms:
+            transforms[key] = None if src == dst else QgsCoordinateTransform(src, dst, project)
+        xform = transforms[key]
+        request = QgsFeatureRequest().setFilterFids(sorted(names)).setNoAttributes()
+        try:
+            for feat in layer.getFeatures(request):
+                try:
+                    pt = _representative_point(feat.geometry())
+                    if pt is None:
+                        continue
+                    pt = QgsPointXY(pt.x(), pt.y())
+                    if xform is not None:
+                        pt = xform.transform(pt)
+                    out[names[int(feat.id())]] = (pt.x(), pt.y())
+                except Exception as e:
+                    logger.debug(f"Skipping node without usable geometry: {e}")
+        except Exception as e:
+            logger.debug(f"Error in node_map_points: {e}")
+    return out
+
+
+def map_to_scene(points: Dict[str, Tuple[float, float]], paths: List[List[Tuple[float, float]]],
+                 width: float = 1600.0, height: float = 1000.0, pad: float = 20.0):
+    """
+    Fit map positions into a ``width`` x ``height`` scene, north up.
+
+    Args:
+        points: node name -> project-CRS (x, y)
+        paths: vertex lists (project CRS), e.g. the edges' ``geom_coords``
+
+    Returns:
+        (node name -> scene (x, y), scene vertex lists in the order of
+        ``paths``), or None when there is nothing to place. Uses NumPy for
+        the vertices when it is installed.
+    """
+    names = list(points)
+    flat = [points[n] for n in names]
+    for path in paths:
+        flat.extend(path or ())
+    if not flat:
+        return None
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        xy = np.asarray(flat, dtype=float)
+        minx, miny = xy.min(axis=0)
+        maxx, maxy = xy.max(axis=0)
+        scale = min(width / max(1.0, maxx - minx), height / max(1.0, maxy - miny))
+        out = np.empty_like(xy)
+        out[:, 0] = (xy[:, 0] - minx) * scale + pad
+        out[:, 1] = (maxy - xy[:, 1]) * scale + pad
+        scene = [(float(x), float(y)) for x, y in out.tolist()]
+    else:
+        minx = min(x for x, _ in flat)
+        maxx = max(x for x, _ in flat)
+        miny = min(y for _, y in flat)
+        maxy = max(y for _, y in flat)
+        scale = min(width / max(1.0, maxx - minx), height / max(1.0, maxy - miny))
+        scene = [((x - minx) * scale + pad, (maxy - y) * scale + pad) for x, y in flat]
+
+    pos = dict(zip(names, scene))
+    out_paths = []
+    i = len(names)
+    for path in paths:
+        n = len(path or ())
+        out_paths.append(scene[i:i + n])
+        i += n
+    return pos, out_paths
+
+
+class SchematicModel:
+    """Nodes and edges of the schematic of one project, updated per feature."""
+
+    def __init__(self, project=None, catalog=None, registry=None):
+        if project is None:
+            from qgis.core import QgsProject
+            project = QgsProject.instance()
+        self.project = project
+        self._catalog = catalog
+        self._registry = registry
+        self._edges: Dict[Key, dict] = {}
+        self._names: Dict[Key, str] = {}              # point feature -> its node name
+        self._owners: Dict[str, List[Key]] = {}       # node name -> features claiming it
+        self._node_layers: Dict[str, str] = {}        # layer id -> layer name
+        self._layer_order: Dict[str, int] = {}        # layer id -> position in mapLayers()
+
+    @property
+    def catalog(self):
+        return self._catalog or get_cable_catalog()
+
+    @property
+    def registry(self):
+        return self._registry or get_layer_registry()
+
+    # -- reading -----------------------------------------------------------
+
+    def nodes(self) -> Dict[str, dict]:
+        """Node name -> {layer_id, layer_name, fid} of its owner, by name."""
+        out = {}
+        for name in sorted(self._owners):
+            lid, fid = self._owners[name][0]
+            out[name] = {"layer_id": lid, "layer_name": self._node_layers.get(lid, ''), "fid": fid}
+        return out
+
+    def edges(self) -> List[dict]:
+        """Every edge: cables first, then pipes, each in layer and fid order."""
+        return [self._edges[k] for k in sorted(self._edges, key=lambda k: (self._edges[k]['is_pipe'], k))]
+
+    # -- which layers ------------------------------------------------------
+
+    def _edge_layers(self) -> Dict[str, bool]:
+        """Layer id -> is a pipe layer, for every line layer drawn as edges."""
+        from qgis.core import QgsWkbTypes
+
+        line = QgsWkbTypes.GeometryType.LineGeometry
+        out = {lyr.id(): False for lyr in self.registry.by_role(ROLE_CABLE, geometry=line)}
+        out.update({lyr.id(): True for lyr in self.registry.by_role(ROLE_PIPE, geometry=line)})
+        return out
+
+    @staticmethod
+    def is_node_layer(layer) -> bool:
+        """A point layer whose features can name a node."""
+        from qgis.core import QgsVectorLayer, QgsWkbTypes
+
+        try:
+            if not isinstance(layer, QgsVectorLayer) or \
+                    layer.geometryType() != QgsWkbTypes.GeometryType.PointGeometry:
+                return False
+            names = layer.fields().names()
+            return ('naziv' in names or layer.name() == POLE_LAYER_NAME
+                    or (layer.name() in MANHOLE_LAYER_NAMES and 'broj_okna' in names))  # noqa: W503
+        except Exception:
+            return False
+
+    def draws(self, layer) -> bool:
+        """Whether edits to ``layer`` can change the schematic."""
+        try:
+            return layer.id() in self._edge_layers() or self.is_node_layer(layer)
+        except Exception:
+            return False
+
+    def has_layer(self, layer_id: str) -> bool:
+        """Whether ``layer_id`` currently contributes nodes or edges."""
+        return layer_id in self._node_layers or any(k[0] == layer_id for k in self._edges)
+
+    # -- updating ----------------------------------------------------------
+
+    def load(self) -> None:
+        """Collect every node and edge again."""
+        self._edges = {}
+        self._names = {}
+        self._owners = {}
+        self._node_layers = {}
+        self._layer_order = {}
+        for lyr in self.project.mapLayers().values():
+            if self.is_node_layer(lyr):
+                self._load_nodes(lyr, None)
+        catalog = self.catalog
+        for lid, pipe in self._edge_layers().items():
+            layer = self.project.mapLayer(lid)
+            for rec in catalog.layer_records(layer):
+                self._edges[(lid, rec.fid)] = edge_from_record(rec, catalog, pipe)
+
+    def reload_layer(self, layer) -> None:
+        """Drop what ``layer`` contributed and read it again (after a commit renumbers it)."""
+        self.drop_layer(layer.id())
+        edge_layers = self._edge_layers()
+        if layer.id() in edge_layers:
+            catalog = self.catalog
+            for rec in catalog.layer_records(layer):
+                self._edges[(layer.id(), rec.fid)] = edge_from_record(rec, catalog, edge_layers[layer.id()])
+        elif self.is_node_layer(layer):
+            self._load_nodes(layer, None)
+
+    def drop_layer(self, layer_id: str) -> None:
+        """Forget everything ``layer_id`` contributed."""
+        for key in [k for k in self._edges if k[0] == layer_id]:
+            del self._edges[key]
+        for key in [k for k in self._names if k[0] == layer_id]:
+            self._unname(key)
+        self._node_layers.pop(layer_id, None)
+
+    def apply(self, layer, changed: Iterable[int] = (), removed: Iterable[int] = ()) -> bool:
+        """
+        Apply one layer's change set: re-read ``changed`` fids, drop ``removed``.
+
+        Returns:
+            True if a node or an edge changed (False for a layer not drawn).
+        """
+        lid = layer.id()
+        changed = {int(fid) for fid in changed}
+        removed = {int(fid) for fid in removed}
+        changed -= removed
+        edge_layers = self._edge_layers()
+        if lid in edge_layers:
+            catalog = self.catalog
+            catalog.mark_stale(lid, changed | removed)
+            dirty = False
+            for fid in removed:
+                dirty |= self._edges.pop((lid, fid), None) is not None
+            for fid in sorted(changed):
+                rec = catalog.record(lid, fid)
+                old = self._edges.pop((lid, fid), None)
+                if rec is not None:
+                    self._edges[(lid, fid)] = edge_from_record(rec, catalog, edge_layers[lid])
+                dirty |= old != self._edges.get((lid, fid))
+            return dirty
+        if not self.is_node_layer(layer) and lid not in self._node_layers:
+            return False
+        touched = {self._names[(lid, fid)] for fid in removed | changed if (lid, fid) in self._names}
+        before = {name: self._owners[name][0] for name in touched}
+        for fid in removed | changed:
+            self._unname((lid, fid))
+        if changed and self.is_node_layer(layer):
+            self._load_nodes(layer, changed)
+        touched |= {self._names[(lid, fid)] for fid in changed if (lid, fid) in self._names}
+        after = {name: self._owners[name][0] for name in touched if name in self._owners}
+        return after != before
+
+    def _load_nodes(self, layer, fids: Optional[Set[int]]) -> None:
+        from qgis.core import QgsFeatureRequest
+
+        lid = layer.id()
+        lname = layer.name()
+        self._node_layers[lid] = lname
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.Flag.NoGeometry)
+        if fids is not None:
+            request.setFilterFids(sorted(fids))
+        try:
+            names = layer.fields().names()
+            feats = sorted(layer.getFeatures(request), key=lambda f: f.id())
+            for feat in feats:
+                fid = int(feat.id())
+                nm = node_name(lname, dict(zip(names, feat.attributes())), fid)
+                if nm:
+                    self._name((lid, fid), nm)
+        except Exception as e:
+            logger.debug(f"Skipping layer while collecting schematic nodes: {e}")
+
+    def _name(self, key: Key, name: str) -> None:
+        self._names[key] = name
+        owners = self._owners.setdefault(name, [])
+        owners.append(key)
+        owners.sort(key=self._owner_order)
+
+    def _unname(self, key: Key) -> None:
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+        owners = self._owners.get(name, [])
+        if key in owners:
+            owners.remove(key)
+        if not owners:
+            self._owners.pop(name, None)
+
+    def _owner_order(self, key: Key):
+        if key[0] not in self._layer_order:
+            self._layer_order = {lid: i for i, lid in enumerate(self.project.mapLayers())}
+        return (self._layer_order.get(key[0], len(self._layer_order)), key[1])
+
+
+__all__ = [
+    'SchematicModel',
+    'bundle_edges',
+    'edge_from_record',
+    'map_to_scene',
+    'node_map_points',
+    'node_name',
+    'pipe_capacity_text',
+]
@@ -21,7 +21,6 @@ from qgis.core import (
     QgsGeometry,
     QgsPointXY,
     QgsWkbTypes,
-    QgsFeatureRequest,
     QgsMarkerSymbol,
     QgsSingleSymbolRenderer,
     QgsUnitTypes,
@@ -29,8 +28,9 @@ from qgis.core import (
 from qgis.PyQt.QtGui import QColor
 
 # Phase 5.2: Logging
+from .layer_registry import ROLE_CABLE, get_layer_registry
+from .slack_totals import get_slack_totals, write_cable_totals
 from ..utils.logger import get_logger
-from ..utils.measure import ground_length
 logger = get_logger(__name__)
 
 
@@ -94,17 +94,14 @@ class SlackManager:
                 logger.debug(f"Error in SlackManager.ensure_slack_layer: {e}")
 
         # Fallback: find existing or create new
-        # Issue #2: Check for all possible slack layer names
-        for lyr in QgsProject.instance().mapLayers().values():
+        # Issue #2: the registry resolves all possible slack layer names
+        lyr = get_layer_registry().layer(
+            "Optical slack", geometry=QgsWkbTypes.GeometryType.PointGeometry)
+        if lyr is not None:
             try:
-                if (
-                    isinstance(lyr, QgsVectorLayer)
-                    and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry  # noqa: W503
-                    and lyr.name() in ("Opticke_rezerve", "Optical slacks", "Optical slack")  # noqa: W503
-                ):
-                    self.apply_slack_field_aliases(lyr)
-                    self.set_slack_layer_alias(lyr)
-                    return lyr
+                self.apply_slack_field_aliases(lyr)
+                self.set_slack_layer_alias(lyr)
+                return lyr
             except Exception as e:
                 logger.debug(f"Error in SlackManager.ensure_slack_layer: {e}")
 
@@ -170,82 +167,39 @@ class SlackManager:
 
     def recompute_slack_for_cable(self, cable_layer_id: str, cable_fid: int) -> None:
         """
-        Compute sum of 'duzina_m' from Optical slack layer for given cable and update:
-        - slack_m (if field exists: 'slack_m' / 'slack' / 'slack_m' / 'slacks_m')
-        - total_len_m = geom.length() + slack_m (if field 'total_len_m' exists)
+        Update slack totals of one cable from the Optical slack layer:
+        - slack_m (if field exists: 'slack_m' / 'slack' / 'slacks_m')
+        - total_len_m = ground length + slack_m (if field 'total_len_m' exists)
 
         Args:
             cable_layer_id: Layer ID of the cable
             cable_fid: Feature ID of the cable
         """
-        try:
-            prj = QgsProject.instance()
-            rez = self.ensure_slack_layer()
-            if rez is None:
-                return
+        self.recompute_slack_for_cables([(cable_layer_id, cable_fid)])
 
-            # 1) Calculate slack sum
-            slack = 0.0
-            expr = f'"cable_layer_id" = \'{cable_layer_id}\' AND "cable_fid" = {int(cable_fid)}'
-            try:
-                it = rez.getFeatures(QgsFeatureRequest().setFilterExpression(expr))
-            except Exception:
-                it = rez.getFeatures()
-            for f in it:
-                try:
-                    if f["cable_layer_id"] == cable_layer_id and int(f["cable_fid"]) == int(cable_fid):
-                        try:
-                            slack += float(f["duzina_m"] or 0.0)
-                        except Exception as e:
-                            logger.debug(f"Error in SlackManager.recompute_slack_for_cable: {e}")
-                except Exception as e:
-                    logger.debug(f"Error in SlackManager.recompute_slack_for_cable: {e}")
-
-            # 2) Find cable and update attributes
-            cable_lyr = prj.mapLayer(cable_layer_id)
-            if cable_lyr is None:
-                return
-            cable_f = next((f for f in cable_lyr.getFeatures(QgsFeatureRequest(int(cable_fid)))), None)
-            if cable_f is None:
-                return
+    def recompute_slack_for_cables(self, cables) -> None:
+        """
+        Update slack totals of many cables, each cable layer in one edit session.
 
-            # Find field names
-            fld_slack = None
-            for name in ("slack_m", "slack", "slack_m", "slacks_m"):
-                if cable_lyr.fields().indexOf(name) != -1:
-                    fld_slack = name
-                    break
-            has_total = cable_lyr.fields().indexOf("total_len_m") != -1
+        The slack sums come from the shared running totals of the slack layer,
+        so no cable costs a scan of the slack layer.
 
-            if fld_slack is None and (not has_total):
+        Args:
+            cables: Iterable of (cable layer id, cable fid)
+        """
+        try:
+            rez = self.ensure_slack_layer()
+            if rez is None:
                 return
-
-            cable_lyr.startEditing()
-            if fld_slack:
-                cable_f[fld_slack] = float(slack)
-            if has_total:
-                try:
-                    geom_len = ground_length(cable_f.geometry(), cable_lyr)
-                except Exception:
-                    geom_len = 0.0
-                cable_f["total_len_m"] = geom_len + float(slack)
-            cable_lyr.updateFeature(cable_f)
-            cable_lyr.commitChanges()
-
             # Workaround for QGIS bug: after programmatic editing of memory layers,
             # QGIS sometimes "forgets" labels until style is reapplied
-            if self._stylize_cable_layer_callback:
-                try:
-                    self._stylize_cable_layer_callback(cable_lyr)
-                except Exception as e:
-                    logger.debug(f"Error in SlackManager.recompute_slack_for_cable: {e}")
-
-            cable_lyr.triggerRepaint()
+            write_cable_totals(cables, get_slack_totals(rez),
+                               restyle=self._stylize_cable_layer_callback)
         except Exception as e:
             try:
                 self.iface.messageBar().pushWarning("Optical slacks", f"Failed updating slack: {e}")
             except Exception as e:
-                logger.debug(f"Error in SlackManager.recompute_slack_for_cable: {e}")
+                logger.debug(f"Error in SlackManager.recompute_slack_for_cables: {e}")
 
     def start_slack_interactive(self, default_tip: str = "Terminal") -> None:
         """Start map tool for interactive slack placement.
@@ -271,18 +225,11 @@ class SlackManager:
         from ..tools.slack_tool import SlackPlaceTool
 
         vl = self.ensure_slack_layer()
-        kabl_layers = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry and lyr.name() in (
-                    "Kablovi_podzemni", "Kablovi_vazdusni",
-                    "Underground cables", "Aerial cables"
-                ):
-                    kabl_layers.append(lyr)
-            except Exception as e:
-                logger.debug(f"Error in SlackManager.generate_terminal_slack_for_selected: {e}")
+        kabl_layers = get_layer_registry().by_role(
+            ROLE_CABLE, geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
         count = 0
+        touched = set()
         for kl in kabl_layers:
             sel = kl.selectedFeatures()
             for kf in sel:
@@ -337,13 +284,15 @@ class SlackManager:
                     except Exception as e:
                         logger.debug(f"Error recording undo for slack: {e}")
 
-                    # Auto-compute slack for cable
-                    try:
-                        self.recompute_slack_for_cable(kl.id(), int(kf.id()))
-                    except Exception as e:
-                        logger.debug(f"Error in SlackManager.generate_terminal_slack_for_selected: {e}")
+                    touched.add((kl.id(), int(kf.id())))
                     count += 1
 
+        # Auto-compute slack for the cables, once each
+        try:
+            self.recompute_slack_for_cables(touched)
+        except Exception as e:
+            logger.debug(f"Error in SlackManager.generate_terminal_slack_for_selected: {e}")
+
         vl.triggerRepaint()
         try:
             QMessageBox.information(
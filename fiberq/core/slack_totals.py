@@ -0,0 +1,361 @@
+"""
+FiberQ v2 - Running Slack Totals per Cable
+
+A cable's ``slack_m`` is the sum of ``duzina_m`` over the optical slacks that
+reference it (``cable_layer_id`` / ``cable_fid``), and its ``total_len_m`` is its
+ground length plus that sum. Both used to be recomputed by scanning the whole
+slack layer for the one cable -- and after every commit, for every cable the
+slack layer references.
+
+A :class:`SlackTotals` reads the slack layer's committed features once and then
+follows its committed add/remove/attribute deltas, so a cable's total is a
+dictionary lookup. Listeners hear which cables a commit touched.
+:func:`write_cable_totals` writes the totals of many cables with one edit
+session per cable layer and restyles each layer once.
+
+Use :func:`get_slack_totals` for the shared instance of a slack layer.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from qgis.PyQt.QtCore import QVariant
+from qgis.core import (
+    QgsFeatureRequest,
+    QgsField,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from ..utils.logger import get_logger
+from ..utils.measure import ground_length
+
+logger = get_logger(__name__)
+
+CableKey = Tuple[str, int]
+
+#: Cable fields a slack total is written to, in order of preference.
+SLACK_FIELDS = ("slack_m", "slack", "slacks_m")
+TOTAL_FIELD = "total_len_m"
+
+_TOTALS: Dict[str, "SlackTotals"] = {}
+
+
+def _is_null(value) -> bool:
+    return value is None or (hasattr(value, "isNull") and value.isNull())
+
+
+def _cable_key(layer_id, fid) -> Optional[CableKey]:
+    if _is_null(layer_id) or _is_null(fid) or layer_id == "":
+        return None
+    try:
+        return str(layer_id), int(fid)
+    except (TypeError, ValueError):
+        return None
+
+
+def _number(value) -> float:
+    if _is_null(value):
+        return 0.0
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class SlackTotals:
+    """Slack total per cable of one slack layer, kept from committed deltas."""
+
+    def __init__(self, layer: QgsVectorLayer):
+        self.layer = layer
+        self.layer_id = layer.id()
+        self._connected = False
+        self._totals: Dict[CableKey, float] = {}
+        # slack fid -> (cable it counts towards, metres)
+        self._contrib: Dict[int, Tuple[Optional[CableKey], float]] = {}
+        self._listeners: List[Callable[[Set[CableKey]], None]] = []
+        self.seed()
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def total(self, cable_layer_id: str, cable_fid: int) -> float:
+        """Slack metres counted towards one cable."""
+        return self._totals.get(_cable_key(cable_layer_id, cable_fid), 0.0)
+
+    def totals(self) -> Dict[CableKey, float]:
+        """Every cable with slack, and its total."""
+        return dict(self._totals)
+
+    def add_listener(self, callback: Callable[[Set[CableKey]], None]) -> None:
+        """Call ``callback(keys)`` with the cables each commit touched."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def _indexes(self):
+        fields = self.layer.fields()
+        idx_len = fields.indexFromName('duzina_m')
+        if idx_len == -1:
+            idx_len = fields.indexFromName('slack_m')
+        return (fields.indexFromName('cable_layer_id'),
+                fields.indexFromName('cable_fid'),
+                idx_len)
+
+    def seed(self) -> None:
+        """Read every committed slack once."""
+        self._totals = {}
+        self._contrib = {}
+        idx_kid, idx_fid, idx_len = self._indexes()
+        if idx_kid == -1 or idx_fid == -1:
+            return
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.Flag.NoGeometry)
+        request.setSubsetOfAttributes([i for i in (idx_kid, idx_fid, idx_len) if i != -1])
+        # The provider, not the layer: totals follow committed data only
+        for feat in self.layer.dataProvider().getFeatures(request):
+            attrs = feat.attributes()
+            key = _cable_key(attrs[idx_kid], attrs[idx_fid])
+            self._set(int(feat.id()), key, _number(attrs[idx_len]) if idx_len != -1 else 0.0)
+
+    def _set(self, fid: int, key: Optional[CableKey], metres: float) -> Set[CableKey]:
+        """Make slack ``fid`` count ``metres`` towards ``key``; returns the
+        cables whose total changed."""
+        touched = set()
+        old_key, old_metres = self._contrib.pop(fid, (None, 0.0))
+        if old_key is not None:
+            self._totals[old_key] = self._totals.get(old_key, 0.0) - old_metres
+            if abs(self._totals[old_key]) < 1e-9:
+                del self._totals[old_key]
+            touched.add(old_key)
+        if key is not None:
+            self._contrib[fid] = (key, metres)
+            self._totals[key] = self._totals.get(key, 0.0) + metres
+            touched.add(key)
+        return touched
+
+    def _on_added(self, layer_id, features) -> None:
+        idx_kid, idx_fid, idx_len = self._indexes()
+        touched = set()
+        for feat in features:
+            try:
+                attrs = feat.attributes()
+                key = _cable_key(attrs[idx_kid], attrs[idx_fid]) if -1 not in (idx_kid, idx_fid) else None
+                touched |= self._set(int(feat.id()), key, _number(attrs[idx_len]) if idx_len != -1 else 0.0)
+            except Exception as e:
+                logger.debug(f"Error in SlackTotals._on_added: {e}")
+        self._notify(touched)
+
+    def _on_removed(self, layer_id, fids) -> None:
+        touched = set()
+        for fid in fids:
+            touched |= self._set(int(fid), None, 0.0)
+        self._notify(touched)
+
+    def _on_attributes_changed(self, layer_id, changes) -> None:
+        relevant = {i for i in self._indexes() if i != -1}
+        fids = [int(fid) for fid, values in changes.items() if relevant & set(values)]
+        self._notify(self._reread(fids))
+
+    def _reread(self, fids: List[int]) -> Set[CableKey]:
+        """Re-read the committed state of slacks ``fids`` in one request."""
+        if not fids:
+            return set()
+        idx_kid, idx_fid, idx_len = self._indexes()
+        touched = set()
+        request = QgsFeatureRequest().setFilterFids(fids)
+        request.setFlags(QgsFeatureRequest.Flag.NoGeometry)
+        seen = set()
+        for feat in self.layer.dataProvider().getFeatures(request):
+            attrs = feat.attributes()
+            fid = int(feat.id())
+            seen.add(fid)
+            key = _cable_key(attrs[idx_kid], attrs[idx_fid]) if -1 not in (idx_kid, idx_fid) else None
+            touched |= self._set(fid, key, _number(attrs[idx_len]) if idx_len != -1 else 0.0)
+        for fid in set(fids) - seen:
+            touched |= self._set(fid, None, 0.0)
+        return touched
+
+    def _on_source_changed(self, *args) -> None:
+        before = set(self._totals)
+        self.seed()
+        self._notify(before | set(self._totals))
+
+    def _notify(self, touched: Set[CableKey]) -> None:
+        if not touched:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(set(touched))
+            except Exception as e:
+                logger.debug(f"Error in SlackTotals listener: {e}")
+
+    def _signals(self):
+        lyr = self.layer
+        return (
+            (lyr.committedFeaturesAdded, self._on_added),
+            (lyr.committedFeaturesRemoved, self._on_removed),
+            (lyr.committedAttributeValuesChanges, self._on_attributes_changed),
+            (lyr.dataSourceChanged, self._on_source_changed),
+        )
+
+    def connect(self) -> None:
+        """Start following the layer's committed changes."""
+        if self._connected:
+            return
+        for signal, slot in self._signals():
+            try:
+                signal.connect(slot)
+            except Exception as e:
+                logger.debug(f"Error in SlackTotals.connect: {e}")
+        self._connected = True
+
+    def disconnect(self) -> None:
+        """Stop following the layer (it is going away, or the plugin unloads)."""
+        if not self._connected:
+            return
+        for signal, slot in self._signals():
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in SlackTotals.disconnect: {e}")
+        self._connected = False
+
+
+def get_slack_totals(layer: QgsVectorLayer) -> SlackTotals:
+    """The shared :class:`SlackTotals` of a slack layer, seeded on first use."""
+    layer_id = layer.id()
+    totals = _TOTALS.get(layer_id)
+    if totals is not None and totals.layer is layer:
+        return totals
+    if totals is not None:
+        totals.disconnect()
+    else:
+        try:
+            layer.willBeDeleted.connect(lambda lid=layer_id: drop_slack_totals(lid))
+        except Exception as e:
+            logger.debug(f"Error in get_slack_totals: {e}")
+    totals = SlackTotals(layer)
+    totals.connect()
+    _TOTALS[layer_id] = totals
+    return totals
+
+
+def drop_slack_totals(layer_id: str) -> None:
+    """Forget the totals of one slack layer."""
+    totals = _TOTALS.pop(layer_id, None)
+    if totals is not None:
+        totals.disconnect()
+
+
+def clear_slack_totals() -> None:
+    """Forget every cached total (plugin unload)."""
+    for layer_id in list(_TOTALS):
+        drop_slack_totals(layer_id)
+
+
+def write_cable_totals(keys: Iterable[CableKey], totals: SlackTotals,
+                       add_missing_fields: bool = False, places: Optional[int] = None,
+                       restyle: Optional[Callable[[QgsVectorLayer], None]] = None) -> int:
+    """
+    Write ``slack_m`` and ``total_len_m`` of many cables.
+
+    Cables are grouped by layer: each layer gets one feature request for the
+    cables' geometry, one edit session (or the user's, if one is open, which is
+    left open) and one ``restyle`` call.
+
+    Args:
+        keys: (cable layer id, fid) of the cables to write
+        totals: Slack totals to write from
+        add_missing_fields: Add ``slack_m``/``total_len_m`` to layers lacking them
+        places: Round the written values to this many decimals
+        restyle: Called once per written layer (label/style refresh)
+
+    Returns:
+        Number of cables written
+    """
+    by_layer: Dict[str, Set[int]] = {}
+    for key in keys:
+        key = _cable_key(*key)
+        if key is not None:
+            by_layer.setdefault(key[0], set()).add(key[1])
+
+    written = 0
+    project = QgsProject.instance()
+    for layer_id, fids in by_layer.items():
+        lyr = project.mapLayer(layer_id)
+        if not isinstance(lyr, QgsVectorLayer):
+            continue
+        try:
+            slack_idx, tot_idx = _total_fields(lyr, add_missing_fields)
+            if slack_idx == -1 and tot_idx == -1:
+                continue
+
+            changes = {}
+            request = QgsFeatureRequest().setFilterFids(sorted(fids))
+            for feat in lyr.getFeatures(request):
+                fid = int(feat.id())
+                slack = totals.total(layer_id, fid)
+                values = {}
+                if slack_idx != -1:
+                    values[slack_idx] = slack
+                if tot_idx != -1:
+                    values[tot_idx] = ground_length(feat.geometry(), lyr, fid=fid) + slack
+                if places is not None:
+                    values = {idx: round(v, places) for idx, v in values.items()}
+                changes[fid] = values
+            if not changes:
+                continue
+
+            was_editing = lyr.isEditable()
+            if not was_editing:
+                lyr.startEditing()
+            for fid, values in changes.items():
+                lyr.changeAttributeValues(fid, values)
+            if not was_editing:
+                lyr.commitChanges()
+            written += len(changes)
+
+            if restyle is not None:
+                try:
+                    restyle(lyr)
+                except Exception as e:
+                    logger.debug(f"Error in write_cable_totals restyle: {e}")
+            lyr.triggerRepaint()
+        except Exception as e:
+            logger.debug(f"Error in write_cable_totals: {e}")
+    return written
+
+
+def _total_fields(lyr: QgsVectorLayer, add_missing: bool) -> Tuple[int, int]:
+    fields = lyr.fields()
+    slack_idx = next((fields.indexFromName(n) for n in SLACK_FIELDS if fields.indexFromName(n) != -1), -1)
+    tot_idx = fields.indexFromName(TOTAL_FIELD)
+    if add_missing and (slack_idx == -1 or tot_idx == -1):
+        missing = []
+        if slack_idx == -1:
+            missing.append(QgsField(SLACK_FIELDS[0], QVariant.Double))
+        if tot_idx == -1:
+            missing.append(QgsField(TOTAL_FIELD, QVariant.Double))
+        lyr.dataProvider().addAttributes(missing)
+        lyr.updateFields()
+        fields = lyr.fields()
+        slack_idx = fields.indexFromName(SLACK_FIELDS[0]) if slack_idx == -1 else slack_idx
+        tot_idx = fields.indexFromName(TOTAL_FIELD)
+    return slack_idx, tot_idx
+
+
+__all__ = [
+    'SlackTotals',
+    'get_slack_totals',
+    'drop_slack_totals',
+    'clear_slack_totals',
+    'write_cable_totals',
+]
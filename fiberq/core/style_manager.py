@@ -8,7 +8,7 @@ Phase 7 of the modular refactoring.
 """
 
 from qgis.core import (
-    QgsProject, QgsWkbTypes, QgsSymbol,
+    QgsWkbTypes, QgsSymbol,
     QgsMarkerSymbol, QgsFillSymbol, QgsSimpleLineSymbolLayer,
     QgsSimpleMarkerSymbolLayer, QgsSimpleFillSymbolLayer,
     QgsLinePatternFillSymbolLayer, QgsSingleSymbolRenderer,
@@ -21,6 +21,7 @@ from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QColor, QFont
 
 # Phase 5.2: Logging
+from .layer_registry import get_layer_registry
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
@@ -98,14 +99,8 @@ class StyleManager:
             base_width = 0.8
             base_unit = QgsUnitTypes.RenderUnit.RenderMetersInMapUnits
             try:
-                route_layer = next(
-                    (
-                        lyr for lyr in QgsProject.instance().mapLayers().values()
-                        if lyr.name().lower().strip() in ("trasa", "route")
-                        and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry  # noqa: W503
-                    ),
-                    None
-                )
+                route_layer = get_layer_registry().layer(
+                    "Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
                 if route_layer and route_layer.renderer() and route_layer.renderer().symbol():
                     sl = route_layer.renderer().symbol().symbolLayer(0)
                     if hasattr(sl, "width"):
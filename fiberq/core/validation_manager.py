@@ -21,12 +21,33 @@ Design notes
 * **One failing rule never stops the run.** Each rule is wrapped; a failure is
   recorded in ``rule_errors`` (surfaced, not swallowed — WP4 theme) and the
   remaining rules still run. The runner never raises.
+* **Incremental re-runs.** :class:`IncrementalValidator` keeps the context and
+  the last result alive between runs and follows the layers' edit signals, so a
+  re-run after a one-feature fix re-checks that feature and its neighbours only.
+  Each rule declares how its findings depend on the data (``scope``); the merged
+  result is the same as a full run's.
+* **Off the GUI thread.** The rules can run over a
+  :class:`~.validation_snapshot.ProjectSnapshot` instead of the live project, and
+  then rule groups that share no state (:func:`rule_groups`) run side by side in
+  a thread pool. :class:`~.validation_task.ValidationTask` does this as a
+  ``QgsTask``, reporting each finished rule through a
+  :class:`ValidationFeedback`.
+* **Costs are measured.** Every rule's wall and CPU time, the features it read
+  and the index queries it made land in ``ValidationResult.rule_costs``, and the
+  time spent building the shared caches in ``cache_build_s`` -- so a slow run
+  says which rule made it slow.
 
 The rule registry and the individual checks live in :mod:`.validation_rules`.
 """
+import copy
 import enum
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..models import schema
 from ..utils.logger import get_logger
@@ -46,6 +67,25 @@ class Severity(enum.Enum):
     INFO = "info"
 
 
+# How a rule's findings depend on the data -- decides what an incremental re-run
+# (:class:`IncrementalValidator`) has to re-evaluate. Stable identifiers.
+#: Re-run in full every time (project-wide rules, and the safe default).
+SCOPE_PROJECT = "project"
+#: A feature's issues depend on that feature alone. The rule reads features
+#: through :meth:`ValidationContext.features`, which an incremental run limits to
+#: the changed ones; issues of untouched features are carried over.
+SCOPE_FEATURE = "feature"
+#: A feature's issues depend on features near it. The rule keeps its own caches
+#: current from :attr:`ValidationContext.dirty` and yields every issue.
+SCOPE_NEIGHBOURS = "neighbours"
+
+
+def feature_order_key(fid: int) -> Tuple[bool, int]:
+    """Sort key for fids in the order a layer returns its features: saved
+    features by fid, then the edit buffer's new (negative) ones, also by fid."""
+    return (fid < 0, fid)
+
+
 # Sort/summary order: errors first.
 SEVERITY_ORDER: Dict[Severity, int] = {
     Severity.ERROR: 0,
@@ -76,13 +116,15 @@ class ValidationRule:
     yields :class:`ValidationIssue`. ``title`` is marked for translation with
     ``QT_TRANSLATE_NOOP('ValidationRules', ...)`` at its definition site and is
     translated at display time only. ``applies_to`` is a tuple of canonical layer
-    names, or empty for a project-wide rule."""
+    names, or empty for a project-wide rule. ``scope`` is one of the ``SCOPE_*``
+    constants."""
     id: str
     title: str
     category: str
     default_severity: Severity
     check: Callable[["ValidationContext"], Iterable[ValidationIssue]]
     applies_to: Tuple[str, ...] = ()
+    scope: str = SCOPE_PROJECT
 
 
 @dataclass
@@ -96,6 +138,9 @@ class ValidationConfig:
     length_abs_tol: float = 0.5    # map units
     disabled_rules: set = field(default_factory=set)
     severity_overrides: Dict[str, Severity] = field(default_factory=dict)
+    # Trace Python allocations to fill RuleCost.peak_kib. Off by default:
+    # tracemalloc slows every allocation down for as long as it runs.
+    trace_memory: bool = False
 
     def is_enabled(self, rule_id: str) -> bool:
         return rule_id not in self.disabled_rules
@@ -104,6 +149,25 @@ class ValidationConfig:
         return self.severity_overrides.get(rule.id, rule.default_severity)
 
 
+@dataclass
+class RuleCost:
+    """What one rule cost in a run.
+
+    ``features`` counts the features (or column rows) the rule read and
+    ``index_queries`` the spatial-index lookups it made. ``peak_kib`` is the
+    Python allocation peak above where the rule started, known only when
+    :attr:`ValidationConfig.trace_memory` is set; tracemalloc is process-wide,
+    so with rule groups running in parallel it includes whatever ran alongside.
+    A shared cache a rule was first to need is built, and so paid for, in its
+    time.
+    """
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    features: int = 0
+    index_queries: int = 0
+    peak_kib: Optional[float] = None
+
+
 @dataclass
 class ValidationResult:
     """The structured outcome of a validation run."""
@@ -117,6 +181,9 @@ class ValidationResult:
     ran_rules: List[str] = field(default_factory=list)
     skipped_rules: List[str] = field(default_factory=list)
     rule_errors: List[str] = field(default_factory=list)
+    cancelled: bool = False  # stopped before every enabled rule had run
+    rule_costs: Dict[str, RuleCost] = field(default_factory=dict)
+    cache_build_s: Dict[str, float] = field(default_factory=dict)  # cache -> seconds
 
     def add(self, issue: ValidationIssue) -> None:
         self.issues.append(issue)
@@ -147,6 +214,52 @@ class ValidationResult:
         return (f"Validation: {c['error']} error(s), "
                 f"{c['warning']} warning(s), {c['info']} info")
 
+    def slowest_rules(self, n: int = 3) -> List[Tuple[str, RuleCost]]:
+        """The ``n`` rules that took longest, slowest first."""
+        return sorted(self.rule_costs.items(), key=lambda kv: -kv[1].wall_s)[:n]
+
+
+class ValidationFeedback:
+    """Progress and cancellation for a run. The runner asks :meth:`is_cancelled`
+    between rules (and between a rule's issues) and calls :meth:`rule_finished`
+    as each rule completes -- from a worker thread when rule groups run in
+    parallel. The default reports nothing and is cancelled by :meth:`cancel`."""
+
+    def __init__(self):
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def rule_finished(self, rule: ValidationRule, issues: Optional[List[ValidationIssue]],
+                      done: int, total: int) -> None:
+        """``rule`` completed; ``issues`` is None if it failed. ``done`` of
+        ``total`` enabled rules have now completed."""
+
+
+#: Rules in one group share caches (the endpoint scan, the FK references) and run
+#: one after another; groups share nothing they write, so they may run side by
+#: side. Keyed by the first letter of the rule id.
+RULE_GROUPS: Dict[str, str] = {
+    "A": "topology",
+    "B": "references",
+    "C": "attributes",
+    "D": "attributes",
+    "E": "geometry",
+}
+
+
+def rule_groups(rules: Iterable[ValidationRule]) -> List[List[ValidationRule]]:
+    """``rules`` split into :data:`RULE_GROUPS`, each in registry order. A rule
+    from an unknown family gets a group of its own."""
+    groups: Dict[str, List[ValidationRule]] = {}
+    for rule in rules:
+        groups.setdefault(RULE_GROUPS.get(rule.id[:1], rule.id), []).append(rule)
+    return list(groups.values())
+
 
 # ---------------------------------------------------------------------------
 # Context
@@ -163,21 +276,95 @@ class ValidationContext:
         self.config = config or ValidationConfig()
         self._layers_by_canonical: Optional[Dict[str, list]] = None
         self._index_cache: Dict[str, Any] = {}
-        # Scratch space shared between rules for structures that are expensive to
-        # build and useful to more than one rule (e.g. the cable-endpoint scan
-        # that A1 and A2 both read). Lives for one validation run.
+        self._index_bounds: Dict[str, Dict[int, Any]] = {}
+        # Structures that are expensive to build and useful to more than one rule
+        # (e.g. the cable-endpoint index that A1 and A2 both read). Lives as long
+        # as the context: one run, or many under an IncrementalValidator.
         self.cache: Dict[str, Any] = {}
+        # Scratch space for one run (e.g. the endpoint scan A1 and A2 share).
+        self.run_cache: Dict[str, Any] = {}
+
+        # Incremental runs. ``dirty`` maps layer id -> changed fids (None: the
+        # whole layer); it is None on a full run. ``touched_bounds`` holds the
+        # old and new bounding boxes of changed features of indexed layers
+        # (None: unknown, assume everything moved).
+        self.dirty: Optional[Dict[str, Optional[Set[int]]]] = None
+        self.touched_bounds: Dict[str, Optional[list]] = {}
+        # Set by the runner per rule (see scoped/visited/layer_order below). One
+        # copy per thread, since rule groups may run side by side.
+        self._rule_state = threading.local()
+        self._index_lock = threading.RLock()
+        self._columns: Dict[str, Any] = {}
+        self._column_locks: Dict[str, Any] = {}
+        # Costs of the current run, see RuleCost / ValidationResult.cache_build_s
+        self.rule_costs: Dict[str, RuleCost] = {}
+        self.build_seconds: Dict[str, float] = {}
+
+    def _state(self):
+        state = self._rule_state
+        if not hasattr(state, "visited"):
+            state.scoped = False
+            state.visited = {}
+            state.layer_order = []
+            state.counters = {}
+        return state
+
+    def tally(self, counter: str, n: int = 1) -> None:
+        """Count ``n`` more ``features`` or ``index_queries`` against the rule
+        running on this thread."""
+        counters = self._state().counters
+        counters[counter] = counters.get(counter, 0) + n
+
+    @contextmanager
+    def building(self, cache: str):
+        """Add the time spent in the block to ``build_seconds[cache]``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._index_lock:
+                self.build_seconds[cache] = self.build_seconds.get(cache, 0.0) + elapsed
+
+    @property
+    def scoped(self) -> bool:
+        """Whether :meth:`features` is limited to ``dirty`` for the running rule."""
+        return self._state().scoped
+
+    @scoped.setter
+    def scoped(self, value: bool) -> None:
+        self._state().scoped = value
+
+    @property
+    def visited(self) -> Dict[str, Optional[Set[int]]]:
+        """The features :meth:`features` handed the running rule, per layer id."""
+        return self._state().visited
+
+    @visited.setter
+    def visited(self, value) -> None:
+        self._state().visited = value
+
+    @property
+    def layer_order(self) -> List[str]:
+        """The order the running rule came across layers in."""
+        return self._state().layer_order
+
+    @layer_order.setter
+    def layer_order(self, value) -> None:
+        self._state().layer_order = value
 
     @property
     def layers_by_canonical(self) -> Dict[str, list]:
-        """Map canonical layer name -> list of live QgsVectorLayers, resolved via
-        ``canonical_layer_name`` over every project layer (handles legacy/plural
-        names). Cached for the lifetime of the run."""
+        """Map canonical layer name -> list of live QgsVectorLayers (or their
+        snapshots), resolved via ``canonical_layer_name`` over every project layer
+        (handles legacy/plural names). Cached for the lifetime of the run."""
         if self._layers_by_canonical is None:
             from qgis.core import QgsVectorLayer
+
+            from .validation_snapshot import LayerSnapshot
             mapping: Dict[str, list] = {}
             for layer in self.project.mapLayers().values():
-                if not isinstance(layer, QgsVectorLayer):
+                if not isinstance(layer, (QgsVectorLayer, LayerSnapshot)):
                     continue
                 canonical = schema.canonical_layer_name(layer.name())
                 if canonical is None:
@@ -196,31 +383,188 @@ class ValidationContext:
 
     def spatial_index(self, layer):
         """Lazily build and cache a QgsSpatialIndex for ``layer`` (shared across
-        topology rules; used from the wp2-topology branch onward)."""
+        topology rules; used from the wp2-topology branch onward). Kept current
+        feature by feature across incremental runs."""
         key = layer.id()
-        if key not in self._index_cache:
-            from qgis.core import QgsSpatialIndex
-            self._index_cache[key] = QgsSpatialIndex(layer.getFeatures())
+        columns = self.columns(layer)
+        with self._index_lock:
+            if key not in self._index_cache:
+                with self.building("spatial_index"):
+                    self._build_spatial_index(layer, columns)
         return self._index_cache[key]
 
+    def _build_spatial_index(self, layer, columns) -> None:
+        from qgis.core import QgsSpatialIndex
+        index = QgsSpatialIndex()
+        bounds = {}
+        for row in columns.rows():
+            rect = columns.rect(row)
+            if rect is None:
+                continue
+            fid = columns.fids[row]
+            index.addFeature(fid, rect)
+            bounds[fid] = rect
+        self._index_cache[layer.id()] = index
+        self._index_bounds[layer.id()] = bounds
+
+    def columns(self, layer):
+        """``layer`` read once into :class:`~.validation_snapshot.LayerColumns`,
+        shared by every rule that tests all features alike (B4, C1, D1-D3, E2)
+        and kept current feature by feature across incremental runs."""
+        key = layer.id()
+        with self._index_lock:
+            lock = self._column_locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._columns:
+                from .validation_snapshot import LayerColumns
+                with self.building("columns"):
+                    self._columns[key] = LayerColumns.read(layer)
+        return self._columns[key]
+
+    def _scope(self, layer, extra_fids=None) -> Optional[Set[int]]:
+        """The fids a rule may look at in ``layer``: None for all of them, else --
+        on a scoped incremental run -- the changed ones plus ``extra_fids``.
+        Recorded in ``visited`` and ``layer_order``."""
+        lid = layer.id()
+        if lid not in self.layer_order:
+            self.layer_order.append(lid)
+        if not self.scoped or (lid in self.dirty and self.dirty[lid] is None):
+            self.visited[lid] = None
+            return None
+        fids = set(self.dirty.get(lid) or ()) | set(extra_fids or ())
+        if lid in self.visited and self.visited[lid] is None:
+            return set()
+        self.visited[lid] = self.visited.get(lid, set()) | fids
+        return fids
+
+    def features(self, layer, request=None, extra_fids=None):
+        """``layer.getFeatures(request)`` -- limited, on a scoped incremental run,
+        to the layer's changed features plus ``extra_fids``.
+
+        :data:`SCOPE_FEATURE` rules read features only through here or
+        :meth:`rows`, so the runner knows which features' issues were
+        re-evaluated.
+        """
+        from qgis.core import QgsFeatureRequest
+
+        fids = self._scope(layer, extra_fids)
+        if fids is None:
+            features = layer.getFeatures(request) if request is not None else layer.getFeatures()
+        elif not fids:
+            return iter(())
+        else:
+            scoped = QgsFeatureRequest(request) if request is not None else QgsFeatureRequest()
+            scoped.setFilterFids(sorted(fids))
+            features = layer.getFeatures(scoped)
+        return self._counted(features)
+
+    def _counted(self, features):
+        for feat in features:
+            self.tally("features")
+            yield feat
+
+    def rows(self, layer, extra_fids=None):
+        """``(columns, rows)``: :meth:`columns` of ``layer`` and the rows to
+        evaluate, in iteration order -- limited like :meth:`features`."""
+        columns = self.columns(layer)
+        rows = columns.rows(self._scope(layer, extra_fids))
+        self.tally("features", len(rows))
+        return columns, rows
+
+    def rebind(self, project) -> None:
+        """Point the context at a newer snapshot of the same project, keeping its
+        caches (they are keyed by layer id and fid, which a snapshot preserves)."""
+        self.project = project
+        self._layers_by_canonical = None
+
+    def begin_run(self, dirty: Optional[Dict[str, Optional[Set[int]]]] = None) -> None:
+        """Start a run: clear the per-run scratch space and, for an incremental
+        run, bring the cached columns and spatial indexes up to date with
+        ``dirty``."""
+        self.run_cache = {}
+        self.dirty = dirty
+        self.touched_bounds = {}
+        self.rule_costs = {}
+        self.build_seconds = {}
+        self.scoped = False
+        self.visited = {}
+        self.layer_order = []
+        if dirty is None:
+            return
+
+        for lid, fids in dirty.items():
+            layer = self.project.mapLayer(lid)
+            if fids is None or layer is None:
+                # Cheaper to rebuild on demand than to diff a whole layer
+                self._columns.pop(lid, None)
+                if self._index_cache.pop(lid, None) is not None:
+                    self._index_bounds.pop(lid, None)
+                    self.touched_bounds[lid] = None
+                continue
+            columns = self._columns.get(lid)
+            if columns is None:
+                continue  # nothing read yet; an index is only built over columns
+            with self.building("columns"):
+                columns.refresh(layer, fids)
+
+            index = self._index_cache.get(lid)
+            if index is None:
+                continue
+            with self.building("spatial_index"):
+                self.touched_bounds[lid] = self._update_spatial_index(lid, index, columns, fids)
+
+    def _update_spatial_index(self, lid, index, columns, fids) -> list:
+        """Move the entries of ``fids`` in ``index``; the old and new bounds."""
+        from qgis.core import QgsFeature, QgsGeometry
+
+        bounds = self._index_bounds[lid]
+        touched = []
+        for fid in fids:
+            rect = bounds.pop(fid, None)
+            if rect is not None:
+                stub = QgsFeature(fid)
+                stub.setGeometry(QgsGeometry.fromRect(rect))
+                index.deleteFeature(stub)
+                touched.append(rect)
+        for fid in sorted(fids):
+            row = columns.row_of.get(fid)
+            rect = columns.rect(row) if row is not None else None
+            if rect is None:
+                continue
+            index.addFeature(fid, rect)
+            bounds[fid] = rect
+            touched.append(rect)
+        return touched
+
 
 # ---------------------------------------------------------------------------
 # Runner
 # ---------------------------------------------------------------------------
 
 def run_validation(project=None, rules=None, config=None,
-                   timestamp=None, plugin_version="") -> ValidationResult:
+                   timestamp=None, plugin_version="",
+                   feedback: Optional[ValidationFeedback] = None,
+                   workers: int = 1) -> ValidationResult:
     """Run the validation rules over ``project`` and return a structured result.
 
     ``project`` defaults to the current ``QgsProject``. ``rules`` defaults to the
     full registry (:data:`fiberq.core.validation_rules.RULES`). Each rule is run
     inside a try/except: a failure is recorded in ``result.rule_errors`` and the
     remaining rules still run. Never raises.
+
+    With ``workers`` > 1 the rule groups run in a thread pool; the project is
+    then read through a :class:`~.validation_snapshot.ProjectSnapshot`, since a
+    live layer may only be read from the main thread. ``feedback`` hears about
+    each finished rule and can cancel the run (``result.cancelled``).
     """
     from qgis.core import QgsProject
 
     if project is None:
         project = QgsProject.instance()
+    if workers > 1:
+        from .validation_snapshot import ProjectSnapshot
+        if not isinstance(project, ProjectSnapshot):
+            project = ProjectSnapshot(project)
     cfg = config or ValidationConfig()
     ctx = ValidationContext(project, cfg)
 
@@ -239,25 +583,393 @@ def run_validation(project=None, rules=None, config=None,
         feature_counts=_feature_counts(ctx),
     )
 
+    ctx.begin_run()
+    _execute(ctx, rules, cfg, result,
+             lambda rule: _run_rule(ctx, rule, cfg, feedback=feedback),
+             feedback, workers)
+
+    logger.info(result.summary())
+    return result
+
+
+def _execute(ctx: ValidationContext, rules, cfg: ValidationConfig, result: ValidationResult,
+             run_one: Callable[[ValidationRule], Tuple[Optional[List[ValidationIssue]], Optional[str]]],
+             feedback: Optional[ValidationFeedback] = None, workers: int = 1) -> None:
+    """Run the enabled ``rules`` through ``run_one`` and collect the outcomes into
+    ``result`` in registry order, however the groups interleaved.
+
+    ``run_one(rule)`` returns ``(issues, None)``, ``(None, error)`` or, when the
+    run was cancelled under it, ``(None, None)``.
+    """
+    enabled = []
     for rule in rules:
-        if not cfg.is_enabled(rule.id):
+        if cfg.is_enabled(rule.id):
+            enabled.append(rule)
+        else:
             result.skipped_rules.append(rule.id)
+
+    ctx.layers_by_canonical  # resolve once, before any worker reads it
+    tracing = cfg.trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    outcomes: Dict[str, Tuple[Optional[List[ValidationIssue]], Optional[str]]] = {}
+    progress = {"done": 0}
+    lock = threading.Lock()
+
+    def run_group(group):
+        for rule in group:
+            if feedback is not None and feedback.is_cancelled():
+                return
+            issues, error = run_one(rule)
+            if issues is None and error is None:
+                return
+            with lock:
+                outcomes[rule.id] = (issues, error)
+                progress["done"] += 1
+                done = progress["done"]
+            if feedback is not None:
+                try:
+                    feedback.rule_finished(rule, issues, done, len(enabled))
+                except Exception as e:
+                    logger.debug(f"Error in validation_manager._execute: {e}")
+
+    groups = rule_groups(enabled)
+    try:
+        if workers > 1 and len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(groups)),
+                                    thread_name_prefix="fiberq-validation") as pool:
+                for future in [pool.submit(run_group, group) for group in groups]:
+                    future.result()
+        else:
+            run_group(enabled)
+    finally:
+        if tracing:
+            tracemalloc.stop()
+
+    result.cache_build_s = dict(ctx.build_seconds)
+    for rule in enabled:
+        if rule.id not in outcomes:
+            result.cancelled = True
             continue
-        override = cfg.severity_overrides.get(rule.id)
-        try:
-            for issue in rule.check(ctx):
-                # A rule sets each issue's severity; a configured per-rule override
-                # (if any) wins, so a site can downgrade e.g. C1 to INFO.
-                if override is not None:
-                    issue.severity = override
-                result.add(issue)
+        if rule.id in ctx.rule_costs:
+            result.rule_costs[rule.id] = ctx.rule_costs[rule.id]
+        issues, error = outcomes[rule.id]
+        if error is not None:
+            result.rule_errors.append(error)
+        else:
             result.ran_rules.append(rule.id)
-        except Exception as e:  # one bad rule must not sink the run (WP4 theme)
-            result.rule_errors.append(f"{rule.id}: {e}")
-            logger.warning(f"Validation rule '{rule.id}' failed: {e}")
+            result.issues.extend(issues)
+
+
+def _run_rule(ctx: ValidationContext, rule: ValidationRule, cfg: ValidationConfig,
+              scoped: bool = False, feedback: Optional[ValidationFeedback] = None
+              ) -> Tuple[Optional[List[ValidationIssue]], Optional[str]]:
+    """Run one rule: ``(issues, None)``, ``(None, error)`` if it failed, or
+    ``(None, None)`` if ``feedback`` cancelled it. Records the order the rule came
+    across layers in ``ctx.layer_order`` and what it cost in ``ctx.rule_costs``."""
+    ctx.scoped = scoped
+    ctx.visited = {}
+    ctx.layer_order = []
+    state = ctx._state()
+    state.counters = {}
+    traced = tracemalloc.is_tracing()
+    if traced:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    wall, cpu = time.perf_counter(), time.thread_time()
+    override = cfg.severity_overrides.get(rule.id)
+    issues = []
+    try:
+        for issue in rule.check(ctx):
+            if feedback is not None and feedback.is_cancelled():
+                return None, None
+            # A rule sets each issue's severity; a configured per-rule override
+            # (if any) wins, so a site can downgrade e.g. C1 to INFO.
+            if override is not None:
+                issue.severity = override
+            if issue.layer_id and issue.layer_id not in ctx.layer_order:
+                ctx.layer_order.append(issue.layer_id)
+            issues.append(issue)
+    except Exception as e:  # one bad rule must not sink the run (WP4 theme)
+        logger.warning(f"Validation rule '{rule.id}' failed: {e}")
+        return None, f"{rule.id}: {e}"
+    finally:
+        ctx.scoped = False
+        ctx.rule_costs[rule.id] = RuleCost(
+            wall_s=time.perf_counter() - wall,
+            cpu_s=time.thread_time() - cpu,
+            features=state.counters.get("features", 0),
+            index_queries=state.counters.get("index_queries", 0),
+            peak_kib=((tracemalloc.get_traced_memory()[1] - base) / 1024.0
+                      if traced and tracemalloc.is_tracing() else None),
+        )
+    if feedback is not None and feedback.is_cancelled():
+        return None, None
+    return issues, None
 
-    logger.info(result.summary())
-    return result
+
+# ---------------------------------------------------------------------------
+# Incremental runner
+# ---------------------------------------------------------------------------
+
+class IncrementalValidator:
+    """Re-runs validation over what changed since the previous run.
+
+    Keeps one :class:`ValidationContext` (and so its spatial indexes and rule
+    caches) and the previous result alive, and records the features each layer's
+    edit signals report as added, deleted or changed. :meth:`run` then
+
+    * re-runs :data:`SCOPE_PROJECT` rules in full,
+    * re-runs :data:`SCOPE_FEATURE` rules over the changed features only, and
+      carries the previous issues of every other feature over,
+    * lets :data:`SCOPE_NEIGHBOURS` rules refresh their caches around the changes.
+
+    The merged result equals a full run's, issue for issue and in the same order
+    (features in fid order, as the memory, OGR and spatialite providers return
+    them). Anything the signals cannot describe -- a layer added, removed or
+    renamed, a CRS or ellipsoid change, a different configuration or rule set, a
+    rollback, a layer whose feature count changed behind the edit buffer --
+    makes the next run a full one.
+    """
+
+    def __init__(self, project=None):
+        self.project = project
+        self._ctx: Optional[ValidationContext] = None
+        self._config: Optional[ValidationConfig] = None
+        self._rule_ids: Optional[List[str]] = None
+        self._signature = None
+        self._by_rule: Dict[str, List[ValidationIssue]] = {}
+        self._layer_order: Dict[str, List[str]] = {}
+        self._counts: Dict[str, int] = {}
+        self._dirty: Dict[str, Optional[Set[int]]] = {}
+        self._temp_fids: Dict[str, Set[int]] = {}
+        self._full = True
+        self._bound = None
+        self._watched: Dict[str, Tuple[Any, list]] = {}
+
+    # -- change tracking ---------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Make the next run a full one."""
+        self._full = True
+
+    def mark_dirty(self, layer_id: str, fids: Optional[Iterable[int]] = None) -> None:
+        """Record changed features of a layer (``None``: the whole layer)."""
+        if fids is None:
+            self._dirty[layer_id] = None
+            return
+        current = self._dirty.setdefault(layer_id, set())
+        if current is not None:
+            current.update(int(fid) for fid in fids)
+
+    def _watch(self, layer) -> None:
+        lid = layer.id()
+
+        def changed(fid, *_args):
+            self.mark_dirty(lid, [fid])
+
+        def added(fid):
+            if fid < 0:
+                self._temp_fids.setdefault(lid, set()).add(fid)
+            self.mark_dirty(lid, [fid])
+
+        def committed(_layer_id, features):
+            # The edit buffer's temporary (negative) fids become real ones
+            temp = self._temp_fids.pop(lid, set())
+            self.mark_dirty(lid, list(temp) + [f.id() for f in features])
+
+        def whole(*_args):
+            self.mark_dirty(lid, None)
+
+        connections = [
+            (layer.featureAdded, added),
+            (layer.featureDeleted, changed),
+            (layer.geometryChanged, changed),
+            (layer.attributeValueChanged, changed),
+            (layer.committedFeaturesAdded, committed),
+            (layer.afterRollBack, whole),
+            (layer.attributeAdded, whole),
+            (layer.attributeDeleted, whole),
+            (layer.dataSourceChanged, whole),
+            (layer.crsChanged, self.invalidate),
+        ]
+        for signal, slot in connections:
+            try:
+                signal.connect(slot)
+            except Exception as e:
+                logger.debug(f"Error in IncrementalValidator._watch: {e}")
+        self._watched[lid] = (layer, connections)
+
+    def disconnect(self) -> None:
+        """Stop following the layers (the plugin unloads)."""
+        for _layer, connections in self._watched.values():
+            for signal, slot in connections:
+                try:
+                    signal.disconnect(slot)
+                except Exception as e:
+                    logger.debug(f"Error in IncrementalValidator.disconnect: {e}")
+        self._watched = {}
+        self._full = True
+
+    # -- running -----------------------------------------------------------
+
+    def run(self, rules=None, config=None, timestamp=None, plugin_version="",
+            feedback: Optional[ValidationFeedback] = None, workers: int = 1) -> ValidationResult:
+        """Validate the project, incrementally where possible. Never raises,
+        like :func:`run_validation`.
+
+        The same three steps :class:`~.validation_task.ValidationTask` runs on
+        two threads: :meth:`prepare`, :meth:`execute`, :meth:`finish`.
+        """
+        pending = self.prepare(rules, config, timestamp, plugin_version)
+        result = self.execute(pending, feedback, workers)
+        self.finish(pending)
+        return result
+
+    def prepare(self, rules=None, config=None, timestamp=None,
+                plugin_version="") -> "_PendingRun":
+        """Main-thread half of a run: snapshot the project, work out what changed
+        since the last run and follow any new layers."""
+        from qgis.core import QgsProject
+
+        from .validation_snapshot import ProjectSnapshot
+
+        project = self.project or QgsProject.instance()
+        cfg = config or ValidationConfig()
+        if rules is None:
+            from .validation_rules import RULES
+            rules = RULES
+
+        snapshot = ProjectSnapshot(project)
+        signature = _layer_signature(project)
+        full = (self._full or self._ctx is None or self._bound is not project or  # noqa: W504
+                cfg != self._config or [r.id for r in rules] != self._rule_ids or  # noqa: W504
+                signature != self._signature)
+        dirty = None
+        if not full:
+            self._ctx.rebind(snapshot)
+            dirty = self._take_dirty()
+        self._full = True  # until a run completes
+        if dirty is None:
+            self._ctx = ValidationContext(snapshot, cfg)
+            self._bound = project
+            self._by_rule = {}
+            self._layer_order = {}
+            self._dirty = {}
+            self._temp_fids = {}
+            self.disconnect()
+            for layer in self._ctx.layers_for():
+                live = project.mapLayer(layer.id())
+                if live is not None:
+                    self._watch(live)
+
+        ctx = self._ctx
+        result = ValidationResult(
+            project_name=snapshot.baseName() or snapshot.fileName(),
+            crs=_project_crs(snapshot),
+            schema_version=_project_schema_version(snapshot),
+            plugin_version=plugin_version,
+            timestamp=timestamp,
+            feature_counts=_feature_counts(ctx),
+        )
+        return _PendingRun(ctx=ctx, rules=list(rules), config=cfg, dirty=dirty,
+                           signature=signature, result=result)
+
+    def execute(self, pending: "_PendingRun", feedback: Optional[ValidationFeedback] = None,
+                workers: int = 1) -> ValidationResult:
+        """Worker half of a run: evaluate the rules over the snapshot and merge
+        with the previous issues. Touches no live layer."""
+        ctx, cfg, dirty, result = pending.ctx, pending.config, pending.dirty, pending.result
+
+        def run_one(rule):
+            previous = self._by_rule.get(rule.id)
+            scoped = dirty is not None and rule.scope == SCOPE_FEATURE and previous is not None
+            issues, error = _run_rule(ctx, rule, cfg, scoped=scoped, feedback=feedback)
+            if issues is None:
+                self._by_rule.pop(rule.id, None)
+                return issues, error
+            if scoped:
+                issues = _merge_scoped(previous, issues, ctx.visited,
+                                       self._layer_order.get(rule.id, []))
+            else:
+                self._layer_order[rule.id] = list(ctx.layer_order)
+            self._by_rule[rule.id] = issues
+            return issues, None
+
+        ctx.begin_run(dirty)
+        _execute(ctx, pending.rules, cfg, result, run_one, feedback, workers)
+        ctx.begin_run(None)
+        logger.info(result.summary())
+        return result
+
+    def finish(self, pending: "_PendingRun") -> None:
+        """Main-thread close of a run: a completed run becomes the baseline the
+        next one is measured against; a cancelled one leaves the next run full."""
+        if pending.result.cancelled:
+            return
+        self._config = copy.deepcopy(pending.config)
+        self._rule_ids = [r.id for r in pending.rules]
+        self._signature = pending.signature
+        self._counts = _layer_counts(pending.ctx)
+        self._full = False
+
+    def _take_dirty(self) -> Dict[str, Optional[Set[int]]]:
+        """The changes since the last run, plus any layer whose feature count
+        moved without a signal (a write straight to the data provider)."""
+        dirty = self._dirty
+        self._dirty = {}
+        for lid, count in _layer_counts(self._ctx).items():
+            if lid not in dirty and count != self._counts.get(lid):
+                dirty[lid] = None
+        return dirty
+
+
+@dataclass
+class _PendingRun:
+    """What :meth:`IncrementalValidator.prepare` hands to ``execute``/``finish``."""
+    ctx: ValidationContext
+    rules: List[ValidationRule]
+    config: ValidationConfig
+    dirty: Optional[Dict[str, Optional[Set[int]]]]
+    signature: tuple
+    result: ValidationResult
+
+
+def _merge_scoped(previous: List[ValidationIssue], fresh: List[ValidationIssue],
+                  visited: Dict[str, Optional[Set[int]]],
+                  layer_order: List[str]) -> List[ValidationIssue]:
+    """Previous issues of the features a scoped run did not look at, plus the
+    fresh ones, in the order a full run produces them."""
+    fresh_layer_level = {i.layer_id for i in fresh if i.feature_id == -1}
+
+    def replaced(issue):
+        if issue.layer_id in visited:
+            fids = visited[issue.layer_id]
+            if fids is None or issue.feature_id == -1 or issue.feature_id in fids:
+                return True
+        return issue.feature_id == -1 and issue.layer_id in fresh_layer_level
+
+    merged = [i for i in previous if not replaced(i)] + fresh
+    rank = {lid: n for n, lid in enumerate(layer_order)}
+    positions = {id(issue): n for n, issue in enumerate(merged)}
+    return sorted(merged, key=lambda i: (
+        rank.get(i.layer_id, len(rank)), i.feature_id != -1,
+        feature_order_key(i.feature_id), positions[id(i)]))
+
+
+def _layer_signature(project) -> tuple:
+    """What an incremental run cannot follow by signals: the set of vector
+    layers (and their names and CRSs) and the project CRS and ellipsoid."""
+    from qgis.core import QgsVectorLayer
+    layers = sorted(
+        (lid, layer.name(), layer.crs().authid())
+        for lid, layer in project.mapLayers().items() if isinstance(layer, QgsVectorLayer)
+    )
+    return (tuple(layers), _project_crs(project), project.ellipsoid())
+
+
+def _layer_counts(ctx: ValidationContext) -> Dict[str, int]:
+    return {layer.id(): layer.featureCount() for layer in ctx.layers_for()}
 
 
 def _project_crs(project) -> str:
@@ -267,6 +979,9 @@ def _project_crs(project) -> str:
 
 def _project_schema_version(project) -> str:
     from .schema_version import read_project_schema_version
+    from .validation_snapshot import ProjectSnapshot
+    if isinstance(project, ProjectSnapshot):
+        return project.schema_version
     return read_project_schema_version(project)
 
 
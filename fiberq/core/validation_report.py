@@ -16,6 +16,9 @@ Design constraints worth stating, because they are easy to break later:
   on. Only human-readable prose is translated, and only in the HTML renderer.
 * **Self-contained HTML.** No CDN, no external CSS or fonts: an audit document has
   to open from a USB stick in five years.
+* **Timings are optional.** The "performance" section is the one part of a report
+  that differs between two runs of the same project, so it is only written when
+  the result carries costs; clear ``rule_costs`` for a report meant to be diffed.
 """
 import csv
 import html
@@ -77,6 +80,26 @@ def issue_to_dict(issue) -> Dict[str, Any]:
     }
 
 
+def performance_to_dict(result: ValidationResult) -> Dict[str, Any]:
+    """What each rule and shared cache cost, as plain data (see ``RuleCost``).
+    Seconds are rounded to the millisecond."""
+    rules = {}
+    for rule_id, cost in result.rule_costs.items():
+        rules[rule_id] = {
+            "wall_s": round(cost.wall_s, 3),
+            "cpu_s": round(cost.cpu_s, 3),
+            "features": cost.features,
+            "index_queries": cost.index_queries,
+            "peak_kib": None if cost.peak_kib is None else round(cost.peak_kib, 1),
+        }
+    return {
+        "total_wall_s": round(sum(c.wall_s for c in result.rule_costs.values()), 3),
+        "rules": rules,
+        "cache_build_s": {name: round(seconds, 3)
+                          for name, seconds in sorted(result.cache_build_s.items())},
+    }
+
+
 def result_to_dict(result: ValidationResult) -> Dict[str, Any]:
     """The full report as plain data -- the single source every format renders."""
     counts = result.counts_by_severity()
@@ -89,7 +112,7 @@ def result_to_dict(result: ValidationResult) -> Dict[str, Any]:
         if issue.layer_name:
             by_layer[issue.layer_name] = by_layer.get(issue.layer_name, 0) + 1
 
-    return {
+    data = {
         "format": "fiberq-validation-report",
         "format_version": REPORT_FORMAT_VERSION,
         "project": {
@@ -119,6 +142,9 @@ def result_to_dict(result: ValidationResult) -> Dict[str, Any]:
         },
         "issues": issues,
     }
+    if result.rule_costs:
+        data["performance"] = performance_to_dict(result)
+    return data
 
 
 # ---------------------------------------------------------------------------
@@ -353,6 +379,10 @@ def to_html(result: ValidationResult, title: Optional[str] = None) -> str:
                          f'<td class="num">{_esc(count)}</td></tr>')
         parts.append("</tbody></table></div>")
 
+    # --- performance --------------------------------------------------------
+    if "performance" in data:
+        parts.extend(_performance_html(data["performance"]))
+
     parts += [
         "<footer>",
         _esc(_tr(QT_TRANSLATE_NOOP('ValidationReport', "Generated by the FiberQ QGIS plugin."))),
@@ -364,6 +394,45 @@ def to_html(result: ValidationResult, title: Optional[str] = None) -> str:
     return "\n".join(parts)
 
 
+def _performance_html(perf: Dict[str, Any]) -> List[str]:
+    """The "Performance" section: one row per rule, slowest first, then the
+    shared caches."""
+    title = _tr(QT_TRANSLATE_NOOP('ValidationReport', "Performance"))
+    columns = (
+        _tr(QT_TRANSLATE_NOOP('ValidationReport', "Rule")),
+        _tr(QT_TRANSLATE_NOOP('ValidationReport', "Wall time (s)")),
+        _tr(QT_TRANSLATE_NOOP('ValidationReport', "CPU time (s)")),
+        _tr(QT_TRANSLATE_NOOP('ValidationReport', "Features read")),
+        _tr(QT_TRANSLATE_NOOP('ValidationReport', "Index queries")),
+        _tr(QT_TRANSLATE_NOOP('ValidationReport', "Peak memory (KiB)")),
+    )
+    parts = [f"<h2>{_esc(title)}</h2>", '<div class="scroll"><table><thead><tr>']
+    parts += [f"<th>{_esc(column)}</th>" for column in columns]
+    parts.append("</tr></thead><tbody>")
+    for rule_id, cost in sorted(perf["rules"].items(), key=lambda kv: (-kv[1]["wall_s"], kv[0])):
+        peak = "" if cost["peak_kib"] is None else f"{cost['peak_kib']:.0f}"
+        parts.append(
+            "<tr>"
+            f'<td class="rule">{_esc(rule_id)}</td>'
+            f'<td class="num">{cost["wall_s"]:.3f}</td>'
+            f'<td class="num">{cost["cpu_s"]:.3f}</td>'
+            f'<td class="num">{_esc(cost["features"])}</td>'
+            f'<td class="num">{_esc(cost["index_queries"])}</td>'
+            f'<td class="num">{_esc(peak)}</td>'
+            "</tr>"
+        )
+    parts.append("</tbody></table></div>")
+
+    if perf["cache_build_s"]:
+        label = _tr(QT_TRANSLATE_NOOP(
+            'ValidationReport', "Shared caches built (included in the times of the rules that first needed them)"))
+        parts.append(f'<div class="meta"><p>{_esc(label)}</p><dl>')
+        for name, seconds in perf["cache_build_s"].items():
+            parts.append(f"<dt>{_esc(name)}</dt><dd>{seconds:.3f} s</dd>")
+        parts.append("</dl></div>")
+    return parts
+
+
 # ---------------------------------------------------------------------------
 # Writing
 # ---------------------------------------------------------------------------
@@ -24,9 +24,13 @@ This module has no QGIS import at top level, so the registry can be imported and
 asserted in a pure unit test; QGIS types (``NULL``, feature/geometry access) are
 imported lazily inside the checks, which only run under QGIS.
 """
+import math
+
 from ..models import schema
 from ..utils.logger import get_logger
-from .validation_manager import Severity, ValidationIssue, ValidationRule
+from .validation_manager import (
+    SCOPE_FEATURE, SCOPE_NEIGHBOURS, Severity, ValidationIssue, ValidationRule,
+)
 
 logger = get_logger(__name__)
 
@@ -143,7 +147,11 @@ def _is_blank(value, null) -> bool:
 
 def _feature_xy(feat):
     """A representative (x, y) for navigation/zoom, or None."""
-    geom = feat.geometry()
+    return _geometry_xy(feat.geometry())
+
+
+def _geometry_xy(geom):
+    """:func:`_feature_xy` for a bare geometry (a column row's)."""
     if geom is None or geom.isNull() or geom.isEmpty():
         return None
     centroid = geom.centroid()
@@ -162,6 +170,25 @@ def _uuid_of(feat) -> str:
     return "" if value is None else str(value)
 
 
+def _verdicts(column, rows, test):
+    """``[test(column[row]) for row in rows]``, calling ``test`` once per
+    distinct value: an enum or required-field column holds a handful of them
+    however many features there are."""
+    seen = {}
+    out = []
+    for row in rows:
+        value = column[row]
+        key = (type(value), value)
+        try:
+            verdict = seen[key]
+        except KeyError:
+            verdict = seen[key] = test(value)
+        except TypeError:  # unhashable (a bare QVariant)
+            verdict = test(value)
+        out.append(verdict)
+    return out
+
+
 def _fmt(value, places: int = 2) -> str:
     """Compact number for a message: trims trailing zeros so a tolerance of 5.0
     reads as "5" and a distance of 7.25 keeps its precision. ``places`` is raised
@@ -283,67 +310,397 @@ def _rect_around(point, radius):
                         point.x() + radius, point.y() + radius)
 
 
+class _PointIndex:
+    """A point ``QgsSpatialIndex`` over records keyed by ``(layer id, fid)``.
+
+    Records are tuples whose last item is the QgsPointXY. Features can be taken
+    out and put back one at a time, which is what lets the index live across
+    incremental runs (see :class:`~fiberq.core.validation_manager.IncrementalValidator`).
+
+    Alongside the R-tree the points are kept as plain ``(x, y)`` floats in
+    ``coords``, and bucketed into square grids (:meth:`grid`) for the bulk
+    joins of :func:`_match_endpoints`.
+    """
+
+    def __init__(self):
+        from qgis.core import QgsSpatialIndex
+        self.index = QgsSpatialIndex()
+        self.records = {}       # holder id -> record
+        self.by_feature = {}    # (layer id, fid) -> [holder id]
+        self.coords = {}        # holder id -> (x, y)
+        self._grids = {}        # cell size -> {(col, row): [holder id]}
+        self._next_id = 0
+
+    def add(self, key, record):
+        from qgis.core import QgsFeature, QgsGeometry
+        holder = QgsFeature(self._next_id)
+        holder.setGeometry(QgsGeometry.fromPointXY(record[-1]))
+        self.index.addFeature(holder)
+        point = record[-1]
+        xy = self.coords[self._next_id] = (point.x(), point.y())
+        for size, grid in self._grids.items():
+            grid.setdefault(_cell(xy[0], xy[1], size), []).append(self._next_id)
+        self.records[self._next_id] = record
+        self.by_feature.setdefault(key, []).append(self._next_id)
+        self._next_id += 1
+        return self._next_id - 1
+
+    def remove(self, key):
+        """Drop a feature's records; returns them."""
+        from qgis.core import QgsFeature, QgsGeometry
+        removed = []
+        for holder_id in self.by_feature.pop(key, []):
+            record = self.records.pop(holder_id)
+            holder = QgsFeature(holder_id)
+            holder.setGeometry(QgsGeometry.fromPointXY(record[-1]))
+            self.index.deleteFeature(holder)
+            x, y = self.coords.pop(holder_id)
+            for size, grid in self._grids.items():
+                grid[_cell(x, y, size)].remove(holder_id)
+            removed.append(record)
+        return removed
+
+    def intersects(self, rect):
+        return self.index.intersects(rect)
+
+    def grid(self, size):
+        """Holder ids bucketed into square cells ``size`` wide, in ascending
+        holder id per cell. Built on first use and kept current by :meth:`add`
+        and :meth:`remove`."""
+        grid = self._grids.get(size)
+        if grid is None:
+            grid = {}
+            for holder_id, (x, y) in self.coords.items():
+                grid.setdefault(_cell(x, y, size), []).append(holder_id)
+            self._grids[size] = grid
+        return grid
+
+    def near(self, x, y, reach, cache=None):
+        """``[(holder id, x, y)]`` of the points that may lie in the square of
+        half-side ``reach`` around ``(x, y)`` -- the cells it overlaps.
+        ``cache`` shares the lists between queries touching the same cells."""
+        size = max(reach, _MIN_CELL)
+        grid = self.grid(size)
+        x0, y0 = _cell(x - reach, y - reach, size)
+        x1, y1 = _cell(x + reach, y + reach, size)
+        key = (x0, y0, x1, y1)
+        if cache is not None and key in cache:
+            return cache[key]
+        coords = self.coords
+        out = [
+            (holder_id,) + coords[holder_id]
+            for col in range(x0, x1 + 1)
+            for row in range(y0, y1 + 1)
+            for holder_id in grid.get((col, row), ())
+        ]
+        if cache is not None:
+            cache[key] = out
+        return out
+
+
+# Smallest grid cell: a zero tolerance still needs a finite cell width.
+_MIN_CELL = 1e-9
+
+
+def _cell(x, y, size):
+    # Division and floor are both monotonic, so a point inside a query square
+    # always lands in one of the cells the square's corners fall in.
+    return (math.floor(x / size), math.floor(y / size))
+
+
+def _refresh_point_index(ctx, cache_key, layers, records_of):
+    """Build -- or, on an incremental run, update -- a :class:`_PointIndex` kept
+    in ``ctx.cache[cache_key]``, once per run.
+
+    ``records_of(layer, columns, row)`` yields ``(key, record)`` pairs for a
+    row of the layer's :meth:`~.validation_manager.ValidationContext.columns`,
+    which :meth:`~.validation_manager.ValidationContext.begin_run` has already
+    brought up to date. Returns
+    ``(index, touched, added)``: the points that appeared or disappeared and the
+    new holder ids, or ``(index, None, None)`` after a full build.
+    """
+    done = ctx.run_cache.get(cache_key)
+    if done is not None:
+        return done
+
+    pidx = ctx.cache.get(cache_key)
+    if pidx is None or ctx.dirty is None:
+        pidx = _PointIndex()
+        for layer in layers:
+            columns = ctx.columns(layer)
+            rows = columns.rows()
+            ctx.tally("features", len(rows))
+            with ctx.building(cache_key):
+                for row in rows:
+                    for key, record in records_of(layer, columns, row):
+                        pidx.add(key, record)
+        done = (pidx, None, None)
+    else:
+        touched, added = [], []
+        for layer in layers:
+            lid = layer.id()
+            if lid not in ctx.dirty:
+                continue
+            fids = ctx.dirty[lid]
+            if fids is None:
+                keys = [key for key in pidx.by_feature if key[0] == lid]
+            else:
+                keys = [(lid, fid) for fid in fids]
+            columns = ctx.columns(layer)
+            rows = columns.rows(fids)
+            ctx.tally("features", len(rows))
+            with ctx.building(cache_key):
+                for key in keys:
+                    touched.extend(record[-1] for record in pidx.remove(key))
+                for row in rows:
+                    for key, record in records_of(layer, columns, row):
+                        added.append(pidx.add(key, record))
+                        touched.append(record[-1])
+        done = (pidx, touched, added)
+
+    ctx.cache[cache_key] = pidx
+    ctx.run_cache[cache_key] = done
+    return done
+
+
+def _node_records(layer, columns, row):
+    point = _first_point(columns.geometries[row])
+    if point is not None:
+        fid = columns.fids[row]
+        yield (layer.id(), fid), (layer.name(), layer.id(), fid, columns.uuid(row), point)
+
+
 def _node_index(ctx):
-    """``(QgsSpatialIndex, {id: (layer_name, fid, QgsPointXY)})`` over every point
-    a cable endpoint may legally connect to.
+    """``(_PointIndex, touched, added)`` over every point a cable endpoint may
+    legally connect to; records are ``(layer_name, layer_id, fid, uuid, point)``.
 
     One combined index rather than one per layer, so an endpoint costs a single
-    query instead of ~15. Built once per run and shared by A1/A2/A3.
+    query instead of ~15. Built once and shared by A1/A2/A3.
     """
-    cached = ctx.cache.get("node_index")
-    if cached is not None:
-        return cached
+    return _refresh_point_index(ctx, "node_index", ctx.layers_for(*_NODE_LAYERS), _node_records)
 
-    from qgis.core import QgsFeature, QgsGeometry, QgsSpatialIndex
 
-    index = QgsSpatialIndex()
-    records = {}
-    next_id = 0
-    for layer in ctx.layers_for(*_NODE_LAYERS):
-        for feat in layer.getFeatures():
-            point = _first_point(feat.geometry())
-            if point is None:
-                continue
-            holder = QgsFeature(next_id)
-            holder.setGeometry(QgsGeometry.fromPointXY(point))
-            index.addFeature(holder)
-            records[next_id] = (layer.name(), feat.id(), point)
-            next_id += 1
-
-    cached = (index, records)
-    ctx.cache["node_index"] = cached
-    return cached
+def _cable_endpoint_records(layer, columns, row):
+    fid, uuid = columns.fids[row], columns.uuid(row)
+    for label, point in _line_endpoints(columns.geometries[row]):
+        yield (layer.id(), fid), (layer.name(), layer.id(), fid, uuid, label, point)
 
 
 def _cable_endpoint_index(ctx):
-    """``(QgsSpatialIndex, {id: (layer_name, layer_id, fid, uuid, label, QgsPointXY)})``
-    over every cable endpoint, so endpoint-to-endpoint joins can be detected.
+    """``(_PointIndex, touched, added)`` over every cable endpoint, records
+    ``(layer_name, layer_id, fid, uuid, label, point)``, so endpoint-to-endpoint
+    joins can be detected.
 
     A plain index over cable features would index their bounding boxes, which says
     nothing about where the ends are -- hence a synthetic point index.
     """
-    cached = ctx.cache.get("cable_endpoint_index")
-    if cached is not None:
-        return cached
+    return _refresh_point_index(ctx, "cable_endpoint_index", ctx.layers_for(*_CABLE_LAYERS),
+                                _cable_endpoint_records)
+
+
+def _match_endpoint(holder_id, record, nodes, endpoints, reach, near_cache=None):
+    """The finding for one cable endpoint: its nearest legal partner within reach.
+
+    A partner qualifies when it lies in the square of half-side ``reach``
+    around the endpoint (the bounding-box test an index query makes); the
+    nearest wins, a node before a cable end and then the lower holder id on a
+    tie. ``near_cache`` is :meth:`_PointIndex.near`'s, when matching in bulk.
+    """
+    layer_name, layer_id, fid, uuid, label, point = record
+    x, y = point.x(), point.y()
+    x0, x1, y0, y1 = x - reach, x + reach, y - reach, y + reach
+    best_distance = None
+    best_key = None
+    best_target = None
+
+    node_cache, endpoint_cache = near_cache if near_cache is not None else (None, None)
+    for kind, index, cache in ((0, nodes, node_cache), (1, endpoints, endpoint_cache)):
+        for candidate, cx, cy in index.near(x, y, reach, cache):
+            if candidate == holder_id and index is endpoints:
+                continue
+            if not (x0 <= cx <= x1 and y0 <= cy <= y1):
+                continue
+            dx, dy = x - cx, y - cy
+            distance = math.sqrt(dx * dx + dy * dy)
+            if best_distance is not None and (distance, kind, candidate) >= (best_distance,) + best_key:
+                continue
+            other = index.records[candidate]
+            # An endpoint must join a *different* feature; its own other end
+            # does not count as a connection.
+            if kind == 1 and other[1] == layer_id and other[2] == fid:
+                continue
+            best_distance = distance
+            best_key = (kind, candidate)
+            best_target = (other[0], other[2])
+
+    return _finding(record, best_distance, best_target)
+
+
+def _finding(record, distance, target):
+    layer_name, layer_id, fid, uuid, label, point = record
+    return {
+        "layer_name": layer_name,
+        "layer_id": layer_id,
+        "feature_id": fid,
+        "fiberq_uuid": uuid,
+        "label": label,
+        "point": point,
+        "distance": distance,
+        "target": target,
+    }
+
+
+def _match_endpoints(ctx, nodes, endpoints, reach):
+    """:func:`_match_endpoint` for every endpoint, in bulk.
+
+    With NumPy the whole join runs on arrays (:func:`_match_endpoints_numpy`).
+    Without it the endpoints are visited cell by cell, so all the endpoints of
+    a cell share one gathered list of candidates instead of each paying for an
+    index query, and distances are taken on plain floats.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None and endpoints.coords:
+        by_holder = _match_endpoints_numpy(ctx, nodes, endpoints, reach, np)
+        if by_holder is not None:
+            return by_holder
+
+    by_holder = {}
+    grid = endpoints.grid(max(reach, _MIN_CELL))
+    for cell in sorted(grid):
+        near_cache = ({}, {})  # per cell: the next one gathers its own neighbours
+        for holder_id in grid[cell]:
+            by_holder[holder_id] = _match_endpoint(
+                holder_id, endpoints.records[holder_id], nodes, endpoints, reach, near_cache)
+        ctx.tally("index_queries", len(near_cache[0]) + len(near_cache[1]))
+    return by_holder
+
+
+def _pairs_within(np, xy, other, reach):
+    """``(i, j, lookups)``: every pair of a point ``xy[i]`` and a point
+    ``other[j]`` in the square of half-side ``reach`` around it, and how many
+    cell lookups that took; None if the grid is too fine to number its cells
+    in an int64.
+
+    Both point sets are bucketed into the cells :meth:`_PointIndex.near`
+    uses and each cell is numbered, so the cells a square overlaps are found
+    with ``searchsorted`` in the sorted cell numbers of ``other``. The square
+    test is the one :func:`_match_endpoint` makes, on the same floats.
+    """
+    size = max(reach, _MIN_CELL)
+    x0 = np.floor((xy[:, 0] - reach) / size).astype(np.int64)
+    y0 = np.floor((xy[:, 1] - reach) / size).astype(np.int64)
+    x1 = np.floor((xy[:, 0] + reach) / size).astype(np.int64)
+    y1 = np.floor((xy[:, 1] + reach) / size).astype(np.int64)
+    ocol = np.floor(other[:, 0] / size).astype(np.int64)
+    orow = np.floor(other[:, 1] / size).astype(np.int64)
+
+    # Cell (col, row) is number (col - col0) * rows + (row - row0)
+    col0 = min(int(x0.min()), int(ocol.min()) if len(ocol) else 0)
+    row0 = min(int(y0.min()), int(orow.min()) if len(orow) else 0)
+    cols = max(int(x1.max()), int(ocol.max()) if len(ocol) else 0) - col0 + 1
+    rows = max(int(y1.max()), int(orow.max()) if len(orow) else 0) - row0 + 1
+    if cols * rows >= 2 ** 62:
+        return None
+    cells = (ocol - col0) * rows + (orow - row0)
+    order = np.argsort(cells, kind="stable")
+    cells = cells[order]
+
+    # Points in cell order, so every batch of lookups below is sorted too
+    by_cell = np.argsort((x0 - col0) * rows + (y0 - row0), kind="stable")
+    x0, y0, x1, y1 = x0[by_cell], y0[by_cell], x1[by_cell], y1[by_cell]
+    first_cell = (x0 - col0) * rows + (y0 - row0)
+    i_parts, j_parts = [], []
+    lookups = 0
+    # The square spans three cells a side, four when rounding straddles one
+    for dx in range(4):
+        for dy in range(4):
+            ok = (x0 + dx <= x1) & (y0 + dy <= y1)
+            wanted = first_cell[ok] + (dx * rows + dy)
+            lookups += len(wanted)
+            start = np.searchsorted(cells, wanted, "left")
+            count = np.searchsorted(cells, wanted, "right") - start
+            total = int(count.sum())
+            if not total:
+                continue
+            i_parts.append(np.repeat(by_cell[ok], count))
+            offset = np.repeat(start - (np.cumsum(count) - count), count)
+            j_parts.append(order[offset + np.arange(total)])
+
+    if not i_parts:
+        empty = np.zeros(0, np.int64)
+        return empty, empty, lookups
+    i = np.concatenate(i_parts)
+    j = np.concatenate(j_parts)
+    ox, oy = other[j, 0], other[j, 1]
+    px, py = xy[i, 0], xy[i, 1]
+    inside = (px - reach <= ox) & (ox <= px + reach) & (py - reach <= oy) & (oy <= py + reach)
+    return i[inside], j[inside], lookups
+
+
+def _match_endpoints_numpy(ctx, nodes, endpoints, reach, np):
+    """:func:`_match_endpoints` on arrays: the candidate pairs of every endpoint
+    come from :func:`_pairs_within`, and each endpoint keeps the pair that
+    sorts first by (distance, node before cable end, holder id) -- the order
+    :func:`_match_endpoint` picks in. None if the grid cannot be numbered."""
+    e_ids = sorted(endpoints.coords)
+    n_ids = sorted(nodes.coords)
+    exy = np.array([endpoints.coords[h] for h in e_ids], dtype=float).reshape(-1, 2)
+    nxy = np.array([nodes.coords[h] for h in n_ids], dtype=float).reshape(-1, 2)
+    e_hold = np.array(e_ids, dtype=np.int64)
+    n_hold = np.array(n_ids, dtype=np.int64)
+    features = {}
+    e_feature = np.array([features.setdefault(endpoints.records[h][1:3], len(features)) for h in e_ids],
+                         dtype=np.int64)
+
+    node_pairs = _pairs_within(np, exy, nxy, reach)
+    end_pairs = _pairs_within(np, exy, exy, reach)
+    if node_pairs is None or end_pairs is None:
+        return None
+    i_node, j_node, node_lookups = node_pairs
+    i_end, j_end, end_lookups = end_pairs
+    ctx.tally("index_queries", node_lookups + end_lookups)
+    # An endpoint must join a *different* feature (this also drops itself)
+    other = e_feature[i_end] != e_feature[j_end]
+    i_end, j_end = i_end[other], j_end[other]
+
+    i = np.concatenate((i_node, i_end))
+    kind = np.concatenate((np.zeros(len(i_node), np.int64), np.ones(len(i_end), np.int64)))
+    candidate = np.concatenate((n_hold[j_node], e_hold[j_end]))
+    cxy = np.concatenate((nxy[j_node], exy[j_end])).reshape(-1, 2)
+    dx = exy[i, 0] - cxy[:, 0]
+    dy = exy[i, 1] - cxy[:, 1]
+    distance = np.sqrt(dx * dx + dy * dy)
+
+    order = np.lexsort((candidate, kind, distance, i))
+    ranked = i[order]
+    best = order[np.concatenate(([True], ranked[1:] != ranked[:-1]))] if len(order) else order
+    best_of = dict(zip(i[best].tolist(), best.tolist()))
+
+    by_holder = {}
+    for pos, holder_id in enumerate(e_ids):
+        record = endpoints.records[holder_id]
+        k = best_of.get(pos)
+        if k is None:
+            by_holder[holder_id] = _finding(record, None, None)
+            continue
+        index = nodes if kind[k] == 0 else endpoints
+        partner = index.records[int(candidate[k])]
+        by_holder[holder_id] = _finding(record, float(distance[k]), (partner[0], partner[2]))
+    return by_holder
 
-    from qgis.core import QgsFeature, QgsGeometry, QgsSpatialIndex
-
-    index = QgsSpatialIndex()
-    records = {}
-    next_id = 0
-    for layer in ctx.layers_for(*_CABLE_LAYERS):
-        for feat in layer.getFeatures():
-            for label, point in _line_endpoints(feat.geometry()):
-                holder = QgsFeature(next_id)
-                holder.setGeometry(QgsGeometry.fromPointXY(point))
-                index.addFeature(holder)
-                records[next_id] = (layer.name(), layer.id(), feat.id(),
-                                    _uuid_of(feat), label, point)
-                next_id += 1
-
-    cached = (index, records)
-    ctx.cache["cable_endpoint_index"] = cached
-    return cached
+
+def _scan_order(ctx, layer_names, records):
+    """Sort key putting holder ids in layer order, then fid, then creation order --
+    the order a full scan visits them in."""
+    rank = {layer.id(): n for n, layer in enumerate(ctx.layers_for(*layer_names))}
+
+    def key(holder_id):
+        record = records[holder_id]
+        return (rank.get(record[1], len(rank)), record[2], holder_id)
+    return key
 
 
 def _endpoint_scan(ctx):
@@ -352,56 +709,39 @@ def _endpoint_scan(ctx):
     Returns ``[{layer_name, layer_id, feature_id, fiberq_uuid, label, point,
     distance, target}]`` where ``distance`` is ``None`` when nothing at all lies
     within 2*tol.
-    Shared by A1 and A2 so the scan runs once.
+    Shared by A1 and A2 so the scan runs once. On an incremental run only the
+    endpoints within 2*tol of a node or endpoint that appeared, moved or went
+    away are matched again.
     """
-    cached = ctx.cache.get("endpoint_scan")
+    cached = ctx.run_cache.get("endpoint_scan")
     if cached is not None:
         return cached
 
     tol = ctx.config.tol
     reach = tol * 2.0
-    node_index, node_records = _node_index(ctx)
-    ep_index, ep_records = _cable_endpoint_index(ctx)
-
-    findings = []
-    for holder_id, (layer_name, layer_id, fid, uuid, label, point) in ep_records.items():
-        rect = _rect_around(point, reach)
-        best_distance = None
-        best_target = None
-
-        for candidate in node_index.intersects(rect):
-            target_layer, target_fid, target_point = node_records[candidate]
-            distance = point.distance(target_point)
-            if best_distance is None or distance < best_distance:
-                best_distance = distance
-                best_target = (target_layer, target_fid)
-
-        for candidate in ep_index.intersects(rect):
-            if candidate == holder_id:
-                continue
-            (other_layer, other_layer_id, other_fid,
-             _uuid, _lbl, other_point) = ep_records[candidate]
-            # An endpoint must join a *different* feature; its own other end does
-            # not count as a connection.
-            if other_layer_id == layer_id and other_fid == fid:
-                continue
-            distance = point.distance(other_point)
-            if best_distance is None or distance < best_distance:
-                best_distance = distance
-                best_target = (other_layer, other_fid)
-
-        findings.append({
-            "layer_name": layer_name,
-            "layer_id": layer_id,
-            "feature_id": fid,
-            "fiberq_uuid": uuid,
-            "label": label,
-            "point": point,
-            "distance": best_distance,
-            "target": best_target,
-        })
-
-    ctx.cache["endpoint_scan"] = findings
+    nodes, node_touched, _node_added = _node_index(ctx)
+    endpoints, ep_touched, ep_added = _cable_endpoint_index(ctx)
+
+    by_holder = ctx.cache.get("endpoint_findings")
+    if by_holder is None or node_touched is None or ep_touched is None:
+        by_holder = _match_endpoints(ctx, nodes, endpoints, reach)
+    else:
+        for holder_id in [h for h in by_holder if h not in endpoints.records]:
+            del by_holder[holder_id]
+        affected = set(ep_added)
+        for point in node_touched + ep_touched:
+            affected.update(endpoints.intersects(_rect_around(point, reach)))
+        ctx.tally("index_queries", len(node_touched) + len(ep_touched))
+        for holder_id in affected:
+            record = endpoints.records.get(holder_id)
+            if record is not None:
+                by_holder[holder_id] = _match_endpoint(holder_id, record, nodes, endpoints, reach)
+                ctx.tally("index_queries", 2)
+    ctx.cache["endpoint_findings"] = by_holder
+
+    order = _scan_order(ctx, _CABLE_LAYERS, endpoints.records)
+    findings = [by_holder[h] for h in sorted(by_holder, key=order)]
+    ctx.cache["endpoint_scan"] = ctx.run_cache["endpoint_scan"] = findings
     return findings
 
 
@@ -477,47 +817,82 @@ def _check_near_miss(ctx):
 # A3 -- orphan elements
 # ---------------------------------------------------------------------------
 
-def _check_orphan_elements(ctx):
-    """A node that sits near no cable and no route is probably stranded."""
+def _is_attached(ctx, point, linears, tol):
+    """Whether a linear feature of ``linears`` lies within ``tol`` of ``point``."""
     from qgis.core import QgsGeometry
 
+    rect = _rect_around(point, tol)
+    probe = QgsGeometry.fromPointXY(point)
+    for linear in linears:
+        index = ctx.spatial_index(linear)
+        columns = ctx.columns(linear)
+        ctx.tally("index_queries")
+        for candidate in index.intersects(rect):
+            row = columns.row_of.get(candidate)
+            geom = columns.geometries[row] if row is not None else None
+            # Index hits are bbox-level; confirm with a real distance.
+            if geom is not None and probe.distance(geom) <= tol:
+                return True
+    return False
+
+
+def _check_orphan_elements(ctx):
+    """A node that sits near no cable and no route is probably stranded.
+
+    On an incremental run only the changed nodes, and the nodes within tolerance
+    of a linear feature that changed, are looked at again.
+    """
     tol = ctx.config.tol
     linears = ctx.layers_for(*_LINEAR_LAYERS)
     if not linears:
         return  # nothing to be connected to; not a finding
 
-    for layer in ctx.layers_for(*_NODE_LAYERS):
-        for feat in layer.getFeatures():
-            point = _first_point(feat.geometry())
-            if point is None:
-                continue  # geometry health is E2's concern
-            rect = _rect_around(point, tol)
-            probe = QgsGeometry.fromPointXY(point)
-            attached = False
-            for linear in linears:
-                index = ctx.spatial_index(linear)
-                for candidate in index.intersects(rect):
-                    other = linear.getFeature(candidate)
-                    geom = other.geometry()
-                    # Index hits are bbox-level; confirm with a real distance.
-                    if geom is not None and not geom.isNull() and probe.distance(geom) <= tol:
-                        attached = True
-                        break
-                if attached:
-                    break
-            if attached:
+    nodes, node_touched, node_added = _node_index(ctx)
+    attached = ctx.cache.get("node_attached")
+
+    recheck = None  # None: every node
+    if attached is not None and node_touched is not None:
+        recheck = set(node_added)
+        for linear in linears:
+            lid = linear.id()
+            if lid not in ctx.dirty:
                 continue
-            src = QT_TRANSLATE_NOOP(
-                'ValidationRules', "Element is not on or near any cable or route (tolerance {tol})")
-            yield ValidationIssue(
-                rule_id="A3", severity=Severity.WARNING, category=_CAT_TOPOLOGY,
-                message=_safe_format(
-                    QCoreApplication.translate('ValidationRules', src), src, tol=_fmt(tol)),
-                layer_name=layer.name(), layer_id=layer.id(),
-                feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                where=(point.x(), point.y()),
-                details={"tolerance": tol},
-            )
+            rects = ctx.touched_bounds.get(lid)
+            if rects is None:
+                recheck = None
+                break
+            for rect in rects:
+                grown = rect.buffered(tol)
+                recheck.update(nodes.intersects(grown))
+            ctx.tally("index_queries", len(rects))
+
+    if recheck is None:
+        attached = {}
+        recheck = nodes.records.keys()
+    else:
+        attached = {h: flag for h, flag in attached.items() if h in nodes.records}
+    for holder_id in recheck:
+        record = nodes.records.get(holder_id)
+        if record is not None:
+            attached[holder_id] = _is_attached(ctx, record[-1], linears, tol)
+    ctx.cache["node_attached"] = attached
+
+    order = _scan_order(ctx, _NODE_LAYERS, nodes.records)
+    for holder_id in sorted(attached, key=order):
+        if attached[holder_id]:
+            continue
+        layer_name, layer_id, fid, uuid, point = nodes.records[holder_id]
+        src = QT_TRANSLATE_NOOP(
+            'ValidationRules', "Element is not on or near any cable or route (tolerance {tol})")
+        yield ValidationIssue(
+            rule_id="A3", severity=Severity.WARNING, category=_CAT_TOPOLOGY,
+            message=_safe_format(
+                QCoreApplication.translate('ValidationRules', src), src, tol=_fmt(tol)),
+            layer_name=layer_name, layer_id=layer_id,
+            feature_id=fid, fiberq_uuid=uuid,
+            where=(point.x(), point.y()),
+            details={"tolerance": tol},
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -527,20 +902,50 @@ def _check_orphan_elements(ctx):
 def _fk_rows(ctx, canonical):
     """Yield ``(layer, feat, cable_layer_id, cable_fid)`` for features carrying a
     populated cable reference. Rows with no reference at all are skipped -- an
-    unlinked slack is incomplete (C1's concern), not a broken link."""
-    from qgis.core import NULL
+    unlinked slack is incomplete (C1's concern), not a broken link.
 
+    On a scoped incremental run the rows visited are the changed ones plus those
+    referencing a changed cable, found through the reference map
+    ``ctx.cache["fk_refs"]`` kept from earlier runs.
+    """
+    from qgis.core import NULL, QgsFeatureRequest
+    from ..utils.uuid_utils import FIBERQ_UUID_FIELD
+
+    refs = ctx.cache.setdefault("fk_refs", {})  # (layer id, fid) -> (cable layer id, cable fid)
     for layer in ctx.layers_for(canonical):
         names = set(layer.fields().names())
         layer_id_field = _actual_field(names, "cable_layer_id")
         fid_field = _actual_field(names, "cable_fid")
         if not (layer_id_field and fid_field):
             continue
-        for feat in layer.getFeatures():
+        lid = layer.id()
+        extra = []
+        if ctx.scoped:
+            for (ref_layer, ref_fid), (cable_layer_id, cable_fid) in refs.items():
+                if ref_layer != lid or cable_layer_id not in ctx.dirty:
+                    continue
+                changed = ctx.dirty[cable_layer_id]
+                if changed is None or cable_fid in changed:
+                    extra.append(ref_fid)
+        request = QgsFeatureRequest().setSubsetOfAttributes(
+            [layer_id_field, fid_field, FIBERQ_UUID_FIELD], layer.fields())
+        features = ctx.features(layer, request, extra_fids=extra)
+        visited = ctx.visited.get(lid) if ctx.scoped else None
+        if visited is None:
+            for key in [k for k in refs if k[0] == lid]:
+                del refs[key]
+        else:
+            for fid in visited:
+                refs.pop((lid, fid), None)
+        for feat in features:
             raw_layer_id = feat.attribute(layer_id_field)
             raw_fid = feat.attribute(fid_field)
             if _is_blank(raw_layer_id, NULL) and _is_blank(raw_fid, NULL):
                 continue
+            try:
+                refs[(lid, feat.id())] = (str(raw_layer_id), int(raw_fid))
+            except (TypeError, ValueError):
+                pass  # unresolvable either way; B1/B2 report it
             yield layer, feat, raw_layer_id, raw_fid
 
 
@@ -548,10 +953,12 @@ def _resolve_cable(ctx, raw_layer_id, raw_fid):
     """``(layer, feature)`` for a cable reference, or ``(layer_or_None, None)``."""
     from qgis.core import NULL, QgsVectorLayer
 
+    from .validation_snapshot import LayerSnapshot
+
     if _is_blank(raw_layer_id, NULL):
         return None, None
     layer = ctx.project.mapLayer(str(raw_layer_id))
-    if layer is None or not isinstance(layer, QgsVectorLayer):
+    if layer is None or not isinstance(layer, (QgsVectorLayer, LayerSnapshot)):
         return None, None
     if _is_blank(raw_fid, NULL):
         return layer, None
@@ -658,18 +1065,23 @@ def _check_identity(ctx):
                         "or re-create the layer."),
                 )
                 continue
-            for feat in layer.getFeatures():
-                value = feat.attribute(idx)
-                if _is_blank(value, NULL):
+            columns = ctx.columns(layer)
+            rows = columns.rows()
+            ctx.tally("features", len(rows))
+            column = columns.values[FIBERQ_UUID_FIELD]
+            blank = _verdicts(column, rows, lambda v: _is_blank(v, NULL))
+            for row, is_blank in zip(rows, blank):
+                fid = columns.fids[row]
+                if is_blank:
                     yield ValidationIssue(
                         rule_id="B4", severity=Severity.ERROR, category=_CAT_IDENTITY,
                         message=QCoreApplication.translate(
                             'ValidationRules', "Feature has no fiberq_uuid value"),
                         layer_name=layer.name(), layer_id=layer.id(),
-                        feature_id=feat.id(), where=_feature_xy(feat),
+                        feature_id=fid, where=_geometry_xy(columns.geometries[row]),
                     )
                     continue
-                key = str(value)
+                key = str(column[row])
                 if key in seen:
                     prev_layer, prev_fid = seen[key]
                     src = (QT_TRANSLATE_NOOP(
@@ -680,12 +1092,13 @@ def _check_identity(ctx):
                             QCoreApplication.translate('ValidationRules', src), src,
                             fid=prev_fid, layer=prev_layer),
                         layer_name=layer.name(), layer_id=layer.id(),
-                        feature_id=feat.id(), fiberq_uuid=key, where=_feature_xy(feat),
+                        feature_id=fid, fiberq_uuid=key,
+                        where=_geometry_xy(columns.geometries[row]),
                         details={"duplicate_of_layer": prev_layer,
                                  "duplicate_of_fid": prev_fid},
                     )
                 else:
-                    seen[key] = (layer.name(), feat.id())
+                    seen[key] = (layer.name(), fid)
 
 
 # ---------------------------------------------------------------------------
@@ -722,12 +1135,16 @@ def _check_required_fields(ctx):
         if not required:
             continue
         for layer in layers:
-            names = set(layer.fields().names())
-            for feat in layer.getFeatures():
-                missing = [
-                    f for f in required
-                    if f not in names or _is_blank(feat.attribute(f), NULL)
-                ]
+            columns, rows = ctx.rows(layer)
+            # One blank/not-blank column per required field; a field the layer
+            # lacks altogether is missing on every row.
+            blank = [
+                _verdicts(columns.values[f], rows, lambda v: _is_blank(v, NULL))
+                if f in columns.values else [True] * len(rows)
+                for f in required
+            ]
+            for n, row in enumerate(rows):
+                missing = [f for f, column in zip(required, blank) if column[n]]
                 if not missing:
                     continue
                 src = QT_TRANSLATE_NOOP('ValidationRules', "Required field(s) missing or empty: {fields}")
@@ -737,8 +1154,8 @@ def _check_required_fields(ctx):
                         QCoreApplication.translate('ValidationRules', src), src,
                         fields=", ".join(missing)),
                     layer_name=layer.name(), layer_id=layer.id(),
-                    feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                    where=_feature_xy(feat), details={"missing": missing},
+                    feature_id=columns.fids[row], fiberq_uuid=columns.uuid(row),
+                    where=_geometry_xy(columns.geometries[row]), details={"missing": missing},
                 )
 
 
@@ -767,13 +1184,18 @@ def _check_enum_conformance(ctx):
             active = [(key, _actual_field(names, key), dom)
                       for key, dom in enum_fields]
             active = [(key, actual, dom) for key, actual, dom in active if actual]
-            for feat in layer.getFeatures():
-                for key, actual, allowed in active:
-                    value = feat.attribute(actual)
-                    if _is_blank(value, NULL):
-                        continue  # emptiness is C1's concern, not D1's
-                    if str(value) in allowed:
+            columns, rows = ctx.rows(layer)
+            # Emptiness is C1's concern, not D1's
+            bad = [
+                _verdicts(columns.values[actual], rows,
+                          lambda v, allowed=allowed: not _is_blank(v, NULL) and str(v) not in allowed)
+                for _key, actual, allowed in active
+            ]
+            for n, row in enumerate(rows):
+                for (key, actual, allowed), column in zip(active, bad):
+                    if not column[n]:
                         continue
+                    value = columns.values[actual][row]
                     src = (QT_TRANSLATE_NOOP(
                         'ValidationRules', "Field {field}: value {value} is not one of the allowed values ({allowed})"))
                     yield ValidationIssue(
@@ -783,8 +1205,8 @@ def _check_enum_conformance(ctx):
                             field=actual, value=value,
                             allowed=", ".join(sorted(allowed))),
                         layer_name=layer.name(), layer_id=layer.id(),
-                        feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                        where=_feature_xy(feat),
+                        feature_id=columns.fids[row], fiberq_uuid=columns.uuid(row),
+                        where=_geometry_xy(columns.geometries[row]),
                         details={"field": key, "value": str(value),
                                  "allowed": sorted(allowed)},
                     )
@@ -794,14 +1216,33 @@ def _check_enum_conformance(ctx):
 # D2 -- numeric ranges
 # ---------------------------------------------------------------------------
 
-def _as_number(value, null):
-    """Coerce an attribute to float, or None when blank / not numeric."""
-    if _is_blank(value, null):
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
+def _number_at(columns, name, row):
+    """A numeric column cell as float, or None when blank / not numeric."""
+    number = columns.numbers(name)[row]
+    return None if number != number else number  # NaN: blank / not numeric
+
+
+def _out_of_range(columns, name, rows, low, high, exclusive) -> list:
+    """Positions in ``rows`` whose number in field ``name`` breaks the bounds.
+
+    Compared as one array when NumPy is installed, row by row otherwise. A NaN
+    cell (blank or not a number) breaks no bound either way.
+    """
+    values = columns.number_array(name)
+    if values is not None:
+        picked = values.take(rows)
+        bad = picked <= low if exclusive else picked < low
+        if high is not None:
+            bad |= picked > high
+        return bad.nonzero()[0].tolist()
+    numbers = columns.numbers(name)
+    out = []
+    for n, row in enumerate(rows):
+        number = numbers[row]
+        too_low = number <= low if exclusive else number < low
+        if too_low or (high is not None and number > high):
+            out.append(n)
+    return out
 
 
 def _bound_text(low, high, exclusive) -> str:
@@ -814,8 +1255,6 @@ def _bound_text(low, high, exclusive) -> str:
 
 
 def _check_numeric_ranges(ctx):
-    from qgis.core import NULL
-
     for canonical, layers in ctx.layers_by_canonical.items():
         layer_schema = schema.get_layer_schema(canonical)
         if layer_schema is None:
@@ -833,15 +1272,15 @@ def _check_numeric_ranges(ctx):
         for layer in layers:
             names = set(layer.fields().names())
             active = [c for c in checks if c[0] in names]
-            for feat in layer.getFeatures():
-                for key, (low, high, exclusive), units in active:
-                    number = _as_number(feat.attribute(key), NULL)
-                    if number is None:
-                        continue  # emptiness is C1's concern
-                    too_low = number <= low if exclusive else number < low
-                    too_high = high is not None and number > high
-                    if not (too_low or too_high):
+            columns, rows = ctx.rows(layer)
+            # Blank or non-numeric cells are C1's concern and never flagged
+            flagged = [set(_out_of_range(columns, key, rows, *bounds)) for key, bounds, _units in active]
+            for n in sorted(set().union(*flagged)):
+                row = rows[n]
+                for (key, (low, high, exclusive), units), bad in zip(active, flagged):
+                    if n not in bad:
                         continue
+                    number = columns.numbers(key)[row]
                     src = QT_TRANSLATE_NOOP(
                         'ValidationRules', "Field {field}: {value} is out of range (expected {bound})")
                     yield ValidationIssue(
@@ -851,8 +1290,8 @@ def _check_numeric_ranges(ctx):
                             field=key, value=_fmt(number),
                             bound=_bound_text(low, high, exclusive)),
                         layer_name=layer.name(), layer_id=layer.id(),
-                        feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                        where=_feature_xy(feat),
+                        feature_id=columns.fids[row], fiberq_uuid=columns.uuid(row),
+                        where=_geometry_xy(columns.geometries[row]),
                         details={"field": key, "value": number, "units": units,
                                  "min": low, "max": high, "exclusive_min": exclusive},
                     )
@@ -895,13 +1334,30 @@ def _distance_area(ctx, layer):
     return cached
 
 
-def _measure_length(ctx, layer, geom) -> float:
-    """Ground length of ``geom``, measured the same way the plugin stores it."""
-    try:
-        return float(_distance_area(ctx, layer).measureLength(geom))
-    except Exception as e:
-        logger.debug(f"Falling back to planar length on {layer.name()}: {e}")
-        return float(geom.length())
+def _measure_length(ctx, layer, geom, fid=None) -> float:
+    """Ground length of ``geom``, measured the same way the plugin stores it.
+
+    With ``fid``, the project's ground-length cache (shared with
+    :func:`~fiberq.utils.measure.ground_length`) answers for unchanged features.
+    """
+    def measure():
+        try:
+            return float(_distance_area(ctx, layer).measureLength(geom))
+        except Exception as e:
+            logger.debug(f"Falling back to planar length on {layer.name()}: {e}")
+            return float(geom.length())
+
+    if fid is None:
+        return measure()
+    key = f"length_cache:{layer.id()}"
+    cached = ctx.cache.get(key)
+    if cached is None:
+        from ..utils.measure import length_cache, measure_key
+        cached = (length_cache(ctx.project), measure_key(layer.crs(), ctx.project))
+        cached[0].watch(layer)
+        ctx.cache[key] = cached
+    lengths, mkey = cached
+    return lengths.length(layer.id(), fid, geom, measure, mkey)
 
 
 def _disagrees(stored, computed, cfg) -> bool:
@@ -917,8 +1373,6 @@ def _check_length_coherence(ctx):
     comes out in degrees while the stored value is metres -- so the check is
     skipped there and *says so*, rather than emitting a page of false warnings.
     """
-    from qgis.core import NULL
-
     cfg = ctx.config
     for canonical, stored_field in _STORED_LENGTH_FIELD.items():
         for layer in ctx.layers_for(canonical):
@@ -937,15 +1391,17 @@ def _check_length_coherence(ctx):
                 )
                 continue
 
-            for feat in layer.getFeatures():
-                geom = feat.geometry()
-                if geom is None or geom.isNull() or geom.isEmpty():
+            columns, rows = ctx.rows(layer)
+            for row in rows:
+                geom = columns.geometries[row]
+                if geom is None:
                     continue  # E2's concern
-                computed = _measure_length(ctx, layer, geom)
+                fid, uuid, where = columns.fids[row], columns.uuid(row), _geometry_xy(geom)
+                computed = _measure_length(ctx, layer, geom, fid)
 
                 # 1. stored length vs the geometry it describes
                 if stored_field in names:
-                    stored = _as_number(feat.attribute(stored_field), NULL)
+                    stored = _number_at(columns, stored_field, row)
                     # A stored 0 is the schema default, i.e. a length that was
                     # never written -- the most common wrong length there is, and
                     # exactly what a bill of materials reads as "order nothing".
@@ -959,17 +1415,16 @@ def _check_length_coherence(ctx):
                                 field=stored_field, stored=_fmt(stored),
                                 computed=_fmt(computed)),
                             layer_name=layer.name(), layer_id=layer.id(),
-                            feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                            where=_feature_xy(feat),
+                            feature_id=fid, fiberq_uuid=uuid, where=where,
                             details={"field": stored_field, "stored": stored,
                                      "computed": computed},
                         )
 
                 # 2. cable total = laid length + slack
                 if {"total_len_m", "duzina_m", "slack_m"} <= names:
-                    total = _as_number(feat.attribute("total_len_m"), NULL)
-                    base = _as_number(feat.attribute("duzina_m"), NULL)
-                    slack = _as_number(feat.attribute("slack_m"), NULL)
+                    total = _number_at(columns, "total_len_m", row)
+                    base = _number_at(columns, "duzina_m", row)
+                    slack = _number_at(columns, "slack_m", row)
                     if None not in (total, base, slack) and total > 0:
                         expected = base + slack
                         if _disagrees(total, expected, cfg):
@@ -982,15 +1437,14 @@ def _check_length_coherence(ctx):
                                     QCoreApplication.translate('ValidationRules', src), src,
                                     total=_fmt(total), expected=_fmt(expected)),
                                 layer_name=layer.name(), layer_id=layer.id(),
-                                feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                                where=_feature_xy(feat),
+                                feature_id=fid, fiberq_uuid=uuid, where=where,
                                 details={"total_len_m": total, "expected": expected},
                             )
 
                 # 3. route kilometres agree with metres
                 if {"duzina", "duzina_km"} <= names:
-                    metres = _as_number(feat.attribute("duzina"), NULL)
-                    km = _as_number(feat.attribute("duzina_km"), NULL)
+                    metres = _number_at(columns, "duzina", row)
+                    km = _number_at(columns, "duzina_km", row)
                     if None not in (metres, km) and km > 0:
                         expected = metres / 1000.0
                         # duzina_km is stored rounded (typically 2 decimals), so a
@@ -1011,8 +1465,7 @@ def _check_length_coherence(ctx):
                                     QCoreApplication.translate('ValidationRules', src), src,
                                     km=_fmt(km, 4), expected=_fmt(expected, 4)),
                                 layer_name=layer.name(), layer_id=layer.id(),
-                                feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                                where=_feature_xy(feat),
+                                feature_id=fid, fiberq_uuid=uuid, where=where,
                                 details={"duzina_km": km, "expected": expected},
                             )
 
@@ -1114,23 +1567,28 @@ def _check_geometry_validity(ctx):
         layer_schema = schema.get_layer_schema(canonical)
         expected = layer_schema.geometry if layer_schema else ""
         for layer in layers:
-            for feat in layer.getFeatures():
-                geom = feat.geometry()
+            columns, rows = ctx.rows(layer)
+            for row in rows:
+                geom = columns.geometries[row]
+                fid, uuid = columns.fids[row], columns.uuid(row)
 
-                if geom is None or geom.isNull() or geom.isEmpty():
+                if geom is None:
                     src = QT_TRANSLATE_NOOP('ValidationRules', "Feature has no geometry")
                     yield ValidationIssue(
                         rule_id="E2", severity=Severity.ERROR, category=_CAT_DOMAIN,
                         message=QCoreApplication.translate('ValidationRules', src),
                         layer_name=layer.name(), layer_id=layer.id(),
-                        feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
+                        feature_id=fid, fiberq_uuid=uuid,
                         details={"expected_geometry": expected},
                     )
                     continue
 
                 gtype = geom.type()
                 if gtype == QgsWkbTypes.GeometryType.LineGeometry:
-                    if geom.length() <= 0:
+                    # A line whose bounding box is a point has no length; only
+                    # the others need measuring.
+                    degenerate = (columns.xmin[row], columns.ymin[row]) == (columns.xmax[row], columns.ymax[row])
+                    if degenerate or geom.length() <= 0:
                         src = QT_TRANSLATE_NOOP('ValidationRules', "Line has zero length")
                     elif not geom.isSimple():
                         # A self-crossing LineString is OGC-valid, so
@@ -1152,8 +1610,7 @@ def _check_geometry_validity(ctx):
                     rule_id="E2", severity=Severity.WARNING, category=_CAT_DOMAIN,
                     message=QCoreApplication.translate('ValidationRules', src),
                     layer_name=layer.name(), layer_id=layer.id(),
-                    feature_id=feat.id(), fiberq_uuid=_uuid_of(feat),
-                    where=_feature_xy(feat),
+                    feature_id=fid, fiberq_uuid=uuid, where=_geometry_xy(geom),
                     details={"expected_geometry": expected},
                 )
 
@@ -1171,6 +1628,7 @@ RULES = [
         default_severity=Severity.WARNING,
         check=_check_cable_dangles,
         applies_to=_CABLE_LAYERS,
+        scope=SCOPE_NEIGHBOURS,
     ),
     ValidationRule(
         id="A2",
@@ -1179,6 +1637,7 @@ RULES = [
         default_severity=Severity.INFO,
         check=_check_near_miss,
         applies_to=_CABLE_LAYERS,
+        scope=SCOPE_NEIGHBOURS,
     ),
     ValidationRule(
         id="A3",
@@ -1187,6 +1646,7 @@ RULES = [
         default_severity=Severity.WARNING,
         check=_check_orphan_elements,
         applies_to=_NODE_LAYERS,
+        scope=SCOPE_NEIGHBOURS,
     ),
     ValidationRule(
         id="B1",
@@ -1195,6 +1655,7 @@ RULES = [
         default_severity=Severity.ERROR,
         check=_fk_checker("Optical slack", "B1"),
         applies_to=("Optical slack",),
+        scope=SCOPE_FEATURE,
     ),
     ValidationRule(
         id="B2",
@@ -1203,6 +1664,7 @@ RULES = [
         default_severity=Severity.ERROR,
         check=_fk_checker("Fiber break", "B2"),
         applies_to=("Fiber break",),
+        scope=SCOPE_FEATURE,
     ),
     ValidationRule(
         id="B3",
@@ -1211,6 +1673,7 @@ RULES = [
         default_severity=Severity.WARNING,
         check=_check_fk_spatial,
         applies_to=_FK_LAYERS,
+        scope=SCOPE_FEATURE,
     ),
     ValidationRule(
         id="B4",
@@ -1225,6 +1688,7 @@ RULES = [
         category=_CAT_COMPLETENESS,
         default_severity=Severity.WARNING,
         check=_check_required_fields,
+        scope=SCOPE_FEATURE,
     ),
     ValidationRule(
         id="C2",
@@ -1239,6 +1703,7 @@ RULES = [
         category=_CAT_DOMAIN,
         default_severity=Severity.WARNING,
         check=_check_enum_conformance,
+        scope=SCOPE_FEATURE,
     ),
     ValidationRule(
         id="D2",
@@ -1246,6 +1711,7 @@ RULES = [
         category=_CAT_DOMAIN,
         default_severity=Severity.WARNING,
         check=_check_numeric_ranges,
+        scope=SCOPE_FEATURE,
     ),
     ValidationRule(
         id="D3",
@@ -1254,6 +1720,7 @@ RULES = [
         default_severity=Severity.WARNING,
         check=_check_length_coherence,
         applies_to=tuple(_STORED_LENGTH_FIELD),
+        scope=SCOPE_FEATURE,
     ),
     ValidationRule(
         id="E1",
@@ -1268,5 +1735,6 @@ RULES = [
         category=_CAT_DOMAIN,
         default_severity=Severity.ERROR,
         check=_check_geometry_validity,
+        scope=SCOPE_FEATURE,
     ),
 ]
@@ -0,0 +1,311 @@
+"""Read-only project snapshots for off-thread validation (WP2).
+
+A QGIS layer belongs to the main thread: reading one from a worker races the
+edit buffer, the renderer and the user. The validation task therefore takes a
+snapshot on the main thread -- cheap, a ``QgsVectorLayerFeatureSource`` per
+layer plus its name, CRS and fields -- and the rules read features from it in
+the worker, where each layer is materialised once into a plain dict on first
+use.
+
+:class:`LayerSnapshot` and :class:`ProjectSnapshot` answer the part of the
+``QgsVectorLayer`` / ``QgsProject`` API the rules use, so a rule cannot tell
+which one it was handed. What a snapshot shows is the project as it was when it
+was taken, uncommitted edits included; later edits are the next run's business.
+
+:class:`LayerColumns` is the other half: a layer read once into one column per
+field, for the rules that test every feature the same way (see
+:meth:`~.validation_manager.ValidationContext.columns`).
+"""
+import math
+import sys
+import threading
+from array import array
+
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransformContext,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFields,
+    QgsProject,
+    QgsRectangle,
+    QgsVectorLayer,
+    QgsVectorLayerFeatureSource,
+)
+
+from ..utils.logger import get_logger
+from ..utils.uuid_utils import FIBERQ_UUID_FIELD
+from .validation_manager import feature_order_key
+
+logger = get_logger(__name__)
+
+
+class LayerSnapshot:
+    """The features of one vector layer, frozen when the snapshot was taken."""
+
+    def __init__(self, layer):
+        self._id = layer.id()
+        self._name = layer.name()
+        self._crs = QgsCoordinateReferenceSystem(layer.crs())
+        self._fields = QgsFields(layer.fields())
+        self._wkb_type = layer.wkbType()
+        self._geometry_type = layer.geometryType()
+        self._count = layer.featureCount()
+        self._source = QgsVectorLayerFeatureSource(layer)
+        self._features = None  # fid -> QgsFeature, in provider order
+        self._lock = threading.Lock()
+
+    def id(self) -> str:
+        return self._id
+
+    def name(self) -> str:
+        return self._name
+
+    def crs(self):
+        return self._crs
+
+    def fields(self):
+        return self._fields
+
+    def wkbType(self):
+        return self._wkb_type
+
+    def geometryType(self):
+        return self._geometry_type
+
+    def featureCount(self) -> int:
+        return self._count
+
+    def isValid(self) -> bool:
+        return True
+
+    def _load(self) -> dict:
+        """Read the feature source once; every later request is served from memory.
+        Locked because two rule groups may reach the same layer together."""
+        with self._lock:
+            if self._features is None:
+                features = {}
+                try:
+                    for feat in self._source.getFeatures(QgsFeatureRequest()):
+                        features[feat.id()] = feat
+                except Exception as e:
+                    logger.warning(f"Could not read layer '{self._name}' for validation: {e}")
+                self._features = features
+        return self._features
+
+    def _read_fids(self, fids) -> list:
+        """The features ``fids`` read straight from the source, complete, in
+        iteration order. What a fid request costs before the layer is loaded:
+        an incremental run asks for a few features of a layer it never reads
+        whole."""
+        request = QgsFeatureRequest().setFilterFids(sorted(fids))
+        with self._lock:
+            try:
+                features = list(self._source.getFeatures(request))
+            except Exception as e:
+                logger.warning(f"Could not read layer '{self._name}' for validation: {e}")
+                features = []
+        return sorted(features, key=lambda feat: feature_order_key(feat.id()))
+
+    def getFeatures(self, request=None):
+        """Features in provider order, honouring a request's fid or filter
+        rectangle / expression. Flags and attribute subsets are ignored: the
+        features are always complete."""
+        if request is not None and request.filterFids() and self._features is None:
+            return iter(self._read_fids(request.filterFids()))
+        features = self._load()
+        if request is None:
+            return iter(list(features.values()))
+        fids = request.filterFids()
+        if fids:
+            return iter([features[fid] for fid in sorted(fids, key=feature_order_key)
+                         if fid in features])
+        return iter([feat for feat in features.values() if request.acceptFeature(feat)])
+
+    def getFeature(self, fid):
+        """The feature with ``fid``, or an invalid ``QgsFeature`` like the layer's."""
+        feat = self._load().get(fid)
+        return feat if feat is not None else QgsFeature()
+
+
+class ProjectSnapshot:
+    """Every vector layer of a project as a :class:`LayerSnapshot`, with the
+    project settings the rules read (CRS, ellipsoid, transform context, schema
+    version)."""
+
+    def __init__(self, project=None):
+        from .schema_version import read_project_schema_version
+        from ..utils.measure import length_cache
+
+        project = project if project is not None else QgsProject.instance()
+        self._layers = {
+            lid: LayerSnapshot(layer)
+            for lid, layer in project.mapLayers().items()
+            if isinstance(layer, QgsVectorLayer)
+        }
+        # The live project's ground lengths, kept current by its layers' signals
+        self.ground_lengths = length_cache(project)
+        for layer in project.mapLayers().values():
+            if isinstance(layer, QgsVectorLayer):
+                self.ground_lengths.watch(layer)
+        self._crs = QgsCoordinateReferenceSystem(project.crs())
+        self._ellipsoid = project.ellipsoid()
+        self._transform_context = QgsCoordinateTransformContext(project.transformContext())
+        self._base_name = project.baseName()
+        self._file_name = project.fileName()
+        self.schema_version = read_project_schema_version(project)
+
+    def mapLayers(self) -> dict:
+        return dict(self._layers)
+
+    def mapLayer(self, layer_id):
+        return self._layers.get(layer_id)
+
+    def crs(self):
+        return self._crs
+
+    def ellipsoid(self) -> str:
+        return self._ellipsoid
+
+    def transformContext(self):
+        return self._transform_context
+
+    def baseName(self) -> str:
+        return self._base_name
+
+    def fileName(self) -> str:
+        return self._file_name
+
+
+def _number(value) -> float:
+    """``float(value)``, or NaN when the value is blank or not a number."""
+    if value is None or value == NULL or (isinstance(value, str) and not value.strip()):
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class LayerColumns:
+    """A layer read once into columns.
+
+    ``values[name]`` holds one list per field, strings interned so the many
+    repeats of an enum value share one object; :meth:`numbers` gives the same
+    column as a float ``array`` with NaN where the value is blank or not a
+    number, and :meth:`number_array` as a NumPy array when NumPy is
+    installed. ``geometries`` holds each feature's geometry (None when missing)
+    and ``xmin``/``ymin``/``xmax``/``ymax`` its bounding box (NaN when
+    missing). Rows are list positions; ``row_of`` maps fid -> row.
+
+    Rows can be replaced feature by feature (:meth:`refresh`), which is what
+    lets the columns live across incremental runs. A replaced or deleted
+    feature leaves a dead row behind; :meth:`rows` skips it.
+    """
+
+    def __init__(self, fields):
+        self.names = list(fields.names())
+        self.fids = array("q")
+        self.values = {name: [] for name in self.names}
+        self.geometries = []
+        self.xmin, self.ymin = array("d"), array("d")
+        self.xmax, self.ymax = array("d"), array("d")
+        self.row_of = {}
+        self._numbers = {}
+        self._arrays = {}
+        self._order = []  # live rows in iteration order; None: re-sort by fid
+
+    @classmethod
+    def read(cls, layer):
+        """All features of ``layer``, attributes and geometry, in one pass."""
+        columns = cls(layer.fields())
+        for feat in layer.getFeatures(QgsFeatureRequest()):
+            columns._append(feat)
+        return columns
+
+    def _append(self, feat) -> None:
+        row = len(self.fids)
+        self.fids.append(feat.id())
+        attrs = feat.attributes()
+        for i, name in enumerate(self.names):
+            value = attrs[i] if i < len(attrs) else None
+            if isinstance(value, str):
+                value = sys.intern(value)
+            self.values[name].append(value)
+            numbers = self._numbers.get(name)
+            if numbers is not None:
+                numbers.append(_number(value))
+
+        geom = feat.geometry()
+        if geom is None or geom.isNull() or geom.isEmpty():
+            self.geometries.append(None)
+            for column in (self.xmin, self.ymin, self.xmax, self.ymax):
+                column.append(math.nan)
+        else:
+            rect = geom.boundingBox()
+            self.geometries.append(geom)
+            self.xmin.append(rect.xMinimum())
+            self.ymin.append(rect.yMinimum())
+            self.xmax.append(rect.xMaximum())
+            self.ymax.append(rect.yMaximum())
+
+        self.row_of[feat.id()] = row
+        if self._order is not None:
+            self._order.append(row)
+
+    def refresh(self, layer, fids) -> None:
+        """Re-read the features ``fids`` of ``layer``; the ones gone are dropped."""
+        for fid in fids:
+            self.row_of.pop(fid, None)
+        self._order = None
+        self._arrays.clear()
+        request = QgsFeatureRequest().setFilterFids(sorted(fids))
+        for feat in layer.getFeatures(request):
+            self._append(feat)
+
+    def rows(self, fids=None) -> list:
+        """Live rows in iteration order -- all, or those of ``fids``."""
+        if self._order is None:
+            self._order = sorted(self.row_of.values(),
+                                 key=lambda row: feature_order_key(self.fids[row]))
+        if fids is None:
+            return self._order
+        return sorted((self.row_of[fid] for fid in fids if fid in self.row_of),
+                      key=lambda row: feature_order_key(self.fids[row]))
+
+    def numbers(self, name) -> array:
+        """Field ``name`` as floats, NaN where blank or not a number."""
+        numbers = self._numbers.get(name)
+        if numbers is None:
+            numbers = array("d", (_number(value) for value in self.values[name]))
+            self._numbers[name] = numbers
+        return numbers
+
+    def number_array(self, name):
+        """:meth:`numbers` as a NumPy float array, or None without NumPy.
+
+        A copy rather than a view: a view would pin the ``array`` and keep
+        :meth:`refresh` from appending to it.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        values = self._arrays.get(name)
+        if values is None:
+            values = self._arrays[name] = np.array(self.numbers(name), dtype=float)
+        return values
+
+    def rect(self, row):
+        """The bounding box of ``row`` as a ``QgsRectangle``, or None without geometry."""
+        if self.geometries[row] is None:
+            return None
+        return QgsRectangle(self.xmin[row], self.ymin[row], self.xmax[row], self.ymax[row])
+
+    def uuid(self, row) -> str:
+        column = self.values.get(FIBERQ_UUID_FIELD)
+        if column is None:
+            return ""
+        value = column[row]
+        return "" if value is None else str(value)
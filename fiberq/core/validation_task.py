@@ -0,0 +1,76 @@
+"""Validation as a background task (WP2).
+
+Runs an :class:`~.validation_manager.IncrementalValidator` as a ``QgsTask`` so
+QGIS stays responsive while a large project is checked. The constructor runs on
+the main thread and snapshots the project; :meth:`ValidationTask.run` evaluates
+the rule groups in a thread pool over that snapshot; :meth:`finished` is back on
+the main thread and hands the result over.
+
+Signals emitted from the worker reach main-thread slots queued, so the panel can
+be filled rule by rule while the rest are still running.
+"""
+import os
+
+from qgis.core import QgsTask
+from qgis.PyQt.QtCore import QCoreApplication, pyqtSignal
+
+from ..utils.logger import get_logger
+from .validation_manager import ValidationFeedback
+
+logger = get_logger(__name__)
+
+
+class _TaskFeedback(ValidationFeedback):
+    """Routes the runner's progress to the task: its progress bar, its cancel
+    state and :attr:`ValidationTask.ruleFinished`."""
+
+    def __init__(self, task):
+        super().__init__()
+        self._task = task
+
+    def is_cancelled(self) -> bool:
+        return self._task.isCanceled()
+
+    def rule_finished(self, rule, issues, done, total):
+        self._task.setProgress(100.0 * done / max(total, 1))
+        self._task.ruleFinished.emit(rule.id, issues)
+
+
+class ValidationTask(QgsTask):
+    """Validate the project off the GUI thread, one rule group per worker."""
+
+    #: A rule completed: its id and its issues (None if the rule failed).
+    ruleFinished = pyqtSignal(str, object)
+    #: The run is over: the ValidationResult (``cancelled`` set if the user
+    #: stopped it), or None if it could not run at all.
+    resultReady = pyqtSignal(object)
+
+    def __init__(self, validator, rules=None, config=None, timestamp=None,
+                 plugin_version="", workers=None):
+        super().__init__(QCoreApplication.translate('ValidationTask', 'FiberQ validation'))
+        self._validator = validator
+        self._workers = workers or os.cpu_count() or 1
+        self._result = None
+        self._feedback = _TaskFeedback(self)
+        # Snapshot here, on the main thread: run() must not touch a live layer
+        self._pending = validator.prepare(rules, config, timestamp, plugin_version)
+
+    def rule_count(self) -> int:
+        """How many rules this run will report through :attr:`ruleFinished`."""
+        cfg = self._pending.config
+        return sum(1 for rule in self._pending.rules if cfg.is_enabled(rule.id))
+
+    def run(self):
+        try:
+            self._result = self._validator.execute(self._pending, self._feedback, self._workers)
+        except Exception as e:  # execute() is documented never to raise
+            logger.warning(f"Validation task failed: {e}")
+            return False
+        return True
+
+    def finished(self, ok):
+        result = self._result if ok else None
+        if result is not None:
+            result.cancelled = result.cancelled or self.isCanceled()
+            self._validator.finish(self._pending)
+        self.resultReady.emit(result)
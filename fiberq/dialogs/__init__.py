@@ -19,6 +19,7 @@ Modules:
 - color_dialog.py: ColorCatalogManagerDialog, NewColorCatalogDialog
 - region_dialog.py: CreateRegionDialog
 - settings_dialog.py: FiberQSettingsDialog
+- export_progress_dialog.py: GpkgExportProgressDialog
 """
 
 # Import dialog classes for easy access
@@ -38,6 +39,7 @@ from .latent_dialog import LatentElementsDialog, CablePitstopsDialog
 from .color_dialog import ColorCatalogManagerDialog, NewColorCatalogDialog
 from .region_dialog import CreateRegionDialog
 from .settings_dialog import FiberQSettingsDialog
+from .export_progress_dialog import GpkgExportProgressDialog
 
 # Base utilities
 from .base import (
@@ -70,6 +72,7 @@ __all__ = [
     'NewColorCatalogDialog',
     'CreateRegionDialog',
     'FiberQSettingsDialog',
+    'GpkgExportProgressDialog',
 
     # Utilities
     'normalize_name',
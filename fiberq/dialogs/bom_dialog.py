@@ -2,7 +2,8 @@
 """FiberQ BOM (Bill of Materials) Dialog.
 
 This module contains the BOM report dialog for generating material lists
-with export to XLSX/CSV format.
+with export to XLSX/CSV format. The numbers come from
+:mod:`fiberq.core.bom_engine`, computed in a background task.
 """
 
 import textwrap
@@ -21,19 +22,18 @@ from qgis.PyQt.QtWidgets import (
     QMessageBox,
 )
 
-from qgis.core import (
-    QgsVectorLayer,
-    QgsProject,
-    QgsWkbTypes,
-    QgsDistanceArea,
-)
+from qgis.core import QgsApplication
 
+from ..core.bom_engine import BomTask, group_rows, layer_rows, write_bom_csv, write_bom_xlsx
 from ..utils.legacy_bridge import _fiberq_translate
 
 # Phase 5.2: Logging
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
+#: BOM tasks still running (the dialog may be gone before they finish)
+_RUNNING_BOMS = set()
+
 
 class _BOMDialog(QDialog):
     """BOM (Bill of Materials) report dialog with export to XLSX/CSV."""
@@ -46,10 +46,12 @@ class _BOMDialog(QDialog):
 
         self.tabs = QTabWidget(self)
         self.tab_layers = QWidget(self)
+        self.tab_types = QWidget(self)
         self.tab_summary = QWidget(self)
 
         self.tabs.addTab(self.tab_layers, "By Layers")
         self.tabs.addTab(self.tab_summary, "Summary")
+        self.tabs.addTab(self.tab_types, "By Type")
 
         # By layers table
         self.tbl_layers = QTableWidget(self.tab_layers)
@@ -62,6 +64,16 @@ class _BOMDialog(QDialog):
         v1 = QVBoxLayout(self.tab_layers)
         v1.addWidget(self.tbl_layers)
 
+        # By type table: cable type / capacity / segment type, pipe, route, element
+        self.tbl_types = QTableWidget(self.tab_types)
+        self.tbl_types.setColumnCount(7)
+        self.tbl_types.setHorizontalHeaderLabels([
+            "Category", "Layer", "Type", "Number of elements", "Length [m]", "Slack [m]", "Total [m]"
+        ])
+        self.tbl_types.horizontalHeader().setStretchLastSection(True)
+        v3 = QVBoxLayout(self.tab_types)
+        v3.addWidget(self.tbl_types)
+
         # Summary
         self.lbl_summary = QLabel(self.tab_summary)
         self.lbl_summary.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
@@ -69,14 +81,16 @@ class _BOMDialog(QDialog):
         v2.addWidget(self.lbl_summary)
 
         # Buttons
-        btn_export = QPushButton("Export (.xlsx / .csv)", self)
-        btn_export.clicked.connect(self._export)
+        self.btn_export = QPushButton("Export (.xlsx / .csv)", self)
+        self.btn_export.clicked.connect(self._export)
 
         root = QVBoxLayout(self)
         root.addWidget(self.tabs)
-        root.addWidget(btn_export)
+        root.addWidget(self.btn_export)
 
-        # build data now
+        # build data now (in the background)
+        self._task = None
+        self._result = None
         self._build()
 
     def apply_language(self, lang: str):
@@ -85,6 +99,7 @@ class _BOMDialog(QDialog):
             self.setWindowTitle(_fiberq_translate("BOM report (XLSX/CSV)", lang))
             self.tabs.setTabText(0, _fiberq_translate("By Layers", lang))
             self.tabs.setTabText(1, _fiberq_translate("Summary", lang))
+            self.tabs.setTabText(2, _fiberq_translate("By Type", lang))
             try:
                 # Header labels
                 hs = [
@@ -96,6 +111,11 @@ class _BOMDialog(QDialog):
                     _fiberq_translate("Total [m]", lang),
                 ]
                 self.tbl_layers.setHorizontalHeaderLabels(hs)
+                self.tbl_types.setHorizontalHeaderLabels([
+                    _fiberq_translate("Category", lang),
+                    _fiberq_translate("Layer", lang),
+                    _fiberq_translate("Type", lang),
+                ] + hs[2:])
             except Exception as e:
                 logger.debug(f"Error in _BOMDialog.apply_language: {e}")
             # Export button (last widget in root layout)
@@ -110,108 +130,51 @@ class _BOMDialog(QDialog):
         except Exception as e:
             logger.debug(f"Error in _BOMDialog.apply_language: {e}")
 
-    def _distance_area(self):
-        """Create a QgsDistanceArea object for measuring."""
-        d = QgsDistanceArea()
-        try:
-            d.setSourceCrs(self.iface.mapCanvas().mapSettings().destinationCrs(),
-                           QgsProject.instance().transformContext())
-        except Exception:
-            try:
-                d.setSourceCrs(QgsProject.instance().crs(),
-                               QgsProject.instance().transformContext())
-            except Exception as e:
-                logger.debug(f"Error in _BOMDialog._distance_area: {e}")
-        d.setEllipsoid(QgsProject.instance().ellipsoid())
-        return d
-
     def _build(self):
-        """Build the BOM data from project layers."""
-        project = QgsProject.instance()
-        layers = [l for l in project.mapLayers().values() if isinstance(l, QgsVectorLayer)]  # noqa: E741
-        d = self._distance_area()
-
-        rows = []
-        totals = {
-            "line_len": 0.0,
-            "line_slack": 0.0,
-            "line_total": 0.0,
-            "points": 0
-        }
-
-        for lyr in layers:
+        """Start computing the BOM in the background; the tables fill when it is done."""
+        self._result = None
+        self.lbl_summary.setText("Computing BOM…")
+        self.btn_export.setEnabled(False)
+        task = BomTask()
+        task.resultReady.connect(lambda _result, t=task: _RUNNING_BOMS.discard(t))
+        task.resultReady.connect(self._on_result)
+        self._task = task
+        _RUNNING_BOMS.add(task)
+        QgsApplication.taskManager().addTask(task)
+
+    def done(self, r):
+        task, self._task = self._task, None
+        if task is not None:
             try:
-                gtype = lyr.geometryType()
+                task.cancel()
             except Exception as e:
-                logger.debug(f"skipping layer without geometry type: {e}")
-                continue
+                logger.debug(f"Error in _BOMDialog.done: {e}")
+        super().done(r)
 
-            # Gather stats
-            feat_count = 0
-            length_m = 0.0
-            slack_m = 0.0
-
-            # attribute names tolerant (latin/serbian variations)
-            attr_duz = None
-            attr_slack = None
-            for f in lyr.fields():
-                n = f.name().lower()
-                if n in ("duzina_m", "dužina_m", "duzina", "dužina", "length_m", "len_m"):
-                    attr_duz = f.name()
-                if n in ("slack_m", "slack", "slack_m", "slacks_m"):
-                    attr_slack = f.name()
-
-            for f in lyr.getFeatures():
-                feat_count += 1
-                if gtype == QgsWkbTypes.GeometryType.LineGeometry:
-                    # prefer attribute duzina if it exists and >0, else compute geometry
-                    val_len = None
-                    if attr_duz is not None:
-                        try:
-                            val_len = float(f[attr_duz]) if f[attr_duz] is not None else None
-                        except Exception:
-                            val_len = None
-                    if val_len is None or not (val_len >= 0):
-                        try:
-                            geom = f.geometry()
-                            if geom is not None:
-                                val_len = d.measureLength(geom)
-                        except Exception:
-                            val_len = 0.0
-                    length_m += (val_len or 0.0)
-
-                    if attr_slack is not None:
-                        try:
-                            slack_m += float(f[attr_slack] or 0.0)
-                        except Exception as e:
-                            logger.debug(f"Error in _BOMDialog._build: {e}")
-                elif gtype == QgsWkbTypes.GeometryType.PointGeometry:
-                    # nothing to compute; just counting
-                    pass
-
-            if gtype == QgsWkbTypes.GeometryType.LineGeometry:
-                total_m = length_m + slack_m
-                rows.append([lyr.name(), "Line", feat_count, length_m, slack_m, total_m])
-                totals["line_len"] += length_m
-                totals["line_slack"] += slack_m
-                totals["line_total"] += total_m
-            elif gtype == QgsWkbTypes.GeometryType.PointGeometry:
-                rows.append([lyr.name(), "Point", feat_count, "", "", ""])
-                totals["points"] += feat_count
-            else:
-                # ignore polygonal for now
-                continue
-
-        # fill table
-        self.tbl_layers.setRowCount(len(rows))
+    @staticmethod
+    def _fill(table, rows, numeric):
+        table.setRowCount(len(rows))
         for r, row in enumerate(rows):
             for c, val in enumerate(row):
                 item = QTableWidgetItem("" if val is None else (f"{val:.3f}" if isinstance(val, float) else str(val)))
-                if c in (3, 4, 5):  # numeric align right
+                if c in numeric:  # numeric align right
                     item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.tbl_layers.setItem(r, c, item)
+                table.setItem(r, c, item)
+
+    def _on_result(self, result):
+        """Fill the tables and the summary (main thread)."""
+        if self._task is None:
+            return  # the dialog was closed
+        self._task = None
+        if result.cancelled:
+            self.lbl_summary.setText("BOM cancelled.")
+            return
+
+        self._fill(self.tbl_layers, list(layer_rows(result)), (3, 4, 5))
+        self._fill(self.tbl_types, list(group_rows(result)), (4, 5, 6))
 
         # summary text
+        totals = result.totals
         s = textwrap.dedent(f"""
         <b>Total</b><br>
         Total length of lines: <b>{totals['line_len']:.3f} m</b><br>
@@ -219,12 +182,16 @@ class _BOMDialog(QDialog):
         Line + slack: <b>{totals['line_total']:.3f} m</b><br>
         Total number of point elements: <b>{totals['points']}</b>
         """).strip()
+        if result.errors:
+            s += "<br><br>Not read:<br>" + "<br>".join(result.errors)
         self.lbl_summary.setText(s)
-        self._rows = rows
-        self._totals = totals
+        self._result = result
+        self.btn_export.setEnabled(True)
 
     def _export(self):
         """Export BOM to XLSX or CSV."""
+        if self._result is None:
+            return
         # prefer XLSX if xlsxwriter is available
         has_xlsx = False
         try:
@@ -242,51 +209,13 @@ class _BOMDialog(QDialog):
 
         p = path.lower()
         if p.endswith(".xlsx") and has_xlsx:
-            self._export_xlsx(path)
+            write_bom_xlsx(path, self._result)
+            QMessageBox.information(self, "Export", f"XLSX exported:\n{path}")
         else:
             if not p.endswith(".csv"):
                 path = path + ".csv"
-            self._export_csv(path)
-
-    def _export_csv(self, path):
-        """Export BOM to CSV file."""
-        import csv
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f, delimiter=";")
-            w.writerow(["Layer", "Type", "Number", "Length_m", "Slack_m", "Total_m"])
-            for row in self._rows:
-                w.writerow(row)
-            # add a blank and totals
-            w.writerow([])
-            t = self._totals
-            w.writerow(["TOTAL", "", t["points"], t["line_len"], t["line_slack"], t["line_total"]])
-        QMessageBox.information(self, "Export", f"CSV exported:\n{path}")
-
-    def _export_xlsx(self, path):
-        """Export BOM to XLSX file."""
-        import xlsxwriter
-
-        wb = xlsxwriter.Workbook(path)
-        ws = wb.add_worksheet("By layers")
-        headers = ["Layer", "Type", "Number", "Length_m", "Slack_m", "Total_m"]
-        for c, h in enumerate(headers):
-            ws.write(0, c, h)
-        for r, row in enumerate(self._rows, start=1):
-            for c, val in enumerate(row):
-                ws.write(r, c, val)
-        # totals sheet
-        ws2 = wb.add_worksheet("Total")
-        t = self._totals
-        ws2.write(0, 0, "Total length of lines [m]")
-        ws2.write(0, 1, t["line_len"])
-        ws2.write(1, 0, "Total slack [m]")
-        ws2.write(1, 1, t["line_slack"])
-        ws2.write(2, 0, "Line + slack [m]")
-        ws2.write(2, 1, t["line_total"])
-        ws2.write(3, 0, "Total number of point elements")
-        ws2.write(3, 1, t["points"])
-        wb.close()
-        QMessageBox.information(self, "Export", f"XLSX exported:\n{path}")
+            write_bom_csv(path, self._result)
+            QMessageBox.information(self, "Export", f"CSV exported:\n{path}")
 
 
 __all__ = ['_BOMDialog']
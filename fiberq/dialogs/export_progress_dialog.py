@@ -0,0 +1,77 @@
+# pyright: reportMissingImports=false, reportMissingModuleSource=false
+"""FiberQ Export Progress Dialog.
+
+This module contains the progress dialog shown while a GeoPackage export (or a
+PostGIS publish) task runs: one progress bar per layer and a Cancel button.
+"""
+
+from qgis.PyQt.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QLabel,
+    QProgressBar,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+
+# Phase 5.2: Logging
+from ..utils.logger import get_logger
+logger = get_logger(__name__)
+
+
+class GpkgExportProgressDialog(QDialog):
+    """Per-layer progress of a running GeoPackage export."""
+
+    def __init__(self, task, parent=None, title='GPKG export', target=None):
+        super().__init__(parent)
+        self.task = task
+        self.setWindowTitle(title)
+        self.setModal(False)
+        lay = QVBoxLayout(self)
+
+        self.lbl_path = QLabel(f'Saving to: {target or task.path}')
+        self.lbl_path.setStyleSheet('color: #475569')
+        self.lbl_path.setWordWrap(True)
+        lay.addWidget(self.lbl_path)
+
+        body = QWidget()
+        form = QFormLayout(body)
+        self._bars = {}
+        for job in task.jobs:
+            bar = QProgressBar()
+            bar.setRange(0, 100)
+            bar.setValue(0)
+            form.addRow(QLabel(job.layer_name), bar)
+            self._bars[job.layer_id] = bar
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(body)
+        lay.addWidget(scroll)
+
+        self.btns = QDialogButtonBox(QDialogButtonBox.StandardButton.Cancel)
+        self.btns.rejected.connect(self._cancel)
+        lay.addWidget(self.btns)
+
+        task.layerProgress.connect(self.set_layer_progress)
+        task.resultReady.connect(self._finished)
+
+    def set_layer_progress(self, layer_id: str, percent: float) -> None:
+        bar = self._bars.get(layer_id)
+        if bar is not None:
+            bar.setValue(int(percent))
+
+    def _cancel(self):
+        try:
+            self.task.cancel()
+            self.lbl_path.setText('Cancelling...')
+            self.btns.setEnabled(False)
+        except Exception as e:
+            logger.debug(f"Error in GpkgExportProgressDialog._cancel: {e}")
+
+    def _finished(self, result):
+        self.accept()
+
+
+__all__ = ['GpkgExportProgressDialog']
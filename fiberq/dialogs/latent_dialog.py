@@ -21,6 +21,7 @@ from qgis.PyQt.QtWidgets import (
 from qgis.core import QgsVectorLayer, QgsProject
 
 # Phase 5.2: Logging
+from ..core.cable_catalog import get_cable_catalog
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
@@ -53,10 +54,17 @@ class LatentElementsDialog(QDialog):
 
     def _load_cables(self):
         self.cables = self.core.list_all_cables()
+        catalog = get_cable_catalog()
+        rows = []
+        for c in self.cables:
+            rec = catalog.record(c["layer_id"], c["fid"])
+            rows.append((QgsProject.instance().mapLayer(c["layer_id"]), rec.feature if rec is not None else None))
+        # Candidates of every cable in one sweep over the element indexes
+        cands_by_cable = self.core._find_candidate_elements_for_cables(
+            [(layer, feat) for layer, feat in rows if layer and feat])
         self.tbl.setRowCount(len(self.cables))
         for row, c in enumerate(self.cables):
-            layer = QgsProject.instance().mapLayer(c["layer_id"])
-            feat = None
+            layer, feat = rows[row]
             # Select checkbox
             chk = QCheckBox()
 
@@ -90,15 +98,8 @@ class LatentElementsDialog(QDialog):
             # Edit button enable if there are >0 candidates
             btn = QPushButton("Edit")
             can_edit = False
-            if layer and feat is None:
-                # fetch feature by scanning (fallback)
-                for f in layer.getFeatures():
-                    if int(f.id()) == int(c["fid"]):
-                        feat = f
-                        break
             if layer and feat:
-                cands = self.core._find_candidate_elements_for_cable(layer, feat)
-                can_edit = len(cands) > 0
+                can_edit = len(cands_by_cable.get((layer.id(), int(feat.id())), [])) > 0
             btn.setEnabled(can_edit)
 
             def open_edit(lyr=layer, feat=feat, cdict=c, row=row):
@@ -5,7 +5,9 @@ This module contains the optical schematic view dialog for visualizing
 fiber network topology with filtering, search, and export capabilities.
 """
 
-from qgis.PyQt.QtCore import Qt, QStringListModel, QTimer, QSize, QRect
+import math
+
+from qgis.PyQt.QtCore import Qt, QStringListModel, QTimer, QSize, QRect, pyqtSignal
 from qgis.PyQt.QtGui import QPen, QColor, QPainterPath, QFont
 from qgis.PyQt.QtWidgets import (
     QDialog,
@@ -21,6 +23,7 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
     QGraphicsView,
     QGraphicsScene,
+    QGraphicsItem,
     QCompleter,
     QFileDialog,
 )
@@ -28,16 +31,64 @@ from qgis.PyQt.QtWidgets import (
 from qgis.core import (
     QgsVectorLayer,
     QgsProject,
-    QgsWkbTypes,
-    QgsPointXY,
-    QgsCoordinateTransform,
 )
 
 # Phase 5.2: Logging
+from ..core.schematic_model import SchematicModel, bundle_edges, map_to_scene, node_map_points
 from ..utils.logger import get_logger
-from ..utils.measure import ground_length
 logger = get_logger(__name__)
 
+#: View scale below which node labels and capacity/length text are hidden
+LABEL_MIN_SCALE = 0.5
+#: View scale below which edges joining the same two nodes are drawn as one bundle
+BUNDLE_MAX_SCALE = 0.3
+
+
+class _LabelGrid:
+    """Placed label rects, bucketed by grid cell so a new label is only
+    checked against its neighbours instead of every label in the scene."""
+
+    CELL = 80.0
+
+    def __init__(self):
+        self._rects = {}
+        self._cells = {}
+
+    def _cells_of(self, rect):
+        c = self.CELL
+        for ix in range(math.floor(rect.left() / c), math.floor(rect.right() / c) + 1):
+            for iy in range(math.floor(rect.top() / c), math.floor(rect.bottom() / c) + 1):
+                yield (ix, iy)
+
+    def put(self, owner, rect):
+        self.pop(owner)
+        self._rects[owner] = rect
+        for cell in self._cells_of(rect):
+            self._cells.setdefault(cell, set()).add(owner)
+
+    def pop(self, owner):
+        rect = self._rects.pop(owner, None)
+        if rect is None:
+            return
+        for cell in self._cells_of(rect):
+            owners = self._cells.get(cell)
+            if owners is not None:
+                owners.discard(owner)
+                if not owners:
+                    del self._cells[cell]
+
+    def hits(self, rect, owner):
+        """Whether ``rect`` overlaps a label other than ``owner``'s."""
+        for cell in self._cells_of(rect):
+            for other in self._cells.get(cell, ()):
+                if other != owner and self._rects[other].intersects(rect):
+                    return True
+        return False
+
+    def clear(self):
+        self._rects = {}
+        self._cells = {}
+
 
 class SchematicView(QGraphicsView):
     """QGraphicsView with practical zooming and panning.
@@ -46,12 +97,20 @@ class SchematicView(QGraphicsView):
     - Middle mouse button drag (always works)
     - Left mouse drag when Pan button is toggled on
     - Wheel zoom centered on mouse
+
+    ``zoomChanged`` carries the new scale after every zoom or fit, for
+    level-of-detail switching.
     """
 
+    zoomChanged = pyqtSignal(float)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         from qgis.PyQt.QtGui import QPainter
         self.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
+        # Items are plain paths/text that leave the painter as they found it
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         # We do NOT use Qt's built-in ScrollHandDrag here because its
@@ -73,6 +132,18 @@ class SchematicView(QGraphicsView):
         else:
             self.setCursor(Qt.CursorShape.ArrowCursor)
 
+    def zoom_level(self) -> float:
+        """Current view scale (1.0 = one scene unit per pixel)."""
+        return self.transform().m11()
+
+    def scale(self, sx, sy):
+        super().scale(sx, sy)
+        self.zoomChanged.emit(self.zoom_level())
+
+    def fitInView(self, *args, **kwargs):
+        super().fitInView(*args, **kwargs)
+        self.zoomChanged.emit(self.zoom_level())
+
     def wheelEvent(self, event):
         """Zoom with mouse wheel."""
         factor = 1.15 if event.angleDelta().y() > 0 else 1 / 1.15
@@ -125,6 +196,7 @@ class OpticalSchematicDialog(QDialog):
       - search and centering on element
       - layout rule: OR → backbone (axis), branches downward
       - mini color legend
+      - level of detail: labels hidden and parallel edges bundled when zoomed out
       - export PNG/SVG
     """
 
@@ -134,9 +206,12 @@ class OpticalSchematicDialog(QDialog):
         self.setWindowTitle("Optical Schematic View")
         self.resize(1200, 760)
 
-        # Scene & View
+        # Scene & View: a BSP index keeps painting and hit tests to the items
+        # in view; labels and bundles switch with the zoom (see _apply_lod)
         self.scene = QGraphicsScene(self)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
         self.view = SchematicView(self.scene, self)
+        self.view.zoomChanged.connect(self._apply_lod)
 
         # --- Top bar: controls ---
         top = QHBoxLayout()
@@ -196,7 +271,7 @@ class OpticalSchematicDialog(QDialog):
 
         # Apply/refresh + export buttons
         self.btn_apply = QPushButton("Apply")
-        self.btn_apply.clicked.connect(self.rebuild)
+        self.btn_apply.clicked.connect(lambda: self._draw(full=True))
         self.btn_refresh = QPushButton("Refresh")
         self.btn_refresh.clicked.connect(self.rebuild)
         self.btn_png = QPushButton("PNG")
@@ -245,7 +320,18 @@ class OpticalSchematicDialog(QDialog):
         self._rebuild_timer.timeout.connect(self._do_rebuild_if_needed)
         self._rebuild_pending = False
 
-        # Auto-refresh
+        # Nodes/edges, and the scene items drawn for them
+        self.model = SchematicModel()
+        self._edge_items = {}   # edge key -> {'sig', 'items', 'path', 'labels'}
+        self._node_items = {}   # node name -> {'sig', 'items', 'labels'}
+        self._bundles = {}      # (node, node) -> {'sig', 'items', 'keys'}
+        self._labels = _LabelGrid()  # ('e', key) / ('n', name) -> label rect
+        self._lod = None        # (labels shown, bundled) last applied
+
+        # Auto-refresh: per-layer change sets, applied together after the debounce
+        self._pending = {}      # layer id -> (changed fids, removed fids)
+        self._reload = set()    # layer ids to read again entirely
+        self._connections = []
         self._wired_layers = set()
         self._wire_all_layers()
 
@@ -289,138 +375,6 @@ class OpticalSchematicDialog(QDialog):
                 self.scene.removeItem(item)
             QTimer.singleShot(1300, _remove)
 
-    # ---------- DATA ----------
-    def _collect_nodes(self):
-        nodes = {}
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if isinstance(lyr, QgsVectorLayer) and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry:
-                    lname = lyr.name()
-                    fields = lyr.fields()
-                    has_naziv = fields.indexFromName('naziv') != -1
-
-                    is_manhole_layer = lname in ('OKNA', 'Manholes')
-                    has_broj_okna = (
-                        fields.indexFromName('broj_okna') != -1
-                        if is_manhole_layer
-                        else False
-                    )
-
-                    for f in lyr.getFeatures():
-                        nm = None
-                        # 1) Manholes (OKNA): MH + broj_okna
-                        if is_manhole_layer and has_broj_okna:
-                            val = f['broj_okna']
-                            if val is not None and str(val).strip():
-                                nm = f"MH {str(val).strip()}"  # Issue #9: KO -> MH
-
-                        # 2) other layers with 'naziv' field
-                        if nm is None and has_naziv:
-                            val = f['naziv']
-                            if val is not None and str(val).strip():
-                                nm = str(val).strip()
-
-                        # 3) Poles fallback
-                        if nm is None and lname == 'Poles':
-                            try:
-                                tip = (
-                                    str(f['tip']).strip()
-                                    if fields.indexFromName('tip') != -1 and f['tip'] is not None
-                                    else ''
-                                )
-                            except Exception:
-                                tip = ''
-                            nm = ("Pole " + tip).strip() or f"Pole {int(f.id())}"  # Stub -> Pole
-
-                        if nm and nm not in nodes:
-                            nodes[nm] = {
-                                "layer_id": lyr.id(),
-                                "layer_name": lname,
-                                "fid": int(f.id()),
-                            }
-            except Exception as e:
-                logger.debug(f"Skipping layer while collecting schematic nodes: {e}")
-                continue
-        return nodes
-
-    def _collect_edges(self):
-        """List all cables + read attributes from layer; returns list of dicts."""
-        items = self.core.list_all_cables() + self.core.list_all_pipes()
-        edges = []
-        for it in items:
-            lyr = QgsProject.instance().mapLayer(it.get('layer_id'))
-            if not lyr or not isinstance(lyr, QgsVectorLayer):
-                continue
-            feat = None
-            for _f in lyr.getFeatures():
-                if int(_f.id()) == int(it.get('fid')):
-                    feat = _f
-                    break
-            if not feat:
-                continue
-
-            geom = feat.geometry()
-            # collect geometry coordinates (transformed to project CRS)
-            try:
-                srcCrs = lyr.crs()
-                dstCrs = QgsProject.instance().crs()
-                xform = QgsCoordinateTransform(srcCrs, dstCrs, QgsProject.instance())
-                coords = []
-                if geom.isMultipart():
-                    parts = geom.asMultiPolyline()
-                    for pl in parts:
-                        for p in pl:
-                            pt = xform.transform(QgsPointXY(p.x(), p.y()))
-                            coords.append((pt.x(), pt.y()))
-                else:
-                    pl = geom.asPolyline()
-                    for p in pl:
-                        pt = xform.transform(QgsPointXY(p.x(), p.y()))
-                        coords.append((pt.x(), pt.y()))
-            except Exception:
-                coords = []
-            try:
-                length_m = ground_length(geom, lyr)
-            except Exception:
-                length_m = 0.0
-
-            lname = (it.get('layer_name') or lyr.name() or '').lower()
-            vrsta = 'vazdusni' if ('vazdu' in lname or 'aerial' in lname) else 'podzemni'
-
-            # Attributes: take from 'it' if available, otherwise from feature fields
-            def gv(key):
-                if it.get(key) not in (None, ''):
-                    return it.get(key)
-                idx = lyr.fields().indexFromName(key)
-                return feat[key] if idx != -1 else ''
-
-            # Detect pipe (vs cable) by source layer name so the schematic
-            # can render them and skip cable-only filters. Layer names cover
-            # both English ("PE pipes", "Transition pipes", "PE ducts",
-            # "Transition ducts") and legacy Serbian ("PE cevi", "Prelazne cevi").
-            raw_lname = (it.get('layer_name') or lyr.name() or '')
-            low_lname = raw_lname.lower()
-            is_pipe = (
-                'cevi' in low_lname
-                or 'pipe' in low_lname  # noqa: W503
-                or 'duct' in low_lname  # noqa: W503
-                or (it.get('tip') or '').lower() == 'pipe'  # noqa: W503
-            )
-
-            edges.append({
-                "from": str(gv('od')).strip(),
-                "to": str(gv('do')).strip(),
-                "podtip": str(gv('podtip')).lower(),
-                "kapacitet": gv('kapacitet'),
-                "geom_coords": coords,
-                "length": length_m,
-                "vrsta": vrsta,
-                "relacija": str(gv('relacija')).lower(),
-                "is_pipe": is_pipe,
-                "layer_name": raw_lname,
-            })
-        return edges
-
     # ---------- LAYOUT ----------
     def _rank_for_layer(self, layer_name: str):
         lname = (layer_name or "").lower()
@@ -515,84 +469,19 @@ class OpticalSchematicDialog(QDialog):
 
         # --- MAP LAYOUT: use real coordinates from map ---
         if getattr(self, 'chk_map_layout', None) and self.chk_map_layout.isChecked():
-            # Prepare node positions from centroids/points
-            pos = {}
-            world_points = []
-            for name, info in nodes.items():
-                try:
-                    lyr = QgsProject.instance().mapLayer(info.get('layer_id'))
-                    fid = int(info.get('fid'))
-                    feat = next((f for f in lyr.getFeatures() if int(f.id()) == fid), None)
-                    if not feat:
-                        continue
-                    g = feat.geometry()
-                    # Extract one representative point
-                    pt = None
-                    if g.isEmpty():
-                        continue
-                    if g.type() == QgsWkbTypes.GeometryType.PointGeometry:
-                        pt = g.asPoint()
-                    elif g.type() == QgsWkbTypes.GeometryType.LineGeometry:
-                        try:
-                            d = g.length()
-                            pt = g.interpolate(d / 2.0).asPoint()
-                        except Exception:
-                            ps = g.asPolyline()
-                            pt = ps[len(ps) // 2] if ps else None
-                    else:
-                        try:
-                            pt = g.centroid().asPoint()
-                        except Exception:
-                            pt = None
-                    if pt is None:
-                        continue
-                    # transform to project CRS
-                    src = lyr.crs()
-                    dst = QgsProject.instance().crs()
-                    tr = QgsCoordinateTransform(src, dst, QgsProject.instance())
-                    ptt = tr.transform(QgsPointXY(pt.x(), pt.y()))
-                    pos[name] = (ptt.x(), ptt.y())
-                    world_points.append((ptt.x(), ptt.y()))
-                except Exception as e:
-                    logger.debug(f"Skipping node without usable geometry: {e}")
-                    continue
-
-            # Add all points from cable/pipe geometry
-            for e in edges_f:
-                coords = e.get('geom_coords') or []
-                for x, y in coords:
-                    world_points.append((x, y))
-
+            # Node features come one request per layer, edge vertices are
+            # already in the project CRS (cable catalogue)
+            fitted = map_to_scene(node_map_points(nodes, self.model.project),
+                                  [e.get('geom_coords') or [] for e in edges_f])
             # If no points, return empty layout
-            if not world_points:
+            if fitted is None:
                 return {}, []
-
-            minx = min(x for x, _ in world_points)
-            maxx = max(x for x, _ in world_points)
-            miny = min(y for _, y in world_points)
-            maxy = max(y for _, y in world_points)
-            w = max(1.0, maxx - minx)
-            h = max(1.0, maxy - miny)
-            target_w, target_h = 1600.0, 1000.0
-            scale = min(target_w / w, target_h / h)
-            pad = 20.0
-
-            def tx(x, y):
-                # keep north up (invert Y for QGraphics)
-                X = (x - minx) * scale + pad
-                Y = (maxy - y) * scale + pad
-                return (X, Y)
-
-            # transform node positions
-            pos = {name: tx(x, y) for name, (x, y) in pos.items()}
+            pos, paths = fitted
 
             # build line paths based on original geometry
             lines = []
-            for e in edges_f:
-                coords = e.get('geom_coords') or []
-                if coords:
-                    path = [tx(x, y) for (x, y) in coords]
-                else:
+            for e, path in zip(edges_f, paths):
+                if not path:
                     a = pos.get(e.get('from'))
                     b = pos.get(e.get('to'))
                     if not a or not b:
@@ -609,7 +498,7 @@ class OpticalSchematicDialog(QDialog):
                     self._completer.setModel(model)
                 model.setStringList(sorted(pos.keys()))
             except Exception as e:
-                logger.debug(f"Error in OpticalSchematicDialog.tx: {e}")
+                logger.debug(f"Error in OpticalSchematicDialog._build_layout: {e}")
 
             return pos, lines
 
@@ -746,81 +635,208 @@ class OpticalSchematicDialog(QDialog):
 
     # ---------- DRAWING ----------
     def rebuild(self):
-        self.scene.clear()
-        nodes = self._collect_nodes()
-        edges = self._collect_edges()
-        pos, lines = self._build_layout(nodes, edges)
-
-        def color_for(e):
-            t = (e.get('podtip') or '').lower()
-            lname = (e.get('layer_name') or '').lower()
-            if 'glavni' in t:
-                return QColor(0, 51, 153)
-            if 'distribut' in t:
-                return QColor(204, 0, 0)
-            if 'razvod' in t:
-                return QColor(165, 42, 42)
-            # Pipes: key off the same is_pipe flag the dash logic uses so
-            # English-named layers ("PE pipes", "ducts") get the legend orange
-            # too, not just Serbian "cev"/"cevi".
-            if e.get('is_pipe') or 'cev' in t or 'cevi' in lname:
-                return QColor(255, 140, 0)
-            return QColor(60, 60, 60)
-
+        """Collect every node and edge again and redraw the whole scene."""
+        self._pending = {}
+        self._reload = set()
+        self._rebuild_pending = False
+        self.model.load()
+        self._draw(full=True)
+
+    def _draw(self, full=False):
+        """Lay the model out and bring the scene in line with it.
+
+        A full draw clears the scene; otherwise only items whose path, position,
+        colour or label changed are replaced, and the view is left where it is.
+        """
+        nodes = self.model.nodes()
+        pos, lines = self._build_layout(nodes, self.model.edges())
+        if full:
+            self.scene.clear()
+            self._edge_items = {}
+            self._node_items = {}
+            self._bundles = {}
+            self._labels.clear()
+        self._sync_edges(lines)
+        self._sync_bundles(lines)
+        self._sync_nodes(nodes, pos)
+        if full:
+            self._fit()
+        self._apply_lod(force=True)
+
+    def _apply_lod(self, scale=None, force=False):
+        """Show or hide labels and bundles for the view scale ``scale``.
+
+        Zoomed out past LABEL_MIN_SCALE the text goes; past BUNDLE_MAX_SCALE
+        the edges of a bundle are hidden and its single thick path shown.
+        Nothing is touched while the level of detail stays the same.
+        """
+        if scale is None:
+            scale = self.view.zoom_level()
+        lod = (scale >= LABEL_MIN_SCALE, scale < BUNDLE_MAX_SCALE)
+        if lod == self._lod and not force:
+            return
+        self._lod = lod
+        labels, bundled = lod
+        hidden = {k for b in self._bundles.values() for k in b['keys']} if bundled else set()
+        for key, entry in self._edge_items.items():
+            shown = key not in hidden
+            entry['path'].setVisible(shown)
+            for item in entry['labels']:
+                item.setVisible(labels and shown)
+        for entry in self._node_items.values():
+            for item in entry['labels']:
+                item.setVisible(labels)
+        for entry in self._bundles.values():
+            for item in entry['items']:
+                item.setVisible(bundled)
+
+    @staticmethod
+    def _color_for(e):
+        t = (e.get('podtip') or '').lower()
+        lname = (e.get('layer_name') or '').lower()
+        if 'glavni' in t:
+            return QColor(0, 51, 153)
+        if 'distribut' in t:
+            return QColor(204, 0, 0)
+        if 'razvod' in t:
+            return QColor(165, 42, 42)
+        # Pipes: key off the same is_pipe flag the dash logic uses so
+        # English-named layers ("PE pipes", "ducts") get the legend orange
+        # too, not just Serbian "cev"/"cevi".
+        if e.get('is_pipe') or 'cev' in t or 'cevi' in lname:
+            return QColor(255, 140, 0)
+        return QColor(60, 60, 60)
+
+    @staticmethod
+    def _edge_text(e):
+        text = f"{e.get('kapacitet', '')}".strip()
+        if e.get('length', 0.0):
+            text = (text + (" / " if text else "")) + f"{round(e['length'], 1)} m"
+        return text
+
+    def _place_text(self, owner, x, y, txt, color):
+        """Label at (x, y), nudged off the other labels; returns its items."""
+        if not txt:
+            return []
         # label collision avoidance
-        occupied = []
-
-        def place_text(x, y, txt, color):
-            if not txt:
-                return
-            ti = self.scene.addText(txt, QFont("Arial", 9))
-            ti.setDefaultTextColor(color)
-            offsets = [(8, -8), (10, 10), (-22, -10), (-22, 12), (8, 12), (12, 0)]
-            for dx, dy in offsets:
-                ti.setPos(x + dx, y + dy)
-                rect = ti.mapRectToScene(ti.boundingRect())
-                if not any(rect.intersects(r) for r in occupied):
-                    bg = rect.adjusted(-2, -1, 2, 2)
-                    self.scene.addRect(bg, QPen(Qt.PenStyle.NoPen), QColor(255, 255, 255, 210)).setZValue(ti.zValue() - 1)
-                    occupied.append(bg)
-                    return
-            occupied.append(ti.mapRectToScene(ti.boundingRect()))
-
-        # branches + labels
+        ti = self.scene.addText(txt, QFont("Arial", 9))
+        ti.setDefaultTextColor(color)
+        # Text is costly to lay out: paint it from a pixmap until the zoom changes
+        ti.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        offsets = [(8, -8), (10, 10), (-22, -10), (-22, 12), (8, 12), (12, 0)]
+        for dx, dy in offsets:
+            ti.setPos(x + dx, y + dy)
+            rect = ti.mapRectToScene(ti.boundingRect())
+            if not self._labels.hits(rect, owner):
+                bg = rect.adjusted(-2, -1, 2, 2)
+                bg_item = self.scene.addRect(bg, QPen(Qt.PenStyle.NoPen), QColor(255, 255, 255, 210))
+                bg_item.setZValue(ti.zValue() - 1)
+                self._labels.put(owner, bg)
+                return [ti, bg_item]
+        self._labels.put(owner, ti.mapRectToScene(ti.boundingRect()))
+        return [ti]
+
+    def _remove(self, owner, entry):
+        for item in entry['items']:
+            try:
+                self.scene.removeItem(item)
+            except Exception as e:
+                logger.debug(f"Error in OpticalSchematicDialog._remove: {e}")
+        self._labels.pop(owner)
+
+    @staticmethod
+    def _painter_path(path):
+        gp = QPainterPath()
+        x0, y0 = path[0]
+        gp.moveTo(x0, y0)
+        for x, y in path[1:]:
+            gp.lineTo(x, y)
+        return gp
+
+    def _sync_edges(self, lines):
+        labels = self.chk_labels.isChecked()
+        seen = set()
         for e, path in lines:
-            pen = QPen(color_for(e))
+            key = e['key']
+            seen.add(key)
+            color = self._color_for(e)
+            text = self._edge_text(e) if labels else ''
+            sig = (tuple(path), color.rgba(), bool(e.get('is_pipe')), text)
+            old = self._edge_items.get(key)
+            if old is not None:
+                if old['sig'] == sig:
+                    continue
+                self._remove(('e', key), old)
+
+            pen = QPen(color)
             pen.setWidthF(2.2)
             # Pipes – draw dashed for easier distinction
-            try:
-                if e.get('is_pipe'):
-                    pen.setStyle(Qt.PenStyle.DashLine)
-            except Exception as _err:
-                logger.debug(f"Error applying pipe dash style: {_err}")
-            gp = QPainterPath()
-            x0, y0 = path[0]
-            gp.moveTo(x0, y0)
-            for x, y in path[1:]:
-                gp.lineTo(x, y)
-            self.scene.addPath(gp, pen)
-            if self.chk_labels.isChecked():
-                mid_idx = len(path) // 2
-                mx, my = path[mid_idx]
-                text = f"{e.get('kapacitet', '')}".strip()
-                if e.get('length', 0.0):
-                    text = (text + (" / " if text else "")) + f"{round(e['length'], 1)} m"
-                place_text(mx, my, text, pen.color())
-
-        # nodes + labels
-        for name, meta in nodes.items():
+            if e.get('is_pipe'):
+                pen.setStyle(Qt.PenStyle.DashLine)
+            path_item = self.scene.addPath(self._painter_path(path), pen)
+            label_items = []
+            if text:
+                mx, my = path[len(path) // 2]
+                label_items = self._place_text(('e', key), mx, my, text, pen.color())
+            self._edge_items[key] = {'sig': sig, 'items': [path_item] + label_items,
+                                     'path': path_item, 'labels': label_items}
+
+        for key in [k for k in self._edge_items if k not in seen]:
+            self._remove(('e', key), self._edge_items.pop(key))
+
+    def _sync_bundles(self, lines):
+        """One thick path per node pair joined by several edges (zoomed out)."""
+        seen = set()
+        for pair, members in bundle_edges(lines).items():
+            seen.add(pair)
+            edge, path = members[0]
+            color = self._color_for(edge)
+            keys = tuple(e['key'] for e, _ in members)
+            sig = (tuple(path), color.rgba(), keys)
+            old = self._bundles.get(pair)
+            if old is not None:
+                if old['sig'] == sig:
+                    continue
+                self._remove(('b', pair), old)
+            pen = QPen(color)
+            pen.setWidthF(2.2 + 1.5 * math.log2(len(members)))
+            item = self.scene.addPath(self._painter_path(path), pen)
+            item.setToolTip(f"{pair[0]} – {pair[1]} (×{len(members)})")
+            self._bundles[pair] = {'sig': sig, 'items': [item], 'keys': keys}
+
+        for pair in [p for p in self._bundles if p not in seen]:
+            self._remove(('b', pair), self._bundles.pop(pair))
+
+    def _sync_nodes(self, nodes, pos):
+        labels = self.chk_labels.isChecked()
+        r = 6.0
+        for name in nodes:
             x, y = pos.get(name, (0.0, 0.0))
-            r = 6.0
-            self.scene.addEllipse(x - r, y - r, 2 * r, 2 * r, QPen(Qt.GlobalColor.black), QColor(240, 240, 240))
-            if self.chk_labels.isChecked():
-                place_text(x, y, str(name), QColor(10, 10, 10))
+            sig = (x, y, labels)
+            old = self._node_items.get(name)
+            if old is not None:
+                if old['sig'] == sig:
+                    continue
+                self._remove(('n', name), old)
+            dot = self.scene.addEllipse(x - r, y - r, 2 * r, 2 * r, QPen(Qt.GlobalColor.black), QColor(240, 240, 240))
+            dot.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            label_items = []
+            if labels:
+                label_items = self._place_text(('n', name), x, y, str(name), QColor(10, 10, 10))
+            self._node_items[name] = {'sig': sig, 'items': [dot] + label_items, 'labels': label_items}
 
-        self._fit()
+        for name in [n for n in self._node_items if n not in nodes]:
+            self._remove(('n', name), self._node_items.pop(name))
 
     # ---------- EXPORT ----------
+    def _render(self, painter):
+        """Render the scene in full detail: exports are 1:1, whatever the zoom."""
+        self._apply_lod(1.0)
+        try:
+            self.scene.render(painter)
+        finally:
+            self._apply_lod()
+
     def _export_png(self):
         from qgis.PyQt.QtGui import QImage, QPainter
         rect = self.scene.itemsBoundingRect().adjusted(10, 10, 10, 10)
@@ -828,7 +844,7 @@ class OpticalSchematicDialog(QDialog):
         img.fill(0x00ffffff)
         p = QPainter(img)
         p.translate(-rect.x() + 20, -rect.y() + 20)
-        self.scene.render(p)
+        self._render(p)
         p.end()
         fn, _ = QFileDialog.getSaveFileName(self, "Save PNG", "optical_schematic.png", "PNG (*.png)")
         if fn:
@@ -841,7 +857,7 @@ class OpticalSchematicDialog(QDialog):
         img.fill(0xffffffff)
         p = QPainter(img)
         p.translate(-rect.x() + 20, -rect.y() + 20)
-        self.scene.render(p)
+        self._render(p)
         p.end()
         fn, _ = QFileDialog.getSaveFileName(self, "Save JPG", "optical_schematic.jpg", "JPG (*.jpg)")
         if fn:
@@ -864,61 +880,143 @@ class OpticalSchematicDialog(QDialog):
         gen.setViewBox(QRect(0, 0, int(rect.width()) + 40, int(rect.height()) + 40))
         p = QPainter(gen)
         p.translate(-rect.x() + 20, -rect.y() + 20)
-        self.scene.render(p)
+        self._render(p)
         p.end()
 
     def _schedule_rebuild(self):
-        """Debounced rebuild – used for automatic layer changes."""
+        """Debounced update – used for automatic layer changes."""
         try:
             self._rebuild_pending = True
             if getattr(self, "_rebuild_timer", None) is not None:
-                # restart timer – multiple changes in short time -> one rebuild
+                # restart timer – multiple changes in short time -> one update
                 self._rebuild_timer.start()
             else:
                 # fallback, if no timer
-                self._rebuild_pending = False
-                self.rebuild()
+                self._do_rebuild_if_needed()
         except Exception:
             # if something goes wrong, don't block – do direct rebuild
             self._rebuild_pending = False
             self.rebuild()
 
     def _do_rebuild_if_needed(self):
-        """Called from QTimer.timeout – actually rebuilds if needed."""
+        """Called from QTimer.timeout – applies the queued change sets."""
         if not getattr(self, "_rebuild_pending", False):
             return
+        if not self.isVisible():
+            return  # kept queued until the dialog is shown again
         self._rebuild_pending = False
-        self.rebuild()
+        pending, self._pending = self._pending, {}
+        reload, self._reload = self._reload, set()
+        prj = QgsProject.instance()
+        dirty = False
+        try:
+            for lid in reload:
+                layer = prj.mapLayer(lid)
+                if layer is None:
+                    self.model.drop_layer(lid)
+                else:
+                    self.model.reload_layer(layer)
+                dirty = True
+            for lid, (changed, removed) in pending.items():
+                layer = prj.mapLayer(lid)
+                if layer is not None and lid not in reload:
+                    dirty |= self.model.apply(layer, changed, removed)
+        except Exception as e:
+            logger.debug(f"Error applying schematic changes, rebuilding: {e}")
+            self.rebuild()
+            return
+        if dirty:
+            self._draw()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._rebuild_pending:
+            self._rebuild_timer.start()
 
     # ---------- SIGNALS ----------
-    def _wire_all_layers(self):
-        prj = QgsProject.instance()
+    def _connect(self, signal, slot):
         try:
-            prj.layersAdded.connect(lambda *_: self._schedule_rebuild())
-            prj.layerWillBeRemoved.connect(lambda *_: self._schedule_rebuild())
+            signal.connect(slot)
+            self._connections.append((signal, slot))
         except Exception as e:
-            logger.debug(f"Error in OpticalSchematicDialog._wire_all_layers: {e}")
-        for lyr in QgsProject.instance().mapLayers().values():
+            logger.debug(f"Error in OpticalSchematicDialog._connect: {e}")
+
+    def disconnect_layers(self):
+        """Stop following the project (the plugin unloads)."""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in OpticalSchematicDialog.disconnect_layers: {e}")
+        self._connections = []
+        self._wired_layers = set()
+
+    def _wire_all_layers(self):
+        prj = QgsProject.instance()
+        self._connect(prj.layersAdded, self._on_layers_added)
+        self._connect(prj.layersWillBeRemoved, self._on_layers_removed)
+        for lyr in prj.mapLayers().values():
             self._wire_layer(lyr)
 
-    def _layer_committed(self, *args, **kwargs):
-        # instead of direct rebuild, do debounce
+    def _on_layers_added(self, layers):
+        for lyr in layers:
+            self._wire_layer(lyr)
+            if self.model.draws(lyr):
+                self._reload.add(lyr.id())
+                self._schedule_rebuild()
+
+    def _on_layers_removed(self, layer_ids):
+        for lid in layer_ids:
+            if not isinstance(lid, str):  # the QList<QgsMapLayer*> overload
+                lid = lid.id()
+            self._wired_layers.discard(lid)
+            self._connections = [(sig, slot) for sig, slot in self._connections
+                                 if getattr(slot, 'layer_id', None) != lid]
+            self._reload.add(lid)
+        self._schedule_rebuild()
+
+    def _queue(self, layer, changed=(), removed=()):
+        """Record a change to ``layer`` if the schematic draws it."""
+        if not self.model.draws(layer):
+            return
+        ch, rm = self._pending.setdefault(layer.id(), (set(), set()))
+        ch.update(int(fid) for fid in changed)
+        rm.update(int(fid) for fid in removed)
         self._schedule_rebuild()
 
+    def _queue_reload(self, layer):
+        if self.model.draws(layer) or self.model.has_layer(layer.id()):
+            self._reload.add(layer.id())
+            self._schedule_rebuild()
+
     def _wire_layer(self, lyr):
         if not isinstance(lyr, QgsVectorLayer):
             return
-        if lyr.id() in getattr(self, "_wired_layers", set()):
+        if lyr.id() in self._wired_layers:
             return
         self._wired_layers.add(lyr.id())
-        try:
-            lyr.committedFeaturesAdded.connect(self._layer_committed)
-            lyr.committedFeaturesRemoved.connect(self._layer_committed)
-            lyr.committedAttributeValuesChanges.connect(self._layer_committed)
-            lyr.committedGeometriesChanges.connect(self._layer_committed)
-            lyr.layerModified.connect(self._layer_committed)
-        except Exception as e:
-            logger.debug(f"Error in OpticalSchematicDialog._wire_layer: {e}")
+
+        def changed(fid, *args):
+            self._queue(lyr, changed=[fid])
+
+        def deleted(fids):
+            self._queue(lyr, removed=fids)
+
+        def reread(*args):
+            # A commit gives added features their real fids: read the layer again
+            self._queue_reload(lyr)
+
+        for slot in (changed, deleted, reread):
+            slot.layer_id = lyr.id()
+        self._connect(lyr.featureAdded, changed)
+        self._connect(lyr.attributeValueChanged, changed)
+        self._connect(lyr.geometryChanged, changed)
+        self._connect(lyr.featuresDeleted, deleted)
+        self._connect(lyr.afterCommitChanges, reread)
+        self._connect(lyr.afterRollBack, reread)
+        # New or dropped name fields, or a new name, can make a layer (not) drawn
+        self._connect(lyr.updatedFields, reread)
+        self._connect(lyr.nameChanged, reread)
 
 
 __all__ = ['SchematicView', 'OpticalSchematicDialog']
@@ -54,13 +54,20 @@ from .core.license_manager import (  # noqa: E402
     _fiberq_check_pro,
 )
 
+from .core.cable_catalog import release_cable_catalog  # noqa: E402
+from .core.layer_registry import (  # noqa: E402
+    ROLE_BREAK,
+    ROLE_ELEMENT,
+    ROLE_MANHOLE,
+    ROLE_POLE,
+    get_layer_registry,
+    release_layer_registry,
+)
+
 # =============================================================================
 # Phase 1.3: Layer utility functions moved to core/layer_manager.py
 # =============================================================================
 from .core.layer_manager import (  # noqa: E402
-    # Element definitions
-    ELEMENT_DEFS,
-    NASTAVAK_DEF,
     # Element layer functions
     _ensure_element_layer_with_style,
     _copy_attributes_between_layers,
@@ -328,6 +335,7 @@ class FiberQPlugin:
 
         panel = ValidationPanel(self.iface.mainWindow())
         panel.rerunRequested.connect(self.run_validation)
+        panel.cancelRequested.connect(self._cancel_validation)
         panel.issueActivated.connect(self._zoom_to_issue)
         panel.exportRequested.connect(self.export_validation_report)
         self.iface.addDockWidget(_Qt.DockWidgetArea.RightDockWidgetArea, panel)
@@ -335,27 +343,40 @@ class FiberQPlugin:
         return panel
 
     def run_validation(self):
-        """Run the WP2 validation engine and show the results.
+        """Run the WP2 validation engine in the background and show the results.
 
         Deliberately thin: every rule lives in core.validation_manager /
-        validation_rules, so this only wires the engine to the UI.
+        validation_rules, so this only wires the engine to the UI. The work runs
+        as a QgsTask (core.validation_task); the panel fills up rule by rule and
+        _on_validation_finished reports the outcome.
         """
         from datetime import datetime
 
+        from qgis.core import QgsApplication
+
         from . import __version__ as _plugin_version
-        from .core.validation_manager import run_validation as _run
+        from .core.validation_manager import IncrementalValidator
+        from .core.validation_task import ValidationTask
         from .i18n import safe_format
 
         panel = self._ensure_validation_panel()
-        panel.set_busy(True)
+        if getattr(self, '_validation_task', None) is not None:
+            # One run at a time; the panel's Cancel stops the one in flight
+            panel.show()
+            panel.raise_()
+            return
         try:
-            result = _run(
+            # Kept between runs: a re-run after a fix only re-checks what changed
+            if getattr(self, '_validator', None) is None:
+                self._validator = IncrementalValidator()
+            task = ValidationTask(
+                self._validator,
                 timestamp=datetime.now().isoformat(timespec='seconds'),
                 plugin_version=_plugin_version,
             )
         except Exception as e:
-            # The runner is documented never to raise; if it somehow does, say so
-            # rather than leaving the panel stuck on "Validating...".
+            # Snapshotting is documented never to raise; if it somehow does, say
+            # so rather than leaving the panel stuck on "Validating...".
             logger.warning(f"Validation failed: {e}")
             panel.set_busy(False)
             panel.set_result(None)
@@ -363,10 +384,39 @@ class FiberQPlugin:
             self.iface.messageBar().pushWarning(
                 'FiberQ', safe_format(self.tr(src), src, details=e))
             return
-        panel.set_busy(False)
-        panel.set_result(result)
+
+        task.ruleFinished.connect(panel.add_issues)
+        task.resultReady.connect(self._on_validation_finished)
+        self._validation_task = task
+        panel.start_run(task.rule_count())
         panel.show()
         panel.raise_()
+        QgsApplication.taskManager().addTask(task)
+
+    def _cancel_validation(self):
+        """Stop the validation task in flight, if any."""
+        task = getattr(self, '_validation_task', None)
+        if task is not None:
+            task.cancel()
+
+    def _on_validation_finished(self, result):
+        """Show the outcome of a validation task (main thread)."""
+        from .i18n import safe_format
+
+        self._validation_task = None
+        panel = self._ensure_validation_panel()
+        panel.set_busy(False)
+        if result is None:
+            panel.set_result(None)
+            src = QT_TRANSLATE_NOOP('FiberQPlugin', 'Validation could not run: {details}')
+            self.iface.messageBar().pushWarning(
+                'FiberQ', safe_format(self.tr(src), src, details=self.tr('see the log')))
+            return
+        if result.cancelled:
+            panel.set_cancelled()
+            self.iface.messageBar().pushInfo('FiberQ', self.tr('Validation cancelled.'))
+            return
+        panel.set_result(result)
 
         counts = result.counts_by_severity()
         summary = ', '.join([
@@ -800,22 +850,16 @@ class FiberQPlugin:
     # --- Health check (toolbar action) ---
     def run_health_check(self):
         try:
-            from qgis.core import QgsProject, QgsVectorLayer, QgsWkbTypes
+            from qgis.core import QgsWkbTypes
             from qgis.PyQt.QtWidgets import QMessageBox
 
             msgs = []
 
-            project = QgsProject.instance()
-            layers = {
-                lyr.name(): lyr
-                for lyr in project.mapLayers().values()
-                if isinstance(lyr, QgsVectorLayer)
-            }
-
             # Key layers (accept both Serbian and English names if present)
-            route_layer = layers.get("Route") or layers.get("Route")
-            poles_layer = layers.get("Poles") or layers.get("Poles")
-            manholes_layer = layers.get("Manholes") or layers.get("OKNA")
+            registry = get_layer_registry()
+            route_layer = registry.layer("Route")
+            poles_layer = registry.layer("Poles")
+            manholes_layer = registry.layer("Manholes")
 
             # Route – line
             if route_layer and route_layer.geometryType() == QgsWkbTypes.GeometryType.LineGeometry:
@@ -949,7 +993,9 @@ class FiberQPlugin:
         return _open_fiberq_web(self.iface)
 
     def save_all_layers_to_gpkg(self):
-        # Save all layers to GeoPackage
+        # Save all layers to GeoPackage (in the background, see ExportManager)
+        if self.export_manager:
+            return self.export_manager.save_all_layers_to_gpkg()
         return _telecom_save_all_layers_to_gpkg(self.iface)
 
     def run_create_service_area(self):
@@ -2206,46 +2252,38 @@ class FiberQPlugin:
 
         # After activating tool, find all break layers and apply fixed style
         try:
-            from qgis.core import QgsProject, QgsVectorLayer, QgsWkbTypes
+            from qgis.core import QgsWkbTypes
 
-            for lyr in QgsProject.instance().mapLayers().values():
-                if not isinstance(lyr, QgsVectorLayer):
-                    continue
-                if lyr.geometryType() != QgsWkbTypes.GeometryType.PointGeometry:
-                    continue
+            for lyr in get_layer_registry().by_role(ROLE_BREAK, geometry=QgsWkbTypes.GeometryType.PointGeometry):
+                self._apply_prekid_style(lyr)
 
-                name = (lyr.name() or "").lower()
-                # cover both English and Serbian names
-                if "fiber break" in name or "prekid" in name:
-                    self._apply_prekid_style(lyr)
+                # Field aliases (EN) - user view, field names ostaju isti radi kompatibilnosti koda
+                try:
+                    fields = lyr.fields()
+                    alias_map = {
+                        "naziv": "Name",
+                        "cable_layer_id": "Cable layer ID",
+                        "cable_fid": "Cable feature ID",
+                        "distance_m": "Distance (m)",
+                        "segments_hit": "Segments hit",
+                        "vreme": "Time",
+                    }
 
-                    # Field aliases (EN) - user view, field names ostaju isti radi kompatibilnosti koda
-                    try:
-                        fields = lyr.fields()
-                        alias_map = {
-                            "naziv": "Name",
-                            "cable_layer_id": "Cable layer ID",
-                            "cable_fid": "Cable feature ID",
-                            "distance_m": "Distance (m)",
-                            "segments_hit": "Segments hit",
-                            "vreme": "Time",
-                        }
-
-                        for fn, al in alias_map.items():
-                            idx = fields.indexOf(fn)
-                            if idx != -1:
-                                lyr.setFieldAlias(idx, al)
+                    for fn, al in alias_map.items():
+                        idx = fields.indexOf(fn)
+                        if idx != -1:
+                            lyr.setFieldAlias(idx, al)
 
-                        try:
-                            lyr.updateFields()
-                        except Exception as e:
-                            logger.debug(f"Error in FiberQPlugin.activate_fiber_break_tool: {e}")
-                        try:
-                            lyr.triggerRepaint()
-                        except Exception as e:
-                            logger.debug(f"Error in FiberQPlugin.activate_fiber_break_tool: {e}")
+                    try:
+                        lyr.updateFields()
                     except Exception as e:
                         logger.debug(f"Error in FiberQPlugin.activate_fiber_break_tool: {e}")
+                    try:
+                        lyr.triggerRepaint()
+                    except Exception as e:
+                        logger.debug(f"Error in FiberQPlugin.activate_fiber_break_tool: {e}")
+                except Exception as e:
+                    logger.debug(f"Error in FiberQPlugin.activate_fiber_break_tool: {e}")
 
         except Exception as e:
             # if something fails, do not crash tool - just skip style
@@ -2428,6 +2466,15 @@ class FiberQPlugin:
                 logger.debug(f"Error in FiberQPlugin._find_candidate_elements_for_cable: {e}")
         return []
 
+    def _find_candidate_elements_for_cables(self, cables, tol=5.0):
+        """Find candidate elements for many (layer, feature) cables at once."""
+        if self.relations_manager:
+            try:
+                return self.relations_manager.find_candidate_elements_for_cables(cables, tol)
+            except Exception as e:
+                logger.debug(f"Error in FiberQPlugin._find_candidate_elements_for_cables: {e}")
+        return {}
+
     def open_latent_elements_dialog(self):
         try:
             dlg = LatentElementsDialog(self)
@@ -2510,6 +2557,71 @@ class FiberQPlugin:
         except Exception as e:
             logger.debug(f"Could not disconnect schema migration slot: {e}")
 
+        # Drop cached route graphs and their layer signal connections
+        try:
+            from .utils.route_graph import clear_route_graphs
+            clear_route_graphs()
+        except Exception as e:
+            logger.debug(f"Error clearing route graphs: {e}")
+
+        # ... and the element indexes of the candidate-element search
+        try:
+            from .core.element_index import clear_element_indexes
+            clear_element_indexes()
+        except Exception as e:
+            logger.debug(f"Error clearing element indexes: {e}")
+
+        # ... and the running slack totals
+        try:
+            from .core.slack_totals import clear_slack_totals
+            clear_slack_totals()
+        except Exception as e:
+            logger.debug(f"Error clearing slack totals: {e}")
+
+        # Stop a validation task in flight; its result has nowhere to go now
+        try:
+            task = getattr(self, '_validation_task', None)
+            if task is not None:
+                task.ruleFinished.disconnect()
+                task.resultReady.disconnect()
+                task.cancel()
+        except Exception as e:
+            logger.debug(f"Error cancelling validation task: {e}")
+        self._validation_task = None
+
+        # ... and a GeoPackage export (its transaction is rolled back)
+        try:
+            if getattr(self, 'export_manager', None) is not None:
+                self.export_manager.cancel_gpkg_export()
+        except Exception as e:
+            logger.debug(f"Error cancelling GeoPackage export: {e}")
+
+        # ... and any PostGIS publish, then drop the pooled connections
+        try:
+            from .addons.publish_pg import cancel_project_publishes
+            from .core.pg_publish import close_pg_connections
+            cancel_project_publishes()
+            close_pg_connections()
+        except Exception as e:
+            logger.debug(f"Error closing PostGIS publish: {e}")
+
+        # Stop following layer edits for incremental validation
+        try:
+            validator = getattr(self, '_validator', None)
+            if validator is not None:
+                validator.disconnect()
+        except Exception as e:
+            logger.debug(f"Error disconnecting validator: {e}")
+
+        # Stop following project layers for name lookups, cached cables and lengths
+        try:
+            from .utils.measure import release_length_caches
+            release_cable_catalog()
+            release_layer_registry()
+            release_length_caches()
+        except Exception as e:
+            logger.debug(f"Error releasing layer registry: {e}")
+
         # Clear undo stacks (v1.2 — Feature 2)
         try:
             if hasattr(self, 'undo_manager') and self.undo_manager:
@@ -2619,6 +2731,7 @@ class FiberQPlugin:
         self.translator = None
         try:
             if hasattr(self, '_schematic_dlg') and self._schematic_dlg:
+                self._schematic_dlg.disconnect_layers()
                 self._schematic_dlg.close()
                 self._schematic_dlg = None
         except Exception as e:
@@ -2913,12 +3026,11 @@ class FiberQPlugin:
                 lyr.removeSelection()
 
         # AFTER deleting slack – recalculate slack for affected cables
-        if affected_cables:
-            for cable_layer_id, cable_fid in affected_cables:
-                try:
-                    self._recompute_slack_for_cable(cable_layer_id, cable_fid)
-                except Exception as e:
-                    logger.debug(f"Error in FiberQPlugin.delete_selected: {e}")
+        if affected_cables and self.slack_manager:
+            try:
+                self.slack_manager.recompute_slack_for_cables(affected_cables)
+            except Exception as e:
+                logger.debug(f"Error in FiberQPlugin.delete_selected: {e}")
 
         if obrisano == 0:
             QMessageBox.information(self.iface.mainWindow(), self.tr("Delete"),
@@ -3046,6 +3158,22 @@ class FiberQPlugin:
             except Exception as e:
                 logger.debug(f"Error in FiberQPlugin.lay_cable: {e}")
 
+    def lay_cable_batch(self):
+        """Lay cables from one selected element to all other selected elements."""
+        if self.cable_manager:
+            try:
+                self.cable_manager.lay_cable_batch(color_codes_callback=self._list_color_codes)
+            except Exception as e:
+                logger.debug(f"Error in FiberQPlugin.lay_cable_batch: {e}")
+
+    def lay_cable_batch_from_csv(self):
+        """Lay cables for the from/to element pairs listed in a CSV file."""
+        if self.cable_manager:
+            try:
+                self.cable_manager.lay_cable_batch_from_csv(color_codes_callback=self._list_color_codes)
+            except Exception as e:
+                logger.debug(f"Error in FiberQPlugin.lay_cable_batch_from_csv: {e}")
+
     def import_route_from_file(self):
         """Import routes from external file."""
         if self.route_manager:
@@ -3078,30 +3206,8 @@ class FiberQPlugin:
             return
         # Find all existing point layers relevant to plugin:
         # Poles, Manholes + all elements from Placing elements (+ Joint Closures)
-        node_layer_names = ['Poles', 'Poles', 'OKNA', 'Manholes']
-        try:
-            # Joint Closures / Nastavci
-            try:
-                nm = NASTAVAK_DEF.get("name", "Joint Closures")
-                if nm and nm not in node_layer_names:
-                    node_layer_names.append(nm)
-            except Exception:
-                if 'Nastavci' not in node_layer_names:
-                    node_layer_names.append('Nastavci')
-            # all elements from Placing elements (ELEMENT_DEFS)
-            for d in ELEMENT_DEFS:
-                nm = d.get("name")
-                if nm and nm not in node_layer_names:
-                    node_layer_names.append(nm)
-        except Exception as e:
-            logger.debug(f"Error in FiberQPlugin.import_points: {e}")
-
-        existing_layers = [
-            lyr for lyr in QgsProject.instance().mapLayers().values()
-            if isinstance(lyr, QgsVectorLayer)
-            and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry  # noqa: W503
-            and lyr.name() in node_layer_names  # noqa: W503
-        ]
+        existing_layers = get_layer_registry().by_role(
+            ROLE_POLE, ROLE_MANHOLE, ROLE_ELEMENT, geometry=QgsWkbTypes.GeometryType.PointGeometry)
         layer_names = [lyr.name() for lyr in existing_layers]
 
         # Add option for creating new layer
@@ -3469,16 +3575,11 @@ class FiberQPlugin:
 
     def check_consistency(self):
         self.popravljive_greske = []
-        layers = {
-            lyr.name(): lyr
-            for lyr in QgsProject.instance().mapLayers().values()
-            if isinstance(lyr, QgsVectorLayer)
-        }
-
         # support both Serbian and English names
-        route_layer = layers.get("Route") or layers.get("Route")
-        poles_layer = layers.get("Poles") or layers.get("Poles")
-        manholes_layer = layers.get("Manholes") or layers.get("OKNA")
+        registry = get_layer_registry()
+        route_layer = registry.layer("Route")
+        poles_layer = registry.layer("Poles")
+        manholes_layer = registry.layer("Manholes")
 
         if route_layer and (poles_layer or manholes_layer):
             pole_points = []
@@ -3527,9 +3628,7 @@ class FiberQPlugin:
         # Automatska korekcija
 
     def fix_route_to_pole(self, route_feature, must_start=True):
-        poles_layer = next((lyr for lyr in QgsProject.instance().mapLayers().values()
-                            if lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry
-                            and lyr.name() in ('Poles', 'Poles')), None)  # noqa: W503
+        poles_layer = get_layer_registry().layer("Poles", geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
         if not poles_layer:
             QMessageBox.warning(self.iface.mainWindow(), "FiberQ",
@@ -3564,13 +3663,7 @@ class FiberQPlugin:
             new_geom = QgsGeometry.fromPolylineXY(poly)
 
             # Find 'Route' layer in project (QgsFeature doesn't have .layer())
-            route_layer = next(
-                (lyr for lyr in QgsProject.instance().mapLayers().values()
-                 if isinstance(lyr, QgsVectorLayer)
-                 and lyr.name() in ('Route', 'Route')  # noqa: W503
-                 and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry),  # noqa: W503
-                None
-            )
+            route_layer = get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
             if not route_layer:
                 QMessageBox.warning(self.iface.mainWindow(), "FiberQ",
                                     self.tr("Route layer 'Route' not found!"))
@@ -34,6 +34,10 @@ from qgis.gui import (
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
+from ..core.layer_registry import (  # noqa: E402
+    ROLE_CABLE, ROLE_ELEMENT, ROLE_MANHOLE, ROLE_POLE, get_layer_registry,
+)
+
 # Plugin imports - these need to be imported when the tool is instantiated
 # to avoid circular imports
 
@@ -62,76 +66,23 @@ def get_route_type_options():
 
 def find_route_layer():
     """Find the Route layer in the project."""
-    for lyr in QgsProject.instance().mapLayers().values():
-        try:
-            if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry and  # noqa: W504
-                    lyr.name() in ('Route', 'Trasa')):
-                return lyr
-        except Exception as e:
-            logger.debug(f"Error in find_route_layer: {e}")
-    return None
+    return get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
 
 def find_cable_layers():
     """Find all cable layers in the project."""
-    cable_names = {
-        'Kablovi_podzemni', 'Kablovi_vazdusni',
-        'Underground cables', 'Aerial cables'
-    }
-    layers = []
-    for lyr in QgsProject.instance().mapLayers().values():
-        try:
-            if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry and  # noqa: W504
-                    lyr.name() in cable_names):
-                layers.append(lyr)
-        except Exception as e:
-            logger.debug(f"Error in find_cable_layers: {e}")
-    return layers
+    return get_layer_registry().by_role(ROLE_CABLE, geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
 
 def find_node_layers():
     """Find pole and manhole layers in the project."""
-    node_names = {'Poles', 'Stubovi', 'OKNA', 'Manholes'}
-    layers = []
-    for lyr in QgsProject.instance().mapLayers().values():
-        try:
-            if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                    lyr.name() in node_names):
-                layers.append(lyr)
-        except Exception as e:
-            logger.debug(f"Error in find_node_layers: {e}")
-    return layers
+    return get_layer_registry().by_role(ROLE_POLE, ROLE_MANHOLE,
+                                        geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
 
 def find_element_layers():
     """Find all element layers (ODF, OTB, TB, etc.) in the project."""
-    try:
-        element_defs = get_element_defs()
-        element_names = {d.get('name') for d in element_defs if d.get('name')}
-    except Exception:
-        element_names = set()
-
-    # Add joint closure
-    try:
-        jc_def = get_joint_closure_def()
-        element_names.add(jc_def.get('name', 'Joint Closures'))
-        element_names.add('Nastavci')  # Legacy name
-    except Exception as e:
-        logger.debug(f"Error in find_element_layers: {e}")
-
-    layers = []
-    for lyr in QgsProject.instance().mapLayers().values():
-        try:
-            if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                    lyr.name() in element_names):
-                layers.append(lyr)
-        except Exception as e:
-            logger.debug(f"Error in find_element_layers: {e}")
-    return layers
+    return get_layer_registry().by_role(ROLE_ELEMENT, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
 
 def get_snap_layers():
@@ -384,6 +335,9 @@ __all__ = [
     'find_element_layers', 'get_snap_layers',
     'snap_to_point_layers', 'snap_to_line_layer', 'snap_to_line_vertices',
 
+    # Layer registry
+    'get_layer_registry', 'ROLE_CABLE', 'ROLE_ELEMENT', 'ROLE_MANHOLE', 'ROLE_POLE',
+
     # Base classes
     'FiberQMapTool', 'FiberQMapToolEmitPoint',
 ]
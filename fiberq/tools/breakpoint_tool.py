@@ -6,9 +6,10 @@ Tool for splitting routes at a click point.
 
 from .base import (
     Qt, QColor, QMessageBox,
-    QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry,
+    QgsFeature, QgsGeometry,
     QgsPointXY, QgsWkbTypes, QgsRubberBand,
-    QgsMapToolEmitPoint
+    QgsMapToolEmitPoint,
+    get_layer_registry,
 )
 
 # Phase 5.2: Logging
@@ -42,12 +43,7 @@ class BreakpointTool(QgsMapToolEmitPoint):
 
     def _find_route_layer(self):
         """Find the Route layer in the project."""
-        for lyr in QgsProject.instance().mapLayers().values():
-            if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                lyr.name() in ('Route', 'Trasa') and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry):
-                return lyr
-        return None
+        return get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
     def canvasMoveEvent(self, event):
         """Update snap indicator as mouse moves."""
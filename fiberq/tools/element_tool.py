@@ -17,6 +17,10 @@ from qgis.core import (
 )
 from qgis.gui import QgsMapToolEmitPoint, QgsVertexMarker, QgsMapToolIdentify
 
+from ..core.layer_registry import (
+    ROLE_CABLE, ROLE_MANHOLE, ROLE_POLE, ROLE_ROUTE, get_layer_registry,
+)
+
 # Import from legacy bridge for compatibility
 from ..utils.legacy_bridge import (
     ELEMENT_DEFS,
@@ -85,21 +89,9 @@ class PlaceElementTool(QgsMapToolEmitPoint):
         """Snap to lines (Cables/Route) OR to nodes (Poles/Manholes)."""
         point = self.toMapCoordinates(event.pos())
 
-        line_layers = []
-        node_layers = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry and lyr.name() in (
-                    "Kablovi_podzemni", "Kablovi_vazdusni", "Underground cables",
-                    "Aerial cables", "Route", "Route"
-                ):
-                    line_layers.append(lyr)
-                if lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and lyr.name() in (
-                    "Poles", "Poles", "OKNA", "Manholes"
-                ):
-                    node_layers.append(lyr)
-            except Exception as e:
-                logger.debug(f"Error in PlaceElementTool.canvasMoveEvent: {e}")
+        registry = get_layer_registry()
+        line_layers = registry.by_role(ROLE_CABLE, ROLE_ROUTE, geometry=QgsWkbTypes.GeometryType.LineGeometry)
+        node_layers = registry.by_role(ROLE_POLE, ROLE_MANHOLE, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
         min_dist = None
         snapped_point = None
@@ -162,14 +154,8 @@ class PlaceElementTool(QgsMapToolEmitPoint):
             final_point = self.toMapCoordinates(event.pos())
 
         # Pre-placement dialog (dynamic attributes)
-        existing_layer = None
-        try:
-            for lyr in QgsProject.instance().mapLayers().values():
-                if isinstance(lyr, QgsVectorLayer) and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and lyr.name() == self.target_layer_name:
-                    existing_layer = lyr
-                    break
-        except Exception:
-            existing_layer = None
+        existing_layer = get_layer_registry().layer(
+            self.target_layer_name, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
         # If target is 'Prekid', automatically set name without dialog
         if 'prekid' in self.target_layer_name.lower():
@@ -190,11 +176,8 @@ class PlaceElementTool(QgsMapToolEmitPoint):
             return
 
         # Find or create layer
-        elem_layer = None
-        for lyr in QgsProject.instance().mapLayers().values():
-            if isinstance(lyr, QgsVectorLayer) and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and lyr.name() == self.target_layer_name:
-                elem_layer = lyr
-                break
+        elem_layer = get_layer_registry().layer(
+            self.target_layer_name, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
         if elem_layer is None:
             crs = self.canvas.mapSettings().destinationCrs().authid()
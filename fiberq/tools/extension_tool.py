@@ -18,6 +18,8 @@ from qgis.core import (
 )
 from qgis.gui import QgsMapToolEmitPoint, QgsVertexMarker
 
+from ..core.layer_registry import get_layer_registry
+
 # Import from legacy bridge for compatibility
 from ..utils.legacy_bridge import (
     NASTAVAK_DEF,
@@ -187,26 +189,16 @@ class ExtensionTool(QgsMapToolEmitPoint):
             return
 
         # Find existing Joint Closures layer (supports old name "Nastavci")
-        nastavak_layer = None
-        target_names = {
-            NASTAVAK_DEF.get("name", "Joint Closures"),
-            "Nastavci",
-        }
-        for lyr in QgsProject.instance().mapLayers().values():
-            if (
-                isinstance(lyr, QgsVectorLayer)
-                and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry  # noqa: W503
-                and lyr.name() in target_names  # noqa: W503
-            ):
-                nastavak_layer = lyr
-                self._apply_joint_closure_aliases(nastavak_layer)
-                # Phase 0.1: Ensure UUID field exists
-                try:
-                    from ..utils.uuid_utils import ensure_uuid_field
-                    ensure_uuid_field(nastavak_layer)
-                except Exception as e:
-                    logger.debug(f"Could not ensure UUID field on joint closure layer: {e}")
-                break
+        nastavak_layer = get_layer_registry().layer(
+            NASTAVAK_DEF.get("name", "Joint Closures"), geometry=QgsWkbTypes.GeometryType.PointGeometry)
+        if nastavak_layer is not None:
+            self._apply_joint_closure_aliases(nastavak_layer)
+            # Phase 0.1: Ensure UUID field exists
+            try:
+                from ..utils.uuid_utils import ensure_uuid_field
+                ensure_uuid_field(nastavak_layer)
+            except Exception as e:
+                logger.debug(f"Could not ensure UUID field on joint closure layer: {e}")
 
         # 2) If doesn't exist – create new
         if nastavak_layer is None:
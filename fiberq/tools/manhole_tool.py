@@ -9,9 +9,10 @@ import re
 
 from .base import (
     Qt,
-    QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry,
+    QgsFeature, QgsGeometry,
     QgsPointXY, QgsWkbTypes,
-    QgsMapToolEmitPoint
+    QgsMapToolEmitPoint,
+    get_layer_registry,
 )
 
 # Phase 5.2: Logging
@@ -182,27 +183,11 @@ class ManholePlaceTool(QgsMapToolEmitPoint):
 
     def _find_manhole_layer(self):
         """Find the Manholes layer in the project."""
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.name() in ('Manholes', 'OKNA') and  # noqa: W504
-                        lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry):
-                    return lyr
-            except Exception as e:
-                logger.debug(f"Error in ManholePlaceTool._find_manhole_layer: {e}")
-        return None
+        return get_layer_registry().layer("Manholes", geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
     def _find_route_layer(self):
         """Find the Route layer in the project."""
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.name() in ('Route', 'Trasa') and  # noqa: W504
-                        lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry):
-                    return lyr
-            except Exception as e:
-                logger.debug(f"Error in ManholePlaceTool._find_route_layer: {e}")
-        return None
+        return get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
     def _snap_to_route(self, point):
         """
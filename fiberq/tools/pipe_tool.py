@@ -8,9 +8,10 @@ Phase 5.2: Added logging infrastructure
 
 from .base import (
     Qt, QVariant, QColor,
-    QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry,
+    QgsFeature, QgsGeometry,
     QgsPointXY, QgsField, QgsWkbTypes, QgsRubberBand,
-    QgsMapTool, QgsVertexMarker
+    QgsMapTool, QgsVertexMarker,
+    ROLE_MANHOLE, ROLE_POLE, get_layer_registry,
 )
 
 # Phase 5.2: Logging
@@ -89,57 +90,50 @@ class PipePlaceTool(QgsMapTool):
         min_dist = None
 
         # 1) Snap to node layers (poles, manholes)
-        node_names = {"Poles", "Stubovi", "OKNA", "Manholes"}
-        for lyr in QgsProject.instance().mapLayers().values():
+        registry = get_layer_registry()
+        for lyr in registry.by_role(ROLE_POLE, ROLE_MANHOLE, geometry=QgsWkbTypes.GeometryType.PointGeometry):
             try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                        lyr.name() in node_names):
-                    for f in lyr.getFeatures():
-                        p = f.geometry().asPoint()
-                        d = QgsPointXY(point).distance(QgsPointXY(p))
-                        if min_dist is None or d < min_dist:
-                            min_dist = d
-                            snap_point = QgsPointXY(p)
+                for f in lyr.getFeatures():
+                    p = f.geometry().asPoint()
+                    d = QgsPointXY(point).distance(QgsPointXY(p))
+                    if min_dist is None or d < min_dist:
+                        min_dist = d
+                        snap_point = QgsPointXY(p)
             except Exception as e:
                 logger.debug(f"Error in PipePlaceTool._snap_point: {e}")
 
         # 2) Snap to route vertices and segment midpoints
-        for lyr in QgsProject.instance().mapLayers().values():
+        for lyr in registry.layers("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry):
             try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.name() in ('Route', 'Trasa') and  # noqa: W504
-                        lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry):
-
-                    for g in lyr.getFeatures():
-                        geom = g.geometry()
-                        if geom.isMultipart():
-                            lines = geom.asMultiPolyline()
-                        else:
-                            line = geom.asPolyline()
-                            lines = [line] if line else []
-
-                        for line in lines:
-                            if not line:
-                                continue
-
-                            # Vertices
-                            for p in line:
-                                d = QgsPointXY(point).distance(QgsPointXY(p))
-                                if min_dist is None or d < min_dist:
-                                    min_dist = d
-                                    snap_point = QgsPointXY(p)
-
-                            # Segment midpoints
-                            for i in range(len(line) - 1):
-                                mid = QgsPointXY(
-                                    (line[i].x() + line[i + 1].x()) / 2,
-                                    (line[i].y() + line[i + 1].y()) / 2
-                                )
-                                d = QgsPointXY(point).distance(mid)
-                                if min_dist is None or d < min_dist:
-                                    min_dist = d
-                                    snap_point = mid
+                for g in lyr.getFeatures():
+                    geom = g.geometry()
+                    if geom.isMultipart():
+                        lines = geom.asMultiPolyline()
+                    else:
+                        line = geom.asPolyline()
+                        lines = [line] if line else []
+
+                    for line in lines:
+                        if not line:
+                            continue
+
+                        # Vertices
+                        for p in line:
+                            d = QgsPointXY(point).distance(QgsPointXY(p))
+                            if min_dist is None or d < min_dist:
+                                min_dist = d
+                                snap_point = QgsPointXY(p)
+
+                        # Segment midpoints
+                        for i in range(len(line) - 1):
+                            mid = QgsPointXY(
+                                (line[i].x() + line[i + 1].x()) / 2,
+                                (line[i].y() + line[i + 1].y()) / 2
+                            )
+                            d = QgsPointXY(point).distance(mid)
+                            if min_dist is None or d < min_dist:
+                                min_dist = d
+                                snap_point = mid
             except Exception as e:
                 logger.debug(f"Error in PipePlaceTool._snap_point: {e}")
 
@@ -206,15 +200,7 @@ class PipePlaceTool(QgsMapTool):
 
     def _find_route_layer(self):
         """Find the Route layer in the project."""
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.name() in ('Route', 'Trasa') and  # noqa: W504
-                        lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry):
-                    return lyr
-            except Exception as e:
-                logger.debug(f"Error in PipePlaceTool._find_route_layer: {e}")
-        return None
+        return get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
     def _get_display_name(self, layer, feat):
         """Get a display name for a node feature."""
@@ -309,16 +295,8 @@ class PipePlaceTool(QgsMapTool):
         f['duzina_m'] = ground_length(geom, layer)
 
         # Find FROM/TO names
-        node_names = {"Poles", "Stubovi", "OKNA", "Manholes"}
-        node_layers = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                        lyr.name() in node_names):
-                    node_layers.append(lyr)
-            except Exception as e:
-                logger.debug(f"Error in PipePlaceTool._finish: {e}")
+        node_layers = get_layer_registry().by_role(
+            ROLE_POLE, ROLE_MANHOLE, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
         od_naziv = self._find_nearest_name(p1, node_layers)
         do_naziv = self._find_nearest_name(p2, node_layers)
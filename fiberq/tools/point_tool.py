@@ -11,11 +11,13 @@ from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QColor
 from qgis.PyQt.QtWidgets import QMessageBox
 from qgis.core import (
-    QgsProject, QgsFeature, QgsGeometry, QgsPointXY,
+    QgsFeature, QgsGeometry, QgsPointXY,
     QgsWkbTypes, QgsSettings
 )
 from qgis.gui import QgsMapToolEmitPoint, QgsVertexMarker
 
+from ..core.layer_registry import get_layer_registry
+
 # Phase 5.2: Logging
 from ..utils.logger import get_logger
 logger = get_logger(__name__)
@@ -37,11 +39,7 @@ class PointTool(QgsMapToolEmitPoint):
 
     def _snap_candidate(self, point):
         """Find snap candidate on route layer vertices and midpoints."""
-        route_layer = None
-        for lyr in QgsProject.instance().mapLayers().values():
-            if lyr.name() in ('Route', 'Route') and lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry:
-                route_layer = lyr
-                break
+        route_layer = get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
         snap_point = None
         min_dist = None
@@ -9,7 +9,8 @@ from .base import (
     QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry,
     QgsPointXY, QgsField, QgsWkbTypes, QgsRubberBand,
     QgsMapTool,
-    get_element_defs, get_joint_closure_def, get_route_type_options
+    ROLE_ELEMENT, ROLE_MANHOLE, ROLE_POLE,
+    get_layer_registry, get_route_type_options,
 )
 
 # Phase 5.2: Logging
@@ -47,30 +48,10 @@ class ManualRouteTool(QgsMapTool):
         self.snap_rubber.setColor(QColor(255, 0, 0, 180))
         self.snap_rubber.setWidth(12)
 
-    def _get_snap_layer_names(self):
-        """Get names of layers to snap to."""
-        names = ['Poles', 'Stubovi', 'OKNA', 'Manholes']
-
-        # Add joint closure layer
-        try:
-            jc_def = get_joint_closure_def()
-            nm = jc_def.get('name', 'Joint Closures')
-            if nm and nm not in names:
-                names.append(nm)
-        except Exception:
-            if 'Nastavci' not in names:
-                names.append('Nastavci')
-
-        # Add element layers
-        try:
-            for d in get_element_defs():
-                nm = d.get('name')
-                if nm and nm not in names:
-                    names.append(nm)
-        except Exception as e:
-            logger.debug(f"Error in ManualRouteTool._get_snap_layer_names: {e}")
-
-        return names
+    def _get_snap_layers(self):
+        """Poles, manholes, joint closures and element layers to snap to."""
+        return get_layer_registry().by_role(
+            ROLE_POLE, ROLE_MANHOLE, ROLE_ELEMENT, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
     def _find_snap_point(self, point):
         """
@@ -86,16 +67,7 @@ class ManualRouteTool(QgsMapTool):
         snap_point = None
 
         # Get node layers to snap to
-        node_layer_names = self._get_snap_layer_names()
-        node_layers = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                        lyr.name() in node_layer_names):
-                    node_layers.append(lyr)
-            except Exception as e:
-                logger.debug(f"Error in ManualRouteTool._find_snap_point: {e}")
+        node_layers = self._get_snap_layers()
 
         # Snap to node layers
         for nl in node_layers:
@@ -115,43 +87,39 @@ class ManualRouteTool(QgsMapTool):
 
         # Snap to existing routes (vertices and segment midpoints)
         try:
-            for lyr in QgsProject.instance().mapLayers().values():
+            for lyr in get_layer_registry().layers("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry):
                 try:
-                    if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                        lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry and  # noqa: W504
-                            lyr.name() in ('Route', 'Trasa')):
-
-                        for feat in lyr.getFeatures():
-                            geom = feat.geometry()
-                            if not geom or geom.isEmpty():
+                    for feat in lyr.getFeatures():
+                        geom = feat.geometry()
+                        if not geom or geom.isEmpty():
+                            continue
+
+                        if geom.isMultipart():
+                            lines = geom.asMultiPolyline()
+                        else:
+                            lines = [geom.asPolyline()]
+
+                        for line in lines:
+                            if not line:
                                 continue
 
-                            if geom.isMultipart():
-                                lines = geom.asMultiPolyline()
-                            else:
-                                lines = [geom.asPolyline()]
-
-                            for line in lines:
-                                if not line:
-                                    continue
-
-                                # All vertices
-                                for pt in line:
-                                    d = QgsPointXY(point).distance(QgsPointXY(pt))
-                                    if min_dist is None or d < min_dist:
-                                        min_dist = d
-                                        snap_point = QgsPointXY(pt)
-
-                                # Segment midpoints
-                                for i in range(len(line) - 1):
-                                    mid = QgsPointXY(
-                                        (line[i].x() + line[i + 1].x()) / 2.0,
-                                        (line[i].y() + line[i + 1].y()) / 2.0
-                                    )
-                                    d = QgsPointXY(point).distance(mid)
-                                    if min_dist is None or d < min_dist:
-                                        min_dist = d
-                                        snap_point = mid
+                            # All vertices
+                            for pt in line:
+                                d = QgsPointXY(point).distance(QgsPointXY(pt))
+                                if min_dist is None or d < min_dist:
+                                    min_dist = d
+                                    snap_point = QgsPointXY(pt)
+
+                            # Segment midpoints
+                            for i in range(len(line) - 1):
+                                mid = QgsPointXY(
+                                    (line[i].x() + line[i + 1].x()) / 2.0,
+                                    (line[i].y() + line[i + 1].y()) / 2.0
+                                )
+                                d = QgsPointXY(point).distance(mid)
+                                if min_dist is None or d < min_dist:
+                                    min_dist = d
+                                    snap_point = mid
                 except Exception as e:
                     logger.debug(f"Error in ManualRouteTool._find_snap_point: {e}")
         except Exception as e:
@@ -218,13 +186,7 @@ class ManualRouteTool(QgsMapTool):
             return
 
         # Find or create Route layer
-        route_layer = None
-        for lyr in QgsProject.instance().mapLayers().values():
-            if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                lyr.name() in ('Route', 'Trasa') and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry):
-                route_layer = lyr
-                break
+        route_layer = get_layer_registry().layer("Route", geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
         if route_layer is None:
             crs = self.iface.mapCanvas().mapSettings().destinationCrs().authid()
@@ -10,13 +10,15 @@ from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QColor
 
 from qgis.core import (
-    QgsProject, QgsVectorLayer, QgsGeometry,
+    QgsGeometry,
     QgsPointXY, QgsWkbTypes, QgsRectangle, QgsFeatureRequest
 )
 from qgis.gui import QgsMapTool, QgsVertexMarker
 
-# Import from legacy bridge for compatibility
-from ..utils.legacy_bridge import ELEMENT_DEFS, NASTAVAK_DEF
+from ..core.layer_registry import (
+    ROLE_AREA, ROLE_CABLE, ROLE_ELEMENT, ROLE_MANHOLE, ROLE_PIPE, ROLE_POLE, ROLE_ROUTE,
+    get_layer_registry,
+)
 
 # Phase 5.2: Logging
 from ..utils.logger import get_logger
@@ -58,33 +60,17 @@ class SmartMultiSelectTool(QgsMapTool):
         100 - other
         """
         try:
-            name = (lyr.name() or "").lower()
+            role = get_layer_registry().role(lyr)
             gtype = lyr.geometryType()
         except Exception:
             return 100
 
         # 1) elements + joint closures (highest priority)
-        element_names = set()
-        try:
-            try:
-                element_names.add(NASTAVAK_DEF.get('name', 'Nastavci').lower())
-            except Exception:
-                element_names.add('nastavci')
-            try:
-                for d in ELEMENT_DEFS:
-                    nm = d.get('name')
-                    if nm:
-                        element_names.add(nm.lower())
-            except Exception as e:
-                logger.debug(f"Error in SmartMultiSelectTool._layer_priority: {e}")
-        except Exception as e:
-            logger.debug(f"Error in SmartMultiSelectTool._layer_priority: {e}")
-
-        if name in element_names:
+        if role == ROLE_ELEMENT:
             return 0
 
         # 2) poles / manholes
-        if name in ("stubovi", "poles", "okna", "manholes"):
+        if role in (ROLE_POLE, ROLE_MANHOLE):
             return 10
 
         # 3) lines: route, cables, pipes
@@ -244,86 +230,16 @@ class SmartMultiSelectTool(QgsMapTool):
         - 'Objekti' / 'Objects'
         - 'Rejon' / 'Service Area'
         """
-        try:
-            # --- POINT layers: elements + poles/manholes ---
-            valid_point_names = set()
-
-            # 1) Joint Closure
-            try:
-                valid_point_names.add(NASTAVAK_DEF.get('name', 'Nastavci'))
-            except Exception:
-                valid_point_names.add('Nastavci')
-
-            # 2) All elements from ELEMENT_DEFS
-            try:
-                for d in ELEMENT_DEFS:
-                    nm = d.get('name')
-                    if nm:
-                        valid_point_names.add(nm)
-            except Exception as e:
-                logger.debug(f"Error in SmartMultiSelectTool._candidate_layers: {e}")
-
-            # 3) Poles and Manholes
-            valid_point_names.update(['Poles', 'Stubovi', 'OKNA', 'Manholes'])
-
-            # --- LINE layers: route + pipes ---
-            valid_line_names = {
-                'Route', 'Trasa',
-                'PE cevi', 'PE pipes',
-                'Prelazne cevi', 'Transition pipes',
-                'Kablovi_podzemni', 'Underground cables',
-                'Kablovi_vazdusni', 'Aerial cables',
-            }
-
-            # --- POLYGON layers: objects + regions ---
-            valid_poly_names = {
-                'Objekti', 'Objects',
-                'Rejon', 'Service Area', 'Service area',
-            }
-
-            low_point = {n.lower() for n in valid_point_names}
-            low_line = {n.lower() for n in valid_line_names}
-            low_poly = {n.lower() for n in valid_poly_names}
-
-            layers = []
-
-            for lyr in QgsProject.instance().mapLayers().values():
-                try:
-                    if not isinstance(lyr, QgsVectorLayer) or not lyr.isValid():
-                        continue
-
-                    name = (lyr.name() or "")
-                    lname = name.lower()
-                    gtype = lyr.geometryType()
-
-                    if gtype == QgsWkbTypes.GeometryType.PointGeometry:
-                        if name in valid_point_names or lname in low_point:
-                            layers.append(lyr)
-                    elif gtype == QgsWkbTypes.GeometryType.LineGeometry:
-                        if name in valid_line_names or lname in low_line:
-                            layers.append(lyr)
-                    elif gtype == QgsWkbTypes.GeometryType.PolygonGeometry:
-                        if name in valid_poly_names or lname in low_poly:
-                            layers.append(lyr)
-                except Exception as e:
-                    logger.debug(f"Skipping layer during smart-select classification: {e}")
-                    continue
-
-            return layers
-
-        except Exception as e:
-            # Fallback – if something fails, keep old behavior (only some point layers)
-            import re as _re
-            logger.debug(f"Smart layer detection failed, using fallback: {e}")
-            layers = []
-            for lyr in QgsProject.instance().mapLayers().values():
-                try:
-                    if isinstance(lyr, QgsVectorLayer) and lyr.isValid() and lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry:
-                        if _re.search(r"(nastav|stub|okno|zok|patch|ormar|panel|izvod|or)", (lyr.name() or "").lower()):
-                            layers.append(lyr)
-                except Exception as e2:
-                    logger.debug(f"Error checking layer validity: {e2}")
-            return layers
+        registry = get_layer_registry()
+        layers = (
+            registry.by_role(ROLE_ELEMENT, ROLE_POLE, ROLE_MANHOLE,
+                             geometry=QgsWkbTypes.GeometryType.PointGeometry)
+            + registry.by_role(ROLE_ROUTE, ROLE_PIPE, ROLE_CABLE,  # noqa: W503
+                               geometry=QgsWkbTypes.GeometryType.LineGeometry)
+            + registry.by_role(ROLE_AREA, geometry=QgsWkbTypes.GeometryType.PolygonGeometry)  # noqa: W503
+        )
+        layers.sort(key=lambda lyr: lyr.id())
+        return [lyr for lyr in layers if lyr.isValid()]
 
 
 __all__ = ['SmartMultiSelectTool']
@@ -6,9 +6,10 @@ Tool for placing optical slack (reserve) points on cables.
 
 from .base import (
     Qt, QColor, QMessageBox,
-    QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry,
+    QgsFeature, QgsGeometry,
     QgsPointXY, QgsWkbTypes,
-    QgsMapTool, QgsVertexMarker
+    QgsMapTool, QgsVertexMarker,
+    ROLE_CABLE, ROLE_MANHOLE, ROLE_POLE, get_layer_registry,
 )
 
 # Phase 5.2: Logging
@@ -56,30 +57,12 @@ class SlackPlaceTool(QgsMapTool):
 
     def _iter_cable_layers(self):
         """Iterate over all cable layers in the project."""
-        cable_names = {
-            "Kablovi_podzemni", "Kablovi_vazdusni",
-            "Underground cables", "Aerial cables"
-        }
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.LineGeometry and  # noqa: W504
-                        lyr.name() in cable_names):
-                    yield lyr
-            except Exception as e:
-                logger.debug(f"Error in SlackPlaceTool._iter_cable_layers: {e}")
+        yield from get_layer_registry().by_role(ROLE_CABLE, geometry=QgsWkbTypes.GeometryType.LineGeometry)
 
     def _iter_node_layers(self):
         """Iterate over pole and manhole layers."""
-        node_names = {"Poles", "Stubovi", "OKNA", "Manholes"}
-        for lyr in QgsProject.instance().mapLayers().values():
-            try:
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                        lyr.name() in node_names):
-                    yield lyr
-            except Exception as e:
-                logger.debug(f"Error in SlackPlaceTool._iter_node_layers: {e}")
+        yield from get_layer_registry().by_role(
+            ROLE_POLE, ROLE_MANHOLE, geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
     def _nearest_node(self, pt):
         """
@@ -210,12 +193,7 @@ class SlackPlaceTool(QgsMapTool):
 
         if vl is None:
             # Fallback: find existing slack layer
-            for lyr in QgsProject.instance().mapLayers().values():
-                if (isinstance(lyr, QgsVectorLayer) and  # noqa: W504
-                    lyr.geometryType() == QgsWkbTypes.GeometryType.PointGeometry and  # noqa: W504
-                        lyr.name() in ("Opticke_rezerve", "Optical slacks", "Optical slack")):
-                    vl = lyr
-                    break
+            vl = get_layer_registry().layer("Optical slack", geometry=QgsWkbTypes.GeometryType.PointGeometry)
 
             if vl is None:
                 QMessageBox.warning(
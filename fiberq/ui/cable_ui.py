@@ -97,6 +97,19 @@ class CableLayingUI:
         # Add submenus to main menu
         self.menu_kabl.addMenu(self.menu_kabl_podzemni)
         self.menu_kabl.addMenu(self.menu_kabl_vazdusni)
+        self.menu_kabl.addSeparator()
+
+        #: Menu entry under "Cable laying". Lays one cable from a chosen source element
+        #: (e.g. an ODF or OTB) to every other selected element, in one step.
+        act_batch = QAction(self.tr("Batch from selection..."), core.iface.mainWindow())
+        act_batch.triggered.connect(core.lay_cable_batch)
+        self.menu_kabl.addAction(act_batch)
+
+        #: Menu entry under "Cable laying". Lays one cable per from/to row of a CSV file
+        #: naming the two elements. "CSV" is a file format - do not translate.
+        act_batch_csv = QAction(self.tr("Batch from CSV..."), core.iface.mainWindow())
+        act_batch_csv.triggered.connect(core.lay_cable_batch_from_csv)
+        self.menu_kabl.addAction(act_batch_csv)
 
         # Toolbar button
         self.btn_kabl = QToolButton()
@@ -2,6 +2,7 @@
 
 A dockable list of :class:`~fiberq.core.validation_manager.ValidationIssue`, with
 severity/layer/rule filters, live counts, a Re-run button and click-to-zoom.
+While a run is in flight it fills up rule by rule and offers a Cancel button.
 
 This is the first QDockWidget in the plugin, so it sets the pattern: the widget
 owns no validation logic and never touches QgsProject. It renders a
@@ -84,6 +85,8 @@ class ValidationPanel(QDockWidget):
     issueActivated = pyqtSignal(object)
     #: The user asked to export the current result.
     exportRequested = pyqtSignal()
+    #: The user asked to stop the run in flight.
+    cancelRequested = pyqtSignal()
 
     def tr(self, message, disambiguation=None, n=-1):
         """Context must stay equal to the class name (pylupdate6 keys on it)."""
@@ -97,6 +100,8 @@ class ValidationPanel(QDockWidget):
 
         self._issues = []
         self._result = None
+        self._progress = None  # (rules done, rules in the run) while running
+        self._cancelled = False
 
         body = QWidget(self)
         outer = QVBoxLayout(body)
@@ -114,6 +119,12 @@ class ValidationPanel(QDockWidget):
         self.btn_rerun.clicked.connect(self.rerunRequested)
         top.addWidget(self.btn_rerun, 0)
 
+        self.btn_cancel = QPushButton(self.tr('Cancel'), body)
+        self.btn_cancel.setToolTip(self.tr('Stop the validation in progress'))
+        self.btn_cancel.clicked.connect(self.cancelRequested)
+        self.btn_cancel.setVisible(False)
+        top.addWidget(self.btn_cancel, 0)
+
         self.btn_export = QPushButton(self.tr('Export report…'), body)
         self.btn_export.setToolTip(self.tr('Save the results as a report'))
         self.btn_export.clicked.connect(self.exportRequested)
@@ -172,6 +183,8 @@ class ValidationPanel(QDockWidget):
     def set_result(self, result):
         """Render a :class:`ValidationResult` (or ``None`` to clear)."""
         self._result = result
+        self._progress = None
+        self._cancelled = False
         self._issues = list(result.sorted_issues()) if result else []
         self.btn_export.setEnabled(bool(result))
         self._reset_filters()
@@ -190,9 +203,44 @@ class ValidationPanel(QDockWidget):
     def set_busy(self, busy: bool):
         """Disable the controls while a run is in flight."""
         self.btn_rerun.setEnabled(not busy)
+        self.btn_cancel.setVisible(busy)
+        self.btn_cancel.setEnabled(busy)
         if busy:
             self.lbl_summary.setText(self.tr('Validating…'))
 
+    def start_run(self, total_rules: int):
+        """A run of ``total_rules`` rules has started: clear the list and fill it
+        from :meth:`add_issues` as rules complete."""
+        self.set_result(None)
+        self._progress = (0, total_rules)
+        self.set_busy(True)
+        self._update_summary()
+
+    def add_issues(self, rule_id, issues):
+        """One rule of the run in flight completed; ``issues`` is None if it
+        failed. The rows join the list straight away; :meth:`set_result` puts the
+        final result in place when the run is over."""
+        if self._progress is None:
+            return
+        done, total = self._progress
+        self._progress = (done + 1, total)
+        if issues:
+            self.tree.setSortingEnabled(False)
+            for issue in issues:
+                self._issues.append(issue)
+                self.tree.addTopLevelItem(self._make_item(issue))
+            self.tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+            self.tree.setSortingEnabled(True)
+        self._apply_filters()
+
+    def set_cancelled(self):
+        """The run was stopped: drop its partial rows, which would read as a
+        complete result, and say so."""
+        self.set_result(None)
+        self._cancelled = True
+        self.set_busy(False)
+        self._update_summary()
+
     # -- internals ----------------------------------------------------------
 
     def _severity_label(self, severity) -> str:
@@ -223,25 +271,28 @@ class ValidationPanel(QDockWidget):
         for combo in (self.cb_severity, self.cb_layer, self.cb_rule):
             combo.blockSignals(False)
 
+    def _make_item(self, issue):
+        item = _IssueItem([
+            self._severity_label(issue.severity),
+            issue.rule_id,
+            issue.layer_name,
+            str(issue.feature_id) if issue.feature_id >= 0 else '',
+            issue.message,
+        ])
+        colour = _SEVERITY_COLOUR.get(issue.severity)
+        if colour is not None:
+            item.setForeground(0, QBrush(colour))
+        item.setData(0, _ROLE_RANK, SEVERITY_ORDER.get(issue.severity, 9))
+        item.setData(0, _ROLE_ISSUE, issue)
+        if issue.fix_hint:
+            item.setToolTip(4, issue.fix_hint)
+        return item
+
     def _populate(self):
         self.tree.setSortingEnabled(False)
         self.tree.clear()
         for issue in self._issues:
-            item = _IssueItem([
-                self._severity_label(issue.severity),
-                issue.rule_id,
-                issue.layer_name,
-                str(issue.feature_id) if issue.feature_id >= 0 else '',
-                issue.message,
-            ])
-            colour = _SEVERITY_COLOUR.get(issue.severity)
-            if colour is not None:
-                item.setForeground(0, QBrush(colour))
-            item.setData(0, _ROLE_RANK, SEVERITY_ORDER.get(issue.severity, 9))
-            item.setData(0, _ROLE_ISSUE, issue)
-            if issue.fix_hint:
-                item.setToolTip(4, issue.fix_hint)
-            self.tree.addTopLevelItem(item)
+            self.tree.addTopLevelItem(self._make_item(issue))
         # Sort by severity rank ascending, i.e. errors first, before handing
         # sorting back to the user.
         self.tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
@@ -269,6 +320,17 @@ class ValidationPanel(QDockWidget):
         self._update_summary(shown)
 
     def _update_summary(self, shown=None):
+        self.lbl_summary.setToolTip(self._cost_tooltip())
+        if self._progress is not None:
+            done, total = self._progress
+            src = QT_TRANSLATE_NOOP(
+                'ValidationPanel', 'Validating… {done} of {total} rules, {issues} issues so far')
+            self.lbl_summary.setText(safe_format(
+                self.tr(src), src, done=done, total=total, issues=len(self._issues)))
+            return
+        if self._cancelled:
+            self.lbl_summary.setText(self.tr('Validation cancelled.'))
+            return
         if self._result is None:
             self.lbl_summary.setText(self.tr('No validation run yet.'))
             return
@@ -300,6 +362,23 @@ class ValidationPanel(QDockWidget):
                                    '', len(self._result.rule_errors))
         self.lbl_summary.setText(text)
 
+    def _cost_tooltip(self) -> str:
+        """The slowest rules and the cache build times of the rendered result,
+        or an empty string (no tooltip) while there is nothing finished to show."""
+        if self._progress is not None or self._result is None or not self._result.rule_costs:
+            return ''
+        src = QT_TRANSLATE_NOOP(
+            'ValidationPanel', '{rule}: {seconds:.2f} s, {features} features, {queries} index queries')
+        lines = [self.tr('Slowest rules:')]
+        for rule_id, cost in self._result.slowest_rules():
+            lines.append(safe_format(self.tr(src), src, rule=rule_id, seconds=cost.wall_s,
+                                     features=cost.features, queries=cost.index_queries))
+        if self._result.cache_build_s:
+            src = QT_TRANSLATE_NOOP('ValidationPanel', 'Building {cache}: {seconds:.2f} s')
+            for cache, seconds in sorted(self._result.cache_build_s.items()):
+                lines.append(safe_format(self.tr(src), src, cache=cache, seconds=seconds))
+        return '\n'.join(lines)
+
     def _scope(self):
         """What the run actually covered, for the empty-result summary."""
         counts = self._result.feature_counts or {}
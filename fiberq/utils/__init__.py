@@ -8,6 +8,7 @@ Modules:
 - helpers.py: General helper functions
 - geometry.py: Geometry utility functions (Phase 2)
 - routing.py: Path finding algorithms (Phase 2)
+- route_graph.py: Cached, signal-maintained route graph for routing
 - field_aliases.py: Field alias mappings and functions (Phase 2)
 - logger.py: Centralized logging infrastructure (Phase 5.1)
 - layer_names.py: Layer name constants for backward compatibility (Phase 6.1)
@@ -111,6 +112,7 @@ from .constants import (
 from .geometry import (
     round_key,
     fuzzy_key,
+    VertexIndex,
     get_first_last_points,
     extract_line_vertices,
     convert_to_simple_line,
@@ -135,6 +137,25 @@ from .routing import (
     find_route_between_points,
     get_network_connectivity,
     find_endpoints_on_network,
+    walk_joined_routes,
+    ROUTING_BFS,
+    ROUTING_DIJKSTRA,
+    ROUTING_ASTAR,
+    ROUTING_ALGORITHMS,
+    check_cost_profile,
+    build_weighted_network,
+    find_path_astar,
+    build_weighted_path_across_network,
+    shortest_path_tree,
+    path_from_tree,
+)
+
+# Cached route graph (one per Route layer, kept current from edit signals)
+from .route_graph import (
+    RouteGraph,
+    get_route_graph,
+    drop_route_graph,
+    clear_route_graphs,
 )
 
 # Phase 2: Field alias utilities
@@ -377,6 +398,7 @@ __all__ = [
     # Phase 2: Geometry utilities
     'round_key',
     'fuzzy_key',
+    'VertexIndex',
     'get_first_last_points',
     'extract_line_vertices',
     'convert_to_simple_line',
@@ -399,6 +421,23 @@ __all__ = [
     'find_route_between_points',
     'get_network_connectivity',
     'find_endpoints_on_network',
+    'walk_joined_routes',
+    'ROUTING_BFS',
+    'ROUTING_DIJKSTRA',
+    'ROUTING_ASTAR',
+    'ROUTING_ALGORITHMS',
+    'check_cost_profile',
+    'build_weighted_network',
+    'find_path_astar',
+    'build_weighted_path_across_network',
+    'shortest_path_tree',
+    'path_from_tree',
+
+    # Cached route graph
+    'RouteGraph',
+    'get_route_graph',
+    'drop_route_graph',
+    'clear_route_graphs',
 
     # Phase 2: Field alias mappings
     'POLES_FIELD_ALIASES',
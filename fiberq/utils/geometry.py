@@ -5,7 +5,8 @@ This module contains geometry utility functions for point manipulation,
 snapping, distance calculations, and coordinate transformations.
 """
 
-from typing import Optional, Tuple, List, Dict
+import math
+from typing import Optional, Tuple, List, Dict, Union
 from qgis.core import QgsPointXY, QgsGeometry, QgsVectorLayer
 
 # Phase 5.2: Logging
@@ -51,6 +52,125 @@ def fuzzy_key(pt: QgsPointXY, tolerance: float) -> Tuple[int, int]:
     return (int(round(pt.x() / tolerance)), int(round(pt.y() / tolerance)))
 
 
+class VertexIndex:
+    """
+    Uniform-grid spatial hash that snaps vertices within a tolerance together.
+
+    :func:`round_key` / :func:`fuzzy_key` quantise each point on its own, so
+    two vertices a hair apart on either side of a grid line get different keys
+    and a route join is lost. Here a vertex is snapped to the nearest vertex
+    already indexed within ``tolerance``, looking into the neighbouring cells,
+    and only becomes a new vertex when there is none.
+
+    Cells are ``tolerance / sqrt(2)`` wide, so any two points in one cell are
+    within tolerance of each other. A cell therefore holds at most one vertex,
+    and the cell coordinates serve as the vertex key. Lookups touch a fixed
+    number of cells: O(1) expected, independent of the network size.
+
+    ``points`` maps each key to its vertex (the first point snapped there) and
+    is what the routing code calls ``key_to_point``.
+    """
+
+    def __init__(self, tolerance: float):
+        """
+        Args:
+            tolerance: Snapping distance (map units)
+        """
+        self.tolerance = max(float(tolerance), 1e-9)
+        self.cell_size = self.tolerance / math.sqrt(2.0)
+        self.points: Dict[Tuple[int, int], QgsPointXY] = {}
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __contains__(self, key) -> bool:
+        return key in self.points
+
+    def cell_of(self, pt: QgsPointXY) -> Tuple[int, int]:
+        """Grid cell containing a point."""
+        return (int(math.floor(pt.x() / self.cell_size)), int(math.floor(pt.y() / self.cell_size)))
+
+    def nearest(self, pt: QgsPointXY, max_dist: Optional[float] = None) -> Optional[Tuple[int, int]]:
+        """
+        Key of the vertex nearest to a point, searching rings of cells outwards.
+
+        Args:
+            pt: Query point
+            max_dist: Largest accepted distance; defaults to the tolerance
+
+        Returns:
+            Vertex key, or None if no vertex lies within ``max_dist``
+        """
+        if max_dist is None:
+            max_dist = self.tolerance
+        points = self.points
+        if not points:
+            return None
+
+        x, y = pt.x(), pt.y()
+        cx, cy = self.cell_of(pt)
+        max_ring = int(math.ceil(max_dist / self.cell_size))
+        best_key = None
+        best_sq = max_dist * max_dist
+
+        for ring in range(max_ring + 1):
+            # Cells on this ring and beyond are at least (ring - 1) cells away
+            if best_key is not None and ring > 0 and best_sq <= ((ring - 1) * self.cell_size) ** 2:
+                break
+            for key in _ring_cells(cx, cy, ring):
+                vertex = points.get(key)
+                if vertex is None:
+                    continue
+                dx = vertex.x() - x
+                dy = vertex.y() - y
+                dist_sq = dx * dx + dy * dy
+                if best_key is None:
+                    better = dist_sq <= best_sq
+                else:
+                    better = dist_sq < best_sq or (dist_sq == best_sq and key < best_key)
+                if better:
+                    best_sq = dist_sq
+                    best_key = key
+        return best_key
+
+    def snap(self, pt: QgsPointXY) -> Tuple[int, int]:
+        """
+        Key of the vertex ``pt`` merges into, adding ``pt`` as a vertex if none.
+
+        Args:
+            pt: Point to snap
+
+        Returns:
+            Vertex key
+        """
+        key = self.nearest(pt)
+        if key is not None:
+            return key
+        key = self.cell_of(pt)
+        # A vertex in the same cell is within tolerance by construction; only
+        # floating-point rounding at the cell diagonal can get here with one.
+        if key not in self.points:
+            self.points[key] = QgsPointXY(pt)
+        return key
+
+    def remove(self, key: Tuple[int, int]) -> None:
+        """Forget a vertex (e.g. when no feature references it any more)."""
+        self.points.pop(key, None)
+
+
+def _ring_cells(cx: int, cy: int, ring: int):
+    """Cells on the square ring at Chebyshev distance ``ring`` around (cx, cy)."""
+    if ring == 0:
+        yield (cx, cy)
+        return
+    for dx in range(-ring, ring + 1):
+        yield (cx + dx, cy - ring)
+        yield (cx + dx, cy + ring)
+    for dy in range(-ring + 1, ring):
+        yield (cx - ring, cy + dy)
+        yield (cx + ring, cy + dy)
+
+
 # =============================================================================
 # GEOMETRY EXTRACTION FUNCTIONS
 # =============================================================================
@@ -194,21 +314,25 @@ def snap_point_to_layer(
 
 def find_nearest_vertex(
     point: QgsPointXY,
-    vertices: Dict[Tuple[int, int], QgsPointXY],
+    vertices: Union["VertexIndex", Dict[Tuple[int, int], QgsPointXY]],
     tolerance: float
 ) -> Optional[Tuple[int, int]]:
     """
     Find the nearest vertex key from a dictionary of vertices.
 
+    Given a :class:`VertexIndex` only the cells around the point are searched;
+    a plain dict is scanned in full.
+
     Args:
         point: Query point
-        vertices: Dict mapping keys to points
+        vertices: VertexIndex, or dict mapping keys to points
         tolerance: Maximum distance multiplier for acceptance
 
     Returns:
         Key of nearest vertex or None if none within tolerance
     """
-    import math
+    if isinstance(vertices, VertexIndex):
+        return vertices.nearest(point, tolerance * 3.0)
 
     best_key = None
     best_dist_sq = float('inf')
@@ -526,6 +526,7 @@ _TRANSLATION_MAP = {
     'Export (.xlsx / .csv)': 'Export (.xlsx / .csv)',
     'By Layers': 'By Layers',
     'Summary': 'Summary',
+    'By Type': 'By Type',
     'Move element': 'Move elements',
     'Import image to element': 'Attach image to element',
     'Open image (by click)': 'Open image (by click)',
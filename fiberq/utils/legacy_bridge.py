@@ -92,6 +92,7 @@ def _fiberq_translate(text: str, lang: str) -> str:
         'Export (.xlsx / .csv)': 'Export (.xlsx / .csv)',
         'By Layers': 'By Layers',
         'Summary': 'Summary',
+        'By Type': 'By Type',
         'Move element': 'Move elements',
         'Import image to element': 'Attach image to element',
         'Open image (by click)': 'Open image (by click)',
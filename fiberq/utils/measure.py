@@ -14,7 +14,17 @@ materials over-orders by 41%.
 So: never call ``geom.length()`` on a value that reaches a field or a user. Call
 :func:`ground_length`, which measures on the project ellipsoid the way the QGIS
 measure tool does, and agrees with what a surveyor would find on site.
+
+Ellipsoidal measurement is not cheap, and the BOM, the length-coherence rule,
+the length recalculation and the schematic all measure the same cables again.
+Pass the feature id to :func:`ground_length` and the answer is remembered in
+the project's :class:`GroundLengthCache`, keyed by layer, feature and a hash
+of the geometry, until the geometry changes.
 """
+import hashlib
+import threading
+from collections import OrderedDict
+
 from qgis.core import QgsDistanceArea, QgsProject
 
 from .logger import get_logger
@@ -25,6 +35,11 @@ logger = get_logger(__name__)
 #: route import. Keyed on (CRS, ellipsoid) so it re-derives if either changes.
 _CACHE = {}
 
+#: Ground lengths remembered per project (least recently used dropped first).
+LENGTH_CACHE_SIZE = 200000
+#: id(project) -> its GroundLengthCache
+_LENGTHS = {}
+
 
 def _project(project=None):
     return project if project is not None else QgsProject.instance()
@@ -61,12 +76,19 @@ def resolve_ellipsoid(crs=None, project=None) -> str:
         return ""
 
 
+def measure_key(crs=None, project=None) -> tuple:
+    """(CRS, ellipsoid) a measurement from ``crs`` is made with."""
+    prj = _project(project)
+    crs = _resolve_crs(crs, prj)
+    return (crs.authid() or crs.toWkt(), resolve_ellipsoid(crs, prj))
+
+
 def distance_area(crs=None, project=None):
     """A :class:`QgsDistanceArea` configured from the project's measurement settings."""
     prj = _project(project)
     crs = _resolve_crs(crs, prj)
-    ellipsoid = resolve_ellipsoid(crs, prj)
-    key = (crs.authid() or crs.toWkt(), ellipsoid)
+    key = measure_key(crs, prj)
+    ellipsoid = key[1]
 
     cached = _CACHE.get(key)
     if cached is None:
@@ -104,12 +126,144 @@ def measures_metres(layer=None, crs=None, project=None) -> bool:
         return False
 
 
-def ground_length(geom, layer=None, crs=None, project=None) -> float:
+def _geometry_hash(geom) -> bytes:
+    return hashlib.blake2b(bytes(geom.asWkb()), digest_size=16).digest()
+
+
+class GroundLengthCache:
+    """Ground lengths by (layer id, fid, geometry hash), bounded LRU.
+
+    The geometry hash keeps an entry honest when a feature is changed without a
+    layer signal (through the provider); ``geometryChanged`` and
+    ``featuresDeleted`` of a watched layer drop its entries as soon as they go
+    stale. Safe to use from worker threads.
+    """
+
+    def __init__(self, maxsize: int = LENGTH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # (layer id, fid) -> (geometry hash, measure key, metres)
+        self._lengths = OrderedDict()
+        self._watched = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def __contains__(self, key):
+        return key in self._lengths
+
+    def length(self, layer_id: str, fid: int, geom, measure, key=None) -> float:
+        """The cached length of feature ``fid`` if ``geom`` (and ``key``, the
+        measurement settings) are unchanged; else ``measure()``, remembered."""
+        digest = _geometry_hash(geom)
+        k = (layer_id, int(fid))
+        with self._lock:
+            entry = self._lengths.get(k)
+            if entry is not None and entry[0] == digest and entry[1] == key:
+                self._lengths.move_to_end(k)
+                self.hits += 1
+                return entry[2]
+        value = float(measure())
+        with self._lock:
+            self.misses += 1
+            self._lengths[k] = (digest, key, value)
+            self._lengths.move_to_end(k)
+            while len(self._lengths) > self.maxsize:
+                self._lengths.popitem(last=False)
+        return value
+
+    def invalidate(self, layer_id: str, fids=None) -> None:
+        """Forget ``fids`` of ``layer_id`` (all of its features when None)."""
+        with self._lock:
+            if fids is None:
+                for k in [k for k in self._lengths if k[0] == layer_id]:
+                    del self._lengths[k]
+            else:
+                for fid in fids:
+                    self._lengths.pop((layer_id, int(fid)), None)
+
+    def watch(self, layer) -> None:
+        """Drop ``layer``'s entries when its geometries change (once per layer).
+
+        A layer without signals (a validation snapshot) is ignored: its live
+        layer was watched when the snapshot was taken.
+        """
+        if not hasattr(layer, "geometryChanged"):
+            return
+        lid = layer.id()
+        with self._lock:
+            if lid in self._watched:
+                return
+            self._watched[lid] = []
+
+        def changed(fid, *args):
+            self.invalidate(lid, [fid])
+
+        def deleted(fids):
+            self.invalidate(lid, fids)
+
+        def gone():
+            self.invalidate(lid)
+            with self._lock:
+                self._watched.pop(lid, None)
+
+        for signal, slot in ((layer.geometryChanged, changed), (layer.featuresDeleted, deleted),
+                             (layer.willBeDeleted, gone)):
+            try:
+                signal.connect(slot)
+                self._watched[lid].append((signal, slot))
+            except Exception as e:
+                logger.debug(f"Error in GroundLengthCache.watch: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lengths.clear()
+            self.hits = self.misses = 0
+
+    def detach(self) -> None:
+        """Stop following every layer and forget everything."""
+        with self._lock:
+            watched, self._watched = self._watched, {}
+            self._lengths.clear()
+        for connections in watched.values():
+            for signal, slot in connections:
+                try:
+                    signal.disconnect(slot)
+                except Exception as e:
+                    logger.debug(f"Error in GroundLengthCache.detach: {e}")
+
+
+def length_cache(project=None) -> GroundLengthCache:
+    """The ground-length cache of ``project`` (the current project by default).
+
+    A project snapshot hands out the cache of the project it was taken from.
+    """
+    prj = _project(project)
+    shared = getattr(prj, "ground_lengths", None)
+    if isinstance(shared, GroundLengthCache):
+        return shared
+    cache = _LENGTHS.get(id(prj))
+    if cache is None:
+        key = id(prj)
+        cache = _LENGTHS[key] = GroundLengthCache()
+        try:
+            prj.cleared.connect(cache.detach)
+            prj.destroyed.connect(lambda *args: _LENGTHS.pop(key, None))
+        except Exception as e:
+            logger.debug(f"Error in length_cache: {e}")
+    return cache
+
+
+def ground_length(geom, layer=None, crs=None, project=None, fid=None) -> float:
     """Length of ``geom`` in metres on the ground.
 
     Pass the ``layer`` the geometry belongs to (or its ``crs``) so the measurement
     starts from the right coordinate system; without either, the project CRS is
-    assumed, which is right for anything drawn on the canvas.
+    assumed, which is right for anything drawn on the canvas. Pass its ``fid``
+    too (with ``layer``) and the length comes from, and goes into, the
+    project's :func:`length_cache`.
 
     Falls back to the planar length rather than raising -- a slightly wrong number
     beats losing the attribute -- and says so in the log.
@@ -128,6 +282,18 @@ def ground_length(geom, layer=None, crs=None, project=None) -> float:
         except Exception:
             crs = None
 
+    if fid is not None and layer is not None:
+        try:
+            cache = length_cache(project)
+            cache.watch(layer)
+            return cache.length(layer.id(), fid, geom, lambda: _measure(geom, crs, project),
+                                measure_key(crs, project))
+        except Exception as e:
+            logger.debug(f"Length cache unavailable, measuring directly: {e}")
+    return _measure(geom, crs, project)
+
+
+def _measure(geom, crs, project) -> float:
     try:
         return float(distance_area(crs, project).measureLength(geom))
     except Exception as e:
@@ -138,11 +304,42 @@ def ground_length(geom, layer=None, crs=None, project=None) -> float:
             return 0.0
 
 
-def ground_length_km(geom, layer=None, crs=None, project=None, places: int = 2) -> float:
+def ground_distance(p1, p2, layer=None, crs=None, project=None) -> float:
+    """Distance in metres on the ground between two points in ``layer``'s CRS.
+
+    The point-to-point counterpart of :func:`ground_length`, used to weight
+    route graph edges one segment at a time. Same fallback to planar distance.
+    """
+    if crs is None and layer is not None:
+        try:
+            crs = layer.crs()
+        except Exception:
+            crs = None
+
+    try:
+        return float(distance_area(crs, project).measureLine(p1, p2))
+    except Exception as e:
+        logger.debug(f"Ellipsoidal measurement failed, using planar distance: {e}")
+        try:
+            return float(p1.distance(p2))
+        except Exception:
+            return 0.0
+
+
+def ground_length_km(geom, layer=None, crs=None, project=None, places: int = 2, fid=None) -> float:
     """:func:`ground_length` in kilometres, rounded the way the layers store it."""
-    return round(ground_length(geom, layer, crs, project) / 1000.0, places)
+    return round(ground_length(geom, layer, crs, project, fid=fid) / 1000.0, places)
+
+
+def release_length_caches():
+    """Stop every length cache following its layers (plugin unload)."""
+    for cache in list(_LENGTHS.values()):
+        cache.detach()
+    _LENGTHS.clear()
 
 
 def clear_cache():
-    """Drop the cached measurers (call if the project's ellipsoid changes)."""
+    """Drop the cached measurers and lengths (call if the project's ellipsoid changes)."""
     _CACHE.clear()
+    for cache in _LENGTHS.values():
+        cache.clear()
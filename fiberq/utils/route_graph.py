@@ -0,0 +1,624 @@
+"""
+FiberQ v2 - Cached Route Graph
+
+Laying a cable used to rebuild the whole vertex graph of the Route layer (and,
+on a miss, a second feature-level graph) for every single search. On a 40k
+segment city network that is seconds per cable, all of it spent re-reading
+geometry that has not changed since the last cable.
+
+A :class:`RouteGraph` is built once per Route layer and then kept current from
+the layer's edit signals, so a routing query only pays for the search itself.
+Use :func:`get_route_graph` rather than constructing one directly: it hands out
+the shared instance for a layer and tolerance. The map tools' tolerance follows
+the zoom, so the shared graphs are kept per tolerance bucket -- the tolerance
+rounded up to a power of two -- and zooming back and forth reuses them instead
+of rebuilding.
+
+The graph answers the same three questions the stateless functions in
+:mod:`fiberq.utils.routing` answer, with the results they give at the graph's
+tolerance. A shared graph joins vertices with its bucket, up to twice the
+caller's tolerance, so it connects every route the stateless functions connect;
+the caller's own tolerance still decides how far a point may lie from the
+vertex a query starts or ends at.
+
+- :meth:`RouteGraph.path_within_feature` -- both points on one route feature
+- :meth:`RouteGraph.path_across_network` -- vertex-level BFS or A*/Dijkstra
+- :meth:`RouteGraph.path_across_joined_routes` -- feature-level BFS
+"""
+
+import math
+from typing import Optional, List, Dict, Tuple, Set
+
+from qgis.core import (
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsPointXY,
+    QgsRectangle,
+    QgsSpatialIndex,
+    QgsVectorLayer,
+)
+
+from .geometry import VertexIndex
+from .measure import ground_distance
+from .routing import (
+    ROUTE_TYPE_FIELD, ROUTING_ALGORITHMS, ROUTING_ASTAR, ROUTING_BFS,
+    check_cost_profile, find_path_astar, find_path_bfs, path_from_tree,
+    route_type_multiplier, shortest_path_tree, straight_line_heuristic,
+    walk_joined_routes,
+)
+
+from .logger import get_logger
+logger = get_logger(__name__)
+
+Key = Tuple[int, int]
+
+#: Route layer id -> tolerance bucket -> graph, least recently used first.
+#: Entries go away when the layer is deleted or the plugin unloads.
+_GRAPHS: Dict[str, Dict[float, "RouteGraph"]] = {}
+
+#: Graphs kept per layer: each is kept current with every edit, so only the
+#: few zoom levels in use are worth keeping.
+GRAPHS_PER_LAYER = 3
+
+
+def tolerance_bucket(tolerance: float) -> float:
+    """``tolerance`` rounded up to a power of two: the join tolerance of the
+    shared graph a query with this tolerance gets."""
+    if not tolerance > 0:
+        return tolerance
+    return 2.0 ** math.ceil(math.log2(tolerance))
+
+
+def _line_parts(geom: QgsGeometry) -> List[List[QgsPointXY]]:
+    """All polyline parts of a line geometry, as lists of QgsPointXY."""
+    if geom is None or geom.isEmpty():
+        return []
+    line = geom.asPolyline()
+    if line:
+        return [[QgsPointXY(p) for p in line]]
+    return [[QgsPointXY(p) for p in part]
+            for part in (geom.asMultiPolyline() or []) if len(part) >= 2]
+
+
+class RouteGraph:
+    """
+    In-memory routing graph of one Route layer, updated incrementally.
+
+    Holds, per feature, exactly what the feature contributes (its vertex keys,
+    its segments, its first/last node keys), so a feature can be taken out of
+    the graph again without rescanning the layer.
+
+    Vertices are snapped together with one :class:`~fiberq.utils.geometry.VertexIndex`
+    shared by the vertex graph and the feature graph, as the stateless builders do.
+    """
+
+    def __init__(self, layer: QgsVectorLayer, tolerance: float):
+        """
+        Initialize the graph. Nothing is read until the first query.
+
+        Args:
+            layer: Route layer to mirror
+            tolerance: Distance within which vertices are joined (map units)
+        """
+        self.layer = layer
+        self.layer_id = layer.id()
+        self.tolerance = float(tolerance)
+        self._connected = False
+        self._dirty = True
+        self._reset()
+
+    # -------------------------------------------------------------------------
+    # State
+    # -------------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        # Vertex graph
+        self._vertices = VertexIndex(self.tolerance)
+        self.key_to_point: Dict[Key, QgsPointXY] = self._vertices.points
+        self._key_refs: Dict[Key, int] = {}
+        self.adj: Dict[Key, Dict[Key, Dict[int, int]]] = {}  # u -> {v: {fid: count}}
+        self._feature_vertices: Dict[int, List[Key]] = {}
+        self._feature_segments: Dict[int, List[Tuple[Key, Key]]] = {}
+
+        # Edge weights: route type per feature, ground metres per edge (lazy)
+        self._feature_tip: Dict[int, str] = {}
+        self._edge_metres: Dict[Tuple[Key, Key], float] = {}
+
+        # Feature graph (first part only, as get_first_last_points does)
+        self.node_to_edges: Dict[Key, Dict[int, bool]] = {}  # key -> {fid: is_last}
+        self.edge_keys: Dict[int, Tuple[Key, Key]] = {}
+        self.edge_to_points: Dict[int, List[QgsPointXY]] = {}
+
+        # Bounding boxes of the features, for path_within_feature and for
+        # the vertices near a queried point
+        self._index = QgsSpatialIndex()
+        self._bounds: Dict[int, QgsRectangle] = {}
+
+        # Every fid seen, including empty geometries, so featureCount() matches
+        self._fids: Set[int] = set()
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next query."""
+        self._dirty = True
+
+    def rebuild(self) -> None:
+        """Re-read every feature of the layer."""
+        self._reset()
+        tip_idx = self.layer.fields().indexFromName(ROUTE_TYPE_FIELD)
+        request = QgsFeatureRequest()
+        request.setSubsetOfAttributes([tip_idx] if tip_idx != -1 else [])
+        for feature in self.layer.getFeatures(request):
+            self._add(feature.id(), feature.geometry(),
+                      feature.attribute(tip_idx) if tip_idx != -1 else None)
+        self._dirty = False
+
+    def ensure_current(self) -> None:
+        """Rebuild if invalidated, or if the layer changed behind our back.
+
+        Writes straight to the data provider bypass the edit buffer and emit no
+        per-feature signal; a feature count mismatch is the cheap tell.
+        """
+        self.connect()
+        if not self._dirty:
+            try:
+                if self.layer.featureCount() != len(self._fids):
+                    self._dirty = True
+            except Exception as e:
+                logger.debug(f"Error in RouteGraph.ensure_current: {e}")
+                self._dirty = True
+        if self._dirty:
+            self.rebuild()
+
+    # -------------------------------------------------------------------------
+    # Incremental maintenance
+    # -------------------------------------------------------------------------
+
+    def _add(self, fid: int, geom: QgsGeometry, tip=None) -> None:
+        self._fids.add(fid)
+        self._feature_tip[fid] = str(tip or "").strip()
+        parts = _line_parts(geom)
+        if not parts:
+            return
+
+        vertices: List[Key] = []
+        segments: List[Tuple[Key, Key]] = []
+        for part in parts:
+            keys = [self._vertices.snap(pt) for pt in part]
+            for key in keys:
+                vertices.append(key)
+                self._key_refs[key] = self._key_refs.get(key, 0) + 1
+            for u, v in zip(keys, keys[1:]):
+                if u == v:
+                    continue
+                segments.append((u, v))
+                for a, b in ((u, v), (v, u)):
+                    fids = self.adj.setdefault(a, {}).setdefault(b, {})
+                    fids[fid] = fids.get(fid, 0) + 1
+        self._feature_vertices[fid] = vertices
+        self._feature_segments[fid] = segments
+
+        pts = parts[0]
+        k1 = self._vertices.snap(pts[0])
+        k2 = self._vertices.snap(pts[-1])
+        self.edge_keys[fid] = (k1, k2)
+        self.edge_to_points[fid] = pts
+        self.node_to_edges.setdefault(k1, {})[fid] = False
+        self.node_to_edges.setdefault(k2, {})[fid] = True
+
+        rect = QgsGeometry.fromMultiPolylineXY(parts).boundingBox()
+        self._bounds[fid] = rect
+        self._index.addFeature(fid, rect)
+
+    def _remove(self, fid: int) -> None:
+        self._fids.discard(fid)
+        self._feature_tip.pop(fid, None)
+
+        for u, v in self._feature_segments.pop(fid, []):
+            for a, b in ((u, v), (v, u)):
+                nbrs = self.adj.get(a)
+                if nbrs is None or b not in nbrs:
+                    continue
+                fids = nbrs[b]
+                fids[fid] = fids.get(fid, 0) - 1
+                if fids[fid] <= 0:
+                    fids.pop(fid, None)
+                if not fids:
+                    del nbrs[b]
+                    self._edge_metres.pop((min(a, b), max(a, b)), None)
+                if not nbrs:
+                    del self.adj[a]
+
+        for key in self._feature_vertices.pop(fid, []):
+            refs = self._key_refs.get(key, 0) - 1
+            if refs <= 0:
+                self._key_refs.pop(key, None)
+                self._vertices.remove(key)
+            else:
+                self._key_refs[key] = refs
+
+        keys = self.edge_keys.pop(fid, None)
+        self.edge_to_points.pop(fid, None)
+        if keys is not None:
+            for key in keys:
+                edges = self.node_to_edges.get(key)
+                if edges is not None:
+                    edges.pop(fid, None)
+                    if not edges:
+                        del self.node_to_edges[key]
+
+        rect = self._bounds.pop(fid, None)
+        if rect is not None:
+            stub = QgsFeature(fid)
+            stub.setGeometry(QgsGeometry.fromRect(rect))
+            self._index.deleteFeature(stub)
+
+    def _on_feature_added(self, fid) -> None:
+        if self._dirty:
+            return
+        try:
+            feature = self.layer.getFeature(fid)
+            self._remove(fid)
+            self._add(fid, feature.geometry(), self._tip_of(feature))
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph._on_feature_added: {e}")
+            self._dirty = True
+
+    def _on_geometry_changed(self, fid, geom) -> None:
+        if self._dirty:
+            return
+        try:
+            tip = self._feature_tip.get(fid)
+            self._remove(fid)
+            self._add(fid, geom, tip)
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph._on_geometry_changed: {e}")
+            self._dirty = True
+
+    def _on_attribute_changed(self, fid, idx, value) -> None:
+        if self._dirty or fid not in self._fids:
+            return
+        try:
+            if idx == self.layer.fields().indexFromName(ROUTE_TYPE_FIELD):
+                self._feature_tip[fid] = str(value or "").strip()
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph._on_attribute_changed: {e}")
+            self._dirty = True
+
+    def _tip_of(self, feature):
+        idx = feature.fields().indexFromName(ROUTE_TYPE_FIELD)
+        return feature.attribute(idx) if idx != -1 else None
+
+    def _on_feature_deleted(self, fid) -> None:
+        if self._dirty:
+            return
+        try:
+            self._remove(fid)
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph._on_feature_deleted: {e}")
+            self._dirty = True
+
+    def _on_committed_features_added(self, layer_id, features) -> None:
+        """Swap the edit buffer's temporary (negative) fids for the real ones."""
+        if self._dirty:
+            return
+        try:
+            for fid in [f for f in self._fids if f < 0]:
+                self._remove(fid)
+            for feature in features:
+                self._remove(feature.id())
+                self._add(feature.id(), feature.geometry(), self._tip_of(feature))
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph._on_committed_features_added: {e}")
+            self._dirty = True
+
+    def _signals(self):
+        lyr = self.layer
+        return (
+            (lyr.featureAdded, self._on_feature_added),
+            (lyr.geometryChanged, self._on_geometry_changed),
+            (lyr.featureDeleted, self._on_feature_deleted),
+            (lyr.attributeValueChanged, self._on_attribute_changed),
+            (lyr.committedFeaturesAdded, self._on_committed_features_added),
+            (lyr.afterRollBack, self.invalidate),
+            (lyr.dataSourceChanged, self.invalidate),
+        )
+
+    def connect(self) -> None:
+        """Start following the layer's edit signals."""
+        if self._connected:
+            return
+        for signal, slot in self._signals():
+            try:
+                signal.connect(slot)
+            except Exception as e:
+                logger.debug(f"Error in RouteGraph.connect: {e}")
+        self._connected = True
+
+    def disconnect(self) -> None:
+        """Stop following the layer (it is going away, or the plugin unloads)."""
+        if not self._connected:
+            return
+        for signal, slot in self._signals():
+            try:
+                signal.disconnect(slot)
+            except Exception as e:
+                logger.debug(f"Error in RouteGraph.disconnect: {e}")
+        self._connected = False
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def _nearest_vertex(self, pt: QgsPointXY, max_dist: float) -> Optional[Key]:
+        """
+        Key of the vertex nearest to ``pt``, within ``max_dist`` (layer units).
+
+        Looks only at the vertices of the features whose bounding box is
+        within reach, so a pick radius many times the join tolerance costs no
+        more than a small one.
+        """
+        x, y = pt.x(), pt.y()
+        reach = QgsRectangle(x - max_dist, y - max_dist, x + max_dist, y + max_dist)
+        best_key = None
+        best_sq = max_dist * max_dist
+        for fid in self._index.intersects(reach):
+            for key in self._feature_vertices.get(fid, ()):
+                vertex = self.key_to_point[key]
+                dx = vertex.x() - x
+                dy = vertex.y() - y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < best_sq or (dist_sq == best_sq and (best_key is None or key < best_key)):
+                    best_sq = dist_sq
+                    best_key = key
+        return best_key
+
+    def path_within_feature(
+        self,
+        start_pt: QgsPointXY,
+        end_pt: QgsPointXY,
+        max_dist: float = 1.0
+    ) -> Optional[List[QgsPointXY]]:
+        """
+        Sub-line of a single route feature between its vertices nearest the points.
+
+        A feature qualifies when both points lie within ``max_dist`` of one of
+        its vertices and those are different vertices. Candidates come from the
+        spatial index, so only features near both points are examined.
+
+        Returns:
+            List of QgsPointXY ordered from start to end, or None
+        """
+        self.ensure_current()
+        p1, p2 = QgsPointXY(start_pt), QgsPointXY(end_pt)
+
+        def around(pt):
+            return QgsRectangle(pt.x() - max_dist, pt.y() - max_dist,
+                                pt.x() + max_dist, pt.y() + max_dist)
+
+        candidates = set(self._index.intersects(around(p1)))
+        candidates &= set(self._index.intersects(around(p2)))
+
+        for fid in sorted(candidates):
+            line = self.edge_to_points.get(fid)
+            if not line:
+                continue
+            dists1 = [p1.distance(p) for p in line]
+            dists2 = [p2.distance(p) for p in line]
+            min_dist1 = min(dists1)
+            min_dist2 = min(dists2)
+            idx1 = dists1.index(min_dist1)
+            idx2 = dists2.index(min_dist2)
+            if min_dist1 < max_dist and min_dist2 < max_dist and idx1 != idx2:
+                if idx1 < idx2:
+                    return list(line[idx1:idx2 + 1])
+                return list(reversed(line[idx2:idx1 + 1]))
+        return None
+
+    def edge_cost(self, u: Key, v: Key, cost_profile: Optional[Dict[str, float]] = None) -> float:
+        """Ground metres of edge u-v times the cheapest route type carrying it."""
+        edge = (min(u, v), max(u, v))
+        metres = self._edge_metres.get(edge)
+        if metres is None:
+            metres = self._edge_metres[edge] = ground_distance(
+                self.key_to_point[u], self.key_to_point[v], self.layer)
+        if not cost_profile:
+            return metres
+        return metres * min(route_type_multiplier(cost_profile, self._feature_tip.get(fid))
+                            for fid in self.adj[u][v])
+
+    def path_across_network(
+        self,
+        start_pt: QgsPointXY,
+        end_pt: QgsPointXY,
+        algorithm: str = ROUTING_BFS,
+        cost_profile: Optional[Dict[str, float]] = None,
+        stats: Optional[Dict[str, float]] = None,
+        tolerance: Optional[float] = None
+    ) -> Optional[List[QgsPointXY]]:
+        """
+        Vertex-level path, as :func:`~fiberq.utils.routing.build_path_across_network`
+        (``ROUTING_BFS``) or :func:`~fiberq.utils.routing.build_weighted_path_across_network`
+        (``ROUTING_DIJKSTRA`` / ``ROUTING_ASTAR``).
+
+        The path starts and ends at the vertices nearest the points, within
+        three times ``tolerance`` (map units; defaults to the graph's tolerance),
+        as :func:`~fiberq.utils.geometry.find_nearest_vertex` accepts.
+
+        Edge lengths are measured the first time a search reaches them and
+        then kept until the edge changes.
+        """
+        if algorithm not in ROUTING_ALGORITHMS:
+            raise ValueError(f"Unknown routing algorithm {algorithm!r}; expected one of {ROUTING_ALGORITHMS}")
+        scale = check_cost_profile(cost_profile)
+        try:
+            self.ensure_current()
+            if not self.key_to_point or not self.adj:
+                return None
+
+            reach = (self.tolerance if tolerance is None else tolerance) * 3.0
+            start_key = self._nearest_vertex(start_pt, reach)
+            end_key = self._nearest_vertex(end_pt, reach)
+            if start_key is None or end_key is None:
+                return None
+
+            if algorithm == ROUTING_BFS:
+                path_keys = find_path_bfs(self.adj, start_key, end_key, stats)
+            else:
+                heuristic = None
+                if algorithm == ROUTING_ASTAR:
+                    heuristic = straight_line_heuristic(self.key_to_point, end_key, self.layer, scale)
+                path_keys = find_path_astar(
+                    self.weighted_neighbors(cost_profile), start_key, end_key, heuristic, stats
+                )
+            if path_keys is None:
+                return None
+            return [self.key_to_point[k] for k in path_keys]
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph.path_across_network: {e}")
+            return None
+
+    def weighted_neighbors(self, cost_profile: Optional[Dict[str, float]] = None):
+        """``neighbors`` callable for :func:`~fiberq.utils.routing.find_path_astar`."""
+        def neighbors(key):
+            return [(v, self.edge_cost(key, v, cost_profile)) for v in self.adj.get(key, ())]
+        return neighbors
+
+    def paths_from(
+        self,
+        start_pt: QgsPointXY,
+        end_pts: List[QgsPointXY],
+        cost_profile: Optional[Dict[str, float]] = None,
+        tolerance: Optional[float] = None
+    ) -> List[Optional[List[QgsPointXY]]]:
+        """
+        Shortest paths in metres from one point to many, with a single search.
+
+        Builds one shortest-path tree rooted at ``start_pt`` (see
+        :func:`~fiberq.utils.routing.shortest_path_tree`). A target the tree does
+        not reach falls back to the feature-level path, as :meth:`find_route` does.
+        ``tolerance`` is as for :meth:`path_across_network`.
+
+        Returns:
+            One entry per ``end_pts`` item: list of QgsPointXY, or None if unreachable
+        """
+        check_cost_profile(cost_profile)
+        results: List[Optional[List[QgsPointXY]]] = [None] * len(end_pts)
+        try:
+            self.ensure_current()
+            if not self.key_to_point or not self.adj:
+                return results
+
+            reach = (self.tolerance if tolerance is None else tolerance) * 3.0
+            start_key = self._nearest_vertex(start_pt, reach)
+            end_keys = [self._nearest_vertex(pt, reach) for pt in end_pts]
+            parent = {}
+            if start_key is not None:
+                _dist, parent = shortest_path_tree(
+                    self.weighted_neighbors(cost_profile), start_key,
+                    [k for k in end_keys if k is not None]
+                )
+
+            for i, end_key in enumerate(end_keys):
+                path_keys = path_from_tree(parent, end_key) if end_key is not None else None
+                if path_keys is not None:
+                    results[i] = [self.key_to_point[k] for k in path_keys]
+                else:
+                    results[i] = self.path_across_joined_routes(start_pt, end_pts[i], tolerance)
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph.paths_from: {e}")
+        return results
+
+    def path_across_joined_routes(
+        self,
+        start_pt: QgsPointXY,
+        end_pt: QgsPointXY,
+        tolerance: Optional[float] = None
+    ) -> Optional[List[QgsPointXY]]:
+        """Feature-level path, as :func:`~fiberq.utils.routing.build_path_across_joined_routes`.
+
+        The walk starts and ends at the vertices within ``tolerance`` (map
+        units; defaults to the graph's tolerance) of the points.
+        """
+        try:
+            self.ensure_current()
+            reach = self.tolerance if tolerance is None else tolerance
+            return walk_joined_routes(
+                self.node_to_edges,
+                self.edge_keys, self.edge_to_points,
+                self._nearest_vertex(start_pt, reach), self._nearest_vertex(end_pt, reach)
+            )
+        except Exception as e:
+            logger.debug(f"Error in RouteGraph.path_across_joined_routes: {e}")
+            return None
+
+    def find_route(
+        self,
+        start_pt: QgsPointXY,
+        end_pt: QgsPointXY,
+        algorithm: str = ROUTING_BFS,
+        cost_profile: Optional[Dict[str, float]] = None,
+        tolerance: Optional[float] = None
+    ) -> Optional[List[QgsPointXY]]:
+        """Vertex-level path, falling back to the feature-level one.
+
+        The cached counterpart of :func:`~fiberq.utils.routing.find_route_between_points`.
+        """
+        return (self.path_across_network(start_pt, end_pt, algorithm, cost_profile, tolerance=tolerance)
+                or self.path_across_joined_routes(start_pt, end_pt, tolerance))  # noqa: W503
+
+
+# =============================================================================
+# SHARED INSTANCES
+# =============================================================================
+
+def get_route_graph(layer: QgsVectorLayer, tolerance: float) -> RouteGraph:
+    """
+    The shared :class:`RouteGraph` for a Route layer and tolerance.
+
+    The graph joins vertices with :func:`tolerance_bucket` of ``tolerance``,
+    so tolerances that differ by less than a zoom step share one graph. The
+    :data:`GRAPHS_PER_LAYER` most recently used buckets of a layer are kept;
+    pass ``tolerance`` to the queries too, so points are matched to vertices
+    exactly as far as the caller asked.
+
+    Args:
+        layer: Route layer
+        tolerance: Tolerance for vertex matching (map units)
+
+    Returns:
+        RouteGraph kept current with the layer
+    """
+    layer_id = layer.id()
+    bucket = tolerance_bucket(float(tolerance))
+    graphs = _GRAPHS.get(layer_id)
+    if graphs and next(iter(graphs.values())).layer is not layer:
+        drop_route_graph(layer_id)  # a new layer under a reused id
+        graphs = None
+    if graphs is None:
+        graphs = _GRAPHS[layer_id] = {}
+        try:
+            layer.willBeDeleted.connect(lambda lid=layer_id: drop_route_graph(lid))
+        except Exception as e:
+            logger.debug(f"Error in get_route_graph: {e}")
+
+    graph = graphs.pop(bucket, None)
+    if graph is None:
+        graph = RouteGraph(layer, bucket)
+        graph.connect()
+    graphs[bucket] = graph  # most recently used last
+    while len(graphs) > GRAPHS_PER_LAYER:
+        graphs.pop(next(iter(graphs))).disconnect()
+    return graph
+
+
+def drop_route_graph(layer_id: str) -> None:
+    """Forget the graphs of one layer."""
+    for graph in (_GRAPHS.pop(layer_id, None) or {}).values():
+        graph.disconnect()
+
+
+def clear_route_graphs() -> None:
+    """Forget every cached graph (plugin unload)."""
+    for layer_id in list(_GRAPHS):
+        drop_route_graph(layer_id)
@@ -6,17 +6,20 @@ and other network elements across the route network.
 
 The algorithms support:
 - BFS-based shortest path finding on network graphs
+- Length-weighted shortest paths (Dijkstra / A*) with per-route-type costs
 - Virtual merging of disconnected route segments
 - Handling of both simple and multi-part geometries
 """
 
-from typing import Optional, List, Dict, Tuple, Set
+import heapq
+import itertools
+from typing import Callable, Iterable, Optional, List, Dict, Tuple, Set
 from collections import defaultdict, deque
 
 from qgis.core import QgsPointXY, QgsVectorLayer
 
 from .geometry import (
-    fuzzy_key, round_key, get_first_last_points,
+    VertexIndex, get_first_last_points,
     find_nearest_vertex
 )
 
@@ -25,30 +28,44 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
+# Routing algorithms selectable in find_route_between_points
+ROUTING_BFS = "bfs"            # fewest vertices (legacy behaviour)
+ROUTING_DIJKSTRA = "dijkstra"  # fewest metres
+ROUTING_ASTAR = "astar"        # fewest metres, straight-line heuristic
+ROUTING_ALGORITHMS = (ROUTING_BFS, ROUTING_DIJKSTRA, ROUTING_ASTAR)
+
+#: Route attribute the cost profiles are keyed on.
+ROUTE_TYPE_FIELD = "tip_trase"
+
+
 # =============================================================================
 # NETWORK GRAPH BUILDING
 # =============================================================================
 
 def build_network_graph(
     layer: QgsVectorLayer,
-    tolerance: float
+    tolerance: float,
+    index: Optional[VertexIndex] = None
 ) -> Tuple[Dict[Tuple[int, int], QgsPointXY], List[Tuple[Tuple[int, int], Tuple[int, int]]]]:
     """
     Build a network graph from a route layer.
 
-    Extracts all vertices and segments from the layer, using fuzzy
-    coordinate keys to handle near-coincident vertices.
+    Extracts all vertices and segments from the layer, snapping
+    near-coincident vertices together with a :class:`VertexIndex`.
 
     Args:
         layer: Route layer to build graph from
         tolerance: Tolerance for vertex matching
+        index: Optional VertexIndex to fill; pass one to look up the
+            vertices nearest to a point afterwards
 
     Returns:
         Tuple of:
         - Dict mapping coordinate keys to actual points
         - List of segments as (start_key, end_key) tuples
     """
-    key_to_point: Dict[Tuple[int, int], QgsPointXY] = {}
+    if index is None:
+        index = VertexIndex(tolerance)
     segments: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
 
     for feature in layer.getFeatures():
@@ -59,7 +76,7 @@ def build_network_graph(
         # Handle simple polyline
         line = geom.asPolyline()
         if line:
-            _process_line_part(line, tolerance, key_to_point, segments)
+            _process_line_part(line, index, segments)
             continue
 
         # Handle multipart polyline
@@ -67,15 +84,14 @@ def build_network_graph(
         if multiline:
             for part in multiline:
                 if len(part) >= 2:
-                    _process_line_part(part, tolerance, key_to_point, segments)
+                    _process_line_part(part, index, segments)
 
-    return key_to_point, segments
+    return index.points, segments
 
 
 def _process_line_part(
     line_points: List,
-    tolerance: float,
-    key_to_point: Dict[Tuple[int, int], QgsPointXY],
+    index: VertexIndex,
     segments: List[Tuple[Tuple[int, int], Tuple[int, int]]]
 ) -> None:
     """
@@ -83,24 +99,17 @@ def _process_line_part(
 
     Args:
         line_points: List of point coordinates
-        tolerance: Tolerance for key generation
-        key_to_point: Dict to update with vertices
+        index: VertexIndex to snap the vertices into
         segments: List to update with segments
     """
     if len(line_points) < 2:
         return
 
-    # Add all vertices
-    for i, pt in enumerate(line_points):
-        point = QgsPointXY(pt)
-        key = fuzzy_key(point, tolerance)
-        if key not in key_to_point:
-            key_to_point[key] = point
+    # Snap all vertices
+    keys = [index.snap(QgsPointXY(pt)) for pt in line_points]
 
     # Add segments
-    for i in range(len(line_points) - 1):
-        u_key = fuzzy_key(QgsPointXY(line_points[i]), tolerance)
-        v_key = fuzzy_key(QgsPointXY(line_points[i + 1]), tolerance)
+    for u_key, v_key in zip(keys, keys[1:]):
         if u_key != v_key:
             segments.append((u_key, v_key))
 
@@ -128,6 +137,91 @@ def build_adjacency_list(
     return adj
 
 
+def check_cost_profile(cost_profile: Optional[Dict[str, float]]) -> float:
+    """
+    Validate a cost profile and return its smallest multiplier.
+
+    A cost profile maps ``tip_trase`` values to cost multipliers: an edge of a
+    route of that type costs ``metres * multiplier``. Types not in the profile
+    cost 1.0, so the smallest multiplier is never above 1.0. It scales the A*
+    heuristic, which must never overestimate the remaining cost.
+
+    Raises:
+        ValueError: if a multiplier is not a positive number
+    """
+    floor = 1.0
+    for tip, mult in (cost_profile or {}).items():
+        try:
+            mult = float(mult)
+        except (TypeError, ValueError):
+            raise ValueError(f"Cost multiplier for route type {tip!r} is not a number: {mult!r}")
+        if not mult > 0.0:
+            raise ValueError(f"Cost multiplier for route type {tip!r} must be positive, got {mult}")
+        floor = min(floor, mult)
+    return floor
+
+
+def route_type_multiplier(cost_profile: Optional[Dict[str, float]], tip) -> float:
+    """Cost multiplier of one route type under a profile (1.0 if unlisted)."""
+    if not cost_profile:
+        return 1.0
+    return float(cost_profile.get(str(tip or "").strip(), 1.0))
+
+
+def build_weighted_network(
+    layer: QgsVectorLayer,
+    tolerance: float,
+    cost_profile: Optional[Dict[str, float]] = None,
+    index: Optional[VertexIndex] = None
+) -> Tuple[Dict[Tuple[int, int], QgsPointXY], Dict[Tuple[int, int], Dict[Tuple[int, int], float]]]:
+    """
+    Build a length-weighted network graph from a route layer.
+
+    Vertices are merged exactly as in :func:`build_network_graph`. Each edge
+    costs its ground length in metres times the cost multiplier of the route
+    type it belongs to; where several features share an edge the cheapest wins.
+
+    Args:
+        layer: Route layer to build graph from
+        tolerance: Tolerance for vertex matching
+        cost_profile: Optional ``tip_trase`` -> multiplier mapping
+        index: Optional VertexIndex to fill (see :func:`build_network_graph`)
+
+    Returns:
+        Tuple of:
+        - Dict mapping coordinate keys to actual points
+        - Dict mapping each vertex key to {neighbour key: edge cost}
+    """
+    from .measure import ground_distance
+
+    if index is None:
+        index = VertexIndex(tolerance)
+    key_to_point = index.points
+    adj: Dict[Tuple[int, int], Dict[Tuple[int, int], float]] = defaultdict(dict)
+    tip_idx = layer.fields().indexFromName(ROUTE_TYPE_FIELD)
+
+    for feature in layer.getFeatures():
+        geom = feature.geometry()
+        if geom is None or geom.isEmpty():
+            continue
+        mult = route_type_multiplier(cost_profile, feature.attribute(tip_idx) if tip_idx != -1 else None)
+
+        line = geom.asPolyline()
+        parts = [line] if line else (geom.asMultiPolyline() or [])
+        for part in parts:
+            if len(part) < 2:
+                continue
+            segments: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+            _process_line_part(part, index, segments)
+            for u, v in segments:
+                cost = ground_distance(key_to_point[u], key_to_point[v], layer) * mult
+                if cost < adj[u].get(v, float('inf')):
+                    adj[u][v] = cost
+                    adj[v][u] = cost
+
+    return key_to_point, adj
+
+
 # =============================================================================
 # PATH FINDING ALGORITHMS
 # =============================================================================
@@ -135,15 +229,17 @@ def build_adjacency_list(
 def find_path_bfs(
     adj: Dict[Tuple[int, int], List[Tuple[int, int]]],
     start_key: Tuple[int, int],
-    end_key: Tuple[int, int]
+    end_key: Tuple[int, int],
+    stats: Optional[Dict[str, float]] = None
 ) -> Optional[List[Tuple[int, int]]]:
     """
-    Find shortest path using Breadth-First Search.
+    Find the path with the fewest vertices using Breadth-First Search.
 
     Args:
         adj: Adjacency list mapping vertex keys to neighbors
         start_key: Starting vertex key
         end_key: Target vertex key
+        stats: Optional dict; receives ``settled`` (vertices dequeued)
 
     Returns:
         List of vertex keys representing path, or None if no path exists
@@ -154,9 +250,11 @@ def find_path_bfs(
     # BFS
     parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start_key: None}
     queue = deque([start_key])
+    settled = 0
 
     while queue:
         current = queue.popleft()
+        settled += 1
 
         if current == end_key:
             break
@@ -166,6 +264,9 @@ def find_path_bfs(
                 parent[neighbor] = current
                 queue.append(neighbor)
 
+    if stats is not None:
+        stats["settled"] = settled
+
     # Check if we reached the end
     if end_key not in parent:
         return None
@@ -181,6 +282,182 @@ def find_path_bfs(
     return path_keys
 
 
+def find_path_astar(
+    neighbors: Callable[[Tuple[int, int]], Iterable[Tuple[Tuple[int, int], float]]],
+    start_key: Tuple[int, int],
+    end_key: Tuple[int, int],
+    heuristic: Optional[Callable[[Tuple[int, int]], float]] = None,
+    stats: Optional[Dict[str, float]] = None
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Find the cheapest path with A* (Dijkstra when no heuristic is given).
+
+    Args:
+        neighbors: Callable returning (neighbour key, edge cost) pairs of a key
+        start_key: Starting vertex key
+        end_key: Target vertex key
+        heuristic: Optional lower bound of the remaining cost from a key to
+            ``end_key``; it must never overestimate, or the path may not be
+            the cheapest
+        stats: Optional dict; receives ``settled`` (vertices settled) and
+            ``cost`` (total cost of the path found)
+
+    Returns:
+        List of vertex keys representing path, or None if no path exists
+    """
+    if start_key == end_key:
+        if stats is not None:
+            stats["settled"] = 1
+            stats["cost"] = 0.0
+        return [start_key]
+
+    h_cache: Dict[Tuple[int, int], float] = {}
+
+    def h(key):
+        if heuristic is None:
+            return 0.0
+        value = h_cache.get(key)
+        if value is None:
+            value = h_cache[key] = heuristic(key)
+        return value
+
+    dist: Dict[Tuple[int, int], float] = {start_key: 0.0}
+    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start_key: None}
+    settled: Set[Tuple[int, int]] = set()
+    tie = itertools.count()
+    heap = [(h(start_key), next(tie), start_key)]
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if current in settled:
+            continue
+        settled.add(current)
+
+        if current == end_key:
+            break
+
+        base = dist[current]
+        for neighbor, cost in neighbors(current):
+            if neighbor in settled:
+                continue
+            candidate = base + cost
+            if candidate < dist.get(neighbor, float('inf')):
+                dist[neighbor] = candidate
+                parent[neighbor] = current
+                heapq.heappush(heap, (candidate + h(neighbor), next(tie), neighbor))
+
+    if stats is not None:
+        stats["settled"] = len(settled)
+
+    if end_key not in settled:
+        return None
+
+    if stats is not None:
+        stats["cost"] = dist[end_key]
+
+    # Reconstruct path
+    path_keys = []
+    current = end_key
+    while current is not None:
+        path_keys.append(current)
+        current = parent[current]
+
+    path_keys.reverse()
+    return path_keys
+
+
+def shortest_path_tree(
+    neighbors: Callable[[Tuple[int, int]], Iterable[Tuple[Tuple[int, int], float]]],
+    source_key: Tuple[int, int],
+    targets: Optional[Iterable[Tuple[int, int]]] = None
+) -> Tuple[Dict[Tuple[int, int], float], Dict[Tuple[int, int], Optional[Tuple[int, int]]]]:
+    """
+    Single-source shortest-path tree (Dijkstra).
+
+    One search answers every target of the same source, which is what laying
+    many cables out of one ODF/OTB needs. With ``targets`` the search stops as
+    soon as all of them are settled instead of exploring the whole network.
+
+    Args:
+        neighbors: Callable returning (neighbour key, edge cost) pairs of a key
+        source_key: Root of the tree
+        targets: Optional keys the caller needs; the search may stop early
+
+    Returns:
+        Tuple of (cost to each settled key, parent of each settled key). Use
+        :func:`path_from_tree` to read a path out of the parents.
+    """
+    remaining = set(targets) if targets is not None else None
+    dist: Dict[Tuple[int, int], float] = {source_key: 0.0}
+    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {source_key: None}
+    settled: Dict[Tuple[int, int], float] = {}
+    tree_parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+    tie = itertools.count()
+    heap = [(0.0, next(tie), source_key)]
+
+    while heap:
+        base, _, current = heapq.heappop(heap)
+        if current in settled:
+            continue
+        settled[current] = base
+        tree_parent[current] = parent[current]
+
+        if remaining is not None:
+            remaining.discard(current)
+            if not remaining:
+                break
+
+        for neighbor, cost in neighbors(current):
+            if neighbor in settled:
+                continue
+            candidate = base + cost
+            if candidate < dist.get(neighbor, float('inf')):
+                dist[neighbor] = candidate
+                parent[neighbor] = current
+                heapq.heappush(heap, (candidate, next(tie), neighbor))
+
+    return settled, tree_parent
+
+
+def path_from_tree(
+    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]],
+    key: Tuple[int, int]
+) -> Optional[List[Tuple[int, int]]]:
+    """Path from the root of a shortest-path tree to ``key``, or None if unreached."""
+    if key not in parent:
+        return None
+    path_keys = []
+    current = key
+    while current is not None:
+        path_keys.append(current)
+        current = parent[current]
+    path_keys.reverse()
+    return path_keys
+
+
+def straight_line_heuristic(
+    key_to_point: Dict[Tuple[int, int], QgsPointXY],
+    end_key: Tuple[int, int],
+    layer: Optional[QgsVectorLayer] = None,
+    scale: float = 1.0
+) -> Callable[[Tuple[int, int]], float]:
+    """
+    A* heuristic: straight-line ground distance to ``end_key`` times ``scale``.
+
+    Measured like the edges (:func:`fiberq.utils.measure.ground_distance`), so
+    it is a true lower bound of any path's length. ``scale`` is the smallest
+    cost multiplier of the profile in use (see :func:`check_cost_profile`).
+    """
+    from .measure import ground_distance
+
+    goal = key_to_point[end_key]
+
+    def heuristic(key):
+        return ground_distance(key_to_point[key], goal, layer) * scale
+
+    return heuristic
+
+
 def build_path_across_network(
     layer: QgsVectorLayer,
     start_pt: QgsPointXY,
@@ -204,14 +481,15 @@ def build_path_across_network(
     """
     try:
         # Build network graph
-        key_to_point, segments = build_network_graph(layer, tolerance)
+        index = VertexIndex(tolerance)
+        key_to_point, segments = build_network_graph(layer, tolerance, index)
 
         if not key_to_point or not segments:
             return None
 
         # Find nearest vertices to start and end
-        start_key = find_nearest_vertex(start_pt, key_to_point, tolerance)
-        end_key = find_nearest_vertex(end_pt, key_to_point, tolerance)
+        start_key = find_nearest_vertex(start_pt, index, tolerance)
+        end_key = find_nearest_vertex(end_pt, index, tolerance)
 
         if start_key is None or end_key is None:
             return None
@@ -230,6 +508,62 @@ def build_path_across_network(
         return None
 
 
+def build_weighted_path_across_network(
+    layer: QgsVectorLayer,
+    start_pt: QgsPointXY,
+    end_pt: QgsPointXY,
+    tolerance: float,
+    algorithm: str = ROUTING_ASTAR,
+    cost_profile: Optional[Dict[str, float]] = None,
+    stats: Optional[Dict[str, float]] = None
+) -> Optional[List[QgsPointXY]]:
+    """
+    Find the shortest path in metres across the network (Dijkstra or A*).
+
+    Unlike :func:`build_path_across_network`, a long straight segment beats a
+    run of short ones with many breakpoints.
+
+    Args:
+        layer: Route layer to path through
+        start_pt: Starting point
+        end_pt: Ending point
+        tolerance: Tolerance for vertex matching (map units)
+        algorithm: ROUTING_ASTAR or ROUTING_DIJKSTRA
+        cost_profile: Optional ``tip_trase`` -> cost multiplier mapping
+        stats: Optional dict filled by :func:`find_path_astar`
+
+    Returns:
+        List of QgsPointXY representing the path, or None if no path exists
+    """
+    scale = check_cost_profile(cost_profile)
+    try:
+        index = VertexIndex(tolerance)
+        key_to_point, adj = build_weighted_network(layer, tolerance, cost_profile, index)
+        if not key_to_point or not adj:
+            return None
+
+        start_key = find_nearest_vertex(start_pt, index, tolerance)
+        end_key = find_nearest_vertex(end_pt, index, tolerance)
+        if start_key is None or end_key is None:
+            return None
+
+        heuristic = None
+        if algorithm == ROUTING_ASTAR:
+            heuristic = straight_line_heuristic(key_to_point, end_key, layer, scale)
+
+        path_keys = find_path_astar(
+            lambda k: adj.get(k, {}).items(), start_key, end_key, heuristic, stats
+        )
+        if path_keys is None:
+            return None
+
+        return [key_to_point[k] for k in path_keys]
+
+    except Exception as e:
+        logger.debug(f"Error in build_weighted_path_across_network: {e}")
+        return None
+
+
 def build_path_across_joined_routes(
     layer: QgsVectorLayer,
     start_pt: QgsPointXY,
@@ -254,9 +588,10 @@ def build_path_across_joined_routes(
     """
     try:
         # Build feature-level graph
-        node_to_edges: Dict[Tuple[int, int], List[Tuple[int, bool]]] = {}
+        index = VertexIndex(tolerance)
+        node_to_edges: Dict[Tuple[int, int], List[int]] = {}
         edge_to_points: Dict[int, List[QgsPointXY]] = {}
-        endpoints: Dict[int, Tuple[QgsPointXY, QgsPointXY]] = {}
+        edge_keys: Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]] = {}
 
         for feature in layer.getFeatures():
             p_first, p_last, pts = get_first_last_points(feature.geometry())
@@ -264,92 +599,114 @@ def build_path_across_joined_routes(
                 continue
 
             fid = feature.id()
+            k1 = index.snap(p_first)
+            k2 = index.snap(p_last)
             edge_to_points[fid] = pts
-            endpoints[fid] = (p_first, p_last)
+            edge_keys[fid] = (k1, k2)
 
-            k1 = round_key(p_first, tolerance)
-            k2 = round_key(p_last, tolerance)
+            node_to_edges.setdefault(k1, []).append(fid)
+            node_to_edges.setdefault(k2, []).append(fid)
 
-            node_to_edges.setdefault(k1, []).append((fid, False))
-            node_to_edges.setdefault(k2, []).append((fid, True))
+        return walk_joined_routes(
+            node_to_edges, edge_keys, edge_to_points,
+            index.nearest(start_pt), index.nearest(end_pt)
+        )
 
-        # Find start and end nodes
-        start_key = round_key(start_pt, tolerance)
-        end_key = round_key(end_pt, tolerance)
+    except Exception:
+        return None
 
-        if start_key not in node_to_edges or end_key not in node_to_edges:
-            return None
 
-        # BFS at feature level
-        queue = deque([start_key])
-        parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start_key: None}
-        via_edge: Dict[Tuple[int, int], Optional[int]] = {start_key: None}
+def walk_joined_routes(
+    node_to_edges,
+    edge_keys: Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]],
+    edge_to_points: Dict[int, List[QgsPointXY]],
+    start_key: Optional[Tuple[int, int]],
+    end_key: Optional[Tuple[int, int]]
+) -> Optional[List[QgsPointXY]]:
+    """
+    BFS over a feature-level route graph and stitch the feature geometries.
 
-        while queue:
-            u = queue.popleft()
+    Shared by :func:`build_path_across_joined_routes` and the cached
+    :class:`~fiberq.utils.route_graph.RouteGraph`, so both produce the same path.
 
-            if u == end_key:
-                break
+    Args:
+        node_to_edges: Node key -> iterable of fids of the features ending there
+        edge_keys: fid -> (first_key, last_key)
+        edge_to_points: fid -> feature vertices
+        start_key: Node key to start from (None: no node near the start)
+        end_key: Node key to reach (None: no node near the end)
 
-            for (fid, _) in node_to_edges.get(u, []):
-                p0, p1 = endpoints[fid]
-                k0 = round_key(p0, tolerance)
-                k1 = round_key(p1, tolerance)
-                v = k1 if u == k0 else k0
+    Returns:
+        List of QgsPointXY representing the path, or None if no path exists
+    """
+    if start_key is None or end_key is None:
+        return None
+    if start_key not in node_to_edges or end_key not in node_to_edges:
+        return None
 
-                if v not in parent:
-                    parent[v] = u
-                    via_edge[v] = fid
-                    queue.append(v)
+    # BFS at feature level
+    queue = deque([start_key])
+    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start_key: None}
+    via_edge: Dict[Tuple[int, int], Optional[int]] = {start_key: None}
 
-        if end_key not in parent:
-            return None
+    while queue:
+        u = queue.popleft()
 
-        # Reconstruct edge sequence
-        edge_order = []
-        v = end_key
-        while via_edge[v] is not None:
-            edge_order.append(via_edge[v])
-            v = parent[v]
-        edge_order.reverse()
-
-        # Build path from edges
-        path_pts: List[QgsPointXY] = []
-        current_node = start_key
-
-        for fid in edge_order:
-            pts = edge_to_points[fid]
-            p_first, p_last = endpoints[fid]
-            k_first = round_key(p_first, tolerance)
-            k_last = round_key(p_last, tolerance)
-
-            # Determine direction
-            if k_first == current_node:
-                seq = pts
-                current_node = k_last
-            else:
-                seq = list(reversed(pts))
-                current_node = k_first
+        if u == end_key:
+            break
 
-            # Append points, avoiding duplicates at joins
-            if not path_pts:
-                path_pts.extend(seq)
-            else:
-                if (path_pts[-1].x() == seq[0].x() and  # noqa: W504
-                        path_pts[-1].y() == seq[0].y()):
-                    path_pts.extend(seq[1:])
-                else:
-                    path_pts.extend(seq)
-
-        # Verify we reached the end
-        if round_key(path_pts[-1], tolerance) != end_key:
-            return None
+        for fid in node_to_edges.get(u, ()):
+            k0, k1 = edge_keys[fid]
+            v = k1 if u == k0 else k0
 
-        return path_pts
+            if v not in parent:
+                parent[v] = u
+                via_edge[v] = fid
+                queue.append(v)
 
-    except Exception:
+    if end_key not in parent:
+        return None
+
+    # Reconstruct edge sequence
+    edge_order = []
+    v = end_key
+    while via_edge[v] is not None:
+        edge_order.append(via_edge[v])
+        v = parent[v]
+    edge_order.reverse()
+
+    # Build path from edges
+    path_pts: List[QgsPointXY] = []
+    current_node = start_key
+
+    for fid in edge_order:
+        pts = edge_to_points[fid]
+        k_first, k_last = edge_keys[fid]
+
+        # Determine direction
+        if k_first == current_node:
+            seq = pts
+            current_node = k_last
+        else:
+            seq = list(reversed(pts))
+            current_node = k_first
+
+        # Append points, avoiding duplicates at joins
+        if not path_pts:
+            path_pts.extend(seq)
+        else:
+            if (path_pts[-1].x() == seq[0].x() and  # noqa: W504
+                    path_pts[-1].y() == seq[0].y()):
+                path_pts.extend(seq[1:])
+            else:
+                path_pts.extend(seq)
+
+    # Verify we reached the end
+    if not path_pts or current_node != end_key:
         return None
 
+    return path_pts
+
 
 # =============================================================================
 # ROUTING HELPER FUNCTIONS
@@ -359,7 +716,9 @@ def find_route_between_points(
     layer: QgsVectorLayer,
     start_pt: QgsPointXY,
     end_pt: QgsPointXY,
-    tolerance: float
+    tolerance: float,
+    algorithm: str = ROUTING_BFS,
+    cost_profile: Optional[Dict[str, float]] = None
 ) -> Optional[List[QgsPointXY]]:
     """
     Find a route between two points, trying multiple algorithms.
@@ -372,12 +731,29 @@ def find_route_between_points(
         start_pt: Starting point
         end_pt: Ending point
         tolerance: Tolerance for vertex matching (map units)
+        algorithm: One of ROUTING_ALGORITHMS. ROUTING_BFS minimises the
+            number of vertices; ROUTING_DIJKSTRA and ROUTING_ASTAR minimise
+            metres (times the cost profile), A* settling far fewer vertices
+        cost_profile: Optional ``tip_trase`` -> cost multiplier mapping,
+            e.g. ``{"vazdusna": 1.0, "podzemna": 3.0}``; weighted algorithms only
 
     Returns:
         List of QgsPointXY representing the path, or None if no path exists
+
+    Raises:
+        ValueError: for an unknown algorithm or an invalid cost profile
     """
+    if algorithm not in ROUTING_ALGORITHMS:
+        raise ValueError(f"Unknown routing algorithm {algorithm!r}; expected one of {ROUTING_ALGORITHMS}")
+    check_cost_profile(cost_profile)
+
     # Try vertex-level routing first
-    path = build_path_across_network(layer, start_pt, end_pt, tolerance)
+    if algorithm == ROUTING_BFS:
+        path = build_path_across_network(layer, start_pt, end_pt, tolerance)
+    else:
+        path = build_weighted_path_across_network(
+            layer, start_pt, end_pt, tolerance, algorithm, cost_profile
+        )
 
     if path is None:
         # Fall back to feature-level routing
@@ -388,7 +764,8 @@ def find_route_between_points(
 
 def get_network_connectivity(
     layer: QgsVectorLayer,
-    tolerance: float
+    tolerance: float,
+    index: Optional[VertexIndex] = None
 ) -> Dict[Tuple[int, int], Set[int]]:
     """
     Analyze network connectivity, returning connected components.
@@ -396,10 +773,14 @@ def get_network_connectivity(
     Args:
         layer: Route layer to analyze
         tolerance: Tolerance for vertex matching
+        index: Optional VertexIndex to snap the endpoints into; its
+            ``points`` then map the returned keys to coordinates
 
     Returns:
         Dict mapping vertex keys to set of feature IDs connected at that vertex
     """
+    if index is None:
+        index = VertexIndex(tolerance)
     connectivity: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
 
     for feature in layer.getFeatures():
@@ -408,8 +789,8 @@ def get_network_connectivity(
             continue
 
         fid = feature.id()
-        k1 = round_key(p_first, tolerance)
-        k2 = round_key(p_last, tolerance)
+        k1 = index.snap(p_first)
+        k2 = index.snap(p_last)
 
         connectivity[k1].add(fid)
         connectivity[k2].add(fid)
@@ -431,20 +812,12 @@ def find_endpoints_on_network(
     Returns:
         List of endpoint QgsPointXY coordinates
     """
-    connectivity = get_network_connectivity(layer, tolerance)
+    index = VertexIndex(tolerance)
+    connectivity = get_network_connectivity(layer, tolerance, index)
+    key_to_point = index.points
 
     endpoints = []
 
-    # Build key to point mapping
-    key_to_point: Dict[Tuple[int, int], QgsPointXY] = {}
-    for feature in layer.getFeatures():
-        p_first, p_last, _ = get_first_last_points(feature.geometry())
-        if p_first:
-            k1 = round_key(p_first, tolerance)
-            k2 = round_key(p_last, tolerance)
-            key_to_point[k1] = p_first
-            key_to_point[k2] = p_last
-
     # Find vertices connected to only one feature
     for key, fids in connectivity.items():
         if len(fids) == 1 and key in key_to_point:
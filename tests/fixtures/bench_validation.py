@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""Benchmark validation on the scale fixture, rule by rule.
+
+``tests/test_scale.py`` answers "is it still roughly linear?"; this answers "how
+long does each rule take at 200,000 features, and did that change?":
+
+    make bench                                   # every size, clean and faulty
+    python tests/fixtures/bench_validation.py --sizes 1k,10k --modes clean
+    make bench-baseline                          # store this machine's numbers
+
+A case is one fixture size (1k, 10k, 50k or 200k features) in clean or
+``--faulty`` mode, generated with ``make_scale_project``. Each case is validated
+in a fresh interpreter, so the peak memory it reports is its own, and the time
+of every rule is taken from the runner's per-rule progress callbacks.
+
+Every invocation is appended to a JSON history (``bench_history.json`` next to
+this file, not committed) and compared with the stored baseline
+(``bench_baseline.json``). A rule that is slower than the baseline by more than
+``--threshold`` *and* by more than ``--min-seconds``, or a case whose peak
+memory grew by more than ``--threshold``, is reported as a regression and the
+exit status is 1. Timings are wall-clock: compare a baseline only with runs
+from the machine that recorded it.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess  # nosec B404 - runs this same script for each case
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+HERE = os.path.dirname(os.path.abspath(__file__))
+if HERE not in sys.path:
+    sys.path.insert(0, HERE)
+
+from make_scale_project import build, rows  # noqa: E402
+
+HISTORY = os.path.join(HERE, "bench_history.json")
+BASELINE = os.path.join(HERE, "bench_baseline.json")
+
+#: Fixture sizes by name, in features.
+SIZES = {"1k": 1_000, "10k": 10_000, "50k": 50_000, "200k": 200_000}
+MODES = ("clean", "faulty")
+
+#: Features per street segment of the scale fixture (route, cable, poles, manhole).
+FEATURES_PER_SEGMENT = sum(len(features) for features in rows(1).values())
+
+
+def case_name(size, mode) -> str:
+    return f"{size}-{mode}"
+
+
+def parse_sizes(text):
+    """``"1k,10k"`` -> ``[("1k", 1000), ("10k", 10000)]``. A plain number of
+    features is accepted too, and named after itself."""
+    sizes = []
+    for item in text.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        if item in SIZES:
+            sizes.append((item, SIZES[item]))
+            continue
+        try:
+            sizes.append((item, int(item)))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"unknown size {item!r}") from None
+    return sizes
+
+
+def _peak_rss_mb():
+    """This process's peak resident set size in MiB, or None where unknown."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+# ---------------------------------------------------------------------------
+# One case, in its own interpreter
+# ---------------------------------------------------------------------------
+
+def run_case(gpkg, faulty):
+    """Validate the scale GeoPackage ``gpkg``; the case's result dict. Needs a
+    running QgsApplication."""
+    from qgis.core import Qgis, QgsProject
+
+    from make_demo_project import load_demo_layers
+    from fiberq.core.schema_version import mark_project_current
+    from fiberq.core.validation_manager import ValidationFeedback, run_validation
+
+    class _RuleClock(ValidationFeedback):
+        """Time between consecutive rule completions: each rule's own time."""
+
+        def __init__(self):
+            super().__init__()
+            self.seconds = {}
+            self.issues = {}
+            self._last = time.perf_counter()
+
+        def rule_finished(self, rule, issues, done, total):
+            now = time.perf_counter()
+            self.seconds[rule.id] = now - self._last
+            self.issues[rule.id] = len(issues or ())
+            self._last = now
+
+    project = QgsProject()
+    load_demo_layers(gpkg, project)
+    mark_project_current(project)
+    features = sum(layer.featureCount() for layer in project.mapLayers().values())
+
+    clock = _RuleClock()
+    start = time.perf_counter()
+    result = run_validation(project=project, plugin_version="bench", feedback=clock)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "features": features,
+        "faulty": faulty,
+        "seconds": elapsed,
+        "rules": clock.seconds,
+        "issues": clock.issues,
+        "rule_errors": list(result.rule_errors),
+        "peak_rss_mb": _peak_rss_mb(),
+        "qgis": Qgis.version(),
+    }
+
+
+def _case_main(gpkg, faulty):
+    from qgis.core import QgsApplication
+
+    QgsApplication.setPrefixPath("/usr", True)
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        print(json.dumps(run_case(gpkg, faulty)))
+    finally:
+        app.exitQgis()
+    return 0
+
+
+def _spawn_case(gpkg, faulty):
+    cmd = [sys.executable, os.path.abspath(__file__), "--case", gpkg]
+    if faulty:
+        cmd.append("--faulty")
+    done = subprocess.run(cmd, capture_output=True, text=True, check=False)  # nosec B603
+    lines = [line for line in done.stdout.splitlines() if line.startswith("{")]
+    if done.returncode != 0 or not lines:
+        raise RuntimeError(f"benchmark case {gpkg} failed:\n{done.stderr.strip()}")
+    return json.loads(lines[-1])
+
+
+# ---------------------------------------------------------------------------
+# History and baseline
+# ---------------------------------------------------------------------------
+
+def _git_commit():
+    try:
+        done = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,  # nosec B603 B607
+                              capture_output=True, text=True, check=False)
+    except OSError:
+        return ""
+    return done.stdout.strip()
+
+
+def _plugin_version():
+    try:
+        with open(os.path.join(REPO_ROOT, "fiberq", "metadata.txt"), encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("version="):
+                    return line.split("=", 1)[1].strip()
+    except OSError:
+        pass
+    return ""
+
+
+def load_json(path, default):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path, data):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def compare(baseline, run, threshold=0.25, min_seconds=0.05):
+    """Regressions of ``run`` against ``baseline``, as readable lines.
+
+    Only cases and rules present in both are compared, so adding a size or a
+    rule never reads as a regression.
+    """
+    problems = []
+    for name, case in sorted(run.get("cases", {}).items()):
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            continue
+        for rule_id, seconds in sorted(case.get("rules", {}).items()):
+            before = base.get("rules", {}).get(rule_id)
+            if before is None:
+                continue
+            if seconds > before * (1.0 + threshold) and seconds - before > min_seconds:
+                problems.append(f"{name} {rule_id}: {seconds:.3f}s, baseline {before:.3f}s "
+                                f"(+{100.0 * (seconds - before) / max(before, 1e-9):.0f}%)")
+        peak, before = case.get("peak_rss_mb"), base.get("peak_rss_mb")
+        if peak is not None and before and peak > before * (1.0 + threshold):
+            problems.append(f"{name} peak memory: {peak:.0f} MiB, baseline {before:.0f} MiB "
+                            f"(+{100.0 * (peak - before) / before:.0f}%)")
+    return problems
+
+
+def format_run(run, baseline=None) -> str:
+    """A table of the run: one column per case, one row per rule."""
+    names = sorted(run["cases"], key=lambda n: (run["cases"][n]["features"], n))
+    rule_ids = sorted({r for case in run["cases"].values() for r in case["rules"]})
+    base_cases = (baseline or {}).get("cases", {})
+
+    def cell(name, value, base):
+        if value is None:
+            return "-"
+        text = f"{value:.3f}"
+        if base:
+            text += f" ({100.0 * (value - base) / base:+.0f}%)"
+        return text
+
+    width = max([12] + [len(n) for n in names]) + 10
+    lines = ["rule".ljust(8) + "".join(n.rjust(width) for n in names)]
+    for rule_id in rule_ids + ["total"]:
+        row = rule_id.ljust(8)
+        for name in names:
+            case, base = run["cases"][name], base_cases.get(name, {})
+            if rule_id == "total":
+                row += cell(name, case["seconds"], base.get("seconds")).rjust(width)
+            else:
+                row += cell(name, case["rules"].get(rule_id),
+                            base.get("rules", {}).get(rule_id)).rjust(width)
+        lines.append(row)
+    row = "rss MiB".ljust(8)
+    for name in names:
+        peak = run["cases"][name].get("peak_rss_mb")
+        row += ("-" if peak is None else f"{peak:.0f}").rjust(width)
+    lines.append(row)
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=parse_sizes, default=list(SIZES.items()),
+                        help="comma-separated fixture sizes (default: 1k,10k,50k,200k)")
+    parser.add_argument("--modes", default=",".join(MODES),
+                        help="clean, faulty or both (default: clean,faulty)")
+    parser.add_argument("--workdir", help="keep and reuse the generated GeoPackages here")
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slow-down that counts as a regression (default 0.25)")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="ignore slow-downs smaller than this (default 0.05)")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--faulty", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        return _case_main(args.case, args.faulty)
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(sorted(unknown))}")
+
+    run = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "version": _plugin_version(),
+        "python": platform.python_version(),
+        "platform": f"{platform.system()} {platform.machine()}",
+        "cases": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="fiberq-bench-") as scratch:
+        workdir = args.workdir or scratch
+        os.makedirs(workdir, exist_ok=True)
+        for size, features in args.sizes:
+            segments = max(1, round(features / FEATURES_PER_SEGMENT))
+            for mode in modes:
+                name = case_name(size, mode)
+                gpkg = os.path.join(workdir, f"scale_{segments}_{mode}.gpkg")
+                if not (args.workdir and os.path.exists(gpkg)):
+                    build(gpkg, segments, faulty=(mode == "faulty"))
+                print(f"{name}: validating ...", flush=True)
+                case = _spawn_case(gpkg, mode == "faulty")
+                run["qgis"] = case.pop("qgis", "")
+                run["cases"][name] = case
+                print(f"{name}: {case['features']} features in {case['seconds']:.2f}s", flush=True)
+
+    history = load_json(args.history, [])
+    history.append(run)
+    save_json(args.history, history)
+
+    if args.save_baseline:
+        save_json(args.baseline, run)
+        print(format_run(run))
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    baseline = load_json(args.baseline, None)
+    print(format_run(run, baseline))
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline} -- store one with: make bench-baseline")
+        return 0
+    problems = compare(baseline, run, args.threshold, args.min_seconds)
+    if problems:
+        print(f"\n{len(problems)} regression(s) against the baseline of "
+              f"{baseline.get('timestamp', '?')} ({baseline.get('commit', '?')}):")
+        for line in problems:
+            print("  " + line)
+        return 1
+    print(f"\nNo regressions against the baseline of {baseline.get('timestamp', '?')}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
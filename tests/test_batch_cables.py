@@ -0,0 +1,103 @@
+"""Tests for batch cable laying.
+
+Drops out of one OTB share a source, so the router answers them all from one
+shortest-path tree instead of searching the network once per cable.
+"""
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from fiberq.core.cable_manager import CableManager
+from fiberq.utils import route_graph as rg
+from fiberq.utils.routing import path_from_tree, shortest_path_tree
+
+CRS = "EPSG:3857"
+TOL = 0.5
+
+
+def _route_layer(lines):
+    layer = QgsVectorLayer(f"LineString?crs={CRS}&field=tip_trase:string", "Route", "memory")
+    assert layer.isValid()
+    feats = []
+    for pts in lines:
+        feat = QgsFeature(layer.fields())
+        feat.setGeometry(QgsGeometry.fromPolylineXY(pts))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def _star():
+    """Three spurs out of (0,0), plus a detached line."""
+    return _route_layer([
+        [QgsPointXY(0, 0), QgsPointXY(50, 0), QgsPointXY(100, 0)],
+        [QgsPointXY(0, 0), QgsPointXY(0, 80)],
+        [QgsPointXY(0, 0), QgsPointXY(-30, 0), QgsPointXY(-30, -40)],
+        [QgsPointXY(500, 500), QgsPointXY(600, 500)],
+    ])
+
+
+def _xy(path):
+    return [(round(p.x(), 6), round(p.y(), 6)) for p in path] if path else path
+
+
+def test_shortest_path_tree_stops_once_targets_are_settled():
+    edges = {0: [(1, 1.0), (2, 5.0)], 1: [(2, 1.0), (3, 10.0)], 2: [(3, 1.0)], 3: []}
+    dist, parent = shortest_path_tree(lambda k: edges[k], 0, [2])
+    assert dist[2] == 2.0
+    assert path_from_tree(parent, 2) == [0, 1, 2]
+    assert 3 not in dist
+    assert path_from_tree(parent, 3) is None
+
+
+def test_paths_from_matches_one_search_per_target(qgis_app):
+    layer = _star()
+    graph = rg.RouteGraph(layer, TOL)
+    source = QgsPointXY(0, 0)
+    targets = [QgsPointXY(100, 0), QgsPointXY(0, 80), QgsPointXY(-30, -40), QgsPointXY(600, 500)]
+    try:
+        batch = graph.paths_from(source, targets)
+        single = [graph.path_across_network(source, t, "dijkstra") for t in targets]
+    finally:
+        graph.disconnect()
+
+    assert [_xy(p) for p in batch] == [_xy(p) for p in single]
+    assert batch[-1] is None
+
+
+def test_route_cable_pairs_groups_by_source(qgis_app, monkeypatch):
+    layer = _star()
+    manager = CableManager(None)
+    calls = []
+    original = rg.RouteGraph.paths_from
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(rg.RouteGraph, "paths_from", counting)
+    a, b = QgsPointXY(0, 0), QgsPointXY(100, 0)
+    pairs = [(a, b), (a, QgsPointXY(0, 80)), (b, QgsPointXY(0, 80)), (a, QgsPointXY(600, 500))]
+    try:
+        geoms = manager.route_cable_pairs(layer, pairs, TOL)
+    finally:
+        rg.clear_route_graphs()
+
+    assert len(calls) == 2
+    assert geoms[3] is None
+    assert round(geoms[0].length(), 6) == 100.0
+    assert round(geoms[2].length(), 6) == 180.0
+
+
+def test_read_cable_pairs_csv(tmp_path):
+    manager = CableManager(None)
+    named = tmp_path / "named.csv"
+    named.write_text("naziv;od;do\nx;ODF 1;OTB 2\ny;ODF 1;OTB 3\n", encoding="utf-8")
+    assert manager.read_cable_pairs_csv(str(named)) == [("ODF 1", "OTB 2"), ("ODF 1", "OTB 3")]
+
+    bare = tmp_path / "bare.csv"
+    bare.write_text("ODF 1,OTB 2\n\nODF 1,OTB 3\n", encoding="utf-8")
+    assert manager.read_cable_pairs_csv(str(bare)) == [("ODF 1", "OTB 2"), ("ODF 1", "OTB 3")]
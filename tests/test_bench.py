@@ -0,0 +1,62 @@
+"""Tests for the validation benchmark harness (tests/fixtures/bench_validation.py).
+
+The harness itself is run by ``make bench``, not by the suite; these check that
+a case reports every rule, and that the baseline comparison flags what it should
+and nothing else.
+"""
+import pathlib
+import sys
+
+import pytest
+
+FIXTURES = pathlib.Path(__file__).resolve().parent / "fixtures"
+if str(FIXTURES) not in sys.path:
+    sys.path.insert(0, str(FIXTURES))
+
+import bench_validation as bench  # noqa: E402
+
+
+def _run(seconds, peak=500.0):
+    return {"cases": {"10k-clean": {"features": 10_000, "seconds": sum(seconds.values()),
+                                    "rules": dict(seconds), "peak_rss_mb": peak}}}
+
+
+def test_sizes_parse_by_name_or_number():
+    assert bench.parse_sizes("1k, 200k") == [("1k", 1_000), ("200k", 200_000)]
+    assert bench.parse_sizes("2500") == [("2500", 2_500)]
+    with pytest.raises(Exception):
+        bench.parse_sizes("huge")
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = _run({"A1": 1.0, "B4": 0.01, "C1": 0.5})
+    run = _run({"A1": 1.5, "B4": 0.03, "C1": 0.55, "E2": 9.0})
+    problems = bench.compare(baseline, run, threshold=0.25, min_seconds=0.05)
+    # A1 is 50% slower; B4 tripled but by 20 ms; C1 is within 25%; E2 is new
+    assert len(problems) == 1
+    assert problems[0].startswith("10k-clean A1:")
+
+
+def test_compare_flags_memory_growth_and_ignores_new_cases():
+    baseline = _run({"A1": 1.0}, peak=400.0)
+    run = _run({"A1": 1.0}, peak=600.0)
+    run["cases"]["200k-faulty"] = {"features": 200_000, "seconds": 1.0, "rules": {"A1": 99.0}}
+    problems = bench.compare(baseline, run)
+    assert len(problems) == 1
+    assert "peak memory" in problems[0]
+    assert "A1" in bench.format_run(run, baseline)
+
+
+@pytest.mark.slow
+def test_a_case_times_every_rule(qgis_app, tmp_path):
+    from fiberq.core.validation_rules import RULES
+
+    gpkg = str(tmp_path / "bench.gpkg")
+    bench.build(gpkg, 40, faulty=True)
+    case = bench.run_case(gpkg, faulty=True)
+
+    assert case["features"] == 40 * bench.FEATURES_PER_SEGMENT
+    assert set(case["rules"]) == {rule.id for rule in RULES}
+    assert all(seconds >= 0 for seconds in case["rules"].values())
+    assert case["issues"]["A3"] > 0  # the faulty fixture really is faulty
+    assert case["rule_errors"] == []
@@ -0,0 +1,120 @@
+"""Tests for the streaming BOM engine.
+
+Only FiberQ layers are counted; stored lengths are used as they are and only
+features without one are measured; every feature lands in its layer's totals
+and in its (category, layer, type) bucket.
+"""
+import csv
+
+import pytest
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core.bom_engine import bom_layers, build_bom, write_bom_csv
+from fiberq.core.layer_registry import ROLE_CABLE, ROLE_ELEMENT, LayerRegistry
+from fiberq.utils.measure import clear_cache, distance_area
+
+CRS = "EPSG:3857"
+
+
+@pytest.fixture
+def project(qgis_app):
+    project = QgsProject()
+    project.setCrs(QgsCoordinateReferenceSystem(CRS))
+    project.setEllipsoid("EPSG:7030")
+    clear_cache()
+    yield project
+    project.clear()
+    clear_cache()
+
+
+@pytest.fixture
+def registry(project):
+    registry = LayerRegistry(project)
+    yield registry
+    registry.detach()
+
+
+def _cables(rows):
+    layer = QgsVectorLayer(
+        f"LineString?crs={CRS}&field=tip:string&field=kapacitet:string&field=podtip:string"
+        f"&field=duzina_m:double&field=slack_m:double",
+        "Underground cables", "memory")
+    assert layer.isValid()
+    feats = []
+    for i, (tip, kap, podtip, length, slack) in enumerate(rows):
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([tip, kap, podtip, NULL if length is None else length, slack])
+        feat.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(0, i * 10.0), QgsPointXY(500.0, i * 10.0)]))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def _points(name, count, fields="naziv:string"):
+    layer = QgsVectorLayer(f"Point?crs={CRS}&field={fields}", name, "memory")
+    feats = []
+    for i in range(count):
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([f"{name} {i}"])
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i, i)))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def test_rollup_by_layer_and_type(project, registry):
+    cables = _cables([
+        ("optical", "24", "glavni", 100.0, 5.0),
+        ("optical", "24", "glavni", 50.0, None),
+        ("optical", "48", "glavni", None, 2.0),   # no stored length: measured
+    ])
+    odf = _points("ODF", 3)
+    dxf = _points("DXF", 7, fields="layer:string")
+    project.addMapLayers([cables, odf, dxf])
+
+    result = build_bom(bom_layers(project, registry))
+
+    assert result.ok
+    assert set(result.by_layer) == {cables.id(), odf.id()}
+    measured = distance_area(cables.crs(), project).measureLength(
+        QgsGeometry.fromPolylineXY([QgsPointXY(0, 20.0), QgsPointXY(500.0, 20.0)]))
+    row = result.by_layer[cables.id()]
+    assert row.count == 3
+    assert row.length_m == pytest.approx(150.0 + measured)
+    assert row.slack_m == pytest.approx(7.0)
+    assert result.by_layer[odf.id()].count == 3
+
+    groups = {(cat, layer, key): (r.count, r.length_m) for (cat, layer, key), r in result.groups.items()}
+    assert groups[(ROLE_CABLE, "Underground cables", ("optical", "24", "glavni"))] == (2, 150.0)
+    assert groups[(ROLE_CABLE, "Underground cables", ("optical", "48", "glavni"))] == (1, pytest.approx(measured))
+    assert groups[(ROLE_ELEMENT, "ODF", ())][0] == 3
+    assert result.totals["points"] == 3
+
+
+def test_cancel_stops_the_rollup(project, registry):
+    project.addMapLayers([_cables([("optical", "24", "glavni", 1.0, 0.0)]), _points("ODF", 1)])
+
+    result = build_bom(bom_layers(project, registry), is_cancelled=lambda: True)
+
+    assert result.cancelled
+
+
+def test_csv_has_layers_totals_and_types(project, registry, tmp_path):
+    project.addMapLayers([_cables([("optical", "24", "glavni", 10.0, 1.0)])])
+    path = tmp_path / "bom.csv"
+
+    write_bom_csv(str(path), build_bom(bom_layers(project, registry)))
+
+    rows = list(csv.reader(path.read_text(encoding="utf-8").splitlines(), delimiter=";"))
+    assert rows[0][0] == "Layer"
+    assert rows[1][:3] == ["Underground cables", "Line", "1"]
+    assert rows[3][0] == "TOTAL"
+    assert rows[6][:4] == [ROLE_CABLE, "Underground cables", "optical / 24 / glavni", "1"]
@@ -0,0 +1,92 @@
+"""Tests for branch_index assignment.
+
+Only values that change are written, and a newly laid cable only re-indexes
+the cables sharing its endpoints.
+"""
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core import validation_manager as vm
+from fiberq.core.cable_manager import CableManager
+
+CRS = "EPSG:3857"
+
+
+def _line(*xy):
+    return QgsGeometry.fromPolylineXY([QgsPointXY(x, y) for x, y in xy])
+
+
+def _cables(geoms, fields="&field=naziv:string"):
+    layer = QgsVectorLayer(f"LineString?crs={CRS}{fields}", "Underground cables", "memory")
+    assert layer.isValid()
+    _add(layer, geoms)
+    return layer
+
+
+def _add(layer, geoms):
+    feats = []
+    for geom in geoms:
+        feat = QgsFeature(layer.fields())
+        feat.setGeometry(geom)
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+
+
+def _indices(layer):
+    return {f.id(): f["branch_index"] for f in layer.getFeatures()}
+
+
+def test_groups_are_direction_independent_and_rewrites_are_skipped(qgis_app):
+    layer = _cables([_line((0, 0), (100, 0)), _line((100, 0), (50, 20), (0, 0)), _line((0, 0), (0, 100))])
+    manager = CableManager(None)
+
+    assert manager.compute_branch_indices_for_layer(layer, tol_m=1.0) == (2, 3)
+    assert sorted(_indices(layer).values()) == [-1, 0, 1]
+    assert not layer.isEditable()
+
+    assert manager.compute_branch_indices_for_layer(layer, tol_m=1.0) == (2, 0)
+
+
+def test_new_cable_only_touches_its_endpoint_group(qgis_app):
+    layer = _cables([_line((0, 0), (100, 0)), _line((0, 0), (0, 100))])
+    manager = CableManager(None)
+    manager.compute_branch_indices_for_layer(layer, tol_m=1.0)
+
+    new = _line((100, 0.5), (0, 0.5))
+    _add(layer, [new])
+    assert manager.update_branch_indices_near(layer, [new], tol_m=1.0) == 2
+
+    full = _indices(layer)
+    assert manager.compute_branch_indices_for_layer(layer, tol_m=1.0) == (2, 0)
+    assert _indices(layer) == full
+
+
+def test_unbranched_layers_are_left_alone(qgis_app):
+    layer = _cables([_line((0, 0), (100, 0))])
+    assert CableManager(None).update_branch_indices_near(layer, [_line((0, 0), (100, 0))]) == 0
+    assert layer.fields().indexFromName("branch_index") == -1
+
+
+def test_caches_following_the_layer_see_the_written_indices(qgis_app):
+    """The write goes through the provider, which emits no layer signal."""
+    layer = _cables([_line((0, 0), (100, 0)), _line((100, 0), (0, 0))],
+                    fields="&field=naziv:string&field=branch_index:integer")
+    project = QgsProject()
+    project.addMapLayer(layer)
+    validator = vm.IncrementalValidator(project)
+    validator.run()
+    heard = []
+    layer.attributeValueChanged.connect(lambda fid, idx, value: heard.append((fid, value)))
+
+    assert CableManager(None).compute_branch_indices_for_layer(layer, tol_m=1.0) == (1, 2)
+
+    assert sorted(heard) == sorted(_indices(layer).items())
+    validator.run()
+    columns = validator._ctx.columns(layer)
+    assert {columns.fids[r]: columns.values["branch_index"][r] for r in columns.rows()} == _indices(layer)
+    validator.disconnect()
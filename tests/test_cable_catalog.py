@@ -0,0 +1,102 @@
+"""Tests for the shared cable catalogue.
+
+Lookups must agree with the layer, and edits must be picked up without a full
+re-read.
+"""
+import pytest
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core.cable_catalog import CableCatalog
+from fiberq.core.layer_registry import LayerRegistry
+
+CRS = "EPSG:3857"
+
+
+def _cables(name="Underground cables", count=3):
+    layer = QgsVectorLayer(
+        f"LineString?crs={CRS}&field=fiberq_uuid:string&field=od:string&field=do:string",
+        name, "memory")
+    assert layer.isValid()
+    feats = []
+    for i in range(count):
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([f"c{i}", f"n{i}", f"n{i + 1}"])
+        feat.setGeometry(QgsGeometry.fromPolylineXY(
+            [QgsPointXY(i * 100.0, 0), QgsPointXY(i * 100.0 + 100, 0)]))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+@pytest.fixture
+def project(qgis_app):
+    project = QgsProject()
+    project.setCrs(project.crs().fromOgcWmsCrs(CRS))
+    yield project
+    project.clear()
+
+
+@pytest.fixture
+def catalog(project):
+    registry = LayerRegistry(project)
+    catalog = CableCatalog(project, registry)
+    yield catalog
+    catalog.detach()
+    registry.detach()
+
+
+def test_records_by_id_and_uuid(project, catalog):
+    layer = _cables()
+    project.addMapLayer(layer)
+
+    records = catalog.records()
+    assert [rec.uuid for rec in records] == ["c0", "c1", "c2"]
+    first = records[0]
+    assert catalog.record(layer.id(), first.fid) is first
+    assert catalog.by_uuid("c2").get("do") == "n3"
+    assert catalog.by_uuid("missing") is None
+    assert catalog.coords(first) == [(0.0, 0.0), (100.0, 0.0)]
+    assert catalog.length(first) == pytest.approx(100.0, rel=0.01)
+
+
+def test_edits_refresh_only_what_they_touch(project, catalog):
+    layer = _cables()
+    project.addMapLayer(layer)
+    before = {rec.uuid: rec for rec in catalog.records()}
+
+    layer.startEditing()
+    changed = before["c1"]
+    layer.changeAttributeValue(changed.fid, layer.fields().indexOf("od"), "moved")
+    layer.deleteFeature(before["c2"].fid)
+
+    after = {rec.uuid: rec for rec in catalog.records()}
+    assert set(after) == {"c0", "c1"}
+    assert after["c1"].get("od") == "moved"
+    assert after["c0"] is before["c0"]  # untouched records are not re-read
+
+    layer.rollBack()
+    assert {rec.uuid for rec in catalog.records()} == {"c0", "c1", "c2"}
+
+
+def test_removed_layers_are_forgotten(project, catalog):
+    layer = _cables()
+    project.addMapLayer(layer)
+    fid = catalog.records()[0].fid
+
+    project.removeMapLayer(layer.id())
+    assert catalog.records() == []
+    assert catalog.record(layer.id(), fid) is None
+
+
+def test_other_line_layers_load_on_lookup(project, catalog):
+    pipes = _cables("PE pipes", count=1)
+    project.addMapLayer(pipes)
+    assert catalog.records() == []  # cables only by default
+    fid = next(pipes.getFeatures()).id()
+    assert catalog.record(pipes.id(), fid).uuid == "c0"
@@ -0,0 +1,90 @@
+"""Tests for the spatially indexed candidate-element search.
+
+The index must find exactly what measuring every point finds, in the same
+order, and see edits made after it was built.
+"""
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from fiberq.core import element_index as ei
+
+CRS = "EPSG:3857"
+
+
+def _points(name, rows):
+    layer = QgsVectorLayer(f"Point?crs={CRS}&field=naziv:string", name, "memory")
+    assert layer.isValid()
+    feats = []
+    for naziv, x, y in rows:
+        feat = QgsFeature(layer.fields())
+        feat.setAttribute("naziv", naziv)
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(x, y)))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def _cable(pts, od="", do=""):
+    layer = QgsVectorLayer(f"LineString?crs={CRS}&field=od:string&field=do:string",
+                           "Underground cables", "memory")
+    feat = QgsFeature(layer.fields())
+    feat.setAttributes([od, do])
+    feat.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(x, y) for x, y in pts]))
+    layer.dataProvider().addFeatures([feat])
+    return layer, next(layer.getFeatures())
+
+
+def _brute_force(cable_feature, layer, tol):
+    geom = cable_feature.geometry()
+    return sorted(
+        (float(geom.lineLocatePoint(f.geometry())), f["naziv"])
+        for f in layer.getFeatures() if geom.distance(f.geometry()) <= tol)
+
+
+def test_matches_a_full_scan_and_skips_endpoints(qgis_app):
+    # An L-shaped cable: its bounding box holds points far from the line
+    cable_layer, cable = _cable([(0, 0), (1000, 0), (1000, 1000)], od="start", do="end")
+    rows = [("start", 0, 1), ("end", 1000, 1000), ("a", 300, 4), ("b", 1003, 600),
+            ("inside-bbox", 500, 500), ("far", 5000, 5000)]
+    elements = _points("ODF", rows)
+    ei.drop_element_index(elements.id())
+
+    found = ei.candidate_elements(cable_layer, cable, [elements], tol=5.0)
+
+    assert [c["naziv"] for c in found] == ["a", "b"]
+    expected = [(m, name) for m, name in _brute_force(cable, elements, 5.0)
+                if name not in ("start", "end")]
+    assert [(c["m"], c["naziv"]) for c in found] == expected
+
+
+def test_batch_matches_single_cable_search(qgis_app):
+    elements = _points("TB", [("p", 50, 2), ("q", 150, 2), ("r", 250, 2)])
+    cables = [_cable([(0, 0), (100, 0)]), _cable([(100, 0), (300, 0)])]
+
+    batch = ei.candidate_elements_for_cables(cables, [elements], tol=5.0)
+
+    for layer, feat in cables:
+        single = ei.candidate_elements(layer, feat, [elements], tol=5.0)
+        assert batch[(layer.id(), feat.id())] == single
+
+
+def test_index_follows_edits(qgis_app):
+    cable_layer, cable = _cable([(0, 0), (100, 0)])
+    elements = _points("OTB", [("old", 10, 1)])
+    assert [c["naziv"] for c in ei.candidate_elements(cable_layer, cable, [elements])] == ["old"]
+
+    elements.startEditing()
+    feat = QgsFeature(elements.fields())
+    feat.setAttribute("naziv", "new")
+    feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(90, 1)))
+    elements.addFeature(feat)
+    names = [c["naziv"] for c in ei.candidate_elements(cable_layer, cable, [elements])]
+    elements.rollBack()
+
+    assert names == ["old", "new"]
+    assert [c["naziv"] for c in ei.candidate_elements(cable_layer, cable, [elements])] == ["old"]
+    ei.clear_element_indexes()
@@ -0,0 +1,166 @@
+"""Tests for the background GeoPackage export.
+
+Every layer goes into one transaction: all of them land, with their feature ids
+and a spatial index, or -- on cancel -- none do. Saving again only writes the
+features that changed.
+"""
+import sqlite3
+from contextlib import closing
+
+from qgis.core import (
+    NULL,
+    QgsFeature,
+    QgsFeatureSource,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core.export_manager import ExportManager
+from fiberq.core.gpkg_export_task import LayerExport, gpkg_layer_names, write_gpkg
+
+CRS = "EPSG:3857"
+
+
+def _layer(name, count, deleted=()):
+    layer = QgsVectorLayer(f"Point?crs={CRS}&field=naziv:string&field=kapacitet:integer",
+                           name, "memory")
+    assert layer.isValid()
+    feats = []
+    for i in range(count):
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([f"{name}-{i}", i if i % 2 else None])
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i, i)))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    layer.dataProvider().deleteFeatures(list(deleted))
+    return layer
+
+
+def _jobs(layers):
+    names = gpkg_layer_names(layers)
+    return [LayerExport(lyr, names[lyr.id()]) for lyr in layers]
+
+
+def test_layers_are_written_with_their_fids_and_an_index(qgis_app, tmp_path):
+    layers = [_layer("ODF", 5, deleted=[2]), _layer("ODF", 3)]
+    path = str(tmp_path / "project.gpkg")
+    heard = []
+
+    result = write_gpkg(path, _jobs(layers), progress=lambda lid, pct: heard.append((lid, pct)))
+
+    assert result.ok
+    assert result.written == {layers[0].id(): "ODF", layers[1].id(): "ODF_2"}
+    assert {(lid, pct) for lid, pct in heard if pct == 100.0} == {(lyr.id(), 100.0) for lyr in layers}
+
+    odf = QgsVectorLayer(f"{path}|layername=ODF", "ODF", "ogr")
+    assert odf.isValid()
+    by_fid = {f.id(): f for f in odf.getFeatures()}
+    assert sorted(by_fid) == sorted(f.id() for f in layers[0].getFeatures())
+    assert by_fid[3]["naziv"] == "ODF-2"
+    assert by_fid[1]["kapacitet"] == NULL
+    assert odf.hasSpatialIndex() == QgsFeatureSource.SpatialIndexPresence.SpatialIndexPresent
+
+
+def test_cancel_leaves_the_file_as_it_was(qgis_app, tmp_path):
+    path = str(tmp_path / "project.gpkg")
+    first = [_layer("Route", 2)]
+    assert write_gpkg(path, _jobs(first)).ok
+
+    result = write_gpkg(path, _jobs([_layer("Route", 7), _layer("Poles", 1)]), is_cancelled=lambda: True)
+
+    assert result.cancelled and not result.written
+    route = QgsVectorLayer(f"{path}|layername=Route", "Route", "ogr")
+    assert route.featureCount() == 2
+    assert not QgsVectorLayer(f"{path}|layername=Poles", "Poles", "ogr").isValid()
+    with closing(sqlite3.connect(path)) as db:
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+
+def _keyed(rows):
+    layer = QgsVectorLayer(f"Point?crs={CRS}&field=fiberq_uuid:string&field=naziv:string", "Poles", "memory")
+    _add_keyed(layer, rows)
+    return layer
+
+
+def _add_keyed(layer, rows):
+    feats = []
+    for uuid, naziv, x in rows:
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([uuid, naziv])
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(x, 0)))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+
+
+def test_delta_sync_writes_only_changed_rows(qgis_app, tmp_path):
+    path = str(tmp_path / "project.gpkg")
+    layer = _keyed([(f"u{i}", f"P{i}", i) for i in range(50)])
+    assert write_gpkg(path, _jobs([layer]), delta=True).ok
+
+    unchanged = write_gpkg(path, _jobs([layer]), delta=True)
+    assert unchanged.synced == {layer.id(): (0, 0, 0)}
+
+    by_uuid = {f["fiberq_uuid"]: f.id() for f in layer.getFeatures()}
+    pr = layer.dataProvider()
+    pr.changeAttributeValues({by_uuid["u3"]: {layer.fields().indexOf("naziv"): "renamed"}})
+    pr.deleteFeatures([by_uuid["u7"]])
+    _add_keyed(layer, [("new", "P-new", 99)])
+
+    result = write_gpkg(path, _jobs([layer]), delta=True)
+
+    assert result.synced == {layer.id(): (1, 1, 1)}
+    saved = QgsVectorLayer(f"{path}|layername=Poles", "Poles", "ogr")
+    rows = {f["fiberq_uuid"]: f["naziv"] for f in saved.getFeatures()}
+    assert len(rows) == 50 and "u7" not in rows
+    assert rows["u3"] == "renamed" and rows["new"] == "P-new"
+    assert {f["fiberq_uuid"]: f.id() for f in saved.getFeatures()} == {
+        f["fiberq_uuid"]: f.id() for f in layer.getFeatures()}
+
+
+def test_delta_sync_rewrites_tables_it_cannot_key(qgis_app, tmp_path):
+    path = str(tmp_path / "project.gpkg")
+    layer = _keyed([("u1", "P1", 1), ("u1", "P1 again", 2)])  # duplicate uuid
+    assert write_gpkg(path, _jobs([layer]), delta=True).ok
+
+    result = write_gpkg(path, _jobs([layer]), delta=True)
+
+    assert result.ok and result.synced == {}
+    assert QgsVectorLayer(f"{path}|layername=Poles", "Poles", "ogr").featureCount() == 2
+
+
+def test_delta_sync_rewrites_tables_whose_fids_moved(qgis_app, tmp_path):
+    path = str(tmp_path / "project.gpkg")
+    rows = [(f"u{i}", f"P{i}", i) for i in range(5)]
+    assert write_gpkg(path, _jobs([_keyed(rows)]), delta=True).ok
+    layer = _keyed(rows[::-1])  # same uuids, other fids
+
+    result = write_gpkg(path, _jobs([layer]), delta=True)
+
+    assert result.ok and result.synced == {} and result.moved == []
+    saved = QgsVectorLayer(f"{path}|layername=Poles", "Poles", "ogr")
+    assert {f["fiberq_uuid"]: f.id() for f in saved.getFeatures()} == {
+        f["fiberq_uuid"]: f.id() for f in layer.getFeatures()}
+
+
+def test_layers_edited_during_the_export_stay_on_their_source(qgis_app, qgis_iface, tmp_path):
+    path = str(tmp_path / "project.gpkg")
+    edited, untouched = _layer("ODF", 2), _layer("Poles", 2)
+    QgsProject.instance().addMapLayers([edited, untouched])
+    manager = ExportManager(qgis_iface)
+    try:
+        manager._watch_edits([edited, untouched])
+        result = write_gpkg(path, _jobs([edited, untouched]))
+        edited.startEditing()
+        edited.changeAttributeValue(1, 0, "renamed while saving")
+        edited.commitChanges()
+
+        manager._on_gpkg_export_finished(result)
+
+        assert edited.providerType() == "memory"
+        assert next(edited.getFeatures())["naziv"] == "renamed while saving"
+        assert untouched.providerType() == "ogr"
+        assert manager._gpkg_watch == []
+    finally:
+        QgsProject.instance().removeMapLayers([edited.id(), untouched.id()])
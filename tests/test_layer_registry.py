@@ -0,0 +1,109 @@
+"""Tests for the project-wide FiberQ layer registry.
+
+Lookups must give what the old ``mapLayers()`` name scans gave, and stay right
+as layers are added, renamed and removed.
+"""
+import pytest
+from qgis.core import QgsProject, QgsVectorLayer, QgsWkbTypes
+
+from fiberq.core.layer_registry import (
+    ROLE_CABLE,
+    ROLE_MANHOLE,
+    ROLE_POLE,
+    LayerRegistry,
+    resolve_layer_name,
+)
+
+POINT = QgsWkbTypes.GeometryType.PointGeometry
+LINE = QgsWkbTypes.GeometryType.LineGeometry
+
+
+def _layer(geom_type, name):
+    layer = QgsVectorLayer(f"{geom_type}?crs=EPSG:3857", name, "memory")
+    assert layer.isValid(), name
+    return layer
+
+
+@pytest.fixture
+def project(qgis_app):
+    project = QgsProject()
+    yield project
+    project.clear()
+
+
+@pytest.fixture
+def registry(project):
+    registry = LayerRegistry(project)
+    yield registry
+    registry.detach()
+
+
+def test_legacy_and_folded_names_resolve():
+    assert resolve_layer_name("Trasa") == "Route"
+    assert resolve_layer_name("okna ") == "Manholes"
+    assert resolve_layer_name("Optical slacks") == "Optical slack"
+    assert resolve_layer_name("Parcels") is None
+
+
+def test_layers_present_before_the_registry_are_indexed(project):
+    route = _layer("LineString", "Trasa")
+    project.addMapLayer(route)
+    registry = LayerRegistry(project)
+    try:
+        assert registry.layer("Route") is route
+        assert registry.layer("Route", geometry=POINT) is None
+        assert registry.canonical_name(route) == "Route"
+    finally:
+        registry.detach()
+
+
+def test_roles_and_geometry(project, registry):
+    poles = _layer("Point", "Stubovi")
+    manholes = _layer("Point", "Manholes")
+    aerial = _layer("LineString", "Aerial cables")
+    underground = _layer("LineString", "Kablovi_podzemni")
+    project.addMapLayers([poles, manholes, aerial, underground])
+
+    by_id = sorted([aerial, underground], key=lambda lyr: lyr.id())
+    assert registry.by_role(ROLE_CABLE) == by_id
+    assert registry.by_role(ROLE_CABLE, geometry=POINT) == []
+    assert set(registry.by_role(ROLE_POLE, ROLE_MANHOLE)) == {poles, manholes}
+    assert set(registry.by_geometry(LINE)) == {aerial, underground}
+    assert registry.role(poles) == ROLE_POLE
+
+
+def test_renames_join_and_leave_the_index(project, registry):
+    layer = _layer("Point", "scratch")
+    project.addMapLayer(layer)
+    assert registry.layers() == []
+
+    layer.setName("OKNA")
+    assert registry.layer("Manholes") is layer
+
+    layer.setName("scratch again")
+    assert registry.layer("Manholes") is None
+    assert registry.by_geometry(POINT) == []
+
+
+def test_removed_layers_leave_the_index(project, registry):
+    layer = _layer("Point", "Poles")
+    project.addMapLayer(layer)
+    assert registry.layer("Poles") is layer
+
+    project.removeMapLayer(layer.id())
+    assert registry.layer("Poles") is None
+    assert registry.by_role(ROLE_POLE) == []
+
+
+def test_unknown_names_are_looked_up_in_the_project(project, registry):
+    custom = _layer("Point", "My cabinets")
+    project.addMapLayer(custom)
+    assert registry.layers() == []
+    assert registry.layer("My cabinets") is custom
+    assert registry.layer("My cabinets", geometry=LINE) is None
+
+
+def test_cleared_project_empties_the_registry(project, registry):
+    project.addMapLayer(_layer("LineString", "Route"))
+    project.clear()
+    assert registry.layers() == []
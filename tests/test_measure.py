@@ -169,6 +169,53 @@ def test_cache_is_keyed_on_crs_and_ellipsoid(project):
     assert ground_length(geom, _layer(), project=project) != pytest.approx(on_wgs84)
 
 
+# ---------------------------------------------------------------------------
+# Length cache -- unchanged features are measured once
+# ---------------------------------------------------------------------------
+
+def _layer_with(geom):
+    from qgis.core import QgsFeature
+
+    layer = _layer()
+    feat = QgsFeature(layer.fields())
+    feat.setGeometry(geom)
+    layer.dataProvider().addFeatures([feat])
+    return layer, next(layer.getFeatures()).id()
+
+
+def test_lengths_are_cached_per_feature_and_geometry(project):
+    from fiberq.utils.measure import length_cache
+
+    layer, fid = _layer_with(_mercator_line(1000.0))
+    cache = length_cache(project)
+    first = ground_length(next(layer.getFeatures()).geometry(), layer, project=project, fid=fid)
+    again = ground_length(next(layer.getFeatures()).geometry(), layer, project=project, fid=fid)
+
+    assert again == first == pytest.approx(ground_length(_mercator_line(1000.0), layer, project=project))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Changed behind the layer's back (no signal): the geometry hash catches it
+    layer.dataProvider().changeGeometryValues({fid: _mercator_line(2000.0)})
+    longer = ground_length(next(layer.getFeatures()).geometry(), layer, project=project, fid=fid)
+    assert longer == pytest.approx(2 * first, rel=0.01)
+    assert cache.misses == 2
+
+
+def test_geometry_changed_drops_the_cached_length(project):
+    from fiberq.utils.measure import length_cache
+
+    layer, fid = _layer_with(_mercator_line(1000.0))
+    ground_length(next(layer.getFeatures()).geometry(), layer, project=project, fid=fid)
+    cache = length_cache(project)
+    assert (layer.id(), fid) in cache
+
+    layer.startEditing()
+    layer.changeGeometry(fid, _mercator_line(500.0))
+
+    assert (layer.id(), fid) not in cache
+    layer.rollBack()
+
+
 # ---------------------------------------------------------------------------
 # No caller may regress to planar maths for a stored length
 # ---------------------------------------------------------------------------
@@ -177,12 +224,11 @@ def test_cache_is_keyed_on_crs_and_ellipsoid(project):
 LENGTH_WRITERS = [
     ("fiberq/core/route_manager.py", 4),
     ("fiberq/core/cable_manager.py", 1),
-    ("fiberq/core/slack_manager.py", 1),
+    ("fiberq/core/slack_totals.py", 1),
     ("fiberq/tools/route_tool.py", 1),
     ("fiberq/tools/breakpoint_tool.py", 2),
     ("fiberq/tools/branch_tool.py", 1),
-    ("fiberq/dialogs/schematic_dialog.py", 1),
-    ("fiberq/addons/reserve_hook.py", 1),
+    ("fiberq/core/cable_catalog.py", 1),
     ("fiberq/tools/pipe_tool.py", 1),
 ]
 
@@ -0,0 +1,170 @@
+"""Tests for publishing the project to PostGIS.
+
+Runs against the database of the ``pg_dsn`` fixture (skipped without one).
+Every layer lands in one transaction, and republishing a keyed layer only
+writes the rows that changed.
+"""
+import threading
+
+import pytest
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from fiberq.core.pg_publish import close_pg_connections, get_pg_connection, pg_connection, publish_layers
+from fiberq.core.gpkg_export_task import LayerExport
+
+pytestmark = pytest.mark.postgis
+
+CRS = "EPSG:3857"
+SCHEMA = "fiberq_test"
+
+
+@pytest.fixture
+def conn(pg_dsn):
+    conn = get_pg_connection(pg_dsn)
+    with conn.cursor() as cur:
+        cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    conn.commit()
+    yield conn
+    close_pg_connections()
+
+
+def _keyed(name, rows):
+    layer = QgsVectorLayer(f"Point?crs={CRS}&field=fiberq_uuid:string&field=naziv:string&field=kapacitet:integer",
+                           name, "memory")
+    assert layer.isValid()
+    _add(layer, rows)
+    return layer
+
+
+def _add(layer, rows):
+    feats = []
+    for uuid, naziv, x in rows:
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([uuid, naziv, x if x % 2 else None])
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(x, 0)))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+
+
+def _jobs(layers):
+    return [LayerExport(lyr, lyr.name().lower()) for lyr in layers]
+
+
+def _rows(conn, table):
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT fiberq_uuid, naziv, kapacitet, ST_X(geom), ST_SRID(geom) FROM {SCHEMA}.{table}")
+        return {r[0]: r[1:] for r in cur.fetchall()}
+
+
+def test_layers_are_published_together(qgis_app, conn):
+    poles = _keyed("Poles", [(f"p{i}", f"P{i}", i) for i in range(20)])
+    odf = _keyed("ODF", [("o1", "ODF 1", 5)])
+
+    result = publish_layers(conn, SCHEMA, _jobs([poles, odf]))
+
+    assert result.ok
+    assert result.counts == {poles.id(): (20, 0), odf.id(): (1, 0)}
+    rows = _rows(conn, "poles")
+    assert len(rows) == 20
+    assert rows["p3"] == ("P3", 3, 3.0, 3857)
+    assert rows["p4"][1] is None
+    with conn.cursor() as cur:
+        cur.execute("SELECT indexdef FROM pg_indexes WHERE schemaname = %s AND tablename = 'poles'", (SCHEMA,))
+        assert any("gist" in d.lower() for (d,) in cur.fetchall())
+
+
+def test_republish_writes_only_changes(qgis_app, conn):
+    layer = _keyed("Poles", [(f"p{i}", f"P{i}", i) for i in range(20)])
+    assert publish_layers(conn, SCHEMA, _jobs([layer])).ok
+    assert publish_layers(conn, SCHEMA, _jobs([layer])).counts == {layer.id(): (0, 0)}
+
+    by_uuid = {f["fiberq_uuid"]: f.id() for f in layer.getFeatures()}
+    pr = layer.dataProvider()
+    pr.changeAttributeValues({by_uuid["p3"]: {layer.fields().indexOf("naziv"): "renamed"}})
+    pr.deleteFeatures([by_uuid["p7"]])
+    _add(layer, [("new", "P-new", 99)])
+
+    result = publish_layers(conn, SCHEMA, _jobs([layer]))
+
+    assert result.counts == {layer.id(): (2, 1)}
+    rows = _rows(conn, "poles")
+    assert len(rows) == 20 and "p7" not in rows
+    assert rows["p3"][0] == "renamed" and rows["new"][0] == "P-new"
+
+
+def test_cancel_publishes_nothing(qgis_app, conn):
+    layers = [_keyed("Poles", [("p1", "P1", 1)]), _keyed("ODF", [("o1", "ODF 1", 1)])]
+    checks = []
+
+    def is_cancelled():
+        checks.append(1)
+        return len(checks) > 1  # after the first layer
+
+    result = publish_layers(conn, SCHEMA, _jobs(layers), is_cancelled=is_cancelled)
+
+    assert result.cancelled and not result.tables
+    with conn.cursor() as cur:
+        cur.execute("SELECT count(*) FROM pg_namespace WHERE nspname = %s", (SCHEMA,))
+        assert cur.fetchone()[0] == 0
+
+
+def test_nulls_stay_null(qgis_app, conn):
+    layer = QgsVectorLayer(f"Point?crs={CRS}&field=naziv:string&field=duzina:double&field=datum:date",
+                           "Nulls", "memory")
+    feats = []
+    for naziv, geom in (("", QgsGeometry.fromPointXY(QgsPointXY(1, 1))), (None, QgsGeometry())):
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([naziv, None, None])
+        feat.setGeometry(geom)
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+
+    result = publish_layers(conn, SCHEMA, _jobs([layer]))
+
+    assert result.ok, result.errors
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT naziv, duzina, datum, geom IS NULL FROM {SCHEMA}.nulls ORDER BY fid")
+        assert cur.fetchall() == [("", None, None, False), (None, None, None, True)]
+
+
+def test_repeated_uuids_fail_the_publish(qgis_app, conn):
+    poles = _keyed("Poles", [("p1", "P1", 1)])
+    odf = _keyed("ODF", [("o1", "ODF 1", 1), ("o1", "ODF 1 again", 3), ("o2", "ODF 2", 5)])
+
+    result = publish_layers(conn, SCHEMA, _jobs([poles, odf]))
+
+    assert not result.ok and result.tables == {}
+    assert result.errors[0].startswith("ODF: 1 feature(s) repeat")
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass(%s)", (f"{SCHEMA}.poles",))
+        assert cur.fetchone()[0] is None  # rolled back with the rest
+
+
+def test_close_waits_for_the_publish_holding_the_connection(qgis_app, pg_dsn):
+    held, release, seen = threading.Event(), threading.Event(), []
+
+    def publish():
+        with pg_connection(pg_dsn) as conn:
+            held.set()
+            release.wait(5)
+            seen.append(conn.closed)
+
+    worker = threading.Thread(target=publish)
+    worker.start()
+    assert held.wait(5)
+    closer = threading.Thread(target=close_pg_connections)
+    closer.start()
+    closer.join(0.2)
+    assert closer.is_alive()  # waiting for the publish, not closing under it
+
+    release.set()
+    worker.join()
+    closer.join()
+    assert seen == [0]
+    assert get_pg_connection(pg_dsn).closed == 0  # a fresh one
+    close_pg_connections()
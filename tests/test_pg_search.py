@@ -0,0 +1,88 @@
+"""Tests for the server-side preview search.
+
+Runs against the database of the ``pg_dsn`` fixture (skipped without one).
+Exact matches beat prefix matches, only ids and the extent come back, and
+several tables are searched in one call.
+"""
+import pytest
+
+from fiberq.core.pg_search import PgSearch, _like_escape, recommended_index_ddl
+
+pytestmark = pytest.mark.postgis
+
+SCHEMA = "fiberq_search_test"
+
+
+@pytest.fixture
+def search(pg_dsn):
+    psycopg2 = pytest.importorskip("psycopg2")
+    conn = psycopg2.connect(pg_dsn)
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        cur.execute(f"CREATE SCHEMA {SCHEMA}")
+        cur.execute(f"CREATE TABLE {SCHEMA}.trasa (fid serial PRIMARY KEY, naziv text, geom geometry(Point, 3857))")
+        cur.execute(f"INSERT INTO {SCHEMA}.trasa (naziv, geom) VALUES "
+                    "('R-10', ST_SetSRID(ST_MakePoint(0, 0), 3857)), "
+                    "('R-100', ST_SetSRID(ST_MakePoint(10, 5), 3857)), "
+                    "('R-101', ST_SetSRID(ST_MakePoint(20, 5), 3857)), "
+                    "('X_1', ST_SetSRID(ST_MakePoint(30, 5), 3857))")
+        cur.execute(f"CREATE TABLE {SCHEMA}.stubovi (fid serial PRIMARY KEY, naziv text, geom geometry(Point, 3857))")
+        cur.execute(f"INSERT INTO {SCHEMA}.stubovi (naziv, geom) VALUES "
+                    "('R-1000', ST_SetSRID(ST_MakePoint(50, 50), 3857))")
+        cur.execute(f"CREATE TABLE {SCHEMA}.nokey (naziv text)")
+    searcher = PgSearch(pg_dsn, SCHEMA)
+    yield searcher, conn
+    searcher.close()
+    with conn.cursor() as cur:
+        cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    conn.close()
+
+
+def test_exact_match_beats_prefix(qgis_app, search):
+    searcher, _conn = search
+
+    hits = searcher.search("r-10", ["trasa"])
+
+    assert list(hits) == ["trasa"]
+    assert hits["trasa"].ids == [1] and hits["trasa"].rank == 0
+    assert hits["trasa"].extent == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_prefix_matches_across_tables(qgis_app, search):
+    searcher, _conn = search
+
+    hits = searcher.search("R-10", ["trasa", "stubovi", "nokey", "missing"])
+    assert hits["trasa"].rank == 0
+
+    hits = searcher.search("R-100", ["trasa", "stubovi", "nokey", "missing"])
+    assert set(hits) == {"trasa", "stubovi"}
+    assert hits["stubovi"].rank == 1 and hits["stubovi"].extent == (50.0, 50.0, 50.0, 50.0)
+
+    assert searcher.search("X_", ["trasa"])["trasa"].ids == [4]
+
+
+def test_like_wildcards_are_literal():
+    assert _like_escape("R_1%") == "R\\_1\\%"
+
+
+def test_results_are_cached(qgis_app, search):
+    searcher, conn = search
+    assert searcher.search("R-101", ["trasa"])["trasa"].ids == [3]
+
+    with conn.cursor() as cur:
+        cur.execute(f"DELETE FROM {SCHEMA}.trasa WHERE naziv = 'R-101'")
+
+    assert searcher.search("R-101", ["trasa"])["trasa"].ids == [3]
+
+
+def test_recommended_indexes_apply(qgis_app, search):
+    _searcher, conn = search
+    with conn.cursor() as cur:
+        try:
+            for statement in recommended_index_ddl(SCHEMA, "trasa", "naziv"):
+                cur.execute(statement)
+        except Exception as e:
+            pytest.skip(f"pg_trgm not available: {e}")
+        cur.execute("SELECT count(*) FROM pg_indexes WHERE schemaname = %s AND tablename = 'trasa'", (SCHEMA,))
+        assert cur.fetchone()[0] == 3
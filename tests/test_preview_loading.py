@@ -0,0 +1,52 @@
+"""Tests for the PostGIS preview's cheap loading helpers.
+
+The ID / name completer asks the provider for DISTINCT values with a LIMIT
+instead of reading every feature, and zoomed-out previews draw no labels.
+"""
+from qgis.core import (
+    QgsFeature,
+    QgsPalLayerSettings,
+    QgsVectorLayer,
+    QgsVectorLayerSimpleLabeling,
+)
+
+from fiberq.addons.fiberq_preview import _completer_values, _id_field, _limit_labels_to_scale
+
+
+def _layer(values):
+    layer = QgsVectorLayer("Point?crs=EPSG:3857&field=oznaka:string&field=naziv:string", "Poles", "memory")
+    assert layer.isValid()
+    feats = []
+    for v in values:
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes(["x", v])
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def test_completer_values_are_distinct_non_empty_and_limited(qgis_app):
+    layer = _layer(["P2", "P1", "P2", None, "  ", " P3 "])
+
+    assert _id_field(layer) == "naziv"
+    assert _completer_values(layer, "naziv") == ["P1", "P2", "P3"]
+    assert len(_completer_values(layer, "naziv", limit=2)) <= 2
+    assert _completer_values(layer, "missing") == []
+
+
+def test_labels_are_limited_to_close_scales(qgis_app):
+    layer = _layer(["P1"])
+    settings = QgsPalLayerSettings()
+    settings.fieldName = "naziv"
+    layer.setLabeling(QgsVectorLayerSimpleLabeling(settings))
+
+    _limit_labels_to_scale(layer, 25000)
+
+    limited = layer.labeling().settings()
+    assert limited.scaleVisibility and limited.minimumScale == 25000
+
+    # A range chosen in the style is kept
+    limited.minimumScale = 5000
+    layer.setLabeling(QgsVectorLayerSimpleLabeling(limited))
+    _limit_labels_to_scale(layer, 25000)
+    assert layer.labeling().settings().minimumScale == 5000
@@ -0,0 +1,152 @@
+"""Tests for the cached route graph.
+
+The graph must answer exactly what the stateless builders in
+fiberq.utils.routing answer, and keep answering correctly while the Route layer
+is edited -- without being rebuilt from the layer for every query.
+"""
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from fiberq.utils import route_graph as rg
+from fiberq.utils.routing import (
+    build_path_across_joined_routes,
+    build_path_across_network,
+)
+
+CRS = "EPSG:3857"
+TOL = 0.5
+
+
+def _route_layer(lines):
+    layer = QgsVectorLayer(f"LineString?crs={CRS}&field=tip_trase:string", "Route", "memory")
+    assert layer.isValid()
+    feats = []
+    for pts in lines:
+        feat = QgsFeature(layer.fields())
+        feat.setGeometry(QgsGeometry.fromPolylineXY(pts))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def _xy(path):
+    return [(round(p.x(), 6), round(p.y(), 6)) for p in path] if path else path
+
+
+def _l_shape():
+    """(0,0) -> (100,0) -> (100,100), as two features, plus a detached stub."""
+    return _route_layer([
+        [QgsPointXY(0, 0), QgsPointXY(50, 0), QgsPointXY(100, 0)],
+        [QgsPointXY(100, 0), QgsPointXY(100, 100)],
+        [QgsPointXY(500, 500), QgsPointXY(600, 500)],
+    ])
+
+
+def test_graph_matches_the_stateless_builders(qgis_app):
+    layer = _l_shape()
+    graph = rg.RouteGraph(layer, TOL)
+    a, b = QgsPointXY(0, 0), QgsPointXY(100, 100)
+
+    assert _xy(graph.path_across_network(a, b)) == _xy(build_path_across_network(layer, a, b, TOL))
+    assert _xy(graph.path_across_joined_routes(a, b)) == _xy(build_path_across_joined_routes(layer, a, b, TOL))
+    assert _xy(graph.path_across_network(a, b)) == [(0, 0), (50, 0), (100, 0), (100, 100)]
+    assert graph.path_across_network(a, QgsPointXY(600, 500)) is None
+    graph.disconnect()
+
+
+def test_path_within_feature_takes_the_sub_line(qgis_app):
+    layer = _l_shape()
+    graph = rg.RouteGraph(layer, TOL)
+
+    assert _xy(graph.path_within_feature(QgsPointXY(100, 0), QgsPointXY(0, 0))) == [(100, 0), (50, 0), (0, 0)]
+    # the two ends are on different features -> not a single-feature path
+    assert graph.path_within_feature(QgsPointXY(0, 0), QgsPointXY(100, 100)) is None
+    graph.disconnect()
+
+
+def test_edits_are_applied_without_a_rebuild(qgis_app, monkeypatch):
+    layer = _l_shape()
+    graph = rg.RouteGraph(layer, TOL)
+    a, c = QgsPointXY(0, 0), QgsPointXY(500, 500)
+    assert graph.path_across_network(a, c) is None
+
+    rebuilds = []
+    monkeypatch.setattr(graph, "rebuild", lambda: rebuilds.append(1))
+
+    # Join the stub to the L with a new route
+    layer.startEditing()
+    bridge = QgsFeature(layer.fields())
+    bridge.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(100, 100), QgsPointXY(500, 500)]))
+    assert layer.addFeature(bridge)
+    assert graph.path_across_network(a, c) is not None
+    assert layer.commitChanges()
+    assert graph.path_across_network(a, c) is not None
+
+    # Cut the L: the far side is unreachable again
+    layer.startEditing()
+    second = next(f.id() for f in layer.getFeatures()
+                  if f.geometry().asPolyline()[-1] == QgsPointXY(100, 100))
+    assert layer.deleteFeature(second)
+    assert layer.commitChanges()
+    assert graph.path_across_network(a, c) is None
+
+    # Move the stub so it starts where the L now ends
+    layer.startEditing()
+    stub = next(f.id() for f in layer.getFeatures()
+                if f.geometry().asPolyline()[0] == QgsPointXY(500, 500))
+    assert layer.changeGeometry(stub, QgsGeometry.fromPolylineXY([QgsPointXY(100, 0), QgsPointXY(500, 500)]))
+    assert layer.commitChanges()
+    assert _xy(graph.path_across_network(a, c)) == [(0, 0), (50, 0), (100, 0), (500, 500)]
+
+    assert rebuilds == []
+    graph.disconnect()
+
+
+def test_provider_writes_are_noticed(qgis_app):
+    """Writing straight to the provider emits no per-feature signal."""
+    layer = _l_shape()
+    graph = rg.RouteGraph(layer, TOL)
+    a, c = QgsPointXY(0, 0), QgsPointXY(500, 500)
+    assert graph.path_across_network(a, c) is None
+
+    bridge = QgsFeature(layer.fields())
+    bridge.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(100, 100), QgsPointXY(500, 500)]))
+    layer.dataProvider().addFeatures([bridge])
+    assert graph.path_across_network(a, c) is not None
+    graph.disconnect()
+
+
+def test_shared_instance_per_layer_and_tolerance_bucket(qgis_app):
+    layer = _l_shape()
+    try:
+        first = rg.get_route_graph(layer, 3.0)
+        assert first.tolerance == 4.0
+        assert rg.get_route_graph(layer, 3.5) is first  # a zoom step within the bucket
+        assert rg.get_route_graph(layer, 6.0) is not first
+
+        # Back to the first zoom level: still cached, not rebuilt
+        rg.get_route_graph(layer, 12.0)
+        assert rg.get_route_graph(layer, 3.0) is first
+        for tol in (24.0, 48.0, 96.0):
+            rg.get_route_graph(layer, tol)
+        assert rg.get_route_graph(layer, 3.0) is not first  # least recently used, dropped
+    finally:
+        rg.clear_route_graphs()
+
+
+def test_shared_graph_joins_what_the_stateless_builder_joins(qgis_app):
+    """Routes drawn a few metres apart, never snapped, still connect."""
+    layer = _route_layer([
+        [QgsPointXY(0, 0), QgsPointXY(100, 0)],
+        [QgsPointXY(103, 0), QgsPointXY(200, 0)],
+    ])
+    a, b = QgsPointXY(0, 0), QgsPointXY(200, 0)
+    try:
+        assert build_path_across_network(layer, a, b, 5.0) is not None
+        assert rg.get_route_graph(layer, 5.0).path_across_network(a, b, tolerance=5.0) is not None
+    finally:
+        rg.clear_route_graphs()
@@ -0,0 +1,176 @@
+"""Tests for the optical schematic's node/edge model.
+
+Change sets re-read only the features they name, layers the schematic does
+not draw are ignored, and the result matches a full collection.
+"""
+import sys
+
+import pytest
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core.cable_catalog import CableCatalog
+from fiberq.core.layer_registry import LayerRegistry
+from fiberq.core.schematic_model import SchematicModel, bundle_edges, map_to_scene, node_map_points
+
+CRS = "EPSG:3857"
+
+
+def _points(name, names):
+    layer = QgsVectorLayer(f"Point?crs={CRS}&field=naziv:string", name, "memory")
+    assert layer.isValid()
+    feats = []
+    for i, nm in enumerate(names):
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([nm])
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i * 100.0, 0)))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def _cables(ends):
+    layer = QgsVectorLayer(
+        f"LineString?crs={CRS}&field=od:string&field=do:string&field=podtip:string&field=kapacitet:string",
+        "Underground cables", "memory")
+    assert layer.isValid()
+    feats = []
+    for i, (a, b) in enumerate(ends):
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([a, b, "glavni", "24"])
+        feat.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(i * 100.0, 0), QgsPointXY(i * 100.0 + 100, 0)]))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+@pytest.fixture
+def project(qgis_app):
+    project = QgsProject()
+    project.setCrs(project.crs().fromOgcWmsCrs(CRS))
+    yield project
+    project.clear()
+
+
+@pytest.fixture
+def model(project):
+    registry = LayerRegistry(project)
+    catalog = CableCatalog(project, registry)
+    yield SchematicModel(project, catalog, registry)
+    catalog.detach()
+    registry.detach()
+
+
+def _full(project, model):
+    fresh = SchematicModel(project, model.catalog, model.registry)
+    fresh.load()
+    return fresh.nodes(), [(e["key"], e["from"], e["to"], e["kapacitet"]) for e in fresh.edges()]
+
+
+def _state(model):
+    return model.nodes(), [(e["key"], e["from"], e["to"], e["kapacitet"]) for e in model.edges()]
+
+
+def test_change_sets_match_a_full_collection(project, model):
+    odf = _points("ODF", ["OR 1", "ZOK 1", "ZOK 2"])
+    cables = _cables([("OR 1", "ZOK 1"), ("ZOK 1", "ZOK 2")])
+    project.addMapLayers([odf, cables])
+    model.load()
+    assert set(model.nodes()) == {"OR 1", "ZOK 1", "ZOK 2"}
+    assert len(model.edges()) == 2
+
+    # Rename a node, add one, delete one
+    fids = {f["naziv"]: f.id() for f in odf.getFeatures()}
+    odf.dataProvider().changeAttributeValues({fids["ZOK 2"]: {0: "ZOK 9"}})
+    odf.dataProvider().deleteFeatures([fids["ZOK 1"]])
+    added = _points("tmp", ["ZOK 3"])
+    odf.dataProvider().addFeatures(list(added.getFeatures()))
+    new_fid = max(f.id() for f in odf.getFeatures())
+    assert model.apply(odf, changed=[fids["ZOK 2"], new_fid], removed=[fids["ZOK 1"]])
+
+    # Change a cable's capacity and drop the other
+    cfids = sorted(f.id() for f in cables.getFeatures())
+    cables.dataProvider().changeAttributeValues({cfids[0]: {3: "48"}})
+    cables.dataProvider().deleteFeatures([cfids[1]])
+    assert model.apply(cables, changed=[cfids[0]], removed=[cfids[1]])
+
+    assert set(model.nodes()) == {"OR 1", "ZOK 9", "ZOK 3"}
+    assert _state(model) == _full(project, model)
+
+
+def test_layers_not_drawn_are_ignored(project, model):
+    drawing = QgsVectorLayer(f"Point?crs={CRS}&field=layer:string", "DXF", "memory")
+    project.addMapLayer(drawing)
+    model.load()
+
+    assert not model.draws(drawing)
+    assert not model.apply(drawing, changed=[1, 2, 3])
+
+
+def test_first_owner_keeps_a_shared_name(project, model):
+    a = _points("ODF", ["X"])
+    b = _points("TB", ["X"])
+    project.addMapLayers([a, b])
+    model.load()
+    assert model.nodes()["X"]["layer_id"] == a.id()
+
+    fid = next(a.getFeatures()).id()
+    a.dataProvider().deleteFeatures([fid])
+    assert model.apply(a, removed=[fid])
+    assert model.nodes()["X"]["layer_id"] == b.id()
+
+
+def test_parallel_edges_are_bundled_by_node_pair():
+    path = [(0.0, 0.0), (0.0, 70.0)]
+    lines = [
+        ({"from": "A", "to": "B"}, path),
+        ({"from": "B", "to": "A"}, path),
+        ({"from": "B", "to": "C"}, path),
+        ({"from": "A", "to": ""}, path),
+        ({"from": "A", "to": "B"}, path),
+    ]
+
+    bundles = bundle_edges(lines)
+
+    assert list(bundles) == [("A", "B")]
+    assert [e for e, _ in bundles[("A", "B")]] == [lines[0][0], lines[1][0], lines[4][0]]
+
+
+def test_node_map_points_are_in_the_project_crs(project, model):
+    odf = _points("ODF", ["OR 1", "ZOK 1"])
+    wgs = QgsVectorLayer("Point?crs=EPSG:4326&field=naziv:string", "TB", "memory")
+    feat = QgsFeature(wgs.fields())
+    feat.setAttributes(["TB 1"])
+    feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(20.0, 44.0)))
+    wgs.dataProvider().addFeatures([feat])
+    project.addMapLayers([odf, wgs])
+    model.load()
+
+    points = node_map_points(model.nodes(), project)
+
+    assert points["OR 1"] == (0.0, 0.0) and points["ZOK 1"] == (100.0, 0.0)
+    xform = QgsCoordinateTransform(QgsCoordinateReferenceSystem("EPSG:4326"), project.crs(), project)
+    expected = xform.transform(QgsPointXY(20.0, 44.0))
+    assert points["TB 1"] == pytest.approx((expected.x(), expected.y()))
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_map_to_scene_fits_north_up(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setitem(sys.modules, "numpy", None)  # import fails: pure-Python path
+    else:
+        pytest.importorskip("numpy")
+
+    pos, paths = map_to_scene({"A": (0.0, 0.0), "B": (160.0, 100.0)},
+                              [[(0.0, 0.0), (80.0, 100.0)], []], width=1600.0, height=1000.0, pad=20.0)
+
+    assert pos == {"A": (20.0, 1020.0), "B": (1620.0, 20.0)}
+    assert paths == [[(20.0, 1020.0), (820.0, 20.0)], []]
+    assert map_to_scene({}, [[]]) is None
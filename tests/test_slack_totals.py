@@ -0,0 +1,104 @@
+"""Tests for the running slack totals per cable.
+
+Totals must match a full sum over the slack layer, follow committed edits only,
+and tell listeners which cables a commit touched.
+"""
+import pytest
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core.slack_totals import SlackTotals, write_cable_totals
+
+CRS = "EPSG:3857"
+
+
+def _slacks(rows):
+    layer = QgsVectorLayer(
+        f"Point?crs={CRS}&field=cable_layer_id:string&field=cable_fid:integer&field=duzina_m:double",
+        "Optical slacks", "memory")
+    assert layer.isValid()
+    feats = []
+    for kid, fid, metres in rows:
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([kid, fid, metres])
+        feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+@pytest.fixture
+def totals(qgis_app):
+    layer = _slacks([("cables", 1, 20.0), ("cables", 1, 5.0), ("cables", 2, 10.0), (None, None, 7.0)])
+    totals = SlackTotals(layer)
+    totals.connect()
+    heard = []
+    totals.add_listener(heard.append)
+    yield layer, totals, heard
+    totals.disconnect()
+
+
+def test_seed_sums_per_cable(totals):
+    _, totals, _ = totals
+    assert totals.totals() == {("cables", 1): 25.0, ("cables", 2): 10.0}
+    assert totals.total("cables", 3) == 0.0
+
+
+def test_committed_edits_update_totals(totals):
+    layer, totals, heard = totals
+    fid_two = next(f.id() for f in layer.getFeatures() if f["cable_fid"] == 2)
+
+    layer.startEditing()
+    feat = QgsFeature(layer.fields())
+    feat.setAttributes(["cables", 3, 15.0])
+    feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(1, 1)))
+    layer.addFeature(feat)
+    layer.changeAttributeValue(fid_two, layer.fields().indexOf("cable_fid"), 1)
+    assert totals.total("cables", 3) == 0.0  # uncommitted edits do not count
+    layer.commitChanges()
+
+    assert totals.totals() == {("cables", 1): 35.0, ("cables", 3): 15.0}
+    assert set().union(*heard) == {("cables", 1), ("cables", 2), ("cables", 3)}
+
+    heard.clear()
+    layer.startEditing()
+    layer.deleteFeature(fid_two)
+    layer.commitChanges()
+    assert totals.total("cables", 1) == 25.0
+    assert heard == [{("cables", 1)}]
+
+
+def test_write_cable_totals_adds_fields_and_writes_each_cable(totals, qgis_app):
+    slacks, _, _ = totals
+    cables = QgsVectorLayer(f"LineString?crs={CRS}&field=naziv:string", "Underground cables", "memory")
+    feats = []
+    for i in range(2):
+        feat = QgsFeature(cables.fields())
+        feat.setAttributes([f"k{i}"])
+        feat.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(0, 0), QgsPointXY(100, 0)]))
+        feats.append(feat)
+    cables.dataProvider().addFeatures(feats)
+    project = QgsProject.instance()
+    project.addMapLayer(cables)
+    try:
+        fids = sorted(f.id() for f in cables.getFeatures())
+        totals = SlackTotals(_slacks([(cables.id(), fids[0], 20.0), (cables.id(), fids[1], 4.5)]))
+        restyled = []
+
+        written = write_cable_totals([(cables.id(), fid) for fid in fids], totals,
+                                     add_missing_fields=True, places=2, restyle=restyled.append)
+
+        assert written == 2
+        assert restyled == [cables]
+        assert not cables.isEditable()
+        by_fid = {f.id(): f for f in cables.getFeatures()}
+        assert by_fid[fids[0]]["slack_m"] == 20.0
+        assert by_fid[fids[1]]["slack_m"] == 4.5
+        assert by_fid[fids[0]]["total_len_m"] == pytest.approx(120.0, rel=0.01)
+    finally:
+        project.removeMapLayer(cables.id())
@@ -189,6 +189,27 @@ def test_failing_rule_is_recorded_not_raised():
     assert "B4" in result.ran_rules  # the good rule still ran after the bad one
 
 
+def test_every_rule_reports_its_cost():
+    project = QgsProject()
+    project.addMapLayer(_mk_layer(
+        "Underground cables",
+        ["fiberq_uuid:string", "tip:string", "broj_vlakana:integer"],
+        [({"fiberq_uuid": f"u{i}", "tip": "opticki", "broj_vlakana": 12}, QgsPointXY(i, 0))
+         for i in range(5)],
+    ))
+    result = vm.run_validation(project, config=vm.ValidationConfig(trace_memory=True))
+    assert set(result.rule_costs) == set(result.ran_rules)
+    c1 = result.rule_costs["C1"]
+    assert c1.features == 5
+    assert c1.wall_s >= 0 and c1.cpu_s >= 0
+    assert c1.peak_kib is not None
+    assert "columns" in result.cache_build_s
+    assert result.slowest_rules(2)[0][1].wall_s >= result.slowest_rules(2)[1][1].wall_s
+
+    untraced = vm.run_validation(project)
+    assert all(cost.peak_kib is None for cost in untraced.rule_costs.values())
+
+
 def test_severity_override_downgrades_rule():
     project = QgsProject()
     project.addMapLayer(_mk_layer(
@@ -0,0 +1,114 @@
+"""Tests for the columnar feature snapshot the attribute rules share.
+
+Each layer is read once per validation and the attribute rules test its
+columns; an incremental run replaces only the rows that changed.
+"""
+import math
+
+import pytest
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core import validation_manager as vm
+from fiberq.core.validation_snapshot import LayerColumns
+
+CRS = "EPSG:3857"
+CABLE_FIELDS = ("fiberq_uuid:string", "tip:string", "broj_vlakana:integer")
+
+
+def _cables(rows):
+    uri = f"LineString?crs={CRS}"
+    for spec in CABLE_FIELDS:
+        uri += "&field=" + spec
+    layer = QgsVectorLayer(uri, "Underground cables", "memory")
+    assert layer.isValid()
+    feats = []
+    for uuid, tip, fibres, x in rows:
+        feat = QgsFeature(layer.fields())
+        feat.setAttributes([uuid, tip, fibres])
+        feat.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(x, 0), QgsPointXY(x + 100, 0)]))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    layer.updateExtents()
+    return layer
+
+
+def _project(n=30):
+    """Cables with a blank type every fifth row and an out-of-range fibre count
+    every seventh."""
+    project = QgsProject()
+    project.setCrs(project.crs().fromOgcWmsCrs(CRS))
+    cables = _cables([
+        (f"c{i}", "" if i % 5 == 0 else "opticki", 0 if i % 7 == 0 else 12, i * 100.0)
+        for i in range(n)
+    ])
+    project.addMapLayer(cables)
+    return project, cables
+
+
+def _snapshot(result):
+    return [(i.rule_id, i.severity, i.layer_id, i.feature_id, i.message, i.where, i.details)
+            for i in result.issues]
+
+
+def test_columns_hold_every_row(qgis_app):
+    layer = _cables([("a", "opticki", 12, 0.0), ("b", "", None, 100.0)])
+    columns = LayerColumns.read(layer)
+
+    rows = columns.rows()
+    assert [columns.fids[r] for r in rows] == [f.id() for f in layer.getFeatures()]
+    assert [columns.values["tip"][r] for r in rows] == ["opticki", ""]
+    assert columns.numbers("broj_vlakana")[rows[0]] == 12.0
+    assert math.isnan(columns.numbers("broj_vlakana")[rows[1]])
+    assert [columns.uuid(r) for r in rows] == ["a", "b"]
+    assert columns.rect(rows[1]).xMinimum() == 100.0
+
+
+def test_each_layer_is_read_once(qgis_app, monkeypatch):
+    project, cables = _project()
+    reads = []
+    original = LayerColumns.read.__func__
+    monkeypatch.setattr(LayerColumns, "read",
+                        classmethod(lambda cls, layer: reads.append(layer.id()) or original(cls, layer)))
+
+    result = vm.run_validation(project)
+    assert reads == [cables.id()]
+    assert {"C1", "D2"} <= {i.rule_id for i in result.issues}
+    assert sum(i.rule_id == "C1" for i in result.issues) == 6
+
+
+def test_incremental_run_refreshes_changed_rows(qgis_app, monkeypatch):
+    project, cables = _project()
+    validator = vm.IncrementalValidator(project)
+    validator.run()
+
+    reads = []
+    monkeypatch.setattr(LayerColumns, "read", classmethod(lambda cls, layer: reads.append(layer)))
+    cables.startEditing()
+    fid = next(f.id() for f in cables.getFeatures() if f["fiberq_uuid"] == "c5")
+    cables.changeAttributeValue(fid, cables.fields().indexFromName("tip"), "opticki")
+    result = validator.run()
+    monkeypatch.undo()
+
+    assert reads == []  # the cached columns were patched, not re-read
+    assert sum(i.rule_id == "C1" for i in result.issues) == 5
+    assert _snapshot(result) == _snapshot(vm.run_validation(project))
+    cables.rollBack()
+    validator.disconnect()
+
+
+def test_numeric_ranges_agree_with_and_without_numpy(qgis_app, monkeypatch):
+    pytest.importorskip("numpy")
+    project, _cables = _project()
+    with_numpy = _snapshot(vm.run_validation(project))
+
+    monkeypatch.setattr(LayerColumns, "number_array", lambda self, name: None)
+    without = _snapshot(vm.run_validation(project))
+
+    assert [i for i in with_numpy if i[0] == "D2"] == [i for i in without if i[0] == "D2"]
+    assert sum(i[0] == "D2" for i in with_numpy) == 5
@@ -0,0 +1,177 @@
+"""Tests for incremental re-validation.
+
+A re-run after a one-feature fix must give exactly what a full run gives, while
+only re-checking the changed feature and its neighbours.
+"""
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core import validation_manager as vm
+from fiberq.core import validation_rules as vr
+
+CRS = "EPSG:3857"
+CABLE_FIELDS = ("fiberq_uuid:string", "tip:string", "broj_vlakana:integer")
+NODE_FIELDS = ("fiberq_uuid:string", "naziv:string", "kapacitet:integer")
+
+
+def _layer(geom_type, name, rows, fields):
+    uri = f"{geom_type}?crs={CRS}"
+    for spec in fields:
+        uri += "&field=" + spec
+    layer = QgsVectorLayer(uri, name, "memory")
+    assert layer.isValid(), name
+    feats = []
+    for attrs, geom in rows:
+        feat = QgsFeature(layer.fields())
+        for key, value in attrs.items():
+            feat.setAttribute(key, value)
+        feat.setGeometry(geom)
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    layer.updateExtents()
+    return layer
+
+
+def _cable(uuid, pts, tip="opticki"):
+    return ({"fiberq_uuid": uuid, "tip": tip, "broj_vlakana": 12},
+            QgsGeometry.fromPolylineXY(pts))
+
+
+def _node(uuid, x, y):
+    return ({"fiberq_uuid": uuid, "naziv": uuid, "kapacitet": 1},
+            QgsGeometry.fromPointXY(QgsPointXY(x, y)))
+
+
+def _project(cables=20):
+    """A row of ODFs, each joined to the next by a cable; the last cable dangles."""
+    project = QgsProject()
+    project.setCrs(project.crs().fromOgcWmsCrs(CRS))
+    nodes = _layer("Point", "ODF", [_node(f"n{i}", i * 100.0, 0) for i in range(cables)], NODE_FIELDS)
+    rows = [_cable(f"c{i}", [QgsPointXY(i * 100.0, 0), QgsPointXY(i * 100.0 + 100, 0)])
+            for i in range(cables)]
+    rows[3] = _cable("c3", [QgsPointXY(300, 0), QgsPointXY(400, 0)], tip="")  # C1
+    cables_layer = _layer("LineString", "Underground cables", rows, CABLE_FIELDS)
+    project.addMapLayer(nodes)
+    project.addMapLayer(cables_layer)
+    return project, nodes, cables_layer
+
+
+def _snapshot(result):
+    return [(i.rule_id, i.severity, i.layer_id, i.feature_id, i.message, i.where, i.details)
+            for i in result.issues]
+
+
+def _assert_matches_full_run(project, result):
+    full = vm.run_validation(project)
+    assert result.rule_errors == full.rule_errors == []
+    assert _snapshot(result) == _snapshot(full)
+
+
+def test_unchanged_rerun_equals_full_run(qgis_app):
+    project, _nodes, _cables = _project()
+    validator = vm.IncrementalValidator(project)
+    first = validator.run()
+    _assert_matches_full_run(project, first)
+    assert _snapshot(validator.run()) == _snapshot(first)
+    validator.disconnect()
+
+
+def test_attribute_fix_is_merged(qgis_app):
+    project, _nodes, cables = _project()
+    validator = vm.IncrementalValidator(project)
+    assert any(i.rule_id == "C1" for i in validator.run().issues)
+
+    cables.startEditing()
+    fid = next(f.id() for f in cables.getFeatures() if f["fiberq_uuid"] == "c3")
+    cables.changeAttributeValue(fid, cables.fields().indexFromName("tip"), "opticki")
+    result = validator.run()
+    assert not any(i.rule_id == "C1" for i in result.issues)
+    _assert_matches_full_run(project, result)
+    cables.rollBack()
+    validator.disconnect()
+
+
+def test_geometry_edits_update_topology(qgis_app):
+    project, nodes, cables = _project()
+    validator = vm.IncrementalValidator(project)
+    validator.run()
+
+    # Pull the dangling end of the last cable back onto a node, and break another
+    cables.startEditing()
+    by_uuid = {f["fiberq_uuid"]: f.id() for f in cables.getFeatures()}
+    cables.changeGeometry(by_uuid["c19"], QgsGeometry.fromPolylineXY(
+        [QgsPointXY(1900, 0), QgsPointXY(1800, 0)]))
+    cables.changeGeometry(by_uuid["c7"], QgsGeometry.fromPolylineXY(
+        [QgsPointXY(700, 0), QgsPointXY(790, 3)]))
+    _assert_matches_full_run(project, validator.run())
+
+    # Move a node away from everything: it is orphaned, and the cable ends dangle
+    nodes.startEditing()
+    node = next(f.id() for f in nodes.getFeatures() if f["fiberq_uuid"] == "n12")
+    nodes.changeGeometry(node, QgsGeometry.fromPointXY(QgsPointXY(1200, 500)))
+    _assert_matches_full_run(project, validator.run())
+
+    assert cables.commitChanges()
+    assert nodes.commitChanges()
+    _assert_matches_full_run(project, validator.run())
+    validator.disconnect()
+
+
+def test_added_and_deleted_features(qgis_app):
+    project, _nodes, cables = _project()
+    validator = vm.IncrementalValidator(project)
+    validator.run()
+
+    cables.startEditing()
+    row = _cable("c3", [QgsPointXY(5000, 0), QgsPointXY(5100, 0)])  # duplicate uuid, dangling
+    feat = QgsFeature(cables.fields())
+    for key, value in row[0].items():
+        feat.setAttribute(key, value)
+    feat.setGeometry(row[1])
+    assert cables.addFeature(feat)
+    cables.deleteFeature(next(f.id() for f in cables.getFeatures() if f["fiberq_uuid"] == "c5"))
+    _assert_matches_full_run(project, validator.run())
+
+    assert cables.commitChanges()
+    _assert_matches_full_run(project, validator.run())
+    validator.disconnect()
+
+
+def test_provider_writes_are_noticed(qgis_app):
+    """Writing straight to the provider emits no per-feature signal."""
+    project, _nodes, cables = _project()
+    validator = vm.IncrementalValidator(project)
+    validator.run()
+    row = _cable("x", [QgsPointXY(9000, 0), QgsPointXY(9100, 0)])
+    feat = QgsFeature(cables.fields())
+    feat.setAttributes([row[0]["fiberq_uuid"], row[0]["tip"], row[0]["broj_vlakana"]])
+    feat.setGeometry(row[1])
+    cables.dataProvider().addFeatures([feat])
+    _assert_matches_full_run(project, validator.run())
+    validator.disconnect()
+
+
+def test_only_changed_features_are_rechecked(qgis_app, monkeypatch):
+    project, _nodes, cables = _project(cables=200)
+    validator = vm.IncrementalValidator(project)
+    validator.run()
+
+    matched = []
+    original = vr._match_endpoint
+    monkeypatch.setattr(vr, "_match_endpoint", lambda *a: matched.append(1) or original(*a))
+
+    cables.startEditing()
+    fid = next(f.id() for f in cables.getFeatures() if f["fiberq_uuid"] == "c3")
+    cables.changeAttributeValue(fid, cables.fields().indexFromName("tip"), "opticki")
+    result = validator.run()
+
+    # The cable's two ends and the ends of its neighbours -- not all 400
+    assert 0 < len(matched) <= 6
+    _assert_matches_full_run(project, result)
+    cables.rollBack()
+    validator.disconnect()
@@ -125,6 +125,21 @@ def test_failed_rules_are_surfaced_when_there_are_no_issues(qgis_app):
     assert "fail" in text.lower()
 
 
+def test_summary_tooltip_names_the_slowest_rules(qgis_app):
+    panel = ValidationPanel()
+    result = _result([_issue()])
+    result.rule_costs = {"A1": vm.RuleCost(wall_s=0.5, features=40, index_queries=7),
+                         "D2": vm.RuleCost(wall_s=1.5, features=40)}
+    result.cache_build_s = {"columns": 0.1}
+    panel.set_result(result)
+    tip = panel.lbl_summary.toolTip()
+    assert tip.index("D2") < tip.index("A1")
+    assert "7 index queries" in tip and "columns" in tip
+
+    panel.set_result(None)
+    assert panel.lbl_summary.toolTip() == ""
+
+
 def test_set_result_none_clears(qgis_app):
     panel = ValidationPanel()
     panel.set_result(_result([_issue()]))
@@ -216,6 +231,56 @@ def test_busy_state_disables_rerun(qgis_app):
     assert panel.btn_rerun.isEnabled()
 
 
+def test_cancel_button_only_while_running(qgis_app):
+    panel = ValidationPanel()
+    assert panel.btn_cancel.isHidden()
+    fired = []
+    panel.cancelRequested.connect(lambda: fired.append(True))
+    panel.start_run(14)
+    assert not panel.btn_cancel.isHidden()
+    panel.btn_cancel.click()
+    assert fired == [True]
+    panel.set_busy(False)
+    assert panel.btn_cancel.isHidden()
+
+
+# ---------------------------------------------------------------------------
+# Progressive population
+# ---------------------------------------------------------------------------
+
+def test_rows_arrive_rule_by_rule(qgis_app):
+    panel = ValidationPanel()
+    panel.set_result(_result([_issue(rule_id="D2")]))
+    panel.start_run(3)
+    assert _rows(panel) == []
+    assert "0" in panel.lbl_summary.text() and "3" in panel.lbl_summary.text()
+
+    panel.add_issues("A1", [_issue(rule_id="A1", severity=vm.Severity.INFO)])
+    panel.add_issues("B1", None)  # a failed rule still counts as done
+    panel.add_issues("B4", [_issue(rule_id="B4", severity=vm.Severity.ERROR)])
+    assert [r.text(1) for r in _rows(panel)] == ["B4", "A1"]
+    assert "3 of 3" in panel.lbl_summary.text()
+    assert not panel.btn_export.isEnabled()
+
+    final = _result([_issue(rule_id="A1"), _issue(rule_id="B4")], ran_rules=["A1", "B4"])
+    panel.set_busy(False)
+    panel.set_result(final)
+    assert panel.result() is final
+    assert panel.btn_export.isEnabled()
+
+
+def test_cancelled_run_leaves_no_partial_rows(qgis_app):
+    """Half a result would read as a clean bill for the rules that never ran."""
+    panel = ValidationPanel()
+    panel.start_run(14)
+    panel.add_issues("A1", [_issue(rule_id="A1")])
+    panel.set_cancelled()
+    assert _rows(panel) == []
+    assert panel.result() is None
+    assert "cancel" in panel.lbl_summary.text().lower()
+    assert panel.btn_rerun.isEnabled()
+
+
 # ---------------------------------------------------------------------------
 # Plugin wiring (source level -- FiberQPlugin needs a live iface to build)
 # ---------------------------------------------------------------------------
@@ -236,7 +301,8 @@ def _called_names(func):
 def test_plugin_exposes_the_validation_entry_points(qgis_app):
     import fiberq.main_plugin as mp
 
-    for name in ("run_validation", "_ensure_validation_panel", "_zoom_to_issue"):
+    for name in ("run_validation", "_ensure_validation_panel", "_zoom_to_issue",
+                 "_on_validation_finished", "_cancel_validation"):
         assert callable(getattr(mp.FiberQPlugin, name, None)), name
 
 
@@ -248,7 +314,7 @@ def test_success_message_is_not_reachable_when_rules_failed(qgis_app):
     """
     import fiberq.main_plugin as mp
 
-    src = textwrap.dedent(inspect.getsource(mp.FiberQPlugin.run_validation))
+    src = textwrap.dedent(inspect.getsource(mp.FiberQPlugin._on_validation_finished))
     tree = ast.parse(src)
     calls = [n for n in ast.walk(tree) if isinstance(n, ast.Call)]
     success = [n for n in calls if getattr(n.func, "attr", "") == "pushSuccess"]
@@ -270,7 +336,7 @@ def test_trigger_stays_thin(qgis_app):
     import fiberq.main_plugin as mp
 
     src = inspect.getsource(mp.FiberQPlugin.run_validation)
-    assert "run_validation as _run" in src
+    assert "ValidationTask(" in src
     # The trigger must not start reimplementing checks.
     assert "getFeatures" not in src
     assert "QgsSpatialIndex" not in src
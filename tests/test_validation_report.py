@@ -159,6 +159,19 @@ def test_json_keeps_non_ascii_readable():
     assert "Postojeće" in text
 
 
+def test_json_carries_rule_costs_only_when_measured():
+    assert "performance" not in json.loads(to_json(_result([])))
+    costs = {"A1": vm.RuleCost(wall_s=1.23456, cpu_s=1.0, features=400, index_queries=80),
+             "B4": vm.RuleCost(wall_s=0.01, features=400, peak_kib=12.345)}
+    perf = json.loads(to_json(_result([], rule_costs=costs,
+                                      cache_build_s={"columns": 0.5})))["performance"]
+    assert perf["rules"]["A1"] == {"wall_s": 1.235, "cpu_s": 1.0, "features": 400,
+                                   "index_queries": 80, "peak_kib": None}
+    assert perf["rules"]["B4"]["peak_kib"] == 12.3
+    assert perf["total_wall_s"] == 1.245
+    assert perf["cache_build_s"] == {"columns": 0.5}
+
+
 def test_json_carries_the_run_provenance():
     run = json.loads(to_json(_result([], ran_rules=["A1", "B1"])))["run"]
     assert run["timestamp"] == "2026-07-30T22:00:00"
@@ -238,6 +251,15 @@ def test_html_renders_a_row_per_issue():
     assert "A1" in html and "D2" in html
 
 
+def test_html_lists_the_slowest_rule_first():
+    assert "Performance" not in to_html(_result([]))
+    costs = {"B4": vm.RuleCost(wall_s=0.01), "A1": vm.RuleCost(wall_s=2.0)}
+    html = to_html(_result([], rule_costs=costs, cache_build_s={"spatial_index": 0.25}))
+    section = html[html.index("Performance"):]
+    assert section.index("A1") < section.index("B4")
+    assert "spatial_index" in section
+
+
 def test_html_supports_dark_mode_and_print():
     html = to_html(_result([_issue()]))
     assert "prefers-color-scheme: dark" in html
@@ -0,0 +1,166 @@
+"""Tests for validation off the GUI thread.
+
+The task reads a snapshot of the project and runs the rule groups side by side;
+neither may change what the rules find.
+"""
+from qgis.core import (
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from fiberq.core import validation_manager as vm
+from fiberq.core import validation_rules as vr
+from fiberq.core.validation_snapshot import ProjectSnapshot
+from fiberq.core.validation_task import ValidationTask
+
+CRS = "EPSG:3857"
+
+
+def _layer(geom_type, name, rows, fields):
+    uri = f"{geom_type}?crs={CRS}"
+    for spec in fields:
+        uri += "&field=" + spec
+    layer = QgsVectorLayer(uri, name, "memory")
+    assert layer.isValid(), name
+    feats = []
+    for attrs, geom in rows:
+        feat = QgsFeature(layer.fields())
+        for key, value in attrs.items():
+            feat.setAttribute(key, value)
+        feat.setGeometry(geom)
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    layer.updateExtents()
+    return layer
+
+
+def _project():
+    """Issues from every rule group: dangling cables (A1), a missing cable type
+    (C1), a duplicate uuid (B4), a slack pointing nowhere (B1)."""
+    project = QgsProject()
+    project.setCrs(project.crs().fromOgcWmsCrs(CRS))
+    project.addMapLayer(_layer("Point", "ODF", [
+        ({"fiberq_uuid": f"n{i}"}, QgsGeometry.fromPointXY(QgsPointXY(i * 100.0, 0)))
+        for i in range(10)
+    ], ("fiberq_uuid:string",)))
+    cables = [
+        ({"fiberq_uuid": f"c{i}", "tip": "opticki" if i != 3 else "", "broj_vlakana": 12},
+         QgsGeometry.fromPolylineXY([QgsPointXY(i * 100.0, 0), QgsPointXY(i * 100.0 + 100, 7)]))
+        for i in range(10)
+    ]
+    cables.append(({"fiberq_uuid": "c1", "tip": "opticki", "broj_vlakana": 12},
+                   QgsGeometry.fromPolylineXY([QgsPointXY(0, 500), QgsPointXY(100, 500)])))
+    project.addMapLayer(_layer("LineString", "Underground cables", cables,
+                               ("fiberq_uuid:string", "tip:string", "broj_vlakana:integer")))
+    project.addMapLayer(_layer("Point", "Optical slacks", [
+        ({"fiberq_uuid": "s1", "cable_layer_id": "gone", "cable_fid": 1},
+         QgsGeometry.fromPointXY(QgsPointXY(50, 0))),
+    ], ("fiberq_uuid:string", "cable_layer_id:string", "cable_fid:integer")))
+    return project
+
+
+def _snapshot(result):
+    return [(i.rule_id, i.severity, i.layer_id, i.feature_id, i.message, i.where, i.details)
+            for i in result.issues]
+
+
+class _Recorder(vm.ValidationFeedback):
+    def __init__(self, cancel_after=None):
+        super().__init__()
+        self.finished = []
+        self._cancel_after = cancel_after
+
+    def rule_finished(self, rule, issues, done, total):
+        self.finished.append((rule.id, done, total))
+        if self._cancel_after is not None and done >= self._cancel_after:
+            self.cancel()
+
+
+def test_rule_groups_follow_the_rule_families():
+    groups = vm.rule_groups(vr.RULES)
+    assert [[r.id[0] for r in g] for g in groups] == [
+        ["A"] * 3, ["B"] * 4, ["C", "C", "D", "D", "D"], ["E", "E"]]
+
+
+def test_parallel_run_over_a_snapshot_matches_a_plain_run(qgis_app):
+    project = _project()
+    plain = vm.run_validation(project)
+    parallel = vm.run_validation(project, workers=4)
+    assert {i.rule_id for i in plain.issues} >= {"A1", "B1", "B4", "C1"}
+    assert parallel.rule_errors == plain.rule_errors == []
+    assert parallel.ran_rules == plain.ran_rules
+    assert _snapshot(parallel) == _snapshot(plain)
+    assert not parallel.cancelled
+
+
+def test_feedback_hears_every_rule(qgis_app):
+    feedback = _Recorder()
+    result = vm.run_validation(_project(), feedback=feedback, workers=4)
+    assert sorted(rule_id for rule_id, _done, _total in feedback.finished) == sorted(result.ran_rules)
+    assert sorted(done for _id, done, _total in feedback.finished) == list(range(1, len(vr.RULES) + 1))
+    assert {total for _id, _done, total in feedback.finished} == {len(vr.RULES)}
+
+
+def test_cancel_stops_the_run(qgis_app):
+    feedback = _Recorder(cancel_after=2)
+    result = vm.run_validation(_project(), feedback=feedback)
+    assert result.cancelled
+    assert result.ran_rules == ["A1", "A2"]
+    assert {i.rule_id for i in result.issues} <= {"A1", "A2"}
+
+
+def test_snapshot_is_frozen_when_taken(qgis_app):
+    project = _project()
+    cables = project.mapLayersByName("Underground cables")[0]
+    cables.startEditing()
+    fid = next(cables.getFeatures()).id()
+    cables.changeAttributeValue(fid, cables.fields().indexFromName("tip"), "edited")
+
+    snapshot = ProjectSnapshot(project)
+    cables.changeAttributeValue(fid, cables.fields().indexFromName("tip"), "later")
+    frozen = snapshot.mapLayer(cables.id())
+    assert frozen.name() == "Underground cables"
+    assert frozen.featureCount() == cables.featureCount()
+    assert frozen.getFeature(fid)["tip"] == "edited"
+    assert not frozen.getFeature(10 ** 6).isValid()
+    cables.rollBack()
+
+
+def test_a_fid_request_does_not_read_the_whole_layer(qgis_app):
+    project = _project()
+    cables = project.mapLayersByName("Underground cables")[0]
+    fids = [f.id() for f in cables.getFeatures()]
+    cables.startEditing()
+    cables.changeAttributeValue(fids[1], cables.fields().indexFromName("tip"), "edited")
+
+    frozen = ProjectSnapshot(project).mapLayer(cables.id())
+    cables.rollBack()
+    picked = list(frozen.getFeatures(QgsFeatureRequest().setFilterFids([fids[1], fids[0]])))
+
+    assert [f.id() for f in picked] == fids[:2]
+    assert picked[1]["tip"] == "edited"
+    assert frozen._features is None  # served from the source, not a full load
+
+
+def test_task_reports_rule_by_rule_and_hands_over_the_result(qgis_app):
+    project = _project()
+    validator = vm.IncrementalValidator(project)
+    task = ValidationTask(validator, workers=4)
+    finished, results = [], []
+    task.ruleFinished.connect(lambda rule_id, issues: finished.append(rule_id))
+    task.resultReady.connect(results.append)
+
+    assert task.rule_count() == len(vr.RULES)
+    assert task.run()
+    task.finished(True)
+
+    assert sorted(finished) == sorted(r.id for r in vr.RULES)
+    assert len(results) == 1
+    assert _snapshot(results[0]) == _snapshot(vm.run_validation(project))
+    # The completed run is the baseline for the next, incremental one
+    assert _snapshot(validator.run()) == _snapshot(results[0])
+    validator.disconnect()
@@ -4,6 +4,7 @@ Each test builds a tiny project with one known defect and asserts exactly that
 issue. Geometry is in EPSG:3857 (metres) so the default 5.0 map-unit tolerance
 means 5 metres and the distances below are easy to reason about.
 """
+import pytest
 from qgis.core import (
     QgsFeature,
     QgsGeometry,
@@ -422,3 +423,91 @@ def test_endpoint_scan_is_built_once_per_run(qgis_app):
     first = vr._endpoint_scan(ctx)
     assert vr._endpoint_scan(ctx) is first
     assert "endpoint_scan" in ctx.cache
+
+
+def _scattered_project():
+    """150 ODFs and 150 short cables scattered over 400 x 400 m."""
+    import random
+
+    rng = random.Random(7)
+    project = QgsProject()
+    project.addMapLayer(_point_layer("ODF", [
+        ({"fiberq_uuid": f"n{i}"}, QgsPointXY(rng.uniform(0, 400), rng.uniform(0, 400)))
+        for i in range(150)
+    ]))
+    lines = []
+    for i in range(150):
+        x, y = rng.uniform(0, 400), rng.uniform(0, 400)
+        lines.append(({"fiberq_uuid": f"c{i}"},
+                      [QgsPointXY(x, y), QgsPointXY(x + rng.uniform(-30, 30), y + rng.uniform(-30, 30))]))
+    project.addMapLayer(_line_layer("Underground cables", lines))
+    return project
+
+
+def test_bulk_endpoint_matching_agrees_with_a_brute_force_scan(qgis_app):
+    """The grid join must find what comparing every pair finds, across cell
+    boundaries and at the corners of the 2*tol search square."""
+    import math
+
+    ctx = vm.ValidationContext(_scattered_project())
+    findings = vr._endpoint_scan(ctx)
+    nodes, _t, _a = vr._node_index(ctx)
+    endpoints, _t, _a = vr._cable_endpoint_index(ctx)
+    reach = ctx.config.tol * 2.0
+
+    def brute(finding):
+        p = finding["point"]
+        best = None
+        candidates = [(r[-1], (r[0], r[2])) for r in nodes.records.values()]
+        candidates += [(r[-1], (r[0], r[2])) for r in endpoints.records.values()
+                       if not (r[1] == finding["layer_id"] and r[2] == finding["feature_id"])]
+        for q, target in candidates:
+            if abs(q.x() - p.x()) <= reach and abs(q.y() - p.y()) <= reach:
+                d = math.hypot(q.x() - p.x(), q.y() - p.y())
+                if best is None or d < best[0]:
+                    best = (d, target)
+        return best
+
+    assert len(findings) == 300
+    matched = 0
+    for finding in findings:
+        expected = brute(finding)
+        if expected is None:
+            assert finding["distance"] is None
+            continue
+        matched += 1
+        assert finding["distance"] == pytest.approx(expected[0])
+        assert finding["target"] == expected[1]
+    assert matched > 20  # the fixture really exercises the join
+
+
+def test_a1_reports_a_partner_in_the_corner_of_the_search_square(qgis_app):
+    """Candidates are everything in the 2*tol square, so a node 9 m across and
+    9 m up (12.7 m away) is still reported as the nearest, like an index query
+    would."""
+    project = QgsProject()
+    project.addMapLayer(_point_layer("ODF", [
+        ({"fiberq_uuid": "n1"}, QgsPointXY(0, 0)),
+        ({"fiberq_uuid": "n2"}, QgsPointXY(109, 9)),
+    ]))
+    project.addMapLayer(_line_layer("Underground cables", [
+        ({"fiberq_uuid": "c1"}, [QgsPointXY(0, 0), QgsPointXY(100, 0)]),
+    ]))
+    result = _run(project, {"A1", "A2"})
+    dangles = _ids(result, "A1")
+    assert len(dangles) == 1
+    assert round(dangles[0].details["nearest_distance"], 2) == 12.73
+    assert _ids(result, "A2") == []
+
+
+def test_numpy_endpoint_join_matches_the_grid_join(qgis_app):
+    """The array join picks exactly what the per-cell grid join picks, ties included."""
+    np = pytest.importorskip("numpy")
+    ctx = vm.ValidationContext(_scattered_project())
+    nodes, _t, _a = vr._node_index(ctx)
+    endpoints, _t, _a = vr._cable_endpoint_index(ctx)
+    reach = ctx.config.tol * 2.0
+
+    bulk = vr._match_endpoints_numpy(ctx, nodes, endpoints, reach, np)
+
+    assert bulk == {h: vr._match_endpoint(h, r, nodes, endpoints, reach) for h, r in endpoints.records.items()}
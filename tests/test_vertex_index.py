@@ -0,0 +1,92 @@
+"""Tests for grid-hash vertex snapping.
+
+Rounding each coordinate to a grid split vertices a hair apart whenever a grid
+line ran between them, and the route join was lost. The VertexIndex snaps to
+the nearest vertex within tolerance, whatever cell it sits in.
+"""
+import math
+import random
+
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from fiberq.utils.geometry import VertexIndex, fuzzy_key
+from fiberq.utils.routing import (
+    build_path_across_joined_routes,
+    build_path_across_network,
+    find_endpoints_on_network,
+    get_network_connectivity,
+)
+
+CRS = "EPSG:3857"
+TOL = 0.5
+
+
+def _route_layer(lines):
+    layer = QgsVectorLayer(f"LineString?crs={CRS}&field=tip_trase:string", "Route", "memory")
+    assert layer.isValid()
+    feats = []
+    for pts in lines:
+        feat = QgsFeature(layer.fields())
+        feat.setGeometry(QgsGeometry.fromPolylineXY(pts))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def _straddling():
+    """Two routes whose shared end is split by a grid line at x = 0.25."""
+    return _route_layer([
+        [QgsPointXY(-100, 0), QgsPointXY(0.2499, 0)],
+        [QgsPointXY(0.2501, 0), QgsPointXY(100, 0)],
+    ])
+
+
+def test_vertices_across_a_cell_boundary_are_joined():
+    a, b = QgsPointXY(0.2499, 0), QgsPointXY(0.2501, 0)
+    assert fuzzy_key(a, TOL) != fuzzy_key(b, TOL)
+
+    index = VertexIndex(TOL)
+    assert index.snap(a) == index.snap(b)
+    assert len(index) == 1
+    assert index.snap(QgsPointXY(0.9, 0)) != index.snap(a)
+
+
+def test_nearest_matches_a_full_scan():
+    rnd = random.Random(7)
+    index = VertexIndex(0.7)
+    for _ in range(2000):
+        index.snap(QgsPointXY(rnd.uniform(0, 100), rnd.uniform(0, 100)))
+
+    for _ in range(300):
+        q = QgsPointXY(rnd.uniform(0, 100), rnd.uniform(0, 100))
+        key, pt = min(index.points.items(), key=lambda kv: (kv[1].distance(q), kv[0]))
+        expected = key if pt.distance(q) <= 2.1 else None
+        assert index.nearest(q, 2.1) == expected
+
+
+def test_snapped_vertices_are_more_than_tolerance_apart():
+    rnd = random.Random(3)
+    index = VertexIndex(1.0)
+    for _ in range(500):
+        index.snap(QgsPointXY(rnd.uniform(0, 20), rnd.uniform(0, 20)))
+    pts = list(index.points.values())
+    for i, p in enumerate(pts):
+        for q in pts[i + 1:]:
+            assert math.hypot(p.x() - q.x(), p.y() - q.y()) > 1.0 - 1e-9
+
+
+def test_routing_crosses_a_join_split_by_the_grid(qgis_app):
+    layer = _straddling()
+    start, end = QgsPointXY(-100, 0), QgsPointXY(100, 0)
+
+    assert build_path_across_network(layer, start, end, TOL) is not None
+    assert build_path_across_joined_routes(layer, start, end, TOL) is not None
+
+    connectivity = get_network_connectivity(layer, TOL)
+    assert sorted(len(fids) for fids in connectivity.values()) == [1, 1, 2]
+    assert sorted(p.x() for p in find_endpoints_on_network(layer, TOL)) == [-100, 100]
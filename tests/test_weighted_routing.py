@@ -0,0 +1,125 @@
+"""Tests for length-weighted routing (Dijkstra / A*).
+
+BFS returns the path with the fewest vertices. A route drawn with many
+breakpoints therefore lost to a long detour with few, and the cable (and the
+bill of materials) came out longer than the street it runs along.
+"""
+import pytest
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from fiberq.utils import route_graph as rg
+from fiberq.utils.routing import (
+    ROUTING_ASTAR,
+    ROUTING_BFS,
+    ROUTING_DIJKSTRA,
+    find_route_between_points,
+)
+
+CRS = "EPSG:3857"
+TOL = 0.5
+
+
+def _route_layer(lines):
+    """lines: [(tip_trase, [QgsPointXY, ...])]"""
+    layer = QgsVectorLayer(f"LineString?crs={CRS}&field=tip_trase:string", "Route", "memory")
+    assert layer.isValid()
+    feats = []
+    for tip, pts in lines:
+        feat = QgsFeature(layer.fields())
+        feat.setAttribute("tip_trase", tip)
+        feat.setGeometry(QgsGeometry.fromPolylineXY(pts))
+        feats.append(feat)
+    layer.dataProvider().addFeatures(feats)
+    return layer
+
+
+def _street_and_detour():
+    """A 100 m street with a breakpoint every 10 m, and a 2-edge ~412 m detour."""
+    street = [QgsPointXY(x, 0) for x in range(0, 101, 10)]
+    detour = [QgsPointXY(0, 0), QgsPointXY(50, 200), QgsPointXY(100, 0)]
+    return _route_layer([("podzemna", street), ("vazdusna", detour)])
+
+
+def _grid(n, step=10.0):
+    lines = []
+    for i in range(n):
+        lines.append(("podzemna", [QgsPointXY(j * step, i * step) for j in range(n)]))
+        lines.append(("podzemna", [QgsPointXY(i * step, j * step) for j in range(n)]))
+    return _route_layer(lines)
+
+
+START, END = QgsPointXY(0, 0), QgsPointXY(100, 0)
+
+
+def test_bfs_takes_the_detour_weighted_takes_the_street(qgis_app):
+    layer = _street_and_detour()
+    bfs = find_route_between_points(layer, START, END, TOL, ROUTING_BFS)
+    assert len(bfs) == 3
+
+    for algorithm in (ROUTING_DIJKSTRA, ROUTING_ASTAR):
+        path = find_route_between_points(layer, START, END, TOL, algorithm)
+        assert [p.y() for p in path] == [0.0] * 11, algorithm
+
+
+def test_cost_profile_can_make_the_detour_cheaper(qgis_app):
+    layer = _street_and_detour()
+    path = find_route_between_points(layer, START, END, TOL, ROUTING_ASTAR,
+                                     cost_profile={"podzemna": 10.0})
+    assert len(path) == 3
+
+
+def test_cached_graph_agrees_with_the_stateless_router(qgis_app):
+    layer = _street_and_detour()
+    graph = rg.RouteGraph(layer, TOL)
+    try:
+        for profile in (None, {"podzemna": 10.0}):
+            expected = find_route_between_points(layer, START, END, TOL, ROUTING_ASTAR, profile)
+            got = graph.find_route(START, END, ROUTING_ASTAR, profile)
+            assert [(p.x(), p.y()) for p in got] == [(p.x(), p.y()) for p in expected]
+    finally:
+        graph.disconnect()
+
+
+def test_route_type_edits_change_the_weighted_path(qgis_app):
+    layer = _street_and_detour()
+    graph = rg.RouteGraph(layer, TOL)
+    profile = {"kroz objekat": 10.0}
+    try:
+        assert len(graph.path_across_network(START, END, ROUTING_ASTAR, profile)) == 11
+        street = next(f.id() for f in layer.getFeatures() if f["tip_trase"] == "podzemna")
+        layer.startEditing()
+        layer.changeAttributeValue(street, layer.fields().indexFromName("tip_trase"), "kroz objekat")
+        assert len(graph.path_across_network(START, END, ROUTING_ASTAR, profile)) == 3
+        layer.rollBack()
+    finally:
+        graph.disconnect()
+
+
+def test_astar_settles_far_fewer_vertices_than_bfs(qgis_app):
+    layer = _grid(30)
+    graph = rg.RouteGraph(layer, TOL)
+    start, end = QgsPointXY(0, 150), QgsPointXY(290, 150)
+    try:
+        bfs, dijkstra, astar = {}, {}, {}
+        graph.path_across_network(start, end, ROUTING_BFS, stats=bfs)
+        graph.path_across_network(start, end, ROUTING_DIJKSTRA, stats=dijkstra)
+        graph.path_across_network(start, end, ROUTING_ASTAR, stats=astar)
+    finally:
+        graph.disconnect()
+
+    assert astar["cost"] == pytest.approx(dijkstra["cost"])
+    assert astar["settled"] * 3 < bfs["settled"]
+    assert astar["settled"] < dijkstra["settled"]
+
+
+def test_bad_arguments_are_rejected(qgis_app):
+    layer = _street_and_detour()
+    with pytest.raises(ValueError):
+        find_route_between_points(layer, START, END, TOL, "shortest")
+    with pytest.raises(ValueError):
+        find_route_between_points(layer, START, END, TOL, ROUTING_ASTAR, {"podzemna": 0})